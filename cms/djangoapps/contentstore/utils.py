@@ -415,29 +415,33 @@ def is_currently_visible_to_students(xblock):
     return True
 
 
-def has_children_visible_to_specific_partition_groups(xblock):
+def has_children_visible_to_specific_partition_groups(xblock, course=None):
     """
     Returns True if this xblock has children that are limited to specific user partition groups.
     Note that this method is not recursive (it does not check grandchildren).
+
+    If provided, ``course`` is used to look up the user partitions instead of loading the course.
     """
     if not xblock.has_children:
         return False
 
     for child in xblock.get_children():
-        if is_visible_to_specific_partition_groups(child):
+        if is_visible_to_specific_partition_groups(child, course=course):
             return True
 
     return False
 
 
-def is_visible_to_specific_partition_groups(xblock):
+def is_visible_to_specific_partition_groups(xblock, course=None):
     """
     Returns True if this xblock has visibility limited to specific user partition groups.
+
+    If provided, ``course`` is used to look up the user partitions instead of loading the course.
     """
     if not xblock.group_access:
         return False
 
-    for partition in get_user_partition_info(xblock):
+    for partition in get_user_partition_info(xblock, course=course):
         if any(g["selected"] for g in partition["groups"]):
             return True
 
@@ -1382,7 +1382,7 @@ def create_xblock_info(xblock, data=None, metadata=None, include_ancestor_info=F
                 xblock_info['staff_only_message'] = False
 
             xblock_info['has_partition_group_components'] = has_children_visible_to_specific_partition_groups(
-                xblock
+                xblock, course=course
             )
         xblock_info['user_partition_info'] = get_visibility_partition_info(xblock, course=course)
 
@@ -80,8 +80,13 @@ from lms.envs.common import (
     HEARTBEAT_CELERY_TIMEOUT,
     HEARTBEAT_CELERY_ROUTING_KEY,
 
+    # Mako templates compiled ahead of time, and whether to check templates for changes
+    MAKO_PRECOMPILED_MODULE_DIR,
+    MAKO_TEMPLATE_FILESYSTEM_CHECKS,
+
     # Default site to use if no site exists matching request headers
     SITE_ID,
+    SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL,
 
     # constants for redirects app
     REDIRECT_CACHE_TIMEOUT,
@@ -102,6 +107,7 @@ from lms.envs.common import (
     DEBUG_TOOLBAR_PATCH_SETTINGS,
 
     COURSE_ENROLLMENT_MODES,
+    COURSE_ENROLLMENT_STATE_CACHE_TIMEOUT,
     CONTENT_TYPE_GATE_GROUP_IDS,
 
     DISABLE_ACCOUNT_ACTIVATION_REQUIREMENT_SWITCH,
@@ -186,6 +186,9 @@ CACHES = {
     },
 }
 
+# Check for changes to the site configurations on every use, as the caches are cleared between tests
+SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL = 0
+
 ############################### BLOCKSTORE #####################################
 # Blockstore tests
 RUN_BLOCKSTORE_TESTS = os.environ.get('EDXAPP_RUN_BLOCKSTORE_TESTS', 'no').lower() in ('true', 'yes', '1')
@@ -1,5 +1,6 @@
 # lint-amnesty, pylint: disable=missing-module-docstring
 
+import hashlib
 import logging
 
 from django.conf import settings
@@ -8,6 +9,7 @@ from django.template import Engine, TemplateDoesNotExist, engines
 from django.template.loaders.app_directories import Loader as AppDirectoriesLoader
 from django.template.loaders.filesystem import Loader as FilesystemLoader
 
+from common.djangoapps.edxmako.paths import get_precompiled_module_filename
 from common.djangoapps.edxmako.template import Template
 from openedx.core.lib.tempdir import mkdtemp_clean
 
@@ -51,13 +53,18 @@ class MakoLoader:
         source, origin = self.load_template_source(template_name)
 
         # In order to allow dynamic template overrides, we need to cache templates based on their absolute paths
-        # rather than relative paths, overriding templates would have same relative paths.
-        module_directory = self.module_directory.rstrip("/") + f"/{hash(origin.name)}/"
+        # rather than relative paths, overriding templates would have same relative paths. The hash of the path must
+        # be the same in every process, so that they can all share the compiled modules.
+        path_hash = hashlib.md5(origin.name.encode('utf-8')).hexdigest()
+        module_directory = self.module_directory.rstrip("/") + f"/{path_hash}/"
 
         if source.startswith("## mako\n"):
             # This is a mako template
             template = Template(filename=origin.name,
                                 module_directory=module_directory,
+                                module_filename=get_precompiled_module_filename(
+                                    origin.name, template_name, source=source,
+                                ),
                                 input_encoding='utf-8',
                                 output_encoding='utf-8',
                                 default_filters=['decode.utf8'],
@@ -0,0 +1,127 @@
+"""
+Management command to compile Mako templates ahead of time.
+"""
+
+
+import logging
+import os
+import posixpath
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from mako.template import Template as MakoTemplate
+
+from common.djangoapps.edxmako import LOOKUP
+from common.djangoapps.edxmako.paths import get_precompiled_module_filename, get_template_module_key
+from openedx.core.djangoapps.theming.helpers import get_themes
+
+log = logging.getLogger(__name__)
+
+# The extensions of the files in the template directories that are compiled as Mako templates
+TEMPLATE_EXTENSIONS = ('.html', '.txt', '.xml')
+
+
+class Command(BaseCommand):
+    """
+    Compile the Mako templates of every template lookup, including the templates of every enabled theme, into a
+    directory of modules that can be shared by every process.
+
+    The modules are named by a hash of the template (see get_template_module_key), so this can be run into the same
+    directory on each deploy, and only templates that have changed are compiled. Set settings.MAKO_PRECOMPILED_MODULE_DIR
+    to the directory to have the compiled modules used.
+
+    Example usage:
+        $ ./manage.py lms compile_mako_templates
+        $ ./manage.py cms compile_mako_templates --module-dir /edx/var/edxapp/mako_modules
+    """
+
+    help = 'Compile the Mako templates of every enabled theme ahead of time.'
+
+    # This allows the templates to be compiled while building images, without database access.
+    requires_system_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--module-dir',
+            dest='module_dir',
+            default=None,
+            help="Directory to compile the templates into. Defaults to settings.MAKO_PRECOMPILED_MODULE_DIR.",
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            default=False,
+            help="Compile every template, even if an up to date module for it already exists.",
+        )
+
+    def handle(self, *args, **options):
+        module_dir = options['module_dir'] or settings.MAKO_PRECOMPILED_MODULE_DIR
+        if not module_dir:
+            raise CommandError("Specify --module-dir or set MAKO_PRECOMPILED_MODULE_DIR.")
+        os.makedirs(module_dir, exist_ok=True)
+
+        start = time.monotonic()
+        compiled = up_to_date = failed = 0
+        for namespace, lookup in LOOKUP.items():
+            for filename, uri in self._get_templates(lookup):
+                try:
+                    if not options['force'] and get_precompiled_module_filename(filename, uri, module_dir):
+                        up_to_date += 1
+                        continue
+                    module_filename = os.path.join(module_dir, get_template_module_key(filename, uri) + '.py')
+                    if os.path.exists(module_filename):
+                        # Mako only compiles templates that are newer than their modules
+                        os.remove(module_filename)
+                    MakoTemplate(
+                        uri=uri, filename=filename, lookup=lookup, module_filename=module_filename,
+                        **lookup.template_args
+                    )
+                    compiled += 1
+                except Exception as exc:  # pylint: disable=broad-except
+                    # Files that aren't Mako templates are left to be compiled (or fail) when they are first used
+                    log.warning('Could not compile template %s (%s) for lookup %s: %s', filename, uri, namespace, exc)
+                    failed += 1
+
+        self.stdout.write(
+            'Compiled {compiled} Mako templates into {module_dir} in {duration:.1f} seconds, '
+            '{up_to_date} were up to date and {failed} could not be compiled.'.format(
+                compiled=compiled,
+                module_dir=module_dir,
+                duration=time.monotonic() - start,
+                up_to_date=up_to_date,
+                failed=failed,
+            )
+        )
+
+    @staticmethod
+    def _get_templates(lookup):
+        """
+        Yield the filename of each template that the lookup can find, with each uri it can be looked up by.
+
+        A template can be looked up either relative to its directory (as by render_to_string), or as an absolute uri
+        (as by an include or inherit tag), and each is compiled into a different module. Only the templates of enabled
+        themes are compiled from the themes directories.
+        """
+        theme_template_dirs = {}
+        for theme in get_themes():
+            theme_template_dirs.setdefault(posixpath.normpath(str(theme.themes_base_dir)), []).append(
+                str(theme.path / 'templates')
+            )
+
+        found_uris = set()
+        for directory in lookup.directories:
+            for template_dir in theme_template_dirs.get(directory, [directory]):
+                for dirpath, __, filenames in os.walk(template_dir):
+                    for name in sorted(filenames):
+                        if not name.endswith(TEMPLATE_EXTENSIONS):
+                            continue
+                        uri = posixpath.relpath(posixpath.join(dirpath, name), directory)
+                        if uri in found_uris:
+                            # The template is overridden by one in an earlier directory of the lookup
+                            continue
+                        found_uris.add(uri)
+                        # This is the filename that the lookup finds for the uri
+                        filename = posixpath.normpath(posixpath.join(directory, uri))
+                        yield filename, uri
+                        yield filename, '/' + uri
@@ -0,0 +1,114 @@
+"""
+Test cases for compile_mako_templates command.
+"""
+
+import os
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from common.djangoapps.edxmako import LOOKUP, add_lookup
+from common.djangoapps.edxmako.paths import get_precompiled_module_filename, get_template_module_key
+from openedx.core.lib.tempdir import mkdtemp_clean
+
+
+class CompileMakoTemplatesTest(TestCase):
+    """
+    Test the compile_mako_templates management command.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.template_dir = mkdtemp_clean()
+        self.module_dir = mkdtemp_clean()
+        os.makedirs(os.path.join(self.template_dir, 'sub'))
+        self.templates = {
+            'hello.html': 'Hello ${name}',
+            'sub/goodbye.html': 'Goodbye ${name}',
+            'README.md': 'Not a template',
+        }
+        for name, source in self.templates.items():
+            with open(os.path.join(self.template_dir, name), 'w') as template_file:
+                template_file.write(source)
+
+        patcher = patch.dict(LOOKUP, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        add_lookup('test', self.template_dir)
+
+    def compile_templates(self, **kwargs):
+        """
+        Run the command, and return its output.
+        """
+        out = StringIO()
+        call_command('compile_mako_templates', module_dir=self.module_dir, stdout=out, **kwargs)
+        return out.getvalue()
+
+    def test_compile_templates(self):
+        output = self.compile_templates()
+        assert 'Compiled 4 Mako templates' in output
+
+        modules = [name for name in os.listdir(self.module_dir) if name.endswith('.py')]
+        assert len(modules) == 4
+        for uri in ('hello.html', '/hello.html', 'sub/goodbye.html', '/sub/goodbye.html'):
+            filename = os.path.join(self.template_dir, uri.lstrip('/'))
+            module_filename = get_precompiled_module_filename(filename, uri, self.module_dir)
+            assert os.path.basename(module_filename) in modules
+
+    def test_compiled_templates_used(self):
+        self.compile_templates()
+        with override_settings(MAKO_PRECOMPILED_MODULE_DIR=self.module_dir):
+            template = LOOKUP['test'].get_template('hello.html')
+        assert os.path.dirname(template.module.__file__) == self.module_dir
+        assert template.render_unicode(name='World') == 'Hello World'
+
+    def test_changed_template_not_precompiled(self):
+        self.compile_templates()
+        with open(os.path.join(self.template_dir, 'hello.html'), 'w') as template_file:
+            template_file.write('Hi ${name}')
+        with override_settings(MAKO_PRECOMPILED_MODULE_DIR=self.module_dir):
+            template = LOOKUP['test'].get_template('hello.html')
+        assert os.path.dirname(template.module.__file__) != self.module_dir
+        assert template.render_unicode(name='World') == 'Hi World'
+
+    def test_module_key_from_source(self):
+        filename = os.path.join(self.template_dir, 'hello.html')
+        source = self.templates['hello.html']
+        assert get_template_module_key(filename, 'hello.html', source=source) == \
+            get_template_module_key(filename, 'hello.html')
+        assert get_template_module_key(filename, 'hello.html', source='Hi ${name}') != \
+            get_template_module_key(filename, 'hello.html')
+
+    def test_precompiled_module_remembered(self):
+        self.compile_templates()
+        filename = os.path.join(self.template_dir, 'hello.html')
+        source = self.templates['hello.html']
+        with override_settings(MAKO_TEMPLATE_FILESYSTEM_CHECKS=False):
+            module_filename = get_precompiled_module_filename(filename, 'hello.html', self.module_dir, source=source)
+            assert module_filename is not None
+
+            # The template isn't read, and neither it nor the module are checked again
+            with patch('os.stat') as mock_stat, patch('builtins.open') as mock_open:
+                assert get_precompiled_module_filename(
+                    filename, 'hello.html', self.module_dir, source=source,
+                ) == module_filename
+            mock_stat.assert_not_called()
+            mock_open.assert_not_called()
+
+    def test_up_to_date_templates_skipped(self):
+        self.compile_templates()
+        output = self.compile_templates()
+        assert 'Compiled 0 Mako templates' in output
+        assert '4 were up to date' in output
+
+        output = self.compile_templates(force=True)
+        assert 'Compiled 4 Mako templates' in output
+
+    @override_settings(MAKO_PRECOMPILED_MODULE_DIR=None)
+    def test_module_dir_required(self):
+        with pytest.raises(CommandError):
+            call_command('compile_mako_templates')
@@ -6,10 +6,12 @@ Set up lookup paths for mako templates.
 import contextlib
 import hashlib
 import os
+import stat
 
 import pkg_resources
 import six
 from django.conf import settings
+from mako import codegen
 from mako.exceptions import TopLevelLookupException
 from mako.lookup import TemplateLookup
 
@@ -18,6 +20,9 @@ from openedx.core.lib.cache_utils import request_cached
 
 from . import LOOKUP
 
+# The precompiled module found for each module key, if templates aren't checked for changes
+_PRECOMPILED_MODULE_FILENAMES = {}
+
 
 class TopLevelTemplateURI(str):
     """
@@ -113,6 +118,56 @@ class DynamicTemplateLookup(TemplateLookup):
         return super().get_template(strip_site_theme_templates_path(uri))
 
 
+def get_template_module_key(filename, uri, source=None):
+    """
+    Return a key for the compiled module of the template in this file when it is looked up by this uri.
+
+    The key is a hash of everything the compiled module depends on, so a module compiled under it can be shared by
+    every process, and by every deploy in which the template is unchanged. Pass the template's source, as read by a
+    template loader, if it has already been read, otherwise it is read from the file.
+    """
+    if source is None:
+        # Read the file as Django's template loaders do, so that the key is the same whichever read it
+        with open(filename, encoding='utf-8') as template_file:
+            source = template_file.read()
+    key = hashlib.sha1()
+    for part in (str(codegen.MAGIC_NUMBER), uri, filename):
+        key.update(part.encode('utf-8'))
+        key.update(b'\0')
+    key.update(source.encode('utf-8'))
+    return key.hexdigest()
+
+
+def get_precompiled_module_filename(filename, uri, module_directory=None, source=None):
+    """
+    Return the filename of the module compiled ahead of time, by the compile_mako_templates management command, for
+    the template in this file when it is looked up by this uri. Returns None if there is no such module, or if it is
+    older than the template file, in which case the template is compiled as usual. Pass the template's source if it
+    has already been read.
+
+    The precompiled modules are only ever read here, so settings.MAKO_PRECOMPILED_MODULE_DIR can be read-only. Unless
+    settings.MAKO_TEMPLATE_FILESYSTEM_CHECKS is set, templates aren't expected to change while the process runs, so
+    the module found for each template is remembered rather than looked for again.
+    """
+    module_directory = module_directory or settings.MAKO_PRECOMPILED_MODULE_DIR
+    if not module_directory:
+        return None
+    module_filename = os.path.join(module_directory, get_template_module_key(filename, uri, source) + '.py')
+    if not settings.MAKO_TEMPLATE_FILESYSTEM_CHECKS and module_filename in _PRECOMPILED_MODULE_FILENAMES:
+        return _PRECOMPILED_MODULE_FILENAMES[module_filename]
+
+    precompiled_module_filename = None
+    try:
+        # Mako recompiles (and rewrites) modules older than their template, so only use the module if it's up to date
+        if os.stat(module_filename)[stat.ST_MTIME] >= os.stat(filename)[stat.ST_MTIME]:
+            precompiled_module_filename = module_filename
+    except OSError:
+        pass
+    if not settings.MAKO_TEMPLATE_FILESYSTEM_CHECKS:
+        _PRECOMPILED_MODULE_FILENAMES[module_filename] = precompiled_module_filename
+    return precompiled_module_filename
+
+
 def clear_lookups(namespace):
     """
     Remove mako template lookups for the given namespace.
@@ -137,6 +192,8 @@ def add_lookup(namespace, directory, package=None, prepend=False):
             input_encoding='utf-8',
             default_filters=['decode.utf8'],
             encoding_errors='replace',
+            filesystem_checks=settings.MAKO_TEMPLATE_FILESYSTEM_CHECKS,
+            modulename_callable=get_precompiled_module_filename,
         )
     if package:
         directory = pkg_resources.resource_filename(package, directory)
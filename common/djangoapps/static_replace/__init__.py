@@ -2,6 +2,7 @@
 
 import logging
 import re
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib.staticfiles import finders
@@ -29,6 +30,17 @@ def _url_replace_regex(prefix):
         """.format(prefix=prefix)
 
 
+@lru_cache(maxsize=256)
+def _url_replace_pattern(prefix):
+    """
+    Return the compiled form of `_url_replace_regex(prefix)`.
+
+    The same handful of prefixes are used for every fragment that is rendered, so each
+    pattern is only compiled once per process.
+    """
+    return re.compile(_url_replace_regex(prefix))
+
+
 def try_staticfiles_lookup(path):
     """
     Try to lookup a path in staticfiles_storage.  If it fails, return
@@ -65,12 +77,16 @@ def replace_jump_to_id_urls(text, course_id, jump_to_id_base_url):  # lint-amnes
     output: <text> after the link rewriting rules are applied
     """
 
+    # Most fragments don't link to other courseware, so skip the regex when they can't match.
+    if '/jump_to_id/' not in text:
+        return text
+
     def replace_jump_to_id_url(match):
         quote = match.group('quote')
         rest = match.group('rest')
         return "".join([quote, jump_to_id_base_url + rest, quote])
 
-    return re.sub(_url_replace_regex('/jump_to_id/'), replace_jump_to_id_url, text)
+    return _url_replace_pattern('/jump_to_id/').sub(replace_jump_to_id_url, text)
 
 
 def replace_course_urls(text, course_key):
@@ -83,6 +99,9 @@ def replace_course_urls(text, course_key):
     returns: text with the links replaced
     """
 
+    if '/course/' not in text:
+        return text
+
     course_id = str(course_key)
 
     def replace_course_url(match):
@@ -90,7 +109,7 @@ def replace_course_urls(text, course_key):
         rest = match.group('rest')
         return "".join([quote, '/courses/' + course_id + '/', rest, quote])
 
-    return re.sub(_url_replace_regex('/course/'), replace_course_url, text)
+    return _url_replace_pattern('/course/').sub(replace_course_url, text)
 
 
 def process_static_urls(text, replacement_function, data_dir=None):
@@ -120,14 +139,14 @@ def process_static_urls(text, replacement_function, data_dir=None):
 
         return replacement_function(original, prefix, quote, rest)
 
-    return re.sub(
-        _url_replace_regex('(?:{static_url}|/static/)(?!{data_dir})'.format(
-            static_url=settings.STATIC_URL,
-            data_dir=data_dir
-        )),
-        wrap_part_extraction,
-        text
-    )
+    static_url = str(settings.STATIC_URL)
+    if '/static/' not in text and static_url not in text:
+        return text
+
+    return _url_replace_pattern('(?:{static_url}|/static/)(?!{data_dir})'.format(
+        static_url=static_url,
+        data_dir=data_dir
+    )).sub(wrap_part_extraction, text)
 
 
 def make_static_urls_absolute(request, html):
@@ -154,7 +173,8 @@ def replace_static_urls(
     static_asset_path='',
     static_paths_out=None,
     xblock=None,
-    lookup_asset_url=None
+    lookup_asset_url=None,
+    static_url_cache=None
 ):
     """
     Replace /static/$stuff urls either with their correct url as generated by collectstatic,
@@ -171,6 +191,8 @@ def replace_static_urls(
       * the updated static URI (will match the original if unchanged)
     xblock: xblock where the static assets are stored
     lookup_url_func: Lookup function which returns the correct path of the asset
+    static_url_cache: (optional) dict in which to remember the urls that static urls resolve to, so that
+      each distinct url is only looked up once for all the text that is replaced using the same dict
     """
 
     if static_paths_out is None:
@@ -195,6 +217,10 @@ def replace_static_urls(
             static_paths_out.append((original_uri, original_uri))
             return original
 
+        cache_key = (str(course_id), static_asset_path, data_directory, prefix, rest)
+        if static_url_cache is not None and cache_key in static_url_cache:
+            url = static_url_cache[cache_key]
+
         # if we're running with a MongoBacked store course_namespace is not None, then use studio style urls
         elif (not static_asset_path) and course_id:
             # first look in the static file pipeline and see if we are trying to reference
@@ -236,6 +262,8 @@ def replace_static_urls(
                     rest, str(err)))
                 url = "".join([prefix, course_path])
 
+        if static_url_cache is not None:
+            static_url_cache[cache_key] = url
         static_paths_out.append((original_uri, url))
         return "".join([quote, url, quote])
 
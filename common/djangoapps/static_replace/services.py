@@ -2,6 +2,11 @@
 Supports replacement of static/course/jump-to-id URLs to absolute URLs in XBlocks.
 """
 
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from edx_django_utils.cache import RequestCache
 from xblock.reference.plugins import Service
 
 from common.djangoapps.static_replace import (
@@ -10,6 +15,12 @@ from common.djangoapps.static_replace import (
     replace_static_urls
 )
 
+# Request cache namespace for the urls that static urls have resolved to during the current request.
+STATIC_URL_CACHE_NAMESPACE = 'static_replace.static_urls'
+
+# Stands in for the (per-request) xblock request token in cached replaced text.
+REQUEST_TOKEN_PLACEHOLDER = '%%XBLOCK_REQUEST_TOKEN%%'
+
 
 class ReplaceURLService(Service):
     """
@@ -43,13 +54,50 @@ class ReplaceURLService(Service):
         self.jump_to_id_base_url = jump_to_id_base_url
         self.lookup_asset_url = lookup_asset_url
 
-    def replace_urls(self, text, static_replace_only=False):
+    def replace_urls(self, text, static_replace_only=False, cacheable=False, request_token=None):
         """
         Replaces all static/course/jump-to-id URLs in provided text/html.
 
         Args:
             text: String containing the URL to be replaced
             static_replace_only: If True, only static urls will be replaced
+            cacheable: If True, the text is the same for every learner (e.g. the content of an
+                HTML block), so the replaced text may be remembered for a short while (see
+                settings.STATIC_REPLACE_FRAGMENT_CACHE_TIMEOUT) and reused for the same text.
+            request_token: (optional) The xblock request token included in the text, which is left out
+                of the cached text so that it can be reused by other requests.
+        """
+        timeout = getattr(settings, 'STATIC_REPLACE_FRAGMENT_CACHE_TIMEOUT', 0)
+        if self.lookup_asset_url or self.static_paths_out is not None:
+            # The replacement depends on the block, or has to report the urls it finds.
+            cacheable = False
+        if not (cacheable and timeout):
+            return self._replace_urls(text, static_replace_only)
+
+        if request_token:
+            text = text.replace(request_token, REQUEST_TOKEN_PLACEHOLDER)
+
+        cache_key = 'static_replace.replaced.{}'.format(hashlib.sha1('\n'.join([
+            str(self.course_id),
+            str(self.data_directory),
+            str(self.static_asset_path),
+            str(self.jump_to_id_base_url),
+            str(static_replace_only),
+            text,
+        ]).encode('utf-8')).hexdigest())
+        replaced_text = cache.get(cache_key)
+        if replaced_text is None:
+            replaced_text = self._replace_urls(text, static_replace_only)
+            if isinstance(replaced_text, str):
+                cache.set(cache_key, replaced_text, timeout)
+
+        if request_token and isinstance(replaced_text, str):
+            replaced_text = replaced_text.replace(REQUEST_TOKEN_PLACEHOLDER, request_token)
+        return replaced_text
+
+    def _replace_urls(self, text, static_replace_only):
+        """
+        Replaces all static/course/jump-to-id URLs in provided text/html, as replace_urls() does.
         """
         if self.lookup_asset_url:
             text = replace_static_urls(text, xblock=self.xblock(), lookup_asset_url=self.lookup_asset_url)
@@ -59,7 +107,9 @@ class ReplaceURLService(Service):
                 data_directory=self.data_directory,
                 course_id=self.course_id,
                 static_asset_path=self.static_asset_path,
-                static_paths_out=self.static_paths_out
+                static_paths_out=self.static_paths_out,
+                # Pages often link to the same assets from many blocks: only look each one up once.
+                static_url_cache=RequestCache(STATIC_URL_CACHE_NAMESPACE).data,
             )
             if not static_replace_only:
                 text = replace_course_urls(text, self.course_id)
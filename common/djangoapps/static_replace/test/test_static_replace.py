@@ -9,6 +9,7 @@ from urllib.parse import parse_qsl, quote, urlparse, urlunparse, urlencode
 
 import ddt
 import pytest
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import override_settings
 from opaque_keys.edx.keys import CourseKey
 from PIL import Image
@@ -19,6 +20,7 @@ from common.djangoapps.static_replace import (
     make_static_urls_absolute,
     process_static_urls,
     replace_course_urls,
+    replace_jump_to_id_urls,
     replace_static_urls
 )
 from common.djangoapps.static_replace.services import ReplaceURLService
@@ -148,6 +150,34 @@ def test_data_dir_fallback(mock_storage, mock_modulestore, mock_settings):  # li
     assert replace_static_urls(STATIC_SOURCE, DATA_DIRECTORY) == '"/static/data_dir/file.png"'
 
 
+@patch('common.djangoapps.static_replace.staticfiles_storage', autospec=True)
+def test_static_url_cache(mock_storage):
+    mock_storage.exists.return_value = True
+    mock_storage.url.return_value = '/static/file.abc123.png'
+    static_url_cache = {}
+
+    for __ in range(2):
+        static_paths = []
+        assert replace_static_urls(
+            STATIC_SOURCE, DATA_DIRECTORY, static_paths_out=static_paths, static_url_cache=static_url_cache
+        ) == '"/static/file.abc123.png"'
+        assert static_paths == [('/static/file.png', '/static/file.abc123.png')]
+    mock_storage.exists.assert_called_once_with('file.png')
+    mock_storage.url.assert_called_once_with('file.png')
+
+
+def test_regexes_skipped_without_prefix():
+    """
+    Make sure text without any of the replaceable prefixes is returned without running the regexes
+    """
+    with patch('common.djangoapps.static_replace._url_replace_pattern') as mock_pattern:
+        text = '<p>No links to replace in "/courses/" here.</p>'
+        assert replace_static_urls(text, DATA_DIRECTORY) == text
+        assert replace_course_urls(text, COURSE_KEY) == text
+        assert replace_jump_to_id_urls(text, COURSE_KEY, '/jump_to_id_base/') == text
+    assert not mock_pattern.called
+
+
 def test_raw_static_check():
     """
     Make sure replace_static_urls leaves alone things that end in '.raw'
@@ -649,6 +679,39 @@ class ReplaceURLServiceTest(TestCase):
         return_text = replace_url_service.replace_urls("text")
         assert not self.mock_replace_jump_to_id_urls.called
 
+    @override_settings(STATIC_REPLACE_FRAGMENT_CACHE_TIMEOUT=300)
+    def test_replace_urls_cacheable(self):
+        """
+        Test that the replaced text is reused for cacheable text, and only for cacheable text.
+        """
+        self.mock_replace_static_urls.side_effect = lambda text, **kwargs: text
+        self.mock_replace_course_urls.side_effect = lambda text, course_id: text + ' replaced'
+        replace_url_service = ReplaceURLService(course_id=COURSE_KEY)
+        with patch('common.djangoapps.static_replace.services.cache', LocMemCache('static_replace_tests', {})):
+            for __ in range(2):
+                assert replace_url_service.replace_urls('text', cacheable=True) == 'text replaced'
+            assert self.mock_replace_course_urls.call_count == 1
+
+            assert replace_url_service.replace_urls('text') == 'text replaced'
+            assert replace_url_service.replace_urls('text', static_replace_only=True, cacheable=True) == 'text'
+            assert self.mock_replace_static_urls.call_count == 3
+
+    @override_settings(STATIC_REPLACE_FRAGMENT_CACHE_TIMEOUT=300)
+    def test_replace_urls_cacheable_with_request_token(self):
+        """
+        Test that the replaced text is reused by requests with different request tokens.
+        """
+        self.mock_replace_static_urls.side_effect = lambda text, **kwargs: text
+        self.mock_replace_course_urls.side_effect = lambda text, course_id: text + ' replaced'
+        replace_url_service = ReplaceURLService(course_id=COURSE_KEY)
+        with patch('common.djangoapps.static_replace.services.cache', LocMemCache('static_replace_tests', {})):
+            for token in ('token1', 'token2'):
+                replaced_text = replace_url_service.replace_urls(
+                    f'<div data-request-token="{token}">text</div>', cacheable=True, request_token=token,
+                )
+                assert replaced_text == f'<div data-request-token="{token}">text</div> replaced'
+            assert self.mock_replace_course_urls.call_count == 1
+
 
 @ddt.ddt
 class TestReplaceURLWrapper(SharedModuleStoreTestCase):
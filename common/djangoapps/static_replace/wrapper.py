@@ -5,8 +5,16 @@ Wrapper function to replace static/course/jump-to-id URLs in XBlock to absolute
 from openedx.core.lib.xblock_utils import wrap_fragment
 
 
-def replace_urls_wrapper(block, view, frag, context, replace_url_service, static_replace_only=False):  # pylint: disable=unused-argument
+def replace_urls_wrapper(block, view, frag, context, replace_url_service, static_replace_only=False,  # pylint: disable=unused-argument
+                         request_token=None):
     """
     Replace any static/course/jump-to-id URLs in XBlock to absolute URLs
+
+    request_token is the xblock request token that the fragment may already have been wrapped with
+    (see wrap_xblock), which differs between requests for the same content.
     """
-    return wrap_fragment(frag, replace_url_service.replace_urls(frag.content, static_replace_only))
+    # HTML blocks render the same content for every learner, so their replaced content can be reused.
+    cacheable = block.scope_ids.block_type == 'html'
+    return wrap_fragment(frag, replace_url_service.replace_urls(
+        frag.content, static_replace_only, cacheable=cacheable, request_token=request_token,
+    ))
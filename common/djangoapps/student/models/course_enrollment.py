@@ -4,6 +4,8 @@ import logging  # lint-amnesty, pylint: disable=wrong-import-order
 import uuid  # lint-amnesty, pylint: disable=wrong-import-order
 from collections import defaultdict, namedtuple  # lint-amnesty, pylint: disable=wrong-import-order
 from datetime import date, datetime, timedelta  # lint-amnesty, pylint: disable=wrong-import-order
+from functools import partial  # lint-amnesty, pylint: disable=wrong-import-order
+from itertools import chain  # lint-amnesty, pylint: disable=wrong-import-order
 from urllib.parse import urljoin
 
 from config_models.models import ConfigurationModel
@@ -12,11 +14,12 @@ from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imp
 from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.core.validators import FileExtensionValidator
-from django.db import models
-from django.db.models import Count, Index, Q
+from django.db import models, transaction
+from django.db.models import Count, Index, Q, prefetch_related_objects
 from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
+from edx_django_utils import monitoring as monitoring_utils
 from edx_django_utils.cache import RequestCache, TieredCache, get_cache_key
 from eventtracking import tracker
 from model_utils.models import TimeStampedModel
@@ -32,6 +35,7 @@ from openedx_filters.learning.filters import CourseEnrollmentStarted, CourseUnen
 from pytz import UTC
 from requests.exceptions import HTTPError, RequestException
 from simple_history.models import HistoricalRecords
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
 
 from common.djangoapps.course_modes.models import CourseMode, get_cosmetic_verified_display_price
 from common.djangoapps.student.signals import ENROLL_STATUS_CHANGE, ENROLLMENT_TRACK_UPDATED, UNENROLL_DONE
@@ -83,6 +87,8 @@ ALLOWEDTOENROLL_TO_UNENROLLED = 'from allowed to enroll to enrolled'
 UNENROLLED_TO_UNENROLLED = 'from unenrolled to unenrolled'
 DEFAULT_TRANSITION_STATE = 'N/A'
 SCORE_RECALCULATION_DELAY_ON_ENROLLMENT_UPDATE = 30
+# The number of enrollments whose events are sent between progress log messages, by CourseEnrollment.bulk_enroll
+BULK_ENROLL_EVENTS_BATCH_SIZE = 100
 
 TRANSITION_STATES = (
     (UNENROLLED_TO_ALLOWEDTOENROLL, UNENROLLED_TO_ALLOWEDTOENROLL),
@@ -291,6 +297,15 @@ class CourseEnrollment(models.Model):
 
     MODE_CACHE_NAMESPACE = 'CourseEnrollment.mode_and_active'
 
+    # Users' enrollment states are also cached across requests, in the shared cache. Each cached value is stored
+    # with the user's cache generation at the time, which is bumped whenever any of their enrollments changes, so
+    # that values which missed an update (for example because a write to the cache failed) are never read.
+    # Bump the version whenever the format of the cached values changes.
+    ENROLLMENT_STATE_CACHE_VERSION = 1
+    ENROLLMENT_STATE_CACHE_KEY = 'CourseEnrollment.state.v{version}.{user_id}.{course_key}'
+    USER_ENROLLMENT_STATES_CACHE_KEY = 'CourseEnrollment.user_states.v{version}.{user_id}'
+    ENROLLMENT_CACHE_GENERATION_KEY = 'CourseEnrollment.generation.{user_id}'
+
     class Meta:
         unique_together = (('user', 'course'), )
         indexes = [Index(fields=['user', '-created'])]
@@ -455,24 +470,19 @@ class CourseEnrollment(models.Model):
                 CourseEnrollmentState(self.mode, self.is_active),
             )
 
+        self._send_enrollment_update_events(
+            activation_changed, mode_changed, course_data, skip_refund=skip_refund, enterprise_uuid=enterprise_uuid,
+        )
+
+    def _send_enrollment_update_events(
+        self, activation_changed, mode_changed, course_data, skip_refund=False, enterprise_uuid=None,
+    ):
+        """
+        Sends the signals and emits the events for an enrollment which has been updated (and saved).
+        """
+        if activation_changed or mode_changed:
             # .. event_implemented_name: COURSE_ENROLLMENT_CHANGED
-            COURSE_ENROLLMENT_CHANGED.send_event(
-                enrollment=CourseEnrollmentData(
-                    user=UserData(
-                        pii=UserPersonalData(
-                            username=self.user.username,
-                            email=self.user.email,
-                            name=self.user.profile.name,
-                        ),
-                        id=self.user.id,
-                        is_active=self.user.is_active,
-                    ),
-                    course=course_data,
-                    mode=self.mode,
-                    is_active=self.is_active,
-                    creation_date=self.created,
-                )
-            )
+            COURSE_ENROLLMENT_CHANGED.send_event(enrollment=self._get_enrollment_data(course_data))
 
         if activation_changed:
             if self.is_active:
@@ -483,23 +493,7 @@ class CourseEnrollment(models.Model):
                 self.send_signal(EnrollStatusChange.unenroll)
 
                 # .. event_implemented_name: COURSE_UNENROLLMENT_COMPLETED
-                COURSE_UNENROLLMENT_COMPLETED.send_event(
-                    enrollment=CourseEnrollmentData(
-                        user=UserData(
-                            pii=UserPersonalData(
-                                username=self.user.username,
-                                email=self.user.email,
-                                name=self.user.profile.name,
-                            ),
-                            id=self.user.id,
-                            is_active=self.user.is_active,
-                        ),
-                        course=course_data,
-                        mode=self.mode,
-                        is_active=self.is_active,
-                        creation_date=self.created,
-                    )
-                )
+                COURSE_UNENROLLMENT_COMPLETED.send_event(enrollment=self._get_enrollment_data(course_data))
 
         if mode_changed:
             from common.djangoapps.student.email_helpers import (
@@ -527,6 +521,26 @@ class CourseEnrollment(models.Model):
                 countdown=SCORE_RECALCULATION_DELAY_ON_ENROLLMENT_UPDATE,
             )
 
+    def _get_enrollment_data(self, course_data):
+        """
+        Returns the CourseEnrollmentData sent with this enrollment's openedx-events.
+        """
+        return CourseEnrollmentData(
+            user=UserData(
+                pii=UserPersonalData(
+                    username=self.user.username,
+                    email=self.user.email,
+                    name=self.user.profile.name,
+                ),
+                id=self.user.id,
+                is_active=self.user.is_active,
+            ),
+            course=course_data,
+            mode=self.mode,
+            is_active=self.is_active,
+            creation_date=self.created,
+        )
+
     def send_signal(self, event, cost=None, currency=None):
         """
         Sends a signal announcing changes in course enrollment status.
@@ -715,28 +729,199 @@ class CourseEnrollment(models.Model):
         # User is allowed to enroll if they've reached this point.
         enrollment = cls.get_or_create_enrollment(user, course_key)
         enrollment.update_enrollment(is_active=True, mode=mode, enterprise_uuid=enterprise_uuid)
-        enrollment.send_signal(EnrollStatusChange.enroll)
+        enrollment._send_enroll_events(course_data)  # pylint: disable=protected-access
+
+        return enrollment
+
+    def _send_enroll_events(self, course_data):
+        """
+        Sends the signals and emits the events for a user who has been enrolled in a course.
+        """
+        self.send_signal(EnrollStatusChange.enroll)
 
         # .. event_implemented_name: COURSE_ENROLLMENT_CREATED
-        COURSE_ENROLLMENT_CREATED.send_event(
-            enrollment=CourseEnrollmentData(
-                user=UserData(
-                    pii=UserPersonalData(
-                        username=user.username,
-                        email=user.email,
-                        name=user.profile.name,
-                    ),
-                    id=user.id,
-                    is_active=user.is_active,
-                ),
-                course=course_data,
-                mode=enrollment.mode,
-                is_active=enrollment.is_active,
-                creation_date=enrollment.created,
+        COURSE_ENROLLMENT_CREATED.send_event(enrollment=self._get_enrollment_data(course_data))
+
+    @classmethod
+    def bulk_enroll(cls, users, course_key, mode=None, enterprise_uuid=None):
+        """
+        Enroll many users in a course, as `enroll` (without `check_access`)
+        would enroll each of them.
+
+        The users' existing enrollments are read, and their new and changed
+        enrollments written, with a handful of queries in total rather than
+        several per user. The signals and events that `enroll` sends are sent
+        for each enrollment, in batches, once the transaction has been
+        committed.
+
+        Returns a dict of the users' CourseEnrollment objects, keyed by user
+        id. Users whose enrollment is prevented by the CourseEnrollmentStarted
+        filter are left out.
+
+        `users` are saved Django User objects.
+
+        `course_key` and `mode` are as for `enroll`.
+        """
+        assert isinstance(course_key, CourseKey)
+
+        # Validate all of the users and modes up front.
+        modes_by_user_id = {}
+        users_to_enroll = []
+        default_mode = None
+        for user in users:
+            try:
+                user, __, user_mode = CourseEnrollmentStarted.run_filter(
+                    user=user, course_key=course_key, mode=mode,
+                )
+            except CourseEnrollmentStarted.PreventEnrollment as exc:
+                log.warning("User %s was not enrolled in course %s: %s", user.username, str(course_key), exc)
+                continue
+            if user_mode is None:
+                default_mode = default_mode or _default_course_mode(str(course_key))
+                user_mode = default_mode
+            if user.id not in modes_by_user_id:
+                users_to_enroll.append(user)
+            modes_by_user_id[user.id] = user_mode
+        if not users_to_enroll:
+            return {}
+
+        prefetch_related_objects(users_to_enroll, 'profile')
+        try:
+            course = CourseOverview.get_from_id(course_key)
+            course_data = CourseData(
+                course_key=course.id,
+                display_name=course.display_name,
+            )
+        except CourseOverview.DoesNotExist:
+            course = None
+            course_data = CourseData(
+                course_key=course_key,
             )
-        )
 
-        return enrollment
+        existing_enrollments = {
+            enrollment.user_id: enrollment
+            for enrollment in cls.objects.filter(user__in=users_to_enroll, course_id=course_key)
+        }
+        new_enrollments = []
+        changed_enrollments = []
+        changes_by_user_id = {}
+        for user in users_to_enroll:
+            user_mode = modes_by_user_id[user.id]
+            enrollment = existing_enrollments.get(user.id)
+            if enrollment is None:
+                # As get_or_create_enrollment creates an inactive enrollment in the default mode, before it is
+                # updated, this activates the enrollment and may change its mode.
+                new_enrollments.append(cls(user=user, course_id=course_key, mode=user_mode, is_active=True))
+                changes_by_user_id[user.id] = (True, user_mode != CourseMode.DEFAULT_MODE_SLUG)
+                continue
+
+            if enrollment.is_active:
+                log.warning(
+                    "User %s attempted to enroll in %s, but they were already enrolled",
+                    user.username,
+                    str(course_key)
+                )
+            activation_changed = not enrollment.is_active
+            mode_changed = enrollment.mode != user_mode
+            enrollment.is_active = True
+            enrollment.mode = user_mode
+            if activation_changed or mode_changed:
+                changed_enrollments.append(enrollment)
+            changes_by_user_id[user.id] = (activation_changed, mode_changed)
+
+        RequestCache('get_enrollment').clear()
+        # Bulk creation and update do NOT call save() or send the post_save signal, so the post_save signal is sent
+        # here for each enrollment, and the caches cleared by save() are cleared in bulk.
+        with transaction.atomic():
+            created_enrollments = []
+            if new_enrollments:
+                cls.objects.bulk_create(new_enrollments)
+                # Not all databases set the ids of bulk created rows, so the new enrollments are read back.
+                created_enrollments = list(cls.objects.filter(
+                    user__in=[enrollment.user_id for enrollment in new_enrollments],
+                    course_id=course_key,
+                ))
+                cls.history.bulk_history_create(created_enrollments)
+            if changed_enrollments:
+                bulk_update_with_history(changed_enrollments, cls, ['is_active', 'mode'])
+
+            # If there were unlinked CEAs, they become linked now
+            users_by_email = {user.email: user for user in users_to_enroll}
+            unlinked_ceas = list(CourseEnrollmentAllowed.objects.filter(
+                email__in=users_by_email,
+                course_id=course_key,
+                user__isnull=True,
+            ))
+            for cea in unlinked_ceas:
+                cea.user = users_by_email[cea.email]
+            if unlinked_ceas:
+                CourseEnrollmentAllowed.objects.bulk_update(unlinked_ceas, ['user'])
+
+            users_by_id = {user.id: user for user in users_to_enroll}
+            changed_user_ids = {enrollment.user_id for enrollment in changed_enrollments}
+            enrollments = {}
+            for enrollment, created in chain(
+                ((enrollment, True) for enrollment in created_enrollments),
+                ((enrollment, False) for enrollment in existing_enrollments.values()),
+            ):
+                enrollment.user = users_by_id[enrollment.user_id]
+                if course is not None:
+                    enrollment.course = course
+                    enrollment._course_overview = course  # pylint: disable=protected-access
+                enrollments[enrollment.user_id] = enrollment
+                if created or enrollment.user_id in changed_user_ids:
+                    models.signals.post_save.send(
+                        sender=cls, instance=enrollment, created=created, update_fields=None, raw=False,
+                        using=enrollment._state.db,  # pylint: disable=protected-access
+                    )
+
+        cache.delete_many([
+            cls.enrollment_status_hash_cache_key(enrollment.user)
+            for enrollment in chain(created_enrollments, changed_enrollments)
+        ])
+        for enrollment in enrollments.values():
+            cls._update_enrollment_in_request_cache(
+                enrollment.user,
+                course_key,
+                CourseEnrollmentState(enrollment.mode, enrollment.is_active),
+            )
+
+        transaction.on_commit(partial(
+            cls._send_bulk_enroll_events,
+            [enrollments[user.id] for user in users_to_enroll],
+            changes_by_user_id,
+            course_data,
+            enterprise_uuid,
+        ))
+        return enrollments
+
+    @classmethod
+    def _send_bulk_enroll_events(cls, enrollments, changes_by_user_id, course_data, enterprise_uuid):
+        """
+        Sends the signals and emits the events for the enrollments written by
+        bulk_enroll, in batches of BULK_ENROLL_EVENTS_BATCH_SIZE.
+        """
+        for start in range(0, len(enrollments), BULK_ENROLL_EVENTS_BATCH_SIZE):
+            for enrollment in enrollments[start:start + BULK_ENROLL_EVENTS_BATCH_SIZE]:
+                activation_changed, mode_changed = changes_by_user_id[enrollment.user_id]
+                try:
+                    enrollment._send_enrollment_update_events(  # pylint: disable=protected-access
+                        activation_changed, mode_changed, course_data, enterprise_uuid=enterprise_uuid,
+                    )
+                    enrollment._send_enroll_events(course_data)  # pylint: disable=protected-access
+                except Exception:  # pylint: disable=broad-except
+                    # Keep going, so that one failing receiver doesn't stop the other learners' events being sent.
+                    log.exception(
+                        "Unable to send the enrollment events for user %s in course %s",
+                        enrollment.user.username,
+                        enrollment.course_id,
+                    )
+            log.info(
+                "Sent the enrollment events for %d of %d bulk enrollments in course %s",
+                min(start + BULK_ENROLL_EVENTS_BATCH_SIZE, len(enrollments)),
+                len(enrollments),
+                course_data.course_key,
+            )
 
     @classmethod
     def enroll_by_email(cls, email, course_id, mode=None, ignore_errors=True):
@@ -1332,11 +1517,16 @@ class CourseEnrollment(models.Model):
             return CourseEnrollmentState(None, None)
         enrollment_state = cls._get_enrollment_in_request_cache(user, course_key)
         if not enrollment_state:
-            try:
-                record = cls.objects.get(user=user, course_id=course_key)
-                enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
-            except cls.DoesNotExist:
-                enrollment_state = CourseEnrollmentState(None, None)
+            enrollment_states, generations = cls._get_enrollment_states_in_shared_cache([user.id], course_key)
+            enrollment_state = enrollment_states.get(user.id)
+            if not enrollment_state:
+                generations = cls._start_enrollment_cache_generations([user.id], generations)
+                try:
+                    record = cls.objects.get(user=user, course_id=course_key)
+                    enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
+                except cls.DoesNotExist:
+                    enrollment_state = CourseEnrollmentState(None, None)
+                cls._set_enrollment_states_in_shared_cache({user.id: enrollment_state}, course_key, generations)
             cls._update_enrollment_in_request_cache(user, course_key, enrollment_state)
         return enrollment_state
 
@@ -1350,11 +1540,52 @@ class CourseEnrollment(models.Model):
         # remove previously cached entries to keep memory usage low.
         RequestCache(cls.MODE_CACHE_NAMESPACE).clear()
 
-        records = cls.objects.filter(user__in=users, course_id=course_key).select_related('user')
+        user_ids = [user.id for user in users]
+        enrollment_states, generations = cls._get_enrollment_states_in_shared_cache(user_ids, course_key)
+        uncached_user_ids = [user_id for user_id in user_ids if user_id not in enrollment_states]
+        if uncached_user_ids:
+            generations = cls._start_enrollment_cache_generations(uncached_user_ids, generations)
+            records = cls.objects.filter(user_id__in=uncached_user_ids, course_id=course_key)
+            fetched_states = {
+                record.user_id: CourseEnrollmentState(record.mode, record.is_active) for record in records
+            }
+            # Users without an enrollment are cached too, as enrollment_status does.
+            for user_id in uncached_user_ids:
+                fetched_states.setdefault(user_id, CourseEnrollmentState(None, None))
+            cls._set_enrollment_states_in_shared_cache(fetched_states, course_key, generations)
+            enrollment_states.update(fetched_states)
+
         cache = cls._get_mode_active_request_cache()  # lint-amnesty, pylint: disable=redefined-outer-name
-        for record in records:
-            enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
-            cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
+        for user_id, enrollment_state in enrollment_states.items():
+            cls._update_enrollment(cache, user_id, course_key, enrollment_state)
+
+    @classmethod
+    def enrollment_states_are_cached(cls, users, course_key):
+        """
+        Returns whether the enrollment states of all the given users in the
+        given course are in the request cache.
+        """
+        cache = cls._get_mode_active_request_cache()  # lint-amnesty, pylint: disable=redefined-outer-name
+        return all((user.id, course_key) in cache for user in users)
+
+    @classmethod
+    def bulk_cache_enrollments(cls, users, course_key, select_related=None):
+        """
+        Bulk pre-fetches the enrollments of the given users in the given
+        course, for later fast retrieval by get_enrollment (called with the
+        same select_related).
+        """
+        request_cache = RequestCache('get_enrollment')
+        query = cls.objects.filter(user__in=users, course_id=course_key)
+        if select_related is not None:
+            query = query.select_related(*select_related)
+        enrollments = {enrollment.user_id: enrollment for enrollment in query}
+        for user in users:
+            if select_related:
+                cache_key = (user.id, course_key, ','.join(select_related))
+            else:
+                cache_key = (user.id, course_key)
+            request_cache.set(cache_key, enrollments.get(user.id))
 
     @classmethod
     def _get_mode_active_request_cache(cls):
@@ -1387,6 +1618,192 @@ class CourseEnrollment(models.Model):
         """
         cache[(user_id, course_key)] = enrollment_state
 
+    @classmethod
+    def enrollment_states_for_user(cls, user):
+        """
+        Returns the CourseEnrollmentStates of all of the user's enrollments
+        (active or not), keyed by course key.
+
+        The states are cached in the shared cache until any of the user's
+        enrollments changes, and are added to the request cache, so that pages
+        listing the user's enrollments (such as the dashboard) don't need to
+        query them on every request.
+        """
+        assert user
+
+        if user.is_anonymous:
+            return {}
+
+        generation_key = cls._enrollment_cache_generation_key(user.id)
+        states_key = cls.USER_ENROLLMENT_STATES_CACHE_KEY.format(
+            version=cls.ENROLLMENT_STATE_CACHE_VERSION, user_id=user.id,
+        )
+        cached = cache.get_many([generation_key, states_key])
+        generation = cached.get(generation_key)
+        cached_generation, cached_states = cached.get(states_key, (None, None))
+        if generation is not None and cached_generation == generation:
+            cls._record_enrollment_state_cache_lookups(hits=1, misses=0)
+            enrollment_states = {
+                CourseKey.from_string(course_id): CourseEnrollmentState(*enrollment_state)
+                for course_id, enrollment_state in cached_states
+            }
+        else:
+            cls._record_enrollment_state_cache_lookups(hits=0, misses=1)
+            if generation is None:
+                generation = cls._start_enrollment_cache_generation(user.id)
+            enrollment_states = {
+                course_id: CourseEnrollmentState(mode, is_active)
+                for course_id, mode, is_active in cls.objects.filter(user=user).values_list(
+                    'course_id', 'mode', 'is_active',
+                )
+            }
+            if generation is not None:
+                cached_states = [
+                    (str(course_id), tuple(enrollment_state))
+                    for course_id, enrollment_state in enrollment_states.items()
+                ]
+                cache.set(states_key, (generation, cached_states), settings.COURSE_ENROLLMENT_STATE_CACHE_TIMEOUT)
+
+        for course_id, enrollment_state in enrollment_states.items():
+            cls._update_enrollment_in_request_cache(user, course_id, enrollment_state)
+        return enrollment_states
+
+    @classmethod
+    def _enrollment_state_cache_key(cls, user_id, course_key):
+        """
+        Returns the shared cache key for the user's enrollment state in the
+        course.
+        """
+        return cls.ENROLLMENT_STATE_CACHE_KEY.format(
+            version=cls.ENROLLMENT_STATE_CACHE_VERSION, user_id=user_id, course_key=course_key,
+        )
+
+    @classmethod
+    def _enrollment_cache_generation_key(cls, user_id):
+        """
+        Returns the shared cache key for the user's enrollment cache
+        generation.
+        """
+        return cls.ENROLLMENT_CACHE_GENERATION_KEY.format(user_id=user_id)
+
+    @classmethod
+    def _get_enrollment_states_in_shared_cache(cls, user_ids, course_key):
+        """
+        Returns the cached CourseEnrollmentStates of the given users in the
+        course that are up to date, keyed by user id, and the users' current
+        cache generations, keyed by user id, with a single cache lookup.
+        """
+        generation_keys = {user_id: cls._enrollment_cache_generation_key(user_id) for user_id in user_ids}
+        state_keys = {user_id: cls._enrollment_state_cache_key(user_id, course_key) for user_id in user_ids}
+        cached = cache.get_many(list(generation_keys.values()) + list(state_keys.values()))
+
+        generations = {
+            user_id: cached[generation_key]
+            for user_id, generation_key in generation_keys.items()
+            if generation_key in cached
+        }
+        enrollment_states = {}
+        for user_id, state_key in state_keys.items():
+            generation, enrollment_state = cached.get(state_key, (None, None))
+            # States cached before the user's latest enrollment change are out of date.
+            if generation is not None and generation == generations.get(user_id):
+                enrollment_states[user_id] = CourseEnrollmentState(*enrollment_state)
+
+        cls._record_enrollment_state_cache_lookups(
+            hits=len(enrollment_states), misses=len(user_ids) - len(enrollment_states),
+        )
+        return enrollment_states, generations
+
+    @classmethod
+    def _set_enrollment_states_in_shared_cache(cls, enrollment_states, course_key, generations):
+        """
+        Caches the given CourseEnrollmentStates of users in the course, keyed by
+        user id, in the shared cache, as of the given cache generations of the
+        users, keyed by user id.
+
+        The states of users without a generation (because the cache couldn't
+        hold it) aren't cached.
+        """
+        cached_states = {
+            cls._enrollment_state_cache_key(user_id, course_key): (generations[user_id], tuple(enrollment_state))
+            for user_id, enrollment_state in enrollment_states.items()
+            if generations.get(user_id) is not None
+        }
+        if cached_states:
+            cache.set_many(cached_states, settings.COURSE_ENROLLMENT_STATE_CACHE_TIMEOUT)
+
+    @classmethod
+    def _start_enrollment_cache_generations(cls, user_ids, generations):
+        """
+        Starts new enrollment cache generations for those of the given users
+        who don't have one in the given generations, keyed by user id, with one
+        write to and one read from the shared cache, and returns the users'
+        current generations, keyed by user id.
+
+        This is called before the users' enrollment states are read from the
+        database, so that states cached as of these generations are invalidated
+        by any enrollment change committed after they were read.
+        """
+        missing_keys = {
+            cls._enrollment_cache_generation_key(user_id): user_id
+            for user_id in user_ids
+            if user_id not in generations
+        }
+        if not missing_keys:
+            return generations
+        # The cache has no bulk add, so a generation started by another process in the meantime may be replaced.
+        # That only means that the states it cached aren't used.
+        cache.set_many({key: uuid.uuid4().int & 0xffffffff for key in missing_keys}, None)
+        started = cache.get_many(list(missing_keys))
+        return {
+            **generations,
+            **{missing_keys[key]: generation for key, generation in started.items()},
+        }
+
+    @classmethod
+    def _start_enrollment_cache_generation(cls, user_id):
+        """
+        Starts a new enrollment cache generation for the user, if they don't
+        have one, and returns the user's current generation.
+
+        Generations start at a random number rather than at zero, so that states
+        cached before a generation was evicted from the cache aren't mistaken for
+        states of the new generation.
+        """
+        generation_key = cls._enrollment_cache_generation_key(user_id)
+        cache.add(generation_key, uuid.uuid4().int & 0xffffffff, None)
+        return cache.get(generation_key)
+
+    @classmethod
+    def _bump_enrollment_cache_generation(cls, user_id):
+        """
+        Bumps the user's enrollment cache generation, invalidating all of their
+        enrollment states in the shared cache, and returns the new generation.
+        """
+        try:
+            return cache.incr(cls._enrollment_cache_generation_key(user_id))
+        except ValueError:
+            # The user has no generation in the cache, so none of their enrollment states are cached either.
+            return cls._start_enrollment_cache_generation(user_id)
+
+    @classmethod
+    def _update_enrollment_in_shared_cache(cls, user_id, course_key, enrollment_state):
+        """
+        Writes the user's new enrollment state in the course through to the
+        shared cache, invalidating their other cached enrollment states.
+        """
+        generation = cls._bump_enrollment_cache_generation(user_id)
+        cls._set_enrollment_states_in_shared_cache({user_id: enrollment_state}, course_key, {user_id: generation})
+
+    @classmethod
+    def _record_enrollment_state_cache_lookups(cls, hits, misses):
+        """
+        Records the number of enrollment state lookups served by the shared
+        cache, and the number that missed it, for monitoring its hit rate.
+        """
+        monitoring_utils.accumulate('course_enrollment.state_cache.hits', hits)
+        monitoring_utils.accumulate('course_enrollment.state_cache.misses', misses)
+
     @classmethod
     def get_active_enrollments_in_course(cls, course_key):
         """
@@ -1431,6 +1848,31 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
     cache.delete(cache_key)
 
 
+@receiver(models.signals.post_save, sender=CourseEnrollment)
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+def update_enrollment_state_cache(sender, instance, signal, **kwargs):  # pylint: disable=unused-argument
+    """
+    Write the enrollment's new state through to the shared enrollment state
+    cache.
+
+    The user's cached enrollment states are invalidated straight away, and the
+    new state is written once the transaction has been committed, so that any
+    state read and cached by another request in the meantime is invalidated too.
+    """
+    if signal is models.signals.post_delete:
+        enrollment_state = CourseEnrollmentState(None, None)
+    else:
+        enrollment_state = CourseEnrollmentState(instance.mode, instance.is_active)
+
+    CourseEnrollment._bump_enrollment_cache_generation(instance.user_id)  # pylint: disable=protected-access
+    transaction.on_commit(partial(
+        CourseEnrollment._update_enrollment_in_shared_cache,  # pylint: disable=protected-access
+        instance.user_id,
+        instance.course_id,
+        enrollment_state,
+    ))
+
+
 @receiver(models.signals.post_save, sender=CourseEnrollment)
 def update_expiry_email_date(sender, instance, **kwargs):  # pylint: disable=unused-argument
     """
@@ -1475,6 +1917,29 @@ class ManualEnrollmentAudit(models.Model):
             role=role,
         )
 
+    @classmethod
+    def bulk_create_manual_enrollment_audits(cls, user, audits):
+        """
+        saves the student manual enrollment information for many enrollments at once.
+
+        `audits` is a list of dicts of the arguments to create_manual_enrollment_audit (other than `user`).
+        """
+        return bulk_create_with_history(
+            [
+                cls(
+                    enrolled_by=user,
+                    enrolled_email=audit['email'],
+                    state_transition=audit['state_transition'],
+                    reason=audit['reason'],
+                    enrollment=audit.get('enrollment'),
+                    role=audit.get('role'),
+                )
+                for audit in audits
+            ],
+            cls,
+            default_user=user,
+        )
+
     @classmethod
     def get_manual_enrollment_by_email(cls, email):
         """
@@ -1,6 +1,9 @@
 # lint-amnesty, pylint: disable=missing-module-docstring
 import datetime
 import hashlib
+import os
+import time
+import unittest
 from unittest import mock
 
 import ddt
@@ -9,8 +12,11 @@ from crum import set_current_request
 from django.contrib.auth.models import AnonymousUser, User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.core.cache import cache
 from django.conf import settings
+from django.db import connection
 from django.db.models.functions import Lower
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles.testutils import override_waffle_flag
 from freezegun import freeze_time
 from opaque_keys.edx.keys import CourseKey
@@ -20,10 +26,12 @@ from common.djangoapps.course_modes.models import CourseMode
 from common.djangoapps.course_modes.tests.factories import CourseModeFactory
 from common.djangoapps.student.models import (
     ALLOWEDTOENROLL_TO_ENROLLED,
+    ENROLL_STATUS_CHANGE,
     IS_MARKETABLE,
     AccountRecovery,
     CourseEnrollment,
     CourseEnrollmentAllowed,
+    EnrollStatusChange,
     ManualEnrollmentAudit,
     PendingEmailChange,
     PendingNameChange,
@@ -121,6 +129,93 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):  # lint-amnesty, pylint:
         CourseEnrollmentFactory.create(user=self.user)
         assert cache.get(CourseEnrollment.enrollment_status_hash_cache_key(self.user)) is None
 
+    def test_enrollment_state_cached_across_requests(self):
+        """ Enrollment states should be read from the shared cache once the request cache is cleared. """
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseEnrollment.enroll(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(0):
+            assert CourseEnrollment.is_enrolled(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(0):
+            assert CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id) == ('audit', True)  # lint-amnesty, pylint: disable=no-member
+
+        # Unenrolling should write the new state through to the cache.
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseEnrollment.unenroll(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(0):
+            assert not CourseEnrollment.is_enrolled(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+
+    def test_enrollment_state_cache_survives_lost_write(self):
+        """ A cached enrollment state should not be read once the enrollment has changed, even if writing through the
+        new state to the cache failed. """
+        assert not CourseEnrollment.is_enrolled(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+
+        with mock.patch.object(CourseEnrollment, '_update_enrollment_in_shared_cache'):
+            with self.captureOnCommitCallbacks(execute=True):
+                CourseEnrollment.enroll(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+        RequestCache.clear_all_namespaces()
+
+        assert CourseEnrollment.is_enrolled(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+
+    def test_bulk_fetch_enrollment_states_cached_across_requests(self):
+        """ bulk_fetch_enrollment_states should only query the states that are not in the shared cache. """
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')  # lint-amnesty, pylint: disable=no-member
+        CourseEnrollment.bulk_fetch_enrollment_states([self.user, self.user_2], self.course.id)  # lint-amnesty, pylint: disable=no-member
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(0):
+            CourseEnrollment.bulk_fetch_enrollment_states([self.user, self.user_2], self.course.id)  # lint-amnesty, pylint: disable=no-member
+            assert CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id) == ('verified', True)  # lint-amnesty, pylint: disable=no-member
+            assert CourseEnrollment.enrollment_mode_for_user(self.user_2, self.course.id) == (None, None)  # lint-amnesty, pylint: disable=no-member
+
+    def test_bulk_fetch_enrollment_states_cold_cache(self):
+        """ bulk_fetch_enrollment_states should start the missing cache generations of all the users at once. """
+        users = [UserFactory() for __ in range(5)]
+        with mock.patch('common.djangoapps.student.models.course_enrollment.cache', wraps=cache) as mock_cache:
+            CourseEnrollment.bulk_fetch_enrollment_states(users, self.course.id)  # lint-amnesty, pylint: disable=no-member
+        assert [name for name, __, __ in mock_cache.method_calls] == ['get_many', 'set_many', 'get_many', 'set_many']
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(0):
+            CourseEnrollment.bulk_fetch_enrollment_states(users, self.course.id)  # lint-amnesty, pylint: disable=no-member
+
+    def test_enrollment_states_for_user(self):
+        """ A user's enrollment states should be cached until any of their enrollments changes. """
+        other_course = CourseFactory()
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')  # lint-amnesty, pylint: disable=no-member
+        expected = {self.course.id: ('verified', True)}  # lint-amnesty, pylint: disable=no-member
+        assert CourseEnrollment.enrollment_states_for_user(self.user) == expected
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(0):
+            assert CourseEnrollment.enrollment_states_for_user(self.user) == expected
+            assert CourseEnrollment.is_enrolled(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+
+        CourseEnrollmentFactory.create(user=self.user, course_id=other_course.id, is_active=False)
+        expected[other_course.id] = ('audit', False)
+        assert CourseEnrollment.enrollment_states_for_user(self.user) == expected
+
+    def test_enrollment_states_for_user_changed_while_read(self):
+        """ Enrollment states read before an enrollment change was committed should not be used once it is. """
+        cache.delete(CourseEnrollment._enrollment_cache_generation_key(self.user.id))  # pylint: disable=protected-access
+        filter_enrollments = CourseEnrollment.objects.filter
+
+        def filter_and_change_enrollment(*args, **kwargs):
+            enrollments = filter_enrollments(*args, **kwargs)
+            # Another process commits an enrollment change for the user before the query is run.
+            CourseEnrollment._bump_enrollment_cache_generation(self.user.id)  # pylint: disable=protected-access
+            return enrollments
+
+        with mock.patch.object(CourseEnrollment.objects, 'filter', side_effect=filter_and_change_enrollment):
+            CourseEnrollment.enrollment_states_for_user(self.user)
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(1):
+            CourseEnrollment.enrollment_states_for_user(self.user)
+
     def test_users_enrolled_in_active_only(self):
         """CourseEnrollment.users_enrolled_in should return only Users with active enrollments when
         `include_inactive` has its default value (False)."""
@@ -251,6 +346,104 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):  # lint-amnesty, pylint:
         assert enrollment_refetched.exists()
         assert enrollment_refetched.all()[0] == enrollment
 
+    def _enroll_and_capture_events(self, enroll):
+        """
+        Call `enroll`, and return the names of the tracking events emitted and
+        the (user id, mode, is_active) of each enrollment status change signal.
+        """
+        signals = []
+
+        def record_signal(sender, event=None, user=None, mode=None, **kwargs):  # pylint: disable=unused-argument
+            if event == EnrollStatusChange.enroll:
+                signals.append((user.id, mode))
+
+        ENROLL_STATUS_CHANGE.connect(record_signal)
+        try:
+            with mock.patch('common.djangoapps.student.models.course_enrollment.tracker') as mock_tracker:
+                with self.captureOnCommitCallbacks(execute=True):
+                    enroll()
+        finally:
+            ENROLL_STATUS_CHANGE.disconnect(record_signal)
+        events = [call[0][0] for call in mock_tracker.emit.call_args_list]
+        return events, signals
+
+    def test_bulk_enroll(self):
+        """ bulk_enroll should enroll, reactivate and re-mode users as enroll does. """
+        new_user = UserFactory()
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='audit', is_active=False)  # lint-amnesty, pylint: disable=no-member
+        CourseEnrollmentFactory.create(user=self.user_2, course_id=self.course.id, mode='verified', is_active=True)  # lint-amnesty, pylint: disable=no-member
+
+        enrollments = CourseEnrollment.bulk_enroll(
+            [self.user, self.user_2, new_user], self.course.id, mode='verified',  # lint-amnesty, pylint: disable=no-member
+        )
+
+        assert set(enrollments) == {self.user.id, self.user_2.id, new_user.id}
+        for user in (self.user, self.user_2, new_user):
+            enrollment = CourseEnrollment.objects.get(user=user, course_id=self.course.id)  # lint-amnesty, pylint: disable=no-member
+            assert enrollment.is_active
+            assert enrollment.mode == 'verified'
+            assert enrollment.history.count() >= 1
+            assert enrollments[user.id].id == enrollment.id
+
+    def test_bulk_enroll_events(self):
+        """ bulk_enroll should emit the same events and signals as enrolling each user in turn. """
+        course = CourseFactory()
+        users = [UserFactory() for __ in range(3)]
+        bulk_users = [UserFactory() for __ in range(3)]
+        CourseEnrollmentFactory.create(user=users[0], course_id=course.id, is_active=False)
+        CourseEnrollmentFactory.create(user=bulk_users[0], course_id=course.id, is_active=False)
+
+        def enroll_each():
+            for user in users:
+                CourseEnrollment.enroll(user, course.id)
+
+        events, signals = self._enroll_and_capture_events(enroll_each)
+        bulk_events, bulk_signals = self._enroll_and_capture_events(
+            lambda: CourseEnrollment.bulk_enroll(bulk_users, course.id)
+        )
+
+        assert sorted(bulk_events) == sorted(events)
+        assert len(bulk_signals) == len(signals) == len(users)
+        assert [mode for __, mode in bulk_signals] == [mode for __, mode in signals]
+
+    def test_bulk_enroll_query_count(self):
+        """ The number of queries made by bulk_enroll should not grow with the number of users. """
+        course = CourseFactory()
+        few_users = [UserFactory() for __ in range(2)]
+        many_users = [UserFactory() for __ in range(10)]
+        CourseEnrollment.bulk_enroll([UserFactory()], course.id)
+
+        with CaptureQueriesContext(connection) as few_queries:
+            CourseEnrollment.bulk_enroll(few_users, course.id)
+        with CaptureQueriesContext(connection) as many_queries:
+            CourseEnrollment.bulk_enroll(many_users, course.id)
+
+        assert len(many_queries) == len(few_queries)
+
+    @unittest.skipUnless(os.environ.get('RUN_PERF_TESTS'), 'Set RUN_PERF_TESTS to run the bulk enrollment benchmark')
+    def test_bulk_enroll_benchmark(self):
+        """ Compare the time taken to enroll users one at a time and in bulk. """
+        course = CourseFactory()
+        user_count = int(os.environ.get('BULK_ENROLL_BENCHMARK_USERS', 200))
+        users = [UserFactory() for __ in range(user_count)]
+        bulk_users = [UserFactory() for __ in range(user_count)]
+
+        start = time.perf_counter()
+        with self.captureOnCommitCallbacks(execute=True):
+            for user in users:
+                CourseEnrollment.enroll(user, course.id)
+        enroll_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseEnrollment.bulk_enroll(bulk_users, course.id)
+        bulk_enroll_seconds = time.perf_counter() - start
+
+        print(
+            f'Enrolled {user_count} users in {enroll_seconds:.2f}s one at a time, '
+            f'and in {bulk_enroll_seconds:.2f}s in bulk'
+        )
+
 
 @override_waffle_flag(COURSEWARE_MICROFRONTEND_PROGRESS_MILESTONES, active=True)
 @override_waffle_flag(COURSEWARE_MICROFRONTEND_PROGRESS_MILESTONES_STREAK_CELEBRATION, active=True)
@@ -677,6 +870,30 @@ class TestManualEnrollmentAudit(SharedModuleStoreTestCase):
         assert not ManualEnrollmentAudit.objects.filter(enrollment=enrollment).exclude(enrolled_email='xxx')
         assert not ManualEnrollmentAudit.objects.filter(enrollment=enrollment).exclude(reason='')
 
+    def test_bulk_create_manual_enrollment_audits(self):
+        """
+        Tests that bulk_create_manual_enrollment_audits creates an audit for
+        each of the given enrollments, with its history.
+        """
+        enrollment = CourseEnrollment.enroll(self.user, self.course.id)  # lint-amnesty, pylint: disable=no-member
+        ManualEnrollmentAudit.bulk_create_manual_enrollment_audits(self.instructor, [
+            {
+                'email': self.user.email,
+                'state_transition': ALLOWEDTOENROLL_TO_ENROLLED,
+                'reason': 'manually enrolling unenrolled user',
+                'enrollment': enrollment,
+            },
+            {
+                'email': 'unregistered@example.com',
+                'state_transition': ALLOWEDTOENROLL_TO_ENROLLED,
+                'reason': 'manually enrolling unregistered user',
+            },
+        ])
+        audits = ManualEnrollmentAudit.objects.filter(enrolled_by=self.instructor)
+        assert audits.count() == 2
+        assert audits.get(enrollment=enrollment).enrolled_email == self.user.email
+        assert audits.get(enrolled_email='unregistered@example.com').enrollment is None
+
 
 class TestAccountRecovery(TestCase):
     """
@@ -471,7 +471,10 @@ def show_load_all_courses_link(user, course_limit, course_enrollments):
     if course_limit is None:
         return False
 
-    total_enrollments = CourseEnrollment.enrollments_for_user(user).count()
+    total_enrollments = sum(
+        1 for enrollment_state in CourseEnrollment.enrollment_states_for_user(user).values()
+        if enrollment_state.is_active
+    )
     return len(course_enrollments) < total_enrollments
 
 
@@ -26,6 +26,7 @@ from common.djangoapps.student.models import CourseEnrollment
 from lms.djangoapps.branding import api as branding_api
 from lms.djangoapps.certificates.generation_handler import (
     generate_certificate_task as _generate_certificate_task,
+    generate_course_certificates_task as _generate_course_certificates_task,
     is_on_certificate_allowlist as _is_on_certificate_allowlist
 )
 from lms.djangoapps.certificates.config import AUTO_CERTIFICATE_GENERATION as _AUTO_CERTIFICATE_GENERATION
@@ -268,6 +269,21 @@ def generate_certificate_task(user, course_key, generation_mode=None):
     return _generate_certificate_task(user, course_key, generation_mode)
 
 
+def generate_course_certificates_task(course_key, users, generation_mode=None):
+    """
+    Create tasks to generate certificates for these users in this course run, for those users who are eligible and for
+    whom a certificate can be generated. Each task generates the certificates of a batch of users, so this should be
+    used instead of generate_certificate_task when generating certificates for many users in a course run.
+
+    Args:
+        course_key: course run key for which to generate certificates
+        users: users for whom to generate certificates
+        generation_mode: Used when emitting an events. Options are "self" (implying the user generated the cert
+            themself) and "batch" for everything else.
+    """
+    return _generate_course_certificates_task(course_key, users, generation_mode)
+
+
 def certificate_downloadable_status(student, course_key):
     """
     Check the student existing certificates against a given course.
@@ -8,6 +8,7 @@ cannot be generated, a message is logged and no further action is taken.
 
 import logging
 from django.conf import settings
+from edx_django_utils.cache import RequestCache
 from openedx_filters.learning.filters import CertificateCreationRequested
 
 from common.djangoapps.course_modes import api as modes_api
@@ -19,15 +20,23 @@ from lms.djangoapps.certificates.models import (
     CertificateInvalidation,
     GeneratedCertificate
 )
-from lms.djangoapps.certificates.tasks import CERTIFICATE_DELAY_SECONDS, generate_certificate
+from lms.djangoapps.certificates.generation import generate_course_certificate
+from lms.djangoapps.certificates.tasks import (
+    CERTIFICATE_DELAY_SECONDS,
+    generate_certificate,
+    generate_course_certificates
+)
 from lms.djangoapps.certificates.utils import has_html_certificates_enabled
-from lms.djangoapps.grades.api import CourseGradeFactory
-from lms.djangoapps.instructor.access import is_beta_tester
+from lms.djangoapps.grades.api import CourseGradeFactory, clear_prefetched_course_grades, prefetch_course_grades
+from lms.djangoapps.instructor.access import is_beta_tester, list_with_level
 from lms.djangoapps.verify_student.services import IDVerificationService
 from openedx.core.djangoapps.content.course_overviews.api import get_course_overview_or_none
 
 log = logging.getLogger(__name__)
 
+# Request cache namespace for the eligibility data prefetched by generate_course_certificates_for_users
+CERTIFICATE_GENERATION_CACHE_NAMESPACE = 'certificates.generation_handler'
+
 
 class GeneratedCertificateException(Exception):
     pass
@@ -56,6 +65,81 @@ def generate_certificate_task(user, course_key, generation_mode=None, delay_seco
                                               delay_seconds=delay_seconds)
 
 
+def generate_course_certificates_task(course_key, users, generation_mode=None,
+                                      delay_seconds=CERTIFICATE_DELAY_SECONDS):
+    """
+    Create tasks to generate certificates for these users in this course run, for those users who are eligible and for
+    whom a certificate can be generated.
+
+    Rather than creating a task per user, the users are split into batches of
+    settings.CERTIFICATE_GENERATION_BATCH_SIZE and a single task is created for each batch. Each task checks the
+    eligibility of all of its users with bulk queries, and generates their certificates itself.
+
+    Returns the number of tasks created.
+    """
+    user_ids = [user.id for user in users]
+    batch_size = settings.CERTIFICATE_GENERATION_BATCH_SIZE
+    task_count = 0
+    for start in range(0, len(user_ids), batch_size):
+        kwargs = {
+            'course_key': str(course_key),
+            'user_ids': user_ids[start:start + batch_size],
+        }
+        if generation_mode is not None:
+            kwargs['generation_mode'] = generation_mode
+        generate_course_certificates.apply_async(countdown=delay_seconds, kwargs=kwargs)
+        task_count += 1
+
+    log.info(f'Created {task_count} tasks to generate course certificates for {len(user_ids)} users in {course_key}')
+    return task_count
+
+
+def generate_course_certificates_for_users(course_key, users, generation_mode=None):
+    """
+    Generate certificates for these users in this course run, for those users who are eligible and for whom a
+    certificate can be generated. This should be called from a task.
+
+    The same eligibility checks are made (and certificate statuses set) as by generate_certificate_task, but the data
+    they need is prefetched for all of the users, and certificates are generated directly rather than in a task per
+    user.
+
+    An error generating one user's certificate is logged, and doesn't stop certificates from being generated for the
+    other users.
+
+    Returns the number of users for whom a certificate was generated or had its status set.
+    """
+    users = list(users)
+    generated_count = 0
+    failed_count = 0
+    _prefetch_certificate_generation_data(course_key, users)
+    try:
+        for user in users:
+            try:
+                if generate_certificate_task(user, course_key, generation_mode=generation_mode):
+                    generated_count += 1
+            except CertificateGenerationNotAllowed:
+                log.error(
+                    "Certificate generation not allowed for user %s in course %s",
+                    user.id,
+                    course_key,
+                )
+            except Exception:  # pylint: disable=broad-except
+                failed_count += 1
+                log.exception(
+                    "Error generating a course certificate for user %s in course %s",
+                    user.id,
+                    course_key,
+                )
+    finally:
+        _clear_prefetched_certificate_generation_data(course_key)
+
+    log.info(
+        f'Generated or updated course certificates for {generated_count} of {len(users)} users in {course_key}, '
+        f'failed for {failed_count} users'
+    )
+    return generated_count
+
+
 def generate_allowlist_certificate_task(user, course_key, generation_mode=None,
                                         delay_seconds=CERTIFICATE_DELAY_SECONDS):
     """
@@ -133,6 +217,15 @@ def _generate_certificate_task(user, course_key, enrollment_mode, course_grade,
         'enrollment_mode': str(enrollment_mode),
         'course_grade': str(course_grade_val)
     }
+    if _get_prefetched_data(user, course_key) is not None:
+        # Certificates are being generated in bulk from a task, so generate the certificate now
+        generate_course_certificate(
+            user=user, course_key=course_key, status=status or CertificateStatuses.downloadable,
+            enrollment_mode=kwargs['enrollment_mode'], course_grade=kwargs['course_grade'],
+            generation_mode=generation_mode or 'batch',
+        )
+        return True
+
     if status is not None:
         kwargs['status'] = status
     if generation_mode is not None:
@@ -172,7 +265,7 @@ def _can_generate_regular_certificate(user, course_key, enrollment_mode, course_
         log.info(f'{course_key} is a CCX course. Certificate cannot be generated for {user.id}.')
         return False
 
-    if is_beta_tester(user, course_key):
+    if _is_beta_tester(user, course_key):
         log.info(f'{user.id} is a beta tester in {course_key}. Certificate cannot be generated.')
         return False
 
@@ -195,7 +288,7 @@ def _can_generate_certificate_common(user, course_key, enrollment_mode):
 
     This method contains checks that are common to both allowlist and regular course certificates.
     """
-    if CertificateInvalidation.has_certificate_invalidation(user, course_key):
+    if _has_certificate_invalidation(user, course_key):
         # The invalidation list prevents certificate generation
         log.info(f'{user.id} : {course_key} is on the certificate invalidation list. Certificate cannot be generated.')
         return False
@@ -212,7 +305,7 @@ def _can_generate_certificate_common(user, course_key, enrollment_mode):
 
     # If the IDV check fails we then check if the course-run requires ID verification. Honor and Professional-No-ID
     # modes do not require IDV for certificate generation.
-    if _id_verification_enforced_and_missing(user):
+    if _id_verification_enforced_and_missing(user, course_key):
         if enrollment_mode not in CourseMode.NON_VERIFIED_MODES:
             log.info(f'{user.id} does not have a verified id. Certificate cannot be generated for {course_key}.')
             return False
@@ -223,7 +316,7 @@ def _can_generate_certificate_common(user, course_key, enrollment_mode):
     if not _can_generate_certificate_for_status(user, course_key, enrollment_mode):
         return False
 
-    course_overview = get_course_overview_or_none(course_key)
+    course_overview = _get_course_overview(course_key)
     if not course_overview:
         log.info(f'{course_key} does not a course overview. Certificate cannot be generated for {user.id}.')
         return False
@@ -246,7 +339,7 @@ def _set_allowlist_cert_status(user, course_key, enrollment_mode, course_grade):
     if not _can_set_allowlist_cert_status(user, course_key, enrollment_mode):
         return None
 
-    cert = GeneratedCertificate.certificate_for_student(user, course_key)
+    cert = _get_certificate(user, course_key)
     return _get_cert_status_common(user, course_key, enrollment_mode, course_grade, cert)
 
 
@@ -260,12 +353,12 @@ def _set_regular_cert_status(user, course_key, enrollment_mode, course_grade):
     if not _can_set_regular_cert_status(user, course_key, enrollment_mode):
         return None
 
-    cert = GeneratedCertificate.certificate_for_student(user, course_key)
+    cert = _get_certificate(user, course_key)
     status = _get_cert_status_common(user, course_key, enrollment_mode, course_grade, cert)
     if status is not None:
         return status
 
-    if not _id_verification_enforced_and_missing(user) \
+    if not _id_verification_enforced_and_missing(user, course_key) \
             and not _is_passing_grade(course_grade) \
             and cert is not None:
         if cert.status != CertificateStatuses.notpassing:
@@ -283,12 +376,12 @@ def _get_cert_status_common(user, course_key, enrollment_mode, course_grade, cer
     This is used when a downloadable cert cannot be generated, but we want to provide more info about why it cannot
     be generated.
     """
-    if CertificateInvalidation.has_certificate_invalidation(user, course_key) and cert is not None:
+    if _has_certificate_invalidation(user, course_key) and cert is not None:
         if cert.status != CertificateStatuses.unavailable:
             cert.invalidate(mode=enrollment_mode, source='certificate_generation')
         return CertificateStatuses.unavailable
 
-    if _id_verification_enforced_and_missing(user) and _has_passing_grade_or_is_allowlisted(
+    if _id_verification_enforced_and_missing(user, course_key) and _has_passing_grade_or_is_allowlisted(
         user, course_key, course_grade
     ):
         if cert is None:
@@ -319,7 +412,7 @@ def _can_set_regular_cert_status(user, course_key, enrollment_mode):
     if _is_ccx_course(course_key):
         return False
 
-    if is_beta_tester(user, course_key):
+    if _is_beta_tester(user, course_key):
         return False
 
     return _can_set_cert_status_common(user, course_key, enrollment_mode)
@@ -338,7 +431,7 @@ def _can_set_cert_status_common(user, course_key, enrollment_mode):
     if not modes_api.is_eligible_for_certificate(enrollment_mode):
         return False
 
-    course_overview = get_course_overview_or_none(course_key)
+    course_overview = _get_course_overview(course_key)
     if not course_overview:
         return False
 
@@ -352,6 +445,9 @@ def is_on_certificate_allowlist(user, course_key):
     """
     Check if the user is on the allowlist, and is enabled for the allowlist, for this course run
     """
+    prefetched_data = _get_prefetched_data(user, course_key)
+    if prefetched_data is not None:
+        return user.id in prefetched_data['allowlisted_user_ids']
     return CertificateAllowlist.objects.filter(user=user, course_id=course_key, allowlist=True).exists()
 
 
@@ -359,7 +455,7 @@ def _can_generate_certificate_for_status(user, course_key, enrollment_mode):
     """
     Check if the user's certificate status can handle regular (non-allowlist) certificate generation
     """
-    cert = GeneratedCertificate.certificate_for_student(user, course_key)
+    cert = _get_certificate(user, course_key)
     if cert is None:
         return True
 
@@ -430,12 +526,12 @@ def _is_cert_downloadable(user, course_key):
     """
     Check if cert already exists, has a downloadable status, and has not been invalidated
     """
-    cert = GeneratedCertificate.certificate_for_student(user, course_key)
+    cert = _get_certificate(user, course_key)
     if cert is None:
         return False
     if cert.status != CertificateStatuses.downloadable:
         return False
-    if CertificateInvalidation.has_certificate_invalidation(user, course_key):
+    if _has_certificate_invalidation(user, course_key):
         return False
 
     return True
@@ -450,9 +546,103 @@ def _is_mode_now_eligible(enrollment_mode, cert):
     return False
 
 
-def _id_verification_enforced_and_missing(user):
+def _id_verification_enforced_and_missing(user, course_key):
     """
     Return true if IDV is required for this course and the user does not have it
     """
-    return settings.FEATURES.get(
-        'ENABLE_CERTIFICATES_IDV_REQUIREMENT') and not IDVerificationService.user_is_verified(user)
+    return settings.FEATURES.get('ENABLE_CERTIFICATES_IDV_REQUIREMENT') and not _user_is_verified(user, course_key)
+
+
+def _user_is_verified(user, course_key):
+    """
+    Check if the user has an approved, unexpired ID verification
+    """
+    prefetched_data = _get_prefetched_data(user, course_key)
+    if prefetched_data is not None:
+        return user.id in prefetched_data['verified_user_ids']
+    return IDVerificationService.user_is_verified(user)
+
+
+def _has_certificate_invalidation(user, course_key):
+    """
+    Check if the user's certificate in this course run has been invalidated
+    """
+    prefetched_data = _get_prefetched_data(user, course_key)
+    if prefetched_data is not None:
+        return user.id in prefetched_data['invalidated_user_ids']
+    return CertificateInvalidation.has_certificate_invalidation(user, course_key)
+
+
+def _get_certificate(user, course_key):
+    """
+    Get the user's certificate in this course run. Note that this may be None.
+    """
+    prefetched_data = _get_prefetched_data(user, course_key)
+    if prefetched_data is not None:
+        return prefetched_data['certificates'].get(user.id)
+    return GeneratedCertificate.certificate_for_student(user, course_key)
+
+
+def _is_beta_tester(user, course_key):
+    """
+    Check if the user is a beta tester in this course run
+    """
+    prefetched_data = _get_prefetched_data(user, course_key)
+    if prefetched_data is not None:
+        return user.id in prefetched_data['beta_tester_ids']
+    return is_beta_tester(user, course_key)
+
+
+def _get_course_overview(course_key):
+    """
+    Get the course overview for this course run. Note that this may be None.
+    """
+    prefetched_data = RequestCache(CERTIFICATE_GENERATION_CACHE_NAMESPACE).data.get(course_key)
+    if prefetched_data is not None:
+        return prefetched_data['course_overview']
+    return get_course_overview_or_none(course_key)
+
+
+def _get_prefetched_data(user, course_key):
+    """
+    Get the certificate generation data prefetched for this user in this course run, or None if it wasn't prefetched
+    """
+    prefetched_data = RequestCache(CERTIFICATE_GENERATION_CACHE_NAMESPACE).data.get(course_key)
+    if prefetched_data is not None and user.id in prefetched_data['user_ids']:
+        return prefetched_data
+    return None
+
+
+def _prefetch_certificate_generation_data(course_key, users):
+    """
+    Pre-fetches and caches the data needed to check whether certificates can be generated for these users in this
+    course run, for later fast retrieval by the eligibility checks.
+    """
+    user_ids = {user.id for user in users}
+    CourseEnrollment.bulk_fetch_enrollment_states(users, course_key)
+    prefetch_course_grades(course_key, users)
+    verified_users = IDVerificationService.bulk_user_is_verified(users)
+    RequestCache(CERTIFICATE_GENERATION_CACHE_NAMESPACE).set(course_key, {
+        'user_ids': user_ids,
+        'allowlisted_user_ids': set(CertificateAllowlist.objects.filter(
+            course_id=course_key, allowlist=True, user_id__in=user_ids,
+        ).values_list('user_id', flat=True)),
+        'invalidated_user_ids': set(CertificateInvalidation.objects.filter(
+            generated_certificate__course_id=course_key, active=True, generated_certificate__user_id__in=user_ids,
+        ).values_list('generated_certificate__user_id', flat=True)),
+        'verified_user_ids': {user_id for user_id, is_verified in verified_users.items() if is_verified},
+        'beta_tester_ids': set(list_with_level(course_key, 'beta').values_list('id', flat=True)),
+        'certificates': {
+            cert.user_id: cert
+            for cert in GeneratedCertificate.objects.filter(course_id=course_key, user_id__in=user_ids)
+        },
+        'course_overview': get_course_overview_or_none(course_key),
+    })
+
+
+def _clear_prefetched_certificate_generation_data(course_key):
+    """
+    Clear the certificate generation data prefetched for this course run
+    """
+    RequestCache(CERTIFICATE_GENERATION_CACHE_NAMESPACE).data.pop(course_key, None)
+    clear_prefetched_course_grades(course_key)
@@ -1,5 +1,5 @@
 """
-Tasks that generate a course certificate for a user
+Tasks that generate course certificates for users
 """
 
 from logging import getLogger
@@ -46,3 +46,25 @@ def generate_certificate(self, **kwargs):  # pylint: disable=unused-argument
 
     generate_course_certificate(user=student, course_key=course_key, status=status, enrollment_mode=enrollment_mode,
                                 course_grade=course_grade, generation_mode=generation_mode)
+
+
+@shared_task(base=LoggedPersistOnFailureTask, bind=True, default_retry_delay=30, max_retries=2)
+@set_code_owner_attribute
+def generate_course_certificates(self, **kwargs):  # pylint: disable=unused-argument
+    """
+    Generates certificates for a batch of users in a course run, for those users who are eligible.
+
+    kwargs:
+        - course_key: The course key for the course that the students are receiving certificates in. Required.
+        - user_ids: The ids of the students for whom to generate certificates. Required.
+        - generation_mode: Used when emitting an event. Options are "self" (implying the user generated the cert
+            themself) and "batch" for everything else. Defaults to 'batch'.
+    """
+    # Imported here to avoid a circular import, as the generation handler creates these tasks
+    from lms.djangoapps.certificates.generation_handler import generate_course_certificates_for_users
+
+    course_key = CourseKey.from_string(kwargs.pop('course_key'))
+    students = User.objects.filter(id__in=kwargs.pop('user_ids'))
+    generation_mode = kwargs.pop('generation_mode', 'batch')
+
+    generate_course_certificates_for_users(course_key, students, generation_mode=generation_mode)
@@ -6,7 +6,9 @@ from unittest import mock
 
 import ddt
 from django.conf import settings
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from common.djangoapps.course_modes.models import CourseMode
 from common.djangoapps.student.tests.factories import CourseEnrollmentFactory, UserFactory
@@ -20,6 +22,8 @@ from lms.djangoapps.certificates.generation_handler import (
     _set_regular_cert_status,
     generate_allowlist_certificate_task,
     generate_certificate_task,
+    generate_course_certificates_for_users,
+    generate_course_certificates_task,
     is_on_certificate_allowlist
 )
 from lms.djangoapps.certificates.models import GeneratedCertificate
@@ -35,6 +39,7 @@ from xmodule.modulestore.tests.factories import CourseFactory  # lint-amnesty, p
 log = logging.getLogger(__name__)
 
 BETA_TESTER_METHOD = 'lms.djangoapps.certificates.generation_handler.is_beta_tester'
+COURSE_CERTIFICATES_TASK = 'lms.djangoapps.certificates.generation_handler.generate_course_certificates.apply_async'
 COURSE_OVERVIEW_METHOD = 'lms.djangoapps.certificates.generation_handler.get_course_overview_or_none'
 CCX_COURSE_METHOD = 'lms.djangoapps.certificates.generation_handler._is_ccx_course'
 GET_GRADE_METHOD = 'lms.djangoapps.certificates.generation_handler._get_course_grade'
@@ -800,3 +805,115 @@ class CertificateTests(ModuleStoreTestCase):
                 mock.patch(PASSING_GRADE_METHOD, return_value=True), \
                 override_settings(FEATURES={**settings.FEATURES, 'DISABLE_HONOR_CERTIFICATES': True}):
             assert not _can_generate_regular_certificate(self.user, course_run_key, enrollment_mode, grade)
+
+
+@mock.patch.dict(settings.FEATURES, ENABLE_CERTIFICATES_IDV_REQUIREMENT=False)
+@mock.patch(CCX_COURSE_METHOD, mock.Mock(return_value=False))
+@mock.patch(PASSING_GRADE_METHOD, mock.Mock(return_value=True))
+@mock.patch(WEB_CERTS_METHOD, mock.Mock(return_value=True))
+class CourseCertificatesTests(ModuleStoreTestCase):
+    """
+    Tests for generating certificates for many users in a course run
+    """
+
+    def setUp(self):
+        super().setUp()
+
+        self.course_run = CourseFactory()
+        self.course_run_key = self.course_run.id  # pylint: disable=no-member
+
+    def _create_enrolled_users(self, count, mode=CourseMode.VERIFIED):
+        """
+        Create users enrolled in the course run with the given mode
+        """
+        users = UserFactory.create_batch(count)
+        for user in users:
+            CourseEnrollmentFactory(user=user, course_id=self.course_run_key, is_active=True, mode=mode)
+        return users
+
+    @override_settings(CERTIFICATE_GENERATION_BATCH_SIZE=2)
+    def test_generate_course_certificates_task(self):
+        """
+        Test that a task is created for each batch of users
+        """
+        users = self._create_enrolled_users(5)
+
+        with mock.patch(COURSE_CERTIFICATES_TASK) as mock_task:
+            assert generate_course_certificates_task(self.course_run_key, users) == 3
+
+        assert [call.kwargs['kwargs']['user_ids'] for call in mock_task.call_args_list] == [
+            [users[0].id, users[1].id], [users[2].id, users[3].id], [users[4].id],
+        ]
+        assert all(call.kwargs['kwargs']['course_key'] == str(self.course_run_key)
+                   for call in mock_task.call_args_list)
+
+    def test_generate_course_certificates_for_users(self):
+        """
+        Test that the same certificates are generated as by generating them for each user
+        """
+        verified_user, allowlisted_user, invalidated_user = self._create_enrolled_users(3)
+        audit_user = self._create_enrolled_users(1, mode=CourseMode.AUDIT)[0]
+        unenrolled_user = UserFactory()
+        CertificateAllowlistFactory.create(course_id=self.course_run_key, user=allowlisted_user)
+        cert = GeneratedCertificateFactory(
+            user=invalidated_user,
+            course_id=self.course_run_key,
+            mode=GeneratedCertificate.MODES.verified,
+            status=CertificateStatuses.downloadable,
+        )
+        CertificateInvalidationFactory.create(generated_certificate=cert, invalidated_by=verified_user, active=True)
+
+        users = [verified_user, allowlisted_user, invalidated_user, audit_user, unenrolled_user]
+        with mock.patch(BETA_TESTER_METHOD) as mock_beta_tester:
+            assert generate_course_certificates_for_users(self.course_run_key, users) == 3
+            mock_beta_tester.assert_not_called()
+
+        statuses = dict(
+            GeneratedCertificate.objects.filter(course_id=self.course_run_key).values_list('user_id', 'status')
+        )
+        assert statuses == {
+            verified_user.id: CertificateStatuses.downloadable,
+            allowlisted_user.id: CertificateStatuses.downloadable,
+            invalidated_user.id: CertificateStatuses.unavailable,
+        }
+        assert GeneratedCertificate.objects.get(user=verified_user, course_id=self.course_run_key).mode == \
+            CourseMode.VERIFIED
+
+    def test_generate_course_certificates_for_users_error(self):
+        """
+        Test that an error generating one user's certificate doesn't stop the other users' certificates from being
+        generated
+        """
+        users = self._create_enrolled_users(3)
+        failing_user = users[1]
+
+        def _generate_certificate_task(user, course_key, **kwargs):
+            if user == failing_user:
+                raise ValueError('Unexpected error')
+            return generate_certificate_task(user, course_key, **kwargs)
+
+        with mock.patch(
+            'lms.djangoapps.certificates.generation_handler.generate_certificate_task',
+            side_effect=_generate_certificate_task,
+        ):
+            with self.assertLogs('lms.djangoapps.certificates.generation_handler', level='ERROR') as logs:
+                assert generate_course_certificates_for_users(self.course_run_key, users) == 2
+
+        assert any(f'Error generating a course certificate for user {failing_user.id}' in line for line in logs.output)
+        assert set(
+            GeneratedCertificate.objects.filter(course_id=self.course_run_key).values_list('user_id', flat=True)
+        ) == {users[0].id, users[2].id}
+
+    def test_generate_course_certificates_for_users_query_count(self):
+        """
+        Test that the queries made to check eligibility don't depend on the number of users
+        """
+        few_users = self._create_enrolled_users(2, mode=CourseMode.AUDIT)
+        many_users = self._create_enrolled_users(10, mode=CourseMode.AUDIT)
+
+        with CaptureQueriesContext(connection) as few_users_queries:
+            assert generate_course_certificates_for_users(self.course_run_key, few_users) == 0
+        with CaptureQueriesContext(connection) as many_users_queries:
+            assert generate_course_certificates_for_users(self.course_run_key, many_users) == 0
+
+        assert len(many_users_queries) == len(few_users_queries)
@@ -0,0 +1,22 @@
+"""
+Course API Application Configuration
+
+Signal handlers are connected here.
+"""
+
+
+from django.apps import AppConfig
+
+
+class CourseApiConfig(AppConfig):
+    """
+    Application Configuration for the Course API.
+    """
+    name = 'lms.djangoapps.course_api'
+    verbose_name = 'Course API'
+
+    def ready(self):
+        """
+        Connect signal handlers.
+        """
+        from .blocks import handlers  # pylint: disable=unused-import
@@ -0,0 +1,20 @@
+"""
+Signal handlers for the Course Blocks API.
+"""
+
+
+from completion.models import BlockCompletion
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .transformers.block_completion import invalidate_user_course_completions
+
+
+@receiver(post_save, sender=BlockCompletion, dispatch_uid="invalidate_block_completions_on_save")
+@receiver(post_delete, sender=BlockCompletion, dispatch_uid="invalidate_block_completions_on_delete")
+def invalidate_cached_completions(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidates the cached completions of the user whose completion in the
+    course changed.
+    """
+    invalidate_user_course_completions(instance.user_id, instance.context_key)
@@ -3,11 +3,103 @@ Block Completion Transformer
 """
 
 
+import uuid
+
 from completion.models import BlockCompletion
+from django.core.cache import cache
+from django.db import transaction
 from xblock.completable import XBlockCompletionMode as CompletionMode
 
 from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
 
+# How long a user's completions in a course are cached for, in seconds. Cached completions
+# are also invalidated whenever one of the user's completions in the course changes.
+COMPLETIONS_CACHE_TIMEOUT = 60 * 60
+
+
+def _completions_cache_key(user_id, course_key):
+    return f'blocks_api.completions.{user_id}.{course_key}'
+
+
+def _completions_generation_cache_key(user_id, course_key):
+    return f'blocks_api.completions.generation.{user_id}.{course_key}'
+
+
+def _start_completions_generation(user_id, course_key):
+    """
+    Starts a new completions cache generation for the user in the course, if
+    they don't have one, and returns their current generation.
+
+    Generations start at a random number rather than at zero, so that
+    completions cached before a generation was evicted from the cache aren't
+    mistaken for completions of the new generation.
+    """
+    generation_key = _completions_generation_cache_key(user_id, course_key)
+    cache.add(generation_key, uuid.uuid4().int & 0xffffffff, None)
+    return cache.get(generation_key)
+
+
+def _bump_completions_generation(user_id, course_key):
+    """
+    Bumps the completions cache generation of the user in the course, so that
+    any completions cached for an earlier generation are no longer used.
+    """
+    try:
+        cache.incr(_completions_generation_cache_key(user_id, course_key))
+    except ValueError:
+        # The user has no generation in the cache, so none of their completions are cached either.
+        _start_completions_generation(user_id, course_key)
+
+
+def get_user_course_completions(user, course_key):
+    """
+    Returns a tuple of the user's completions in the course, as a dict of
+    block keys (mapped into the course) to completion values, and the key of
+    the block the user most recently completed (or None).
+
+    All of the user's completions in the course are loaded with a single
+    query, and are cached until one of them changes.
+    """
+    generation_key = _completions_generation_cache_key(user.id, course_key)
+    cache_key = _completions_cache_key(user.id, course_key)
+    cached = cache.get_many([generation_key, cache_key])
+    generation = cached.get(generation_key)
+    cached_generation, completions, latest_complete_key = cached.get(cache_key, (None, None, None))
+    # Completions cached before the user's latest completion change are out of date.
+    if generation is not None and cached_generation == generation:
+        return completions, latest_complete_key
+
+    completions = {}
+    latest_complete_key, latest_complete_modified = None, None
+    for block_key, completion, modified in BlockCompletion.objects.filter(
+        user=user,
+        context_key=course_key,
+    ).values_list(
+        'block_key',
+        'completion',
+        'modified',
+    ):
+        completions[block_key.map_into_course(course_key)] = completion
+        if completion == 1.0 and (latest_complete_modified is None or modified > latest_complete_modified):
+            latest_complete_key, latest_complete_modified = block_key, modified
+
+    if generation is None:
+        generation = _start_completions_generation(user.id, course_key)
+    cache.set(cache_key, (generation, completions, latest_complete_key), COMPLETIONS_CACHE_TIMEOUT)
+    return completions, latest_complete_key
+
+
+def invalidate_user_course_completions(user_id, course_key):
+    """
+    Invalidates the cached completions of the user in the course.
+
+    The generation is bumped straight away, and again once the transaction
+    commits, so that completions cached by a request that read them before
+    the change was committed aren't used either.
+    """
+    _bump_completions_generation(user_id, course_key)
+    transaction.on_commit(lambda: _bump_completions_generation(user_id, course_key))
+
 
 class BlockCompletionTransformer(BlockStructureTransformer):
     """
@@ -108,20 +200,14 @@ class BlockCompletionTransformer(BlockStructureTransformer):
 
             return completion_mode in (CompletionMode.AGGREGATOR, CompletionMode.EXCLUDED)
 
-        completions = BlockCompletion.objects.filter(
-            user=usage_info.user,
-            context_key=usage_info.course_key,
-        ).values_list(
-            'block_key',
-            'completion',
+        completions_dict, latest_complete_key = get_user_course_completions(
+            usage_info.user, usage_info.course_key,
         )
+        complete_keys = {key for key, completion in completions_dict.items() if completion == 1.0}
 
-        completions_dict = {
-            block.map_into_course(usage_info.course_key): completion
-            for block, completion in completions
-        }
-
-        for block_key in block_structure.topological_traversal():
+        # Children are visited before their parents, so the completion of each
+        # aggregator can be rolled up from its children in the same traversal.
+        for block_key in block_structure.post_order_traversal():
             if _is_block_an_aggregator_or_excluded(block_key):
                 completion_value = None
             elif block_key in completions_dict:
@@ -132,10 +218,5 @@ class BlockCompletionTransformer(BlockStructureTransformer):
             block_structure.set_transformer_block_field(
                 block_key, self, self.COMPLETION, completion_value
             )
-
-        complete_blocks = completions.filter(completion=1.0)
-        latest_complete_key = complete_blocks.latest()[0] if complete_blocks else None
-        if latest_complete_key:
-            complete_keys = {key for key, completion in completions_dict.items() if completion == 1.0}
-            for block_key in block_structure.post_order_traversal():
+            if latest_complete_key:
                 self.mark_complete(complete_keys, latest_complete_key, block_key, block_structure)
@@ -3,13 +3,20 @@ Tests for BlockCompletionTransformer.
 """
 
 
+from unittest.mock import patch
+
 from completion.models import BlockCompletion
 from completion.test_utils import CompletionWaffleTestMixin
+from django.core.cache.backends.locmem import LocMemCache
 from xblock.completable import CompletableXBlockMixin, XBlockCompletionMode
 from xblock.core import XBlock
 
 from common.djangoapps.student.tests.factories import UserFactory
-from lms.djangoapps.course_api.blocks.transformers.block_completion import BlockCompletionTransformer
+from lms.djangoapps.course_api.blocks.transformers.block_completion import (
+    BlockCompletionTransformer,
+    _completions_cache_key,
+    get_user_course_completions
+)
 from lms.djangoapps.course_blocks.api import get_course_blocks
 from lms.djangoapps.course_blocks.transformers.tests.helpers import ModuleStoreTestCase, TransformerRegistryTestMixin
 from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory  # lint-amnesty, pylint: disable=wrong-import-order
@@ -127,6 +134,64 @@ class BlockCompletionTransformerTestCase(TransformerRegistryTestMixin, Completio
 
         self._assert_block_has_proper_completion_values(block_structure, block.location, 0.0, False)
 
+    @XBlock.register_temp_plugin(StubCompletableXBlock, identifier='comp')
+    def test_completions_cached_until_changed(self):
+        """
+        A user's completions in a course are loaded once, and reloaded after one of them changes.
+        """
+        course = CourseFactory.create()
+        block = BlockFactory.create(category='comp', parent=course)
+        with patch(
+            'lms.djangoapps.course_api.blocks.transformers.block_completion.cache',
+            LocMemCache('test_block_completion', {}),
+        ):
+            with self.assertNumQueries(1):
+                assert get_user_course_completions(self.user, course.id) == ({}, None)
+            with self.assertNumQueries(0):
+                get_user_course_completions(self.user, course.id)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                BlockCompletion.objects.submit_completion(
+                    user=self.user,
+                    block_key=block.location,
+                    completion=self.COMPLETION_TEST_VALUE,
+                )
+            block_structure = get_course_blocks(self.user, course.location, self.transformers)
+
+        self._assert_block_has_proper_completion_values(
+            block_structure, block.location, self.COMPLETION_TEST_VALUE, True
+        )
+        self._assert_block_has_proper_completion_values(
+            block_structure, course.location, None, True
+        )
+
+    @XBlock.register_temp_plugin(StubCompletableXBlock, identifier='comp')
+    def test_completions_cached_before_change_not_used(self):
+        """
+        Completions cached by a reader that loaded them before a change was committed aren't used after it.
+        """
+        course = CourseFactory.create()
+        block = BlockFactory.create(category='comp', parent=course)
+        test_cache = LocMemCache('test_block_completion', {})
+        cache_key = _completions_cache_key(self.user.id, course.id)
+        with patch('lms.djangoapps.course_api.blocks.transformers.block_completion.cache', test_cache):
+            get_user_course_completions(self.user, course.id)
+            stale_completions = test_cache.get(cache_key)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                BlockCompletion.objects.submit_completion(
+                    user=self.user,
+                    block_key=block.location,
+                    completion=1.0,
+                )
+            # The reader's write lands after the writer's invalidation.
+            test_cache.set(cache_key, stale_completions)
+
+            with self.assertNumQueries(1):
+                completions, latest_complete_key = get_user_course_completions(self.user, course.id)
+        assert completions == {block.location: 1.0}
+        assert str(latest_complete_key) == str(block.location)
+
     def _assert_block_has_proper_completion_values(
             self, block_structure, block_key, expected_completion, expected_complete
     ):
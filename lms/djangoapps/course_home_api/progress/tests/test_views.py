@@ -7,6 +7,8 @@ from unittest.mock import patch
 
 import dateutil
 import ddt
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.timezone import now
 from edx_toggles.toggles.testutils import override_waffle_flag
@@ -314,3 +316,30 @@ class ProgressTabTestViews(BaseCourseHomeTests):
         assert response.status_code == 200
         assert response.data['course_grade']['percent'] == expected_percent
         assert response.data['course_grade']['is_passing'] == (expected_percent >= 0.5)
+
+    @ddt.data(False, True)
+    def test_progress_queries(self, stale):
+        """
+        Verify the number of queries made for a learner's progress, both when the persisted subsection
+        grades are read as-is and when a stale one is recalculated.
+        """
+        CourseEnrollment.enroll(self.user, self.course.id)
+        with self.store.bulk_operations(self.course.id):
+            problem = self.add_subsection_with_problem(format='Homework')
+        answer_problem(self.course, get_mock_request(self.user), problem)
+        if stale:
+            # Adding a problem changes the subsection's visible blocks, so its persisted grade is now stale.
+            BlockFactory(parent_location=problem.parent, category='problem', graded=True)
+
+        # The first request warms the caches shared by the following ones.
+        assert self.client.get(self.url).status_code == 200
+        with CaptureQueriesContext(connection) as queries:
+            assert self.client.get(self.url).status_code == 200
+        for _ in range(2):
+            with self.assertNumQueries(len(queries)):
+                assert self.client.get(self.url).status_code == 200
+
+        # Scores are only loaded to recalculate a stale grade, which is never saved.
+        sql = [query['sql'] for query in queries.captured_queries]
+        assert any('"courseware_studentmodule"' in statement for statement in sql) == stale
+        assert not any(statement.startswith(('INSERT', 'UPDATE')) and '"grades_' in statement for statement in sql)
@@ -12,7 +12,6 @@ from rest_framework.generics import RetrieveAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from xmodule.modulestore.django import modulestore
 from common.djangoapps.student.models import CourseEnrollment
 from lms.djangoapps.course_home_api.progress.serializers import ProgressTabSerializer
 from lms.djangoapps.course_home_api.toggles import course_home_mfe_progress_tab_is_active
@@ -204,7 +203,12 @@ class ProgressTabView(RetrieveAPIView):
         # The block structure is used for both the course_grade and has_scheduled content fields
         # So it is called upfront and reused for optimization purposes
         collected_block_structure = get_block_structure_manager(course_key).get_collected()
-        course_grade = CourseGradeFactory().read(student, collected_block_structure=collected_block_structure)
+        course_grade = CourseGradeFactory().read(
+            student,
+            course=course,
+            collected_block_structure=collected_block_structure,
+            recalculate_stale_subsections=True,
+        )
 
         # recalculate course grade from visible grades (stored grade was calculated over all grades, visible or not)
         course_grade.update(visible_grades_only=True, has_staff_access=is_staff)
@@ -228,8 +232,7 @@ class ProgressTabView(RetrieveAPIView):
             user_grade = course_grade.percent
             user_has_passing_grade = user_grade >= course.lowest_passing_grade
 
-        block = modulestore().get_course(course_key)
-        grading_policy = block.grading_policy
+        grading_policy = course.grading_policy
         verification_status = IDVerificationService.user_status(student)
         verification_link = None
         if verification_status['status'] is None or verification_status['status'] == 'expired':
@@ -13,11 +13,15 @@ Note: The access control logic in this file does NOT check for enrollment in
 
 
 import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
 
 from django.conf import settings  # pylint: disable=unused-import
 from django.contrib.auth.models import AnonymousUser
 from edx_django_utils.monitoring import function_trace
 from opaque_keys.edx.keys import CourseKey, UsageKey
+from pytz import UTC
 from xblock.core import XBlock
 
 from lms.djangoapps.courseware.access_response import (
@@ -97,6 +101,120 @@ def has_ccx_coach_role(user, course_key):
     return False
 
 
+class BlockAccessContext:
+    """
+    The parts of a user's access to the blocks of a course which are the same for every
+    block: their role in the course, their staff and instructor access, their group in
+    each user partition, and whether each start date has passed for them.
+
+    Each is computed the first time a block needs it, and then reused for the other
+    blocks checked with the same context.
+    """
+    def __init__(self, user, course_key):
+        self.user = user
+        self.course_key = course_key
+        self.now = datetime.now(UTC)
+        self._user_role = None
+        self._course_access = {}
+        self._user_groups = {}
+        self._start_date_access = {}
+
+    def user_role(self):
+        """
+        Return the user's role in the course (see `get_user_role`).
+        """
+        if self._user_role is None:
+            self._user_role = get_user_role(self.user, self.course_key)
+        return self._user_role
+
+    def course_access(self, access_level, course_key):
+        """
+        Return whether the user has `access_level` (staff or instructor) access to the course.
+        """
+        key = (access_level, course_key)
+        if key not in self._course_access:
+            self._course_access[key] = _has_access_to_course(self.user, access_level, course_key)
+        return self._course_access[key]
+
+    def group_for_user(self, partition):
+        """
+        Return the user's group in `partition`.
+        """
+        if partition.id not in self._user_groups:
+            self._user_groups[partition.id] = partition.scheme.get_group_for_user(
+                self.course_key, self.user, partition,
+            )
+        return self._user_groups[partition.id]
+
+    def start_date_access(self, days_early_for_beta, start):
+        """
+        Return whether content with the given start date and beta offset has started for the user.
+        """
+        key = (days_early_for_beta, start)
+        if key not in self._start_date_access:
+            self._start_date_access[key] = check_start_date(
+                self.user,
+                days_early_for_beta,
+                start,
+                self.course_key,
+                display_error_to_user=False,
+                now=self.now,
+            )
+        return self._start_date_access[key]
+
+
+class _BulkAccessContexts(threading.local):
+    """
+    A thread local holding the BlockAccessContexts shared by `bulk_access_checks`.
+    """
+    contexts = ()
+
+
+_BULK_ACCESS_CONTEXTS = _BulkAccessContexts()
+
+
+@contextmanager
+def bulk_access_checks(user, course_key):
+    """
+    A context manager inside which every check of `user`'s access to blocks of the course
+    with `course_key` shares one BlockAccessContext, so that the user's roles, groups and
+    start date checks are only computed once, however many blocks are checked.
+    """
+    prev = _BULK_ACCESS_CONTEXTS.contexts
+    _BULK_ACCESS_CONTEXTS.contexts += (BlockAccessContext(user, course_key),)
+    try:
+        yield
+    finally:
+        _BULK_ACCESS_CONTEXTS.contexts = prev
+
+
+def _get_block_access_context(user, course_key):
+    """
+    Return the BlockAccessContext to use for checking `user`'s access to a block of
+    the course with `course_key`: the innermost shared one if `bulk_access_checks`
+    is in use for them, or otherwise a new one.
+    """
+    for context in reversed(_BULK_ACCESS_CONTEXTS.contexts):
+        if context.user is user and context.course_key == course_key:
+            return context
+    return BlockAccessContext(user, course_key)
+
+
+def has_access_to_blocks(user, action, blocks, course_key):
+    """
+    Check whether a user has the access to do action on each of the given blocks of a
+    course, computing the parts of their access that don't depend on the block once.
+
+    Returns a dict mapping the usage key of each block to its AccessResponse, which is
+    the same as `has_access(user, action, block, course_key)` would return.
+    """
+    if not user:
+        user = AnonymousUser()
+
+    with bulk_access_checks(user, course_key):
+        return {block.location: has_access(user, action, block, course_key) for block in blocks}
+
+
 @function_trace('has_access')
 def has_access(user, action, obj, course_key=None):
     """
@@ -444,13 +562,16 @@ def _has_access_error_block(user, action, block, course_key):
     return _dispatch(checkers, action, user, block)
 
 
-def _has_group_access(block, user, course_key):
+def _has_group_access(block, user, course_key, access_context=None):
     """
     This function returns a boolean indicating whether or not `user` has
     sufficient group memberships to "load" a block
     """
+    if access_context is None:
+        access_context = BlockAccessContext(user, course_key)
+
     # Allow staff and instructors roles group access, as they are not masquerading as a student.
-    if get_user_role(user, course_key) in ['staff', 'instructor']:
+    if access_context.user_role() in ['staff', 'instructor']:
         return ACCESS_GRANTED
 
     # use merged_group_access which takes group access on the block's
@@ -511,11 +632,7 @@ def _has_group_access(block, user, course_key):
     missing_groups = []
     block_key = block.scope_ids.usage_id
     for partition, groups in partition_groups:
-        user_group = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
-        )
+        user_group = access_context.group_for_user(partition)
         if user_group not in groups:
             missing_groups.append((
                 partition,
@@ -554,6 +671,8 @@ def _has_access_to_block(user, action, block, course_key=None):
     (e.g. courses).  If you call this method directly instead of going through
     has_access(), it will not do the right thing.
     """
+    access_context = _get_block_access_context(user, course_key)
+
     def can_load():
         """
         NOTE: This does not check that the student is enrolled in the course
@@ -565,12 +684,12 @@ def _has_access_to_block(user, action, block, course_key=None):
         # access to this content, then deny access. The problem with calling _has_staff_access_to_block
         # before this method is that _has_staff_access_to_block short-circuits and returns True
         # for staff users in preview mode.
-        group_access_response = _has_group_access(block, user, course_key)
+        group_access_response = _has_group_access(block, user, course_key, access_context)
         if not group_access_response:
             return group_access_response
 
         # If the user has staff access, they can load the block and checks below are not needed.
-        staff_access_response = _has_staff_access_to_block(user, block, course_key)
+        staff_access_response = access_context.course_access('staff', course_key or block.location.course_key)
         if staff_access_response:
             return staff_access_response
 
@@ -578,20 +697,14 @@ def _has_access_to_block(user, action, block, course_key=None):
             _visible_to_nonstaff_users(block, display_error_to_user=False) and
             (
                 _has_detached_class_tag(block) or
-                check_start_date(
-                    user,
-                    block.days_early_for_beta,
-                    block.start,
-                    course_key,
-                    display_error_to_user=False
-                )
+                access_context.start_date_access(block.days_early_for_beta, block.start)
             )
         )
 
     checkers = {
         'load': can_load,
-        'staff': lambda: _has_staff_access_to_block(user, block, course_key),
-        'instructor': lambda: _has_instructor_access_to_block(user, block, course_key)
+        'staff': lambda: access_context.course_access('staff', course_key or block.location.course_key),
+        'instructor': lambda: access_context.course_access('instructor', course_key or block.location.course_key),
     }
 
     return _dispatch(checkers, action, user, block)
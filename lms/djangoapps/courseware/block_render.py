@@ -54,7 +54,7 @@ from xmodule.services import EventPublishingService, RebindUserService, Settings
 from common.djangoapps.static_replace.services import ReplaceURLService
 from common.djangoapps.static_replace.wrapper import replace_urls_wrapper
 from xmodule.capa.xqueue_interface import XQueueService  # lint-amnesty, pylint: disable=wrong-import-order
-from lms.djangoapps.courseware.access import get_user_role, has_access
+from lms.djangoapps.courseware.access import bulk_access_checks, get_user_role, has_access
 from lms.djangoapps.courseware.entrance_exams import user_can_skip_entrance_exam, user_has_passed_entrance_exam
 from lms.djangoapps.courseware.masquerade import (
     MasqueradingKeyValueStore,
@@ -154,7 +154,8 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
 
     field_data_cache must include data from the course blocks and 2 levels of its descendants
     '''
-    with modulestore().bulk_operations(course.id):
+    # The user's access to every chapter and section is checked as they are loaded.
+    with modulestore().bulk_operations(course.id), bulk_access_checks(user, course.id):
         course_block = get_block_for_descriptor(
             user, request, course, field_data_cache, course.id, course=course
         )
@@ -549,7 +550,9 @@ def prepare_runtime_for_user(
     )
 
     # Rewrite static urls with course-specific absolute urls
-    block_wrappers.append(partial(replace_urls_wrapper, replace_url_service=replace_url_service))
+    block_wrappers.append(partial(
+        replace_urls_wrapper, replace_url_service=replace_url_service, request_token=request_token,
+    ))
 
     block_wrappers.append(partial(display_access_messages, user))
     block_wrappers.append(partial(course_expiration_wrapper, user))
@@ -454,6 +454,49 @@ class AccessTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase, MilestonesTes
 
         self.verify_access(mock_unit, expected_access, expected_error_type)
 
+    @ddt.data('load', 'staff', 'instructor')
+    @patch.dict('django.conf.settings.FEATURES', {'DISABLE_START_DATES': False})
+    def test_has_access_to_blocks(self, action):
+        """
+        Tests that checking access to many blocks at once gives the same answers as checking them one by one.
+        """
+        partition_id = MINIMUM_STATIC_PARTITION_ID
+        self.course.user_partitions.append(UserPartition(
+            partition_id, 'Test Partition', 'Test', [Group(0, 'Group A'), Group(1, 'Group B')], scheme_id='cohort',
+        ))
+        self.course.cohort_config = {'cohorted': True}
+        modulestore().update_item(self.course, ModuleStoreEnum.UserID.test)
+        blocks = [
+            BlockFactory.create(category='chapter', parent_location=self.course.location, **fields)
+            for fields in (
+                {},
+                {'start': self.DATES[self.YESTERDAY]},
+                {'start': self.DATES[self.TOMORROW]},
+                {'start': self.DATES[self.TOMORROW], 'days_early_for_beta': 2},
+                {'visible_to_staff_only': True},
+                {'group_access': {partition_id: [0]}},
+            )
+        ]
+        blocks = [modulestore().get_item(block.location) for block in blocks]
+
+        for user in (self.anonymous_user, self.student, self.beta_user, self.course_staff, self.course_instructor):
+            responses = access.has_access_to_blocks(user, action, blocks, self.course.id)
+            assert list(responses) == [block.location for block in blocks]
+            for block in blocks:
+                expected = access.has_access(user, action, block, self.course.id)
+                assert bool(responses[block.location]) == bool(expected)
+                assert type(responses[block.location]) is type(expected)
+
+    def test_has_access_to_blocks_computes_role_once(self):
+        """
+        Tests that the user's role is only looked up once when checking access to many blocks.
+        """
+        blocks = [BlockFactory.create(category='chapter', parent_location=self.course.location) for __ in range(3)]
+        with patch('lms.djangoapps.courseware.access.get_user_role', return_value='student') as mock_user_role:
+            responses = access.has_access_to_blocks(self.student, 'load', blocks, self.course.id)
+        assert all(responses.values())
+        assert mock_user_role.call_count == 1
+
     def test__has_access_course_can_enroll(self):
         yesterday = datetime.datetime.now(pytz.utc) - datetime.timedelta(days=1)
         tomorrow = datetime.datetime.now(pytz.utc) + datetime.timedelta(days=1)
@@ -15,6 +15,7 @@ from bson import ObjectId
 from completion.waffle import ENABLE_COMPLETION_TRACKING_SWITCH  # lint-amnesty, pylint: disable=wrong-import-order
 from completion.models import BlockCompletion  # lint-amnesty, pylint: disable=wrong-import-order
 from django.conf import settings  # lint-amnesty, pylint: disable=wrong-import-order
+from django.core.cache.backends.locmem import LocMemCache  # lint-amnesty, pylint: disable=wrong-import-order
 from django.contrib.auth.models import AnonymousUser  # lint-amnesty, pylint: disable=wrong-import-order
 from django.http import Http404, HttpResponse  # lint-amnesty, pylint: disable=wrong-import-order
 from django.middleware.csrf import get_token  # lint-amnesty, pylint: disable=wrong-import-order
@@ -60,6 +61,7 @@ from xmodule.services import RebindUserServiceError
 from xmodule.video_block import VideoBlock  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.x_module import STUDENT_VIEW, DescriptorSystem  # lint-amnesty, pylint: disable=wrong-import-order
 from common.djangoapps import static_replace
+from common.djangoapps.static_replace.services import ReplaceURLService
 from common.djangoapps.course_modes.models import CourseMode  # lint-amnesty, pylint: disable=reimported
 from common.djangoapps.student.tests.factories import GlobalStaffFactory
 from common.djangoapps.student.tests.factories import RequestFactoryNoCsrf
@@ -91,6 +93,7 @@ from openedx.core.djangoapps.oauth_dispatch.tests.factories import AccessTokenFa
 from openedx.core.lib.courses import course_image_url
 from openedx.core.lib.gating import api as gating_api
 from openedx.core.lib.url_utils import quote_slashes
+from openedx.core.lib.xblock_utils import request_token as xblock_request_token
 from common.djangoapps.student.models import CourseEnrollment, anonymous_id_for_user
 from lms.djangoapps.verify_student.tests.factories import SoftwareSecurePhotoVerificationFactory
 from common.djangoapps.xblock_django.models import XBlockConfiguration
@@ -1532,6 +1535,37 @@ class TestHtmlModifiers(ModuleStoreTestCase):
 
         assert len(PyQuery(result_fragment.content)('div.xblock.xblock-student_view.xmodule_HtmlBlock')) == 1
 
+    @override_settings(STATIC_REPLACE_FRAGMENT_CACHE_TIMEOUT=300)
+    def test_static_link_rewrite_cached_across_requests(self):
+        """
+        The urls in the content of an HTML block are only replaced once for all requests, even though the content is
+        wrapped with a different request token for each request.
+        """
+        contents = []
+        with patch('common.djangoapps.static_replace.services.cache', LocMemCache('test_html_modifiers', {})), \
+                patch.object(ReplaceURLService, '_replace_urls', autospec=True,
+                             side_effect=ReplaceURLService._replace_urls) as mock_replace_urls:
+            for __ in range(2):
+                request = RequestFactoryNoCsrf().get('/')
+                request.user = self.user
+                request.session = {}
+                block = render.get_block_for_descriptor(
+                    self.user,
+                    request,
+                    self.block,
+                    self.field_data_cache,
+                    self.course.id,
+                    course=self.course,
+                )
+                contents.append(block.render(STUDENT_VIEW).content)
+                assert f'data-request-token="{xblock_request_token(request)}"' in contents[-1]
+
+        assert mock_replace_urls.call_count == 1
+        key = self.course.location
+        for content in contents:
+            assert f'/asset-v1:{key.org}+{key.course}+{key.run}+type@asset+block/foo_content' in content
+        assert contents[0] != contents[1]
+
     def test_xmodule_display_wrapper_disabled(self):
         block = render.get_block(
             self.user,
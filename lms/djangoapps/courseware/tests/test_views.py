@@ -8,7 +8,7 @@ import itertools
 import json
 import re
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, PropertyMock, create_autospec, patch
+from unittest.mock import ANY, MagicMock, PropertyMock, create_autospec, patch
 from urllib.parse import quote, urlencode
 from uuid import uuid4
 
@@ -16,12 +16,14 @@ import ddt
 from completion.test_utils import CompletionWaffleTestMixin
 from crum import set_current_request
 from django.conf import settings
+from django.core.cache.backends.locmem import LocMemCache
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
 from django.http import Http404, HttpResponse, HttpResponseBadRequest
 from django.http.request import QueryDict
 from django.test import RequestFactory, TestCase
 from django.test.client import Client
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse, reverse_lazy
 from edx_django_utils.cache.utils import RequestCache
 from edx_toggles.toggles.testutils import override_waffle_flag
@@ -83,6 +85,7 @@ from lms.djangoapps.courseware.views.views import (
     PublicVideoXBlockView,
     PublicVideoXBlockEmbedView,
 )
+from lms.djangoapps.grades.tests.utils import answer_problem
 from lms.djangoapps.instructor.access import allow_access
 from lms.djangoapps.verify_student.services import IDVerificationService
 from openedx.core.djangoapps.catalog.tests.factories import CourseFactory as CatalogCourseFactory
@@ -1513,6 +1516,36 @@ class ProgressPageTests(ProgressPageBaseTests):
             ), check_mongo_calls(2):
                 self._get_progress_page()
 
+    @ddt.data(False, True)
+    def test_progress_queries_with_persisted_grades(self, stale):
+        """
+        Test the number of queries made for the progress page, both when the persisted subsection grades
+        are read as-is and when a stale one is recalculated.
+        """
+        with self.store.bulk_operations(self.course.id):
+            section = BlockFactory.create(
+                category='sequential', parent_location=self.chapter.location, graded=True, format='Homework',
+            )
+            vertical = BlockFactory.create(category='vertical', parent_location=section.location)
+            problem = BlockFactory.create(category='problem', parent_location=vertical.location, graded=True)
+        answer_problem(self.course, get_mock_request(self.user), problem)
+        if stale:
+            # Adding a problem changes the subsection's visible blocks, so its persisted grade is now stale.
+            BlockFactory.create(category='problem', parent_location=vertical.location, graded=True)
+
+        # The first request warms the caches shared by the following ones.
+        self._get_progress_page()
+        with CaptureQueriesContext(connection) as queries:
+            self._get_progress_page()
+        for _ in range(2):
+            with self.assertNumQueries(len(queries)), check_mongo_calls(2):
+                self._get_progress_page()
+
+        # Scores are only loaded to recalculate a stale grade, which is never saved.
+        sql = [query['sql'] for query in queries.captured_queries]
+        assert any('"courseware_studentmodule"' in statement for statement in sql) == stale
+        assert not any(statement.startswith(('INSERT', 'UPDATE')) and '"grades_' in statement for statement in sql)
+
     @patch.dict(settings.FEATURES, {'ENABLE_CERTIFICATES_IDV_REQUIREMENT': True})
     @ddt.data(
         *itertools.product(
@@ -2809,6 +2842,48 @@ class TestRenderXBlock(RenderXBlockTestMixin, ModuleStoreTestCase, CompletionWaf
         self.assertContains(response, 'data-enable-completion-on-view-service="false"')
         self.assertNotContains(response, 'data-mark-completed-on-view-after-delay')
 
+    @patch('lms.djangoapps.courseware.views.views.set_custom_attribute')
+    def test_render_xblock_fragment_cache(self, mock_set_custom_attribute):
+        """
+        Test that html fragments are rendered once, and then served to every learner from the cache.
+        """
+        self.setup_course(ModuleStoreEnum.Type.split)
+        with patch('lms.djangoapps.courseware.views.views.cache', LocMemCache('render_xblock', {})):
+            for __ in range(2):
+                self.setup_user(admin=False, enroll=True, login=True)
+                response = self.get_response(usage_key=self.html_block.location)
+                assert response.status_code == 200
+                self.assertContains(response, 'Test HTML Content')
+                self.assertContains(response, 'data-request-token=')
+                self.assertNotContains(response, 'XBLOCK_REQUEST_TOKEN')
+
+        hits = [
+            call_args[0][1] for call_args in mock_set_custom_attribute.call_args_list
+            if call_args[0][0] == 'render_xblock_fragment_cache_hit'
+        ]
+        assert hits == [False, True]
+        mock_set_custom_attribute.assert_any_call('render_xblock_fragment_cache_saved_ms', ANY)
+
+    @ddt.data(True, False)
+    @patch('lms.djangoapps.courseware.views.views.set_custom_attribute')
+    def test_render_xblock_fragment_not_cached(self, staff, mock_set_custom_attribute):
+        """
+        Test that the fragments seen by staff, and fragments including the learner's id, aren't cached.
+        """
+        self.setup_course(ModuleStoreEnum.Type.split)
+        if not staff:
+            self.html_block.data = '<p>Hello %%USER_ID%%</p>'
+            self.store.update_item(self.html_block, ModuleStoreEnum.UserID.test)
+            self.store.publish(self.html_block.location, ModuleStoreEnum.UserID.test)
+        with patch('lms.djangoapps.courseware.views.views.cache', LocMemCache('render_xblock', {})):
+            for __ in range(2):
+                self.setup_user(admin=staff, enroll=True, login=True)
+                response = self.get_response(usage_key=self.html_block.location)
+                assert response.status_code == 200
+
+        attributes = [call_args[0][0] for call_args in mock_set_custom_attribute.call_args_list]
+        assert 'render_xblock_fragment_cache_hit' not in attributes
+
     def test_rendering_descendant_of_gated_sequence(self):
         """
         Test that we redirect instead of rendering what should be gated content,
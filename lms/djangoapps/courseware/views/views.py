@@ -3,8 +3,10 @@ Courseware views functions
 """
 
 
+import hashlib
 import json
 import logging
+import time
 import urllib
 from collections import OrderedDict, namedtuple
 from datetime import datetime
@@ -24,7 +26,7 @@ from django.template.context_processors import csrf
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.text import slugify
-from django.utils.translation import gettext
+from django.utils.translation import get_language, gettext
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import gettext_noop
 from django.views.decorators.cache import cache_control
@@ -125,6 +127,7 @@ from openedx.core.djangoapps.zendesk_proxy.utils import create_zendesk_ticket
 from openedx.core.djangolib.markup import HTML, Text
 from openedx.core.lib.courses import get_course_by_id
 from openedx.core.lib.mobile_utils import is_request_from_mobile_app
+from openedx.core.lib.xblock_utils import request_token as xblock_request_token
 from openedx.features.course_duration_limits.access import generate_course_expired_fragment
 from openedx.features.course_experience import course_home_url
 from openedx.features.course_experience.url_helpers import (
@@ -995,7 +998,7 @@ def _progress(request, course_key, student_id):
     # NOTE: To make sure impersonation by instructor works, use
     # student instead of request.user in the rest of the function.
 
-    course_grade = CourseGradeFactory().read(student, course)
+    course_grade = CourseGradeFactory().read(student, course, recalculate_stale_subsections=True)
     courseware_summary = list(course_grade.chapter_grades.values())
 
     studio_url = get_studio_url(course, 'settings/grading')
@@ -1626,8 +1629,9 @@ def render_xblock(request, usage_key_string, check_if_enrolled=True):
                 if not _check_sequence_exam_access(request, seq_block.location):
                     return HttpResponseForbidden("Access to exam content is restricted")
 
-        fragment = block.render(requested_view, context=student_view_context)
-        optimization_flags = get_optimization_flags_for_content(block, fragment)
+        fragment, optimization_flags = _render_xblock_fragment(
+            request, block, requested_view, student_view_context, staff_access,
+        )
 
         context = {
             'fragment': fragment,
@@ -1656,6 +1660,85 @@ def render_xblock(request, usage_key_string, check_if_enrolled=True):
         return render_to_response('courseware/courseware-chromeless.html', context)
 
 
+# Stands in for the (per-request) xblock request token in cached render_xblock fragments.
+FRAGMENT_CACHE_REQUEST_TOKEN_PLACEHOLDER = '%%XBLOCK_REQUEST_TOKEN%%'
+
+
+def _get_fragment_cache_key(block, requested_view, context, staff_access):
+    """
+    Return the key under which render_xblock caches the rendered fragment of `block`,
+    or None if the fragment may differ between learners and must not be cached.
+    """
+    if block.scope_ids.block_type not in getattr(settings, 'RENDER_XBLOCK_FRAGMENT_CACHE_BLOCK_TYPES', []):
+        return None
+
+    # Staff (who may also be masquerading) get extra markup, and learners without access to the block
+    # get an access message instead of its content.
+    if staff_access or getattr(block, 'has_access_error', True):
+        return None
+
+    # Content which includes the learner's anonymous id is never shared.
+    data = getattr(block, 'data', None)
+    if isinstance(data, str) and '%%USER_ID%%' in data:
+        return None
+
+    # The definition id changes with the block's content, and the update version with any of its fields.
+    definition_locator = getattr(block, 'definition_locator', None)
+    update_version = getattr(block, 'update_version', None)
+    if definition_locator is None or update_version is None:
+        return None
+
+    key = json.dumps([
+        str(block.location),
+        str(definition_locator.definition_id),
+        str(update_version),
+        get_language(),
+        requested_view,
+        context,
+    ], sort_keys=True, default=str)
+    return f"courseware.render_xblock.fragment.{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+
+def _render_xblock_fragment(request, block, requested_view, context, staff_access):
+    """
+    Render `block` for render_xblock, and return the fragment and its optimization flags.
+
+    The fragments of blocks whose type is listed in RENDER_XBLOCK_FRAGMENT_CACHE_BLOCK_TYPES are
+    the same for every learner, so they are cached (along with their optimization flags) for
+    RENDER_XBLOCK_FRAGMENT_CACHE_TIMEOUT seconds. Whether the cache was hit, and how long the
+    render it saved took, are reported as custom monitoring attributes.
+    """
+    timeout = getattr(settings, 'RENDER_XBLOCK_FRAGMENT_CACHE_TIMEOUT', 0)
+    cache_key = _get_fragment_cache_key(block, requested_view, context, staff_access) if timeout else None
+    token = xblock_request_token(request)
+
+    if cache_key:
+        cached = cache.get(cache_key)
+        set_custom_attribute('render_xblock_fragment_cache_hit', cached is not None)
+        if cached is not None:
+            set_custom_attribute('render_xblock_fragment_cache_saved_ms', cached['render_ms'])
+            fragment_dict = dict(cached['fragment'])
+            fragment_dict['content'] = fragment_dict['content'].replace(
+                FRAGMENT_CACHE_REQUEST_TOKEN_PLACEHOLDER, token
+            )
+            return Fragment.from_dict(fragment_dict), cached['optimization_flags']
+
+    start = time.perf_counter()
+    fragment = block.render(requested_view, context=context)
+    optimization_flags = get_optimization_flags_for_content(block, fragment)
+
+    if cache_key:
+        fragment_dict = fragment.to_dict()
+        fragment_dict['content'] = fragment_dict['content'].replace(token, FRAGMENT_CACHE_REQUEST_TOKEN_PLACEHOLDER)
+        cache.set(cache_key, {
+            'fragment': fragment_dict,
+            'optimization_flags': optimization_flags,
+            'render_ms': round((time.perf_counter() - start) * 1000, 2),
+        }, timeout)
+
+    return fragment, optimization_flags
+
+
 def get_optimization_flags_for_content(block, fragment):
     """
     Return a dict with a set of display options appropriate for the block.
@@ -3,12 +3,15 @@
 
 import datetime
 import json
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from unittest.mock import Mock, patch
 
 import ddt
 import pytest
+from django.core.cache.backends.locmem import LocMemCache
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
 from edx_django_utils.cache import RequestCache
@@ -27,11 +30,13 @@ from lms.djangoapps.discussion.django_comment_client.tests.factories import Role
 from lms.djangoapps.discussion.django_comment_client.tests.unicode import UnicodeTestMixin
 from lms.djangoapps.discussion.django_comment_client.tests.utils import config_course_discussions, topic_name_to_id
 from lms.djangoapps.teams.tests.factories import CourseTeamFactory
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.course_groups import cohorts
 from openedx.core.djangoapps.course_groups.cohorts import set_course_cohorted
 from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory, config_course_cohorts
 from openedx.core.djangoapps.discussions.utils import (
     available_division_schemes,
+    get_accessible_discussion_blocks,
     get_accessible_discussion_xblocks,
     get_discussion_categories_ids,
     get_group_names_by_id,
@@ -39,6 +44,8 @@ from openedx.core.djangoapps.discussions.utils import (
 )
 from openedx.core.djangoapps.django_comment_common.comment_client.utils import (
     CommentClientMaintenanceError,
+    _record_latency,
+    perform_concurrently,
     perform_request,
 )
 from openedx.core.djangoapps.django_comment_common.models import (
@@ -51,7 +58,7 @@ from openedx.core.djangoapps.django_comment_common.utils import seed_permissions
 from openedx.core.djangoapps.util.testing import ContentGroupTestCase
 from xmodule.modulestore.django import modulestore
 from xmodule.modulestore.tests.django_utils import TEST_DATA_SPLIT_MODULESTORE, ModuleStoreTestCase
-from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory, ToyCourseFactory
+from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory, ToyCourseFactory, check_mongo_calls
 
 
 class DictionaryTestCase(TestCase):
@@ -219,6 +226,41 @@ class CoursewareContextTestCase(ModuleStoreTestCase):
 
         assert len(get_accessible_discussion_xblocks(course, self.user)) == 1
 
+    def test_get_accessible_discussion_blocks(self):
+        """
+        Tests that the accessible discussion blocks are read from the course's collected
+        block structure, and match the accessible discussion xblocks.
+        """
+        BlockFactory.create(
+            parent_location=self.course.location,
+            category="discussion",
+            discussion_id="private_discussion",
+            discussion_category="Chapter",
+            discussion_target="Private",
+            visible_to_staff_only=True,
+        )
+        student = UserFactory.create()
+        CourseEnrollmentFactory.create(user=student, course_id=self.course.id)
+
+        with patch('openedx.core.djangoapps.content.block_structure.api.cache', LocMemCache('block_structures', {})):
+            for user in (self.user, student):
+                RequestCache.clear_all_namespaces()
+                xblocks = get_accessible_discussion_xblocks(self.course, user)
+                get_block_structure_manager(self.course.id).get_collected()
+
+                RequestCache.clear_all_namespaces()
+                with check_mongo_calls(0):
+                    blocks = get_accessible_discussion_blocks(self.course, user)
+
+                assert {
+                    (block.location, block.discussion_id, block.discussion_category, block.discussion_target)
+                    for block in blocks
+                } == {
+                    (xblock.location, xblock.discussion_id, xblock.discussion_category, xblock.discussion_target)
+                    for xblock in xblocks
+                }
+                assert any(block.discussion_id == 'private_discussion' for block in blocks) == (user == self.user)
+
 
 class CachedDiscussionIdMapTestCase(ModuleStoreTestCase):
     """
@@ -1367,6 +1409,25 @@ class GroupIdForUserTestCase(ModuleStoreTestCase):
         assert CourseDiscussionSettings.ENROLLMENT_TRACK == course_discussion_settings.division_scheme
         assert (- 2) == utils.get_group_id_for_user(self.test_user, course_discussion_settings)
 
+    def test_uncohorted_requester_after_bulk_cache(self):
+        """
+        A requester who isn't in a cohort should still be assigned one after the
+        discussion users (the requester included) have been cached in bulk.
+        """
+        set_discussion_division_settings(
+            self.course.id, enable_cohorts=True, division_scheme=CourseDiscussionSettings.COHORT
+        )
+        requester = UserFactory.create()
+        utils.bulk_cache_discussion_users(self.course.id, usernames=[self.test_user.username, requester.username])
+        content = {'username': self.test_user.username}
+        assert utils.get_user_group_ids(self.course.id, content)[1] == self.test_cohort.id
+
+        request = RequestFactory().get('dummy_url')
+        request.user = requester
+        group_id = utils.get_group_id_for_comments_service(request, self.course.id)
+        assert group_id is not None
+        assert group_id == cohorts.get_cohort(requester, self.course.id).id
+
 
 class CourseDiscussionDivisionEnabledTestCase(ModuleStoreTestCase):
     """ Test the course_discussion_division_enabled and available_division_schemes methods. """
@@ -1662,7 +1723,7 @@ class ClientConfigurationTestCase(TestCase):
         with pytest.raises(CommentClientMaintenanceError):
             perform_request('GET', 'http://www.google.com')
 
-    @patch('requests.request')
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.send_request')
     def test_enabled(self, mock_request):
         """Ensures that requests proceed normally when forums are enabled."""
         config = ForumsConfig.current()
@@ -1679,6 +1740,111 @@ class ClientConfigurationTestCase(TestCase):
         assert result == {}
 
 
+@ddt.ddt
+class RequestLatencyTestCase(TestCase):
+    """
+    Tests that the latencies of comments service requests are recorded in a histogram per endpoint.
+    """
+
+    @ddt.data(
+        (0.5, 'le_10'),
+        (10, 'le_10'),
+        (10.5, 'le_25'),
+        (300, 'le_500'),
+        (2500, 'le_2500'),
+        (4000, 'inf'),
+    )
+    @ddt.unpack
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.monitoring_utils')
+    def test_latency_bucket(self, latency_ms, bucket, mock_monitoring):
+        _record_latency('get_thread', latency_ms)
+        mock_monitoring.increment.assert_called_once_with(f'forums_request.get_thread.latency_ms.{bucket}')
+        mock_monitoring.accumulate.assert_called_once_with('forums_request.get_thread.latency_ms', latency_ms)
+
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.monitoring_utils')
+    def test_latency_without_action(self, mock_monitoring):
+        _record_latency(None, 30)
+        mock_monitoring.increment.assert_called_once_with('forums_request.unknown.latency_ms.le_50')
+        mock_monitoring.accumulate.assert_called_once_with('forums_request.unknown.latency_ms', 30)
+
+    @patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.monitoring_utils')
+    def test_concurrent_latencies_recorded_on_request_thread(self, mock_monitoring):
+        recording_threads = []
+        mock_monitoring.increment.side_effect = lambda name: recording_threads.append(threading.current_thread())
+        perform_concurrently(
+            lambda: _record_latency('get_thread', 30),
+            lambda: _record_latency('get_user', 600),
+            max_workers=2
+        )
+        assert mock_monitoring.increment.call_args_list == [
+            mock.call('forums_request.get_thread.latency_ms.le_50'),
+            mock.call('forums_request.get_user.latency_ms.le_1000'),
+        ]
+        assert recording_threads == [threading.current_thread()] * 2
+
+
+class ClientConnectionTestCase(TestCase):
+    """
+    Tests that requests to the comments service share pooled connections, and
+    can be made concurrently.
+    """
+
+    def setUp(self):
+        super().setUp()
+        config = ForumsConfig.current()
+        config.enabled = True
+        config.save()
+
+        client_addresses = self.client_addresses = set()
+
+        class Handler(BaseHTTPRequestHandler):
+            """Responds to every request with its path, after noting which connection it was made on."""
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                client_addresses.add(self.client_address)
+                body = json.dumps({'path': self.path.split('?')[0]}).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    def test_connections_reused(self):
+        for index in range(5):
+            assert perform_request('get', f'{self.url}/{index}') == {'path': f'/{index}'}
+        assert len(self.client_addresses) == 1
+
+    def test_perform_concurrently(self):
+        results = perform_concurrently(
+            *[lambda index=index: perform_request('get', f'{self.url}/{index}') for index in range(4)],
+            max_workers=4
+        )
+        assert results == [{'path': f'/{index}'} for index in range(4)]
+
+    def test_perform_concurrently_raises_first_error(self):
+        def fail(message):
+            raise ValueError(message)
+
+        with pytest.raises(ValueError, match='first'):
+            perform_concurrently(
+                lambda: perform_request('get', f'{self.url}/0'),
+                lambda: fail('first'),
+                lambda: fail('second'),
+                max_workers=3
+            )
+
+
 def set_discussion_division_settings(
     course_key, enable_cohorts=False, always_divide_inline_discussions=False,
     divided_discussions=[], division_scheme=CourseDiscussionSettings.COHORT
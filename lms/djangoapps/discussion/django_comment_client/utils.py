@@ -12,15 +12,16 @@ from datetime import datetime
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import connection
+from django.db.models import Q
 from django.http import HttpResponse
 from django.urls import reverse
 from django.utils.deprecation import MiddlewareMixin
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey, UsageKey, i4xEncoder
 from pytz import UTC
 
-from common.djangoapps.student.models import get_user_by_username_or_email
 from common.djangoapps.student.roles import GlobalStaff
-from lms.djangoapps.courseware.access import has_access
+from lms.djangoapps.courseware.access import bulk_access_checks, has_access
 from lms.djangoapps.discussion.django_comment_client.constants import TYPE_ENTRY, TYPE_SUBCATEGORY
 from lms.djangoapps.discussion.django_comment_client.permissions import (
     check_permissions_by_view,
@@ -28,10 +29,10 @@ from lms.djangoapps.discussion.django_comment_client.permissions import (
     has_permission
 )
 from lms.djangoapps.discussion.django_comment_client.settings import MAX_COMMENT_DEPTH
-from openedx.core.djangoapps.course_groups.cohorts import get_cohort_id
+from openedx.core.djangoapps.course_groups.cohorts import bulk_cache_cohorts, get_cohort_id
 from openedx.core.djangoapps.discussions.utils import (
-    get_accessible_discussion_xblocks,
-    get_accessible_discussion_xblocks_by_course_id,
+    get_accessible_discussion_blocks,
+    get_accessible_discussion_blocks_by_course_id,
     get_course_division_scheme,
     get_discussion_categories_ids,
     get_group_names_by_id,
@@ -45,11 +46,12 @@ from openedx.core.djangoapps.django_comment_common.models import (
     DiscussionsIdMapping,
     Role,
     FORUM_ROLE_ADMINISTRATOR, FORUM_ROLE_MODERATOR, FORUM_ROLE_GROUP_MODERATOR)
+from openedx.core.djangoapps.user_api.models import UserRetirementRequest
 from openedx.core.lib.cache_utils import request_cached
 from openedx.core.lib.courses import get_course_by_id
 from xmodule.modulestore.django import modulestore
 from xmodule.partitions.partitions import ENROLLMENT_TRACK_PARTITION_ID
-from xmodule.partitions.partitions_service import PartitionService
+from xmodule.partitions.partitions_service import PartitionService, prefetch_user_partition_groups
 
 log = logging.getLogger(__name__)
 
@@ -241,14 +243,15 @@ def get_cached_discussion_id_map_by_course_id(course_id, discussion_ids, user):
     include_all = getattr(user, 'is_community_ta', False)
     try:
         entries = []
-        for discussion_id in discussion_ids:
-            key = get_cached_discussion_key(course_id, discussion_id)
-            if not key:
-                continue
-            xblock = _get_item_from_modulestore(key)
-            if not (has_required_keys(xblock) and (include_all or has_access(user, 'load', xblock, course_id))):
-                continue
-            entries.append(get_discussion_id_map_entry(xblock))
+        with bulk_access_checks(user, course_id):
+            for discussion_id in discussion_ids:
+                key = get_cached_discussion_key(course_id, discussion_id)
+                if not key:
+                    continue
+                xblock = _get_item_from_modulestore(key)
+                if not (has_required_keys(xblock) and (include_all or has_access(user, 'load', xblock, course_id))):
+                    continue
+                entries.append(get_discussion_id_map_entry(xblock))
         return dict(entries)
     except DiscussionIdMapIsNotCached:
         return get_discussion_id_map_by_course_id(course_id, user)
@@ -267,8 +270,8 @@ def get_discussion_id_map_by_course_id(course_id, user):
     Transform the list of this course's discussion xblocks (visible to a given user) into a dictionary of metadata keyed
     by discussion_id.
     """
-    xblocks = get_accessible_discussion_xblocks_by_course_id(course_id, user)
-    return dict(list(map(get_discussion_id_map_entry, xblocks)))
+    blocks = get_accessible_discussion_blocks_by_course_id(course_id, user)
+    return dict(list(map(get_discussion_id_map_entry, blocks)))
 
 
 @request_cached()
@@ -385,19 +388,19 @@ def get_discussion_category_map(course, user, divided_only_if_explicit=False, ex
     """
     unexpanded_category_map = defaultdict(list)
 
-    xblocks = get_accessible_discussion_xblocks(course, user)
+    discussion_blocks = get_accessible_discussion_blocks(course, user)
 
     discussion_settings = CourseDiscussionSettings.get(course.id)
     discussion_division_enabled = course_discussion_division_enabled(discussion_settings)
     divided_discussion_ids = discussion_settings.divided_discussions
 
-    for xblock in xblocks:
-        discussion_id = xblock.discussion_id
-        title = xblock.discussion_target
-        sort_key = xblock.sort_key
-        category = " / ".join([x.strip() for x in xblock.discussion_category.split("/")])
-        # Handle case where xblock.start is None
-        entry_start_date = xblock.start if xblock.start else datetime.max.replace(tzinfo=UTC)
+    for block in discussion_blocks:
+        discussion_id = block.discussion_id
+        title = block.discussion_target
+        sort_key = block.sort_key
+        category = " / ".join([x.strip() for x in block.discussion_category.split("/")])
+        # Handle case where block.start is None
+        entry_start_date = block.start if block.start else datetime.max.replace(tzinfo=UTC)
         unexpanded_category_map[category].append({"title": title,
                                                   "id": discussion_id,
                                                   "sort_key": sort_key,
@@ -623,6 +626,86 @@ def get_ability(course_id, content, user):
 # TODO: RENAME
 
 
+DISCUSSION_USERS_CACHE_NAMESPACE = "discussion.users"
+
+
+def bulk_cache_discussion_users(course_id, usernames=(), user_ids=()):
+    """
+    Pre-fetches and caches the users (with their profiles) with the given
+    usernames and ids, whether they have requested retirement, and the
+    discussion groups they belong to in the course, for later fast retrieval
+    by get_cached_discussion_user, get_user_group_ids and
+    get_group_id_for_user_from_cache.
+    """
+    cache = RequestCache(DISCUSSION_USERS_CACHE_NAMESPACE).data
+    usernames = {username for username in usernames if username and ('username', username) not in cache}
+    user_ids = {int(user_id) for user_id in user_ids if user_id is not None and ('id', int(user_id)) not in cache}
+    if not (usernames or user_ids):
+        return
+
+    users = list(User.objects.filter(Q(username__in=usernames) | Q(id__in=user_ids)).select_related('profile'))
+    retiring_user_ids = set(
+        UserRetirementRequest.objects.filter(user__in=users).values_list('user_id', flat=True)
+    )
+    for username in usernames:
+        cache[('username', username)] = None
+    for user_id in user_ids:
+        cache[('id', user_id)] = None
+    for user in users:
+        cache[('username', user.username)] = cache[('id', user.id)] = user
+        cache[('retiring', user.id)] = user.id in retiring_user_ids
+
+    division_scheme = get_course_division_scheme(CourseDiscussionSettings.get(course_id))
+    if users and division_scheme == CourseDiscussionSettings.COHORT:
+        bulk_cache_cohorts(course_id, users)
+    elif users and division_scheme == CourseDiscussionSettings.ENROLLMENT_TRACK:
+        partition = PartitionService(course_id).get_user_partition(ENROLLMENT_TRACK_PARTITION_ID)
+        prefetch_user_partition_groups(course_id, [partition], users)
+
+
+def get_cached_discussion_user(username=None, user_id=None):
+    """
+    Returns the user with the given username (or id), or None if there is no
+    such user, using the users pre-fetched by bulk_cache_discussion_users.
+    """
+    cache = RequestCache(DISCUSSION_USERS_CACHE_NAMESPACE).data
+    if username is not None:
+        key = ('username', username)
+        lookup = {'username': username}
+    else:
+        key = ('id', int(user_id))
+        lookup = {'id': int(user_id)}
+    if key not in cache:
+        cache[key] = User.objects.filter(**lookup).select_related('profile').first()
+    return cache[key]
+
+
+def _has_requested_retirement(user):
+    """
+    Returns whether the user has requested retirement, using the state
+    pre-fetched by bulk_cache_discussion_users.
+    """
+    cache = RequestCache(DISCUSSION_USERS_CACHE_NAMESPACE).data
+    key = ('retiring', user.id)
+    if key not in cache:
+        cache[key] = UserRetirementRequest.has_user_requested_retirement(user)
+    return cache[key]
+
+
+def _get_content_usernames(content):
+    """
+    Returns the usernames of the authors of the thread or comment and all of its children.
+    """
+    usernames = {content.get('username')}
+    for child in (
+            content.get('children', []) +
+            content.get('endorsed_responses', []) +
+            content.get('non_endorsed_responses', [])
+    ):
+        usernames |= _get_content_usernames(child)
+    return usernames
+
+
 def get_user_group_ids(course_id, content, user=None):
     """
     Given a user, course ID, and the content of the thread or comment, returns the group ID for the current user
@@ -632,11 +715,9 @@ def get_user_group_ids(course_id, content, user=None):
     user_group_id = None
     if course_id is not None:
         if content.get('username'):
-            try:
-                content_user = get_user_by_username_or_email(content.get('username'))
-                content_user_group_id = get_group_id_for_user_from_cache(content_user, course_id)
-            except User.DoesNotExist:
-                content_user_group_id = None
+            content_user = get_cached_discussion_user(username=content.get('username'))
+            if content_user is not None and not _has_requested_retirement(content_user):
+                content_user_group_id = get_group_id_for_user_from_cache(content_user, course_id, use_cached=True)
 
         user_group_id = get_group_id_for_user_from_cache(user, course_id) if user else None
     return user_group_id, content_user_group_id
@@ -665,6 +746,7 @@ def get_annotated_content_infos(course_id, thread, user, user_info):
     Get metadata for a thread and its children
     """
     infos = {}
+    bulk_cache_discussion_users(course_id, _get_content_usernames(thread))
 
     def annotate(content):
         infos[str(content['id'])] = get_annotated_content_info(course_id, content, user, user_info)
@@ -686,6 +768,9 @@ def get_metadata_for_threads(course_id, threads, user, user_info):
     def infogetter(thread):
         return get_annotated_content_infos(course_id, thread, user, user_info)
 
+    bulk_cache_discussion_users(
+        course_id, set().union(*(_get_content_usernames(thread) for thread in threads))
+    )
     metadata = {}
     for thread in threads:
         metadata.update(infogetter(thread))
@@ -893,23 +978,27 @@ def get_group_id_for_comments_service(request, course_key, commentable_id=None):
 
 
 @request_cached()
-def get_group_id_for_user_from_cache(user, course_id):
+def get_group_id_for_user_from_cache(user, course_id, use_cached=False):
     """
     Caches the results of get_group_id_for_user, but serializes the course_id
     instead of the course_discussions_settings object as cache keys.
+    Pass use_cached=True for users other than the requester, such as content
+    authors, whose cohorts were cached by bulk_cache_discussion_users.
     """
-    return get_group_id_for_user(user, CourseDiscussionSettings.get(course_id))
+    return get_group_id_for_user(user, CourseDiscussionSettings.get(course_id), use_cached=use_cached)
 
 
-def get_group_id_for_user(user, course_discussion_settings):
+def get_group_id_for_user(user, course_discussion_settings, use_cached=False):
     """
     Given a user, return the group_id for that user according to the course_discussion_settings.
     If discussions are not divided, this method will return None.
     It will also return None if the user is in no group within the specified division_scheme.
+    Pass use_cached=True to use the user's cohort cached during the request (for example, by
+    bulk_cache_discussion_users) instead of fetching it from the database.
     """
     division_scheme = get_course_division_scheme(course_discussion_settings)
     if division_scheme == CourseDiscussionSettings.COHORT:
-        return get_cohort_id(user, course_discussion_settings.course_id)
+        return get_cohort_id(user, course_discussion_settings.course_id, use_cached=use_cached)
     elif division_scheme == CourseDiscussionSettings.ENROLLMENT_TRACK:
         partition_service = PartitionService(course_discussion_settings.course_id)
         group_id = partition_service.get_user_group_id_for_partition(user, ENROLLMENT_TRACK_PARTITION_ID)
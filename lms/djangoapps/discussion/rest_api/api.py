@@ -16,7 +16,7 @@ from pytz import UTC
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db.models import Q
 from django.http import Http404
 from django.urls import reverse
@@ -46,7 +46,7 @@ from openedx.core.djangoapps.discussions.models import (
     Provider,
     PostingRestriction
 )
-from openedx.core.djangoapps.discussions.utils import get_accessible_discussion_xblocks
+from openedx.core.djangoapps.discussions.utils import get_accessible_discussion_blocks
 from openedx.core.djangoapps.django_comment_common import comment_client
 from openedx.core.djangoapps.django_comment_common.comment_client.comment import Comment
 from openedx.core.djangoapps.django_comment_common.comment_client.course import (
@@ -78,7 +78,7 @@ from openedx.core.djangoapps.django_comment_common.signals import (
     thread_flagged,
     thread_voted
 )
-from openedx.core.djangoapps.user_api.accounts.api import get_account_settings
+from openedx.core.djangoapps.user_api.accounts.serializers import AccountLegacyProfileSerializer
 from openedx.core.lib.exceptions import CourseNotFoundError, DiscussionNotFoundError, PageNotFoundError
 from xmodule.course_block import CourseBlock
 from xmodule.modulestore.django import modulestore
@@ -97,6 +97,8 @@ from ..django_comment_client.base.views import (
     track_forum_search_event
 )
 from ..django_comment_client.utils import (
+    bulk_cache_discussion_users,
+    get_cached_discussion_user,
     get_group_id_for_user,
     get_user_role_names,
     has_discussion_privileges,
@@ -427,11 +429,11 @@ def get_courseware_topics(
 
     now = datetime.now(UTC)
 
-    discussion_xblocks = get_accessible_discussion_xblocks(course, request.user)
-    xblocks_by_category = defaultdict(list)
-    for xblock in discussion_xblocks:
-        if course.self_paced or (xblock.start and xblock.start < now):
-            xblocks_by_category[xblock.discussion_category].append(xblock)
+    discussion_blocks = get_accessible_discussion_blocks(course, request.user)
+    blocks_by_category = defaultdict(list)
+    for block in discussion_blocks:
+        if course.self_paced or (block.start and block.start < now):
+            blocks_by_category[block.discussion_category].append(block)
 
     def sort_categories(category_list):
         """
@@ -449,21 +451,21 @@ def get_courseware_topics(
 
         return sorted(category_list, key=alphanum_key)
 
-    for category in sort_categories(xblocks_by_category.keys()):
+    for category in sort_categories(blocks_by_category.keys()):
         children = []
-        for xblock in xblocks_by_category[category]:
-            if not topic_ids or xblock.discussion_id in topic_ids:
+        for block in blocks_by_category[category]:
+            if not topic_ids or block.discussion_id in topic_ids:
                 discussion_topic = DiscussionTopic(
-                    xblock.discussion_id,
-                    xblock.discussion_target,
-                    get_thread_list_url(request, course_key, [xblock.discussion_id]),
+                    block.discussion_id,
+                    block.discussion_target,
+                    get_thread_list_url(request, course_key, [block.discussion_id]),
                     None,
-                    thread_counts.get(xblock.discussion_id),
+                    thread_counts.get(block.discussion_id),
                 )
                 children.append(discussion_topic)
 
-                if topic_ids and xblock.discussion_id in topic_ids:
-                    existing_topic_ids.add(xblock.discussion_id)
+                if topic_ids and block.discussion_id in topic_ids:
+                    existing_topic_ids.add(block.discussion_id)
 
         if not topic_ids or children:
             discussion_topic = DiscussionTopic(
@@ -472,7 +474,7 @@ def get_courseware_topics(
                 get_thread_list_url(
                     request,
                     course_key,
-                    [item.discussion_id for item in xblocks_by_category[category]],
+                    [item.discussion_id for item in blocks_by_category[category]],
                 ),
                 children,
                 None,
@@ -773,8 +775,17 @@ def _get_user_profile_dict(request, usernames):
         username_list = usernames.split(",")
     else:
         username_list = []
-    user_profile_details = get_account_settings(request, username_list)
-    return {user['username']: user for user in user_profile_details}
+    user_profile_dict = {}
+    for username in username_list:
+        user = get_cached_discussion_user(username=username)
+        if user is None:
+            continue
+        try:
+            profile_image = AccountLegacyProfileSerializer.get_profile_image(user.profile, user, request)
+        except ObjectDoesNotExist:
+            profile_image = None
+        user_profile_dict[username] = {'username': username, 'profile_image': profile_image}
+    return user_profile_dict
 
 
 def _user_profile(user_profile):
@@ -851,6 +862,32 @@ def _include_profile_image(requested_fields):
     return requested_fields and 'profile_image' in requested_fields
 
 
+def _bulk_cache_entity_users(course_key, discussion_entities):
+    """
+    Pre-fetches the users whose usernames or roles may be included in the
+    serializations of the given threads or comments (and their children), so
+    that they are loaded with a fixed number of queries for the whole page.
+    """
+    usernames = set()
+    user_ids = set()
+
+    def collect(entity):
+        usernames.add(entity.get("username"))
+        usernames.add(entity.get("closed_by"))
+        edit_history = entity.get("edit_history")
+        if edit_history:
+            usernames.add(edit_history[-1].get("editor_username"))
+        endorsement = entity.get("endorsement")
+        if endorsement:
+            user_ids.add(endorsement["user_id"])
+        for child in entity.get("children") or []:
+            collect(child)
+
+    for entity in discussion_entities:
+        collect(entity)
+    bulk_cache_discussion_users(course_key, usernames, user_ids)
+
+
 def _serialize_discussion_entities(request, context, discussion_entities, requested_fields, discussion_entity_type):
     """
     It serializes Discussion Entity (Thread or Comment) and add additional data if requested.
@@ -874,6 +911,7 @@ def _serialize_discussion_entities(request, context, discussion_entities, reques
     results = []
     usernames = []
     include_profile_image = _include_profile_image(requested_fields)
+    _bulk_cache_entity_users(context["course"].id, discussion_entities)
     for entity in discussion_entities:
         if discussion_entity_type == DiscussionEntity.thread:
             serialized_entity = ThreadSerializer(entity, context=context).data
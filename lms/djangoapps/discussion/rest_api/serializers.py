@@ -6,7 +6,7 @@ from urllib.parse import urlencode, urlunparse
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 from django.db.models import TextChoices
 from django.urls import reverse
 from django.utils.html import strip_tags
@@ -18,6 +18,7 @@ from lms.djangoapps.discussion.django_comment_client.base.views import track_thr
     track_thread_edited_event, track_comment_edited_event, track_forum_response_mark_event
 from lms.djangoapps.discussion.django_comment_client.utils import (
     course_discussion_division_enabled,
+    get_cached_discussion_user,
     get_group_id_for_user,
     get_group_name,
     is_comment_too_deep,
@@ -218,11 +219,8 @@ class _ContentSerializer(serializers.Serializer):
         Returns role label of user from username
         Possible Role Labels: Staff, Community TA or None
         """
-        try:
-            user = User.objects.get(username=username)
-            return self._get_user_label(user.id)
-        except ObjectDoesNotExist:
-            return None
+        user = get_cached_discussion_user(username=username) if username else None
+        return self._get_user_label(user.id) if user else None
 
     def get_author_label(self, obj):
         """
@@ -532,7 +530,10 @@ class CommentSerializer(_ContentSerializer):
                 self._is_anonymous(self.context["thread"]) and
                 not self._is_user_privileged(endorser_id)
             ):
-                return User.objects.get(id=endorser_id).username
+                endorser = get_cached_discussion_user(user_id=endorser_id)
+                if endorser is None:
+                    raise User.DoesNotExist
+                return endorser.username
         return None
 
     def get_endorsed_by_label(self, obj):
@@ -12,7 +12,9 @@ from urllib.parse import parse_qs, urlencode, urlparse
 import ddt
 import httpretty
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from edx_toggles.toggles.testutils import override_waffle_flag
 from opaque_keys.edx.keys import CourseKey
@@ -1350,6 +1352,39 @@ class ThreadViewSetListTest(DiscussionAPIViewTestMixin, ModuleStoreTestCase, Pro
         assert response_thread['author'] is None
         assert {} == response_thread['users']
 
+    def test_profile_image_requested_field_query_count(self):
+        """
+        Tests that the number of queries made for a page of threads with profile
+        images doesn't depend on the number of thread authors
+        """
+        def get_num_queries(num_threads):
+            """
+            Returns the number of queries made to list threads by num_threads different authors.
+            """
+            authors = [UserFactory.create() for __ in range(num_threads)]
+            source_threads = [
+                self.create_source_thread({
+                    "id": f"test_thread_{index}",
+                    "user_id": str(author.id),
+                    "username": author.username,
+                    "edit_history": [{"editor_username": author.username}],
+                })
+                for index, author in enumerate(authors)
+            ]
+            self.register_get_threads_response(source_threads, page=1, num_pages=1)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(
+                    self.url,
+                    {"course_id": str(self.course.id), "requested_fields": "profile_image"},
+                )
+            assert response.status_code == 200
+            assert len(json.loads(response.content.decode('utf-8'))['results']) == num_threads
+            return len(queries)
+
+        self.register_get_user_response(self.user)
+        get_num_queries(1)
+        assert get_num_queries(10) == get_num_queries(2)
+
 
 @httpretty.activate
 @disable_signal(api, 'thread_created')
@@ -211,7 +211,7 @@ class TaskTestCase(ModuleStoreTestCase):  # lint-amnesty, pylint: disable=missin
 
     def setUp(self):
         super().setUp()
-        self.request_patcher = mock.patch('requests.request')
+        self.request_patcher = mock.patch('openedx.core.djangoapps.django_comment_common.comment_client.utils.send_request')
         self.mock_request = self.request_patcher.start()
 
         self.ace_send_patcher = mock.patch('edx_ace.ace.send')
@@ -585,19 +585,23 @@ def create_user_profile_context(request, course_key, user_id):
         'per_page': THREADS_PER_PAGE,   # more than threads_per_page to show more activities
     }
 
+    profiled_user_kwargs = {'id': user_id, 'course_id': course_key}
     group_id = get_group_id_for_comments_service(request, course_key)
     if group_id is not None:
         query_params['group_id'] = group_id
-        profiled_user = cc.User(id=user_id, course_id=course_key, group_id=group_id)
-    else:
-        profiled_user = cc.User(id=user_id, course_id=course_key)
-
-    threads, page, num_pages = profiled_user.active_threads(query_params)
+        profiled_user_kwargs['group_id'] = group_id
+
+    # The active threads and both users are independent, so they're fetched at the same time. The threads
+    # are fetched through their own User, since to_dict() updates the User it's called on from its thread.
+    (threads, page, num_pages), user_info, profiled_user_info = cc.perform_concurrently(
+        lambda: cc.User(**profiled_user_kwargs).active_threads(query_params),
+        user.to_dict,
+        cc.User(**profiled_user_kwargs).to_dict,
+    )
     query_params['page'] = page
     query_params['num_pages'] = num_pages
 
     with function_trace("get_metadata_for_threads"):
-        user_info = cc.User.from_django_user(request.user).to_dict()
         annotated_content_info = utils.get_metadata_for_threads(course_key, threads, request.user, user_info)
 
     is_staff = has_permission(request.user, 'openclose_thread', course.id)
@@ -622,7 +626,7 @@ def create_user_profile_context(request, course_key, user_id):
         context.update({
             'django_user': django_user,
             'django_user_roles': user_roles,
-            'profiled_user': profiled_user.to_dict(),
+            'profiled_user': profiled_user_info,
             'threads': threads,
             'user_group_id': user_group_id,
             'annotated_content_info': annotated_content_info,
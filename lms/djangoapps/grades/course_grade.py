@@ -276,9 +276,14 @@ class ZeroCourseGrade(CourseGradeBase):
 class CourseGrade(CourseGradeBase):
     """
     Course Grade class when grades are updated or read from storage.
+
+    If recalculate_stale_subsections is True, persisted subsection grades
+    that are stale for the current course structure are recalculated
+    (without being saved) when they are read.
     """
-    def __init__(self, user, course_data, *args, **kwargs):
+    def __init__(self, user, course_data, *args, recalculate_stale_subsections=False, **kwargs):
         super().__init__(user, course_data, *args, **kwargs)
+        self.recalculate_stale_subsections = recalculate_stale_subsections
         self._subsection_grade_factory = SubsectionGradeFactory(user, course_data=course_data)
 
     def update(self, visible_grades_only=False, has_staff_access=False):
@@ -311,7 +316,9 @@ class CourseGrade(CourseGradeBase):
             return self._subsection_grade_factory.update(subsection, force_update_subsections=force_update_subsections)
         else:
             # Pass read_only here so the subsection grades can be persisted in bulk at the end.
-            return self._subsection_grade_factory.create(subsection, read_only=True)
+            return self._subsection_grade_factory.create(
+                subsection, read_only=True, recalculate_if_stale=self.recalculate_stale_subsections,
+            )
 
     @staticmethod
     def _compute_percent(grader_result):
@@ -31,6 +31,7 @@ class CourseGradeFactory:
             course_structure=None,
             course_key=None,
             create_if_needed=True,
+            recalculate_stale_subsections=False,
     ):
         """
         Returns the CourseGrade for the given user in the course.
@@ -38,10 +39,15 @@ class CourseGradeFactory:
 
         At least one of course, collected_block_structure, course_structure,
         or course_key should be provided.
+
+        If recalculate_stale_subsections is True, the persisted grades of
+        subsections whose visible blocks have changed since they were saved
+        are recalculated (but not saved); all other subsection grades are
+        read from storage.
         """
         course_data = CourseData(user, course, collected_block_structure, course_structure, course_key)
         try:
-            return self._read(user, course_data)
+            return self._read(user, course_data, recalculate_stale_subsections)
         except PersistentCourseGrade.DoesNotExist:
             return self._create_zero(user, course_data)
 
@@ -130,7 +136,7 @@ class CourseGradeFactory:
         return ZeroCourseGrade(user, course_data)
 
     @staticmethod
-    def _read(user, course_data):
+    def _read(user, course_data, recalculate_stale_subsections=False):
         """
         Returns a CourseGrade object based on stored grade information
         for the given user and course.
@@ -144,7 +150,8 @@ class CourseGradeFactory:
             persistent_grade.percent_grade,
             persistent_grade.letter_grade,
             persistent_grade.letter_grade != '',
-            last_updated=persistent_grade.modified
+            last_updated=persistent_grade.modified,
+            recalculate_stale_subsections=recalculate_stale_subsections,
         )
 
     @staticmethod
@@ -11,6 +11,7 @@ from lazy import lazy
 
 from lms.djangoapps.grades.models import BlockRecord, PersistentSubsectionGrade
 from lms.djangoapps.grades.scores import compute_percent, get_score, possibly_scored
+from lms.djangoapps.grades.transformer import GradesTransformer
 from xmodule import block_metadata_utils, graders  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.graders import AggregatedScore, ShowCorrectness  # lint-amnesty, pylint: disable=wrong-import-order
 
@@ -271,6 +272,33 @@ class ReadSubsectionGrade(NonZeroSubsectionGrade):
                 problem_scores[block.locator] = problem_score
         return problem_scores
 
+    @lazy
+    def is_stale(self):
+        """
+        Returns whether the scored blocks the user can currently see in this
+        subsection differ from the visible blocks the persisted grade was
+        calculated over, e.g. because problems were added to or removed from
+        the subsection, or the user's access to them has changed, since then.
+
+        Only the course structure and the persisted visible blocks are used,
+        so this doesn't load any scores.
+        """
+        course_structure = self.factory.course_data.structure
+        persisted_locations = {block.locator for block in self.model.visible_blocks.blocks}
+        visible_locations = set()
+        for block_key in course_structure.post_order_traversal(
+                filter_func=possibly_scored,
+                start_node=self.location,
+        ):
+            block = course_structure[block_key]
+            if not getattr(block, 'has_score', False):
+                continue
+            # Scorable blocks without a max score are left out of newly calculated
+            # grades (see get_score), so they only count if they were persisted.
+            if block_key in persisted_locations or block.transformer_data[GradesTransformer].max_score is not None:
+                visible_locations.add(block_key)
+        return visible_locations != persisted_locations
+
 
 class CreateSubsectionGrade(NonZeroSubsectionGrade):
     """
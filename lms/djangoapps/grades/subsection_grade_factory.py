@@ -34,19 +34,29 @@ class SubsectionGradeFactory:
         self._cached_subsection_grades = None
         self._unsaved_subsection_grades = OrderedDict()
 
-    def create(self, subsection, read_only=False, force_calculate=False):
+    def create(self, subsection, read_only=False, force_calculate=False, recalculate_if_stale=False):
         """
         Returns the SubsectionGrade object for the student and subsection.
 
         If read_only is True, doesn't save any updates to the grades.
         force_calculate - If true, will cause this function to return a `CreateSubsectionGrade` object if no cached
         grade currently exists.
+        recalculate_if_stale - If true, a persisted grade whose visible blocks no longer match the course
+        structure (and which has no override) is recalculated, without being saved, instead of being returned.
         """
         self._log_event(
             log.debug, f"create, read_only: {read_only}, subsection: {subsection.location}", subsection,
         )
 
         subsection_grade = self._get_bulk_cached_grade(subsection)
+        if (
+            recalculate_if_stale and subsection_grade and
+            subsection_grade.override is None and subsection_grade.is_stale
+        ):
+            self._log_event(log.debug, f"create, stale grade, subsection: {subsection.location}", subsection)
+            return CreateSubsectionGrade(
+                subsection, self.course_data.structure, self._submissions_scores, self._csm_scores,
+            )
         if not subsection_grade:
             if not force_calculate:
                 subsection_grade = ZeroSubsectionGrade(subsection, self.course_data)
@@ -13,7 +13,8 @@ from lms.djangoapps.courseware.tests.test_submitting_problems import ProblemSubm
 
 from ..constants import GradeOverrideFeatureEnum
 from ..models import PersistentSubsectionGrade, PersistentSubsectionGradeOverride
-from ..subsection_grade_factory import ZeroSubsectionGrade
+from ..subsection_grade import CreateSubsectionGrade, ReadSubsectionGrade
+from ..subsection_grade_factory import SubsectionGradeFactory, ZeroSubsectionGrade
 from .base import GradeTestBase
 from .utils import mock_get_score
 
@@ -149,6 +150,40 @@ class TestSubsectionGradeFactory(ProblemSubmissionTestMixin, GradeTestBase):
                 expected_possible = persistent_grade.possible_graded
             self.assert_grade(grade, expected_earned, expected_possible)
 
+    def test_create_reads_current_grade(self):
+        """
+        Test that a persisted grade whose visible blocks match the course
+        structure is read from storage, without loading any scores.
+        """
+        with mock_get_score(1, 2):
+            self.subsection_grade_factory.update(self.sequence)
+
+        grade_factory = SubsectionGradeFactory(self.request.user, self.course, self.course_structure)
+        with self.assertNumQueries(1):
+            grade = grade_factory.create(self.sequence, read_only=True, recalculate_if_stale=True)
+            assert isinstance(grade, ReadSubsectionGrade)
+            self.assert_grade(grade, 1, 2)
+
+    def test_create_recalculates_stale_grade(self):
+        """
+        Test that a persisted grade calculated over blocks which are no longer
+        visible is recalculated, but not saved, when asked to.
+        """
+        with mock_get_score(1, 2):
+            self.subsection_grade_factory.update(self.sequence)
+        self.course_structure.remove_block(self.problem.location, keep_descendants=False)
+
+        grade = SubsectionGradeFactory(self.request.user, self.course, self.course_structure).create(self.sequence)
+        assert isinstance(grade, ReadSubsectionGrade)
+        self.assert_grade(grade, 1, 2)
+
+        grade_factory = SubsectionGradeFactory(self.request.user, self.course, self.course_structure)
+        grade = grade_factory.create(self.sequence, read_only=True, recalculate_if_stale=True)
+        assert isinstance(grade, CreateSubsectionGrade)
+        self.assert_grade(grade, 0, 0)
+        persistent_grade = PersistentSubsectionGrade.objects.get(usage_key=self.sequence.location)
+        assert (persistent_grade.earned_all, persistent_grade.possible_all) == (1, 2)
+
     def test_display_name_not_escaped(self):
         """Confirm that we don't escape the display name - downstream consumers will do that instead"""
         # first, do an update to create a persistent grade
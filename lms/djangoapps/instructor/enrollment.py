@@ -7,11 +7,13 @@ Does not include any access control, be sure to check access before calling.
 
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
 
 import pytz
 from django.conf import settings
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.translation import override as override_language
@@ -66,18 +68,26 @@ class EmailEnrollmentState:
             user = User.objects.get(email=email)
         except User.DoesNotExist:
             user = None
+        if user is not None:
+            ceas = CourseEnrollmentAllowed.for_user(user).filter(course_id=course_id).all()
+        else:
+            ceas = CourseEnrollmentAllowed.objects.filter(email=email, course_id=course_id).all()
+        self._set_state(course_id, user, ceas)
+
+    def _set_state(self, course_id, user, ceas):
+        """
+        Set the state from the user (or None) and their CourseEnrollmentAllowed objects in the course.
+        """
         if user is not None:
             mode, is_active = CourseEnrollment.enrollment_mode_for_user(user, course_id)
             # is_active is `None` if the user is not enrolled in the course
             exists_ce = is_active is not None and is_active
             full_name = user.profile.name
-            ceas = CourseEnrollmentAllowed.for_user(user).filter(course_id=course_id).all()
         else:
             mode = None
             exists_ce = False
             full_name = None
-            ceas = CourseEnrollmentAllowed.objects.filter(email=email, course_id=course_id).all()
-        exists_allowed = ceas.exists()
+        exists_allowed = bool(ceas)
         state_auto_enroll = exists_allowed and ceas[0].auto_enroll
 
         self.user = user
@@ -87,6 +97,33 @@ class EmailEnrollmentState:
         self.full_name = full_name
         self.mode = mode
 
+    @classmethod
+    def bulk_fetch(cls, course_id, emails):
+        """
+        Returns a dict of the enrollment states of the given emails in the course, keyed by email, read with a
+        handful of queries rather than several for each email.
+        """
+        users_by_email = {
+            user.email.lower(): user
+            for user in User.objects.filter(email__in=emails).select_related('profile')
+        }
+        CourseEnrollment.bulk_fetch_enrollment_states(list(users_by_email.values()), course_id)
+        ceas_by_email = defaultdict(list)
+        for cea in CourseEnrollmentAllowed.objects.filter(email__in=emails, course_id=course_id).order_by('id'):
+            ceas_by_email[cea.email.lower()].append(cea)
+
+        states = {}
+        for email in emails:
+            user = users_by_email.get(email.lower())
+            ceas = ceas_by_email[email.lower()]
+            if user is not None:
+                # As CourseEnrollmentAllowed.for_user, exclude the CEAs which were consumed by a different user
+                ceas = [cea for cea in ceas if cea.user_id is None or cea.user_id == user.id]
+            state = cls.__new__(cls)
+            state._set_state(course_id, user, ceas)  # pylint: disable=protected-access
+            states[email] = state
+        return states
+
     def __repr__(self):
         return "{}(user={}, enrollment={}, allowed={}, auto_enroll={})".format(
             self.__class__.__name__,
@@ -180,6 +217,97 @@ def enroll_email(course_id, student_email, auto_enroll=False, email_students=Fal
     return previous_state, after_state, enrollment_obj
 
 
+def enroll_emails(course_id, student_emails, auto_enroll=False, email_students=False, email_params=None,
+                  languages=None):
+    """
+    Enroll students by email, as enroll_email enrolls each of them.
+
+    The students' enrollment states are read, and the registered students enrolled, in bulk rather than one student
+    at a time. Each student is then allowed to enroll or emailed separately, so that an error for one student (for
+    example, failing to send them an email) doesn't affect the others.
+
+    `student_emails` is a list of student's emails e.g. ["foo@bar.com"]
+    `auto_enroll`, `email_students` and `email_params` are as for enroll_email.
+    `languages` is a dict of the languages used to render the emails, keyed by email.
+
+    returns a tuple of:
+        a dict of the (before, after, enrollment) tuples returned by enroll_email for each email, keyed by email,
+        where after is the student's state once all of the students have been enrolled.
+        the set of emails for which there was an error, which has been logged.
+    """
+    student_emails = list(dict.fromkeys(student_emails))
+    languages = languages or {}
+    previous_states = EmailEnrollmentState.bulk_fetch(course_id, student_emails)
+
+    # if the student is currently unenrolled, don't enroll them in their
+    # previous mode
+
+    # for now, White Labels use the
+    # "honor" course_mode. Given the change to use "audit" as the default
+    # course_mode in Open edX, we need to be backwards compatible with
+    # how White Labels approach enrollment modes.
+    default_course_mode = CourseMode.HONOR if CourseMode.is_white_label(course_id) else None
+    emails_by_mode = defaultdict(list)
+    for student_email in student_emails:
+        previous_state = previous_states[student_email]
+        if previous_state.user and previous_state.user.is_active:
+            course_mode = previous_state.mode if previous_state.enrollment else default_course_mode
+            emails_by_mode[course_mode].append(student_email)
+
+    enrollments = {}
+    error_emails = set()
+    for course_mode, emails in emails_by_mode.items():
+        try:
+            enrollments.update(CourseEnrollment.bulk_enroll(
+                [previous_states[student_email].user for student_email in emails], course_id, course_mode,
+            ))
+        except Exception:  # pylint: disable=broad-except
+            # bulk_enroll writes all of its enrollments in one transaction, so none of these students were enrolled.
+            log.exception("Error while enrolling %d students in %s in mode %s", len(emails), course_id, course_mode)
+            error_emails.update(emails)
+
+    enrollment_objs = {}
+    for student_email in student_emails:
+        if student_email in error_emails:
+            continue
+        previous_state = previous_states[student_email]
+        language = languages.get(student_email)
+        try:
+            if previous_state.user and previous_state.user.is_active:
+                enrollment_objs[student_email] = enrollments.get(previous_state.user.id)
+                if email_students:
+                    email_params['message_type'] = 'enrolled_enroll'
+                    email_params['email_address'] = student_email
+                    email_params['user_id'] = previous_state.user.id
+                    email_params['full_name'] = previous_state.full_name
+                    send_mail_to_student(student_email, email_params, language=language)
+
+            elif not is_email_retired(student_email):
+                with transaction.atomic():
+                    cea, _ = CourseEnrollmentAllowed.objects.get_or_create(course_id=course_id, email=student_email)
+                    cea.auto_enroll = auto_enroll
+                    cea.save()
+                if email_students:
+                    email_params['message_type'] = 'allowed_enroll'
+                    email_params['email_address'] = student_email
+                    if previous_state.user:
+                        email_params['user_id'] = previous_state.user.id
+                    send_mail_to_student(student_email, email_params, language=language)
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Error while enrolling student %s in %s", student_email, course_id)
+            error_emails.add(student_email)
+
+    after_states = EmailEnrollmentState.bulk_fetch(course_id, student_emails)
+
+    results = {
+        student_email: (
+            previous_states[student_email], after_states[student_email], enrollment_objs.get(student_email),
+        )
+        for student_email in student_emails
+    }
+    return results, error_emails
+
+
 def unenroll_email(course_id, student_email, email_students=False, email_params=None, language=None):
     """
     Unenroll a student by email.
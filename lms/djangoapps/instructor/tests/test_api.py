@@ -7,6 +7,7 @@ import io
 import json
 import random
 import shutil
+import smtplib
 import tempfile
 from unittest.mock import Mock, NonCallableMock, patch
 
@@ -1135,6 +1136,54 @@ class TestInstructorAPIEnrollment(SharedModuleStoreTestCase, LoginEnrollmentTest
         res_json = json.loads(response.content.decode('utf-8'))
         assert res_json == expected
 
+    def test_enroll_with_email_error(self):
+        """
+        Test that an error sending one student's email is reported for that student only, and that each student
+        who was enrolled, or allowed to enroll, is audited.
+        """
+        def send_mail_to_student(student, param_dict, language=None):  # pylint: disable=unused-argument
+            if student == self.notregistered_email:
+                raise smtplib.SMTPException('Unable to send')
+
+        url = reverse('students_update_enrollment', kwargs={'course_id': str(self.course.id)})
+        params = {
+            'identifiers': f'{self.notenrolled_student.email}, {self.notregistered_email}',
+            'action': 'enroll',
+            'email_students': True,
+        }
+        with patch('lms.djangoapps.instructor.enrollment.send_mail_to_student', side_effect=send_mail_to_student):
+            response = self.client.post(url, params)
+        assert response.status_code == 200
+
+        res_json = json.loads(response.content.decode('utf-8'))
+        assert res_json['results'] == [
+            {
+                "identifier": self.notenrolled_student.email,
+                "before": {
+                    "enrollment": False,
+                    "auto_enroll": False,
+                    "user": True,
+                    "allowed": False,
+                },
+                "after": {
+                    "enrollment": True,
+                    "auto_enroll": False,
+                    "user": True,
+                    "allowed": False,
+                }
+            },
+            {
+                "identifier": self.notregistered_email,
+                "error": True,
+            },
+        ]
+        assert CourseEnrollment.is_enrolled(self.notenrolled_student, self.course.id)
+        assert CourseEnrollmentAllowed.objects.filter(email=self.notregistered_email, course_id=self.course.id).exists()
+        assert dict(ManualEnrollmentAudit.objects.values_list('enrolled_email', 'state_transition')) == {
+            self.notenrolled_student.email: UNENROLLED_TO_ENROLLED,
+            self.notregistered_email: UNENROLLED_TO_ALLOWEDTOENROLL,
+        }
+
     def test_enroll_without_email(self):
         url = reverse('students_update_enrollment', kwargs={'course_id': str(self.course.id)})
         response = self.client.post(url, {'identifiers': self.notenrolled_student.email, 'action': 'enroll',
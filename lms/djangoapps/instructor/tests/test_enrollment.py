@@ -31,6 +31,7 @@ from lms.djangoapps.grades.tests.utils import answer_problem
 from lms.djangoapps.instructor.enrollment import (
     EmailEnrollmentState,
     enroll_email,
+    enroll_emails,
     get_email_params,
     render_message_to_string,
     reset_student_attempts,
@@ -286,6 +287,33 @@ class TestInstructorEnrollDB(TestEnrollmentChangeBase):
         after = EmailEnrollmentState(self.course_key, eobjs.email)
         assert after == after_ideal
 
+    @ddt.data(
+        ((True, False, False, False), (True, True, False, False)),
+        ((True, True, False, False), (True, True, False, False)),
+        ((False, False, False, False), (False, False, True, True)),
+        ((False, False, True, False), (False, False, True, True)),
+    )
+    @ddt.unpack
+    def test_enroll_emails(self, before_state, after_state):
+        """
+        Test that enroll_emails makes the same changes as enroll_email, for all of the emails at once.
+        """
+        before_ideal = SettableEnrollmentState(*before_state)
+        after_ideal = SettableEnrollmentState(*after_state)
+        # Only one student can be created without a user, as they all share the same email.
+        eobjs = [before_ideal.create_user(self.course_key) for __ in range(3 if before_ideal.user else 1)]
+        emails = [eobj.email for eobj in eobjs]
+
+        results, error_emails = enroll_emails(self.course_key, emails, auto_enroll=True)
+
+        assert list(results) == emails
+        assert not error_emails
+        for email in emails:
+            before, after, __ = results[email]
+            assert before == before_ideal
+            assert after == after_ideal
+            assert EmailEnrollmentState(self.course_key, email) == after_ideal
+
 
 class TestInstructorUnenrollDB(TestEnrollmentChangeBase):
     """ Test instructor.enrollment.unenroll_email """
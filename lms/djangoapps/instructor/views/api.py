@@ -93,6 +93,7 @@ from lms.djangoapps.instructor.access import ROLES, allow_access, list_with_leve
 from lms.djangoapps.instructor.constants import INVOICE_KEY
 from lms.djangoapps.instructor.enrollment import (
     enroll_email,
+    enroll_emails,
     get_email_params,
     get_user_email_language,
     send_beta_role_email,
@@ -788,17 +789,16 @@ def students_update_enrollment(request, course_id):  # lint-amnesty, pylint: dis
     email_students = _get_boolean_param(request, 'email_students')
     reason = request.POST.get('reason')
 
-    enrollment_obj = None
-    state_transition = DEFAULT_TRANSITION_STATE
-
     email_params = {}
     if email_students:
         course = get_course_by_id(course_id)
         email_params = get_email_params(course, auto_enroll, secure=request.is_secure())
 
-    results = []
-    for identifier in identifiers:  # lint-amnesty, pylint: disable=too-many-nested-blocks
-        # First try to get a user object from the identifier
+    # First try to get a user object from each identifier, and check that each email address is valid, so that the
+    # students can be enrolled in bulk.
+    students = []
+    invalid_identifiers = set()
+    for identifier in identifiers:
         user = None
         email = None
         language = None
@@ -808,17 +808,49 @@ def students_update_enrollment(request, course_id):  # lint-amnesty, pylint: dis
             email = identifier
         else:
             email = user.email
-            language = get_user_email_language(user)
+            if email_students:
+                language = get_user_email_language(user)
 
         try:
             # Use django.core.validators.validate_email to check email address
             # validity (obviously, cannot check if email actually /exists/,
             # simply that it is plausibly valid)
             validate_email(email)  # Raises ValidationError if invalid
+        except ValidationError:
+            invalid_identifiers.add(identifier)
+        students.append((identifier, user, email, language))
+
+    valid_emails = [email for identifier, __, email, __ in students if identifier not in invalid_identifiers]
+    if valid_emails and action not in ('enroll', 'unenroll'):
+        return HttpResponseBadRequest(strip_tags(
+            f"Unrecognized action '{action}'"
+        ))
+
+    enroll_results = {}
+    enroll_error_emails = set()
+    if action == 'enroll' and valid_emails:
+        # Errors are caught and logged for each student, so that one error doesn't cause a 500.
+        enroll_results, enroll_error_emails = enroll_emails(
+            course_id, valid_emails, auto_enroll, email_students, email_params,
+            languages={email: language for __, __, email, language in students},
+        )
+
+    results = []
+    manual_enrollment_audits = []
+    for identifier, user, email, language in students:  # lint-amnesty, pylint: disable=too-many-nested-blocks
+        if identifier in invalid_identifiers:
+            # Flag this email as an error if invalid, but continue checking
+            # the remaining in the list
+            results.append({
+                'identifier': identifier,
+                'invalidIdentifier': True,
+            })
+            continue
+
+        state_transition = DEFAULT_TRANSITION_STATE
+        try:
             if action == 'enroll':
-                before, after, enrollment_obj = enroll_email(
-                    course_id, email, auto_enroll, email_students, email_params, language=language
-                )
+                before, after, enrollment_obj = enroll_results[email]
                 before_enrollment = before.to_dict()['enrollment']
                 before_user_registered = before.to_dict()['user']
                 before_allowed = before.to_dict()['allowed']
@@ -838,7 +870,23 @@ def students_update_enrollment(request, course_id):  # lint-amnesty, pylint: dis
                     if after_allowed:
                         state_transition = UNENROLLED_TO_ALLOWEDTOENROLL
 
-            elif action == 'unenroll':
+                if email in enroll_error_emails:
+                    # The student may still have been enrolled (or allowed to enroll) before the error, for example
+                    # if only their email couldn't be sent, in which case the enrollment is audited.
+                    if state_transition != DEFAULT_TRANSITION_STATE:
+                        manual_enrollment_audits.append({
+                            'email': email,
+                            'state_transition': state_transition,
+                            'reason': reason,
+                            'enrollment': enrollment_obj,
+                        })
+                    results.append({
+                        'identifier': identifier,
+                        'error': True,
+                    })
+                    continue
+
+            else:
                 before, after = unenroll_email(
                     course_id, email, email_students, email_params, language=language
                 )
@@ -854,39 +902,30 @@ def students_update_enrollment(request, course_id):  # lint-amnesty, pylint: dis
                     else:
                         state_transition = UNENROLLED_TO_UNENROLLED
 
-            else:
-                return HttpResponseBadRequest(strip_tags(
-                    f"Unrecognized action '{action}'"
-                ))
-
-        except ValidationError:
-            # Flag this email as an error if invalid, but continue checking
-            # the remaining in the list
-            results.append({
-                'identifier': identifier,
-                'invalidIdentifier': True,
-            })
-
-        except Exception as exc:  # pylint: disable=broad-except
+        except Exception:  # pylint: disable=broad-except
             # catch and log any exceptions
             # so that one error doesn't cause a 500.
-            log.exception("Error while #{}ing student")
-            log.exception(exc)
+            log.exception("Error while %sing student %s", action, identifier)
             results.append({
                 'identifier': identifier,
                 'error': True,
             })
 
         else:
-            ManualEnrollmentAudit.create_manual_enrollment_audit(
-                request.user, email, state_transition, reason, enrollment_obj
-            )
+            manual_enrollment_audits.append({
+                'email': email,
+                'state_transition': state_transition,
+                'reason': reason,
+                'enrollment': enrollment_obj,
+            })
             results.append({
                 'identifier': identifier,
                 'before': before.to_dict(),
                 'after': after.to_dict(),
             })
 
+    ManualEnrollmentAudit.bulk_create_manual_enrollment_audits(request.user, manual_enrollment_audits)
+
     response_payload = {
         'action': action,
         'results': results,
@@ -45,7 +45,9 @@ from lms.djangoapps.instructor_task.tasks_helper.misc import (
 from lms.djangoapps.instructor_task.tasks_helper.module_state import (
     delete_problem_module_state,
     override_score_module_state,
+    perform_delegate_rescore_batches,
     perform_module_state_update,
+    perform_module_state_update_subtask,
     rescore_problem_module_state,
     reset_attempts_module_state
 )
@@ -73,15 +75,44 @@ def rescore_problem(entry_id, xblock_instance_args):
 
     `xblock_instance_args` provides information needed by _get_module_instance_for_task()
     to instantiate an xblock instance.
+
+    Rescores of more than settings.RESCORE_STUDENT_MODULES_PER_TASK submissions are
+    broken down into rescore_problem_subtask subtasks, which are run in parallel.
     """
     # Translators: This is a past-tense verb that is inserted into task progress messages as {action}.
     action_name = gettext_noop('rescored')
     update_fcn = partial(rescore_problem_module_state, xblock_instance_args)
 
-    visit_fcn = partial(perform_module_state_update, update_fcn, None)
+    def _create_rescore_subtask(student_module_ids, initial_subtask_status):
+        """Creates a subtask to rescore the given StudentModules."""
+        return rescore_problem_subtask.subtask(
+            (
+                entry_id,
+                student_module_ids,
+                xblock_instance_args,
+                initial_subtask_status.to_dict(),
+            ),
+            task_id=initial_subtask_status.task_id,
+        )
+
+    visit_fcn = partial(perform_delegate_rescore_batches, _create_rescore_subtask, update_fcn)
     return run_main_task(entry_id, visit_fcn, action_name)
 
 
+@shared_task
+@set_code_owner_attribute
+def rescore_problem_subtask(entry_id, student_module_ids, xblock_instance_args, subtask_status_dict):
+    """
+    Rescores a batch of StudentModules, as one subtask of a rescore_problem task.
+
+    `entry_id` is the id value of the InstructorTask entry of the parent rescore_problem task,
+    `student_module_ids` are the ids of the StudentModules to rescore, and
+    `subtask_status_dict` is the initial SubtaskStatus of this subtask, as a dict.
+    """
+    update_fcn = partial(rescore_problem_module_state, xblock_instance_args)
+    return perform_module_state_update_subtask(update_fcn, entry_id, student_module_ids, subtask_status_dict)
+
+
 @shared_task(base=BaseInstructorTask)
 @set_code_owner_attribute
 def override_problem_score(entry_id, xblock_instance_args):
@@ -12,7 +12,7 @@ from django.db.models import Q
 
 from common.djangoapps.student.models import CourseEnrollment
 from lms.djangoapps.certificates.api import (
-    generate_certificate_task,
+    generate_course_certificates_task,
     get_enrolled_allowlisted_users,
     get_enrolled_allowlisted_not_passing_users
 )
@@ -69,11 +69,11 @@ def generate_students_certificates(
     current_step = {'step': 'Generating Certificates'}
     task_progress.update_task_state(extra_meta=current_step)
 
-    # Generate certificate for each student
-    for student in students_require_certs:
-        task_progress.attempted += 1
-        log.info(f'Attempt will be made to generate a course certificate for {student.id} : {course_id}.')
-        generate_certificate_task(student, course_id)
+    # Generate certificates for the students in batches, rather than with a task per student
+    task_progress.attempted += len(students_require_certs)
+    log.info(f'Attempt will be made to generate course certificates for {len(students_require_certs)} students in '
+             f'{course_id}.')
+    generate_course_certificates_task(course_id, students_require_certs)
     return task_progress.update_task_state(extra_meta=current_step)
 
 
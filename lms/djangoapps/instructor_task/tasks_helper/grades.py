@@ -25,6 +25,7 @@ from common.djangoapps.student.roles import BulkRoleCache
 from lms.djangoapps.certificates import api as certs_api
 from lms.djangoapps.certificates.models import GeneratedCertificate
 from lms.djangoapps.course_blocks.api import get_course_blocks
+from lms.djangoapps.course_blocks.transformers.user_partitions import UserPartitionTransformer
 from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateClient
 from lms.djangoapps.grades.api import CourseGradeFactory
 from lms.djangoapps.grades.api import context as grades_context
@@ -44,7 +45,10 @@ from openedx.core.djangoapps.user_api.course_tag.api import BulkCourseTags
 from openedx.core.lib.cache_utils import get_cache
 from openedx.core.lib.courses import get_course_by_id
 from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disable=wrong-import-order
-from xmodule.partitions.partitions_service import PartitionService  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.partitions.partitions_service import (  # lint-amnesty, pylint: disable=wrong-import-order
+    PartitionService,
+    prefetch_user_partition_groups
+)
 from xmodule.split_test_block import get_split_user_partitions  # lint-amnesty, pylint: disable=wrong-import-order
 
 from .runner import TaskProgress
@@ -265,12 +269,24 @@ class _EnrollmentBulkContext:
         self.verified_users = set(IDVerificationService.get_verified_user_ids(users))
 
 
+def _prefetch_user_partition_groups(context, users):
+    """
+    Caches what is needed to find the given users' groups in each of the course's
+    user partitions, so that grading them doesn't query per user and partition.
+    """
+    # The partitions the course blocks transformers will check, as collected with the course structure.
+    user_partitions = context.course_structure.get_transformer_data(UserPartitionTransformer, 'user_partitions')
+    if user_partitions:
+        prefetch_user_partition_groups(context.course_id, user_partitions, users)
+
+
 class _CourseGradeBulkContext:  # lint-amnesty, pylint: disable=missing-class-docstring
     def __init__(self, context, users):
         self.certs = _CertificateBulkContext(context, users)
         self.teams = _TeamBulkContext(context, users)
         self.enrollments = _EnrollmentBulkContext(context, users)
         bulk_cache_cohorts(context.course_id, users)
+        _prefetch_user_partition_groups(context, users)
         BulkRoleCache.prefetch(users)
         prefetch_course_and_subsection_grades(context.course_id, users)
         BulkCourseTags.prefetch(context.course_id, users)
@@ -749,6 +765,8 @@ class ProblemGradeReport(GradeReportBase):
         """
         Returns a list of rows for the given users for this report.
         """
+        _prefetch_user_partition_groups(self.context, users)
+
         success_rows, error_rows = [], []
         for student, course_grade, error in CourseGradeFactory().iter(
             users,
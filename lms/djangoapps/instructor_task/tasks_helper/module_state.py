@@ -7,6 +7,8 @@ import json
 import logging
 from time import time
 
+from celery.states import FAILURE, SUCCESS
+from django.conf import settings
 from django.utils.translation import gettext_noop
 from opaque_keys.edx.keys import UsageKey
 from xblock.runtime import KvsFieldData
@@ -26,6 +28,8 @@ from openedx.core.lib.courses import get_course_by_id
 from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disable=wrong-import-order
 
 from ..exceptions import UpdateProblemModuleStateError
+from ..models import InstructorTask
+from ..subtasks import SubtaskStatus, check_subtask_is_valid, queue_subtasks_for_query, update_subtask_status
 from .runner import TaskProgress
 from .utils import UNKNOWN_TASK_ID, UPDATE_STATUS_FAILED, UPDATE_STATUS_SKIPPED, UPDATE_STATUS_SUCCEEDED
 
@@ -61,26 +65,9 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
 
     """
     start_time = time()
-    usage_keys = []
-    problem_url = task_input.get('problem_url')
-    entrance_exam_url = task_input.get('entrance_exam_url')
     student_identifier = task_input.get('student')
     override_score_task = action_name == gettext_noop('overridden')
-    problems = {}
-
-    # if problem_url is present make a usage key from it
-    if problem_url:
-        usage_key = UsageKey.from_string(problem_url).map_into_course(course_id)
-        usage_keys.append(usage_key)
-
-        # find the problem block:
-        problem_block = modulestore().get_item(usage_key)
-        problems[str(usage_key)] = problem_block
-
-    # if entrance_exam is present grab all problems in it
-    if entrance_exam_url:
-        problems = get_problems_in_section(entrance_exam_url)
-        usage_keys = [UsageKey.from_string(location) for location in problems.keys()]
+    usage_keys, problems = _get_problems_to_update(course_id, task_input)
 
     modules_to_update = _get_modules_to_update(
         course_id, usage_keys, student_identifier, filter_fcn, override_score_task
@@ -89,26 +76,126 @@ def perform_module_state_update(update_fcn, filter_fcn, _entry_id, course_id, ta
     task_progress = TaskProgress(action_name, len(modules_to_update), start_time)
     task_progress.update_task_state()
 
-    for module_to_update in modules_to_update:
-        task_progress.attempted += 1
-        block = problems[str(module_to_update.module_state_key)]
-        # There is no try here:  if there's an error, we let it throw, and the task will
-        # be marked as FAILED, with a stack trace.
-        update_status = update_fcn(block, module_to_update, task_input)
-        if update_status == UPDATE_STATUS_SUCCEEDED:
-            # If the update_fcn returns true, then it performed some kind of work.
-            # Logging of failures is left to the update_fcn itself.
-            task_progress.succeeded += 1
-        elif update_status == UPDATE_STATUS_FAILED:
-            task_progress.failed += 1
-        elif update_status == UPDATE_STATUS_SKIPPED:
-            task_progress.skipped += 1
-        else:
-            raise UpdateProblemModuleStateError(f"Unexpected update_status returned: {update_status}")
+    # Keep the course and problem blocks cached across all of the learners being updated.
+    with modulestore().bulk_operations(course_id):
+        for module_to_update in modules_to_update:
+            task_progress.attempted += 1
+            block = problems[str(module_to_update.module_state_key)]
+            # There is no try here:  if there's an error, we let it throw, and the task will
+            # be marked as FAILED, with a stack trace.
+            update_status = update_fcn(block, module_to_update, task_input)
+            if update_status == UPDATE_STATUS_SUCCEEDED:
+                # If the update_fcn returns true, then it performed some kind of work.
+                # Logging of failures is left to the update_fcn itself.
+                task_progress.succeeded += 1
+            elif update_status == UPDATE_STATUS_FAILED:
+                task_progress.failed += 1
+            elif update_status == UPDATE_STATUS_SKIPPED:
+                task_progress.skipped += 1
+            else:
+                raise UpdateProblemModuleStateError(f"Unexpected update_status returned: {update_status}")
 
     return task_progress.update_task_state()
 
 
+def perform_delegate_rescore_batches(create_subtask_fcn, update_fcn, entry_id, course_id, task_input, action_name):
+    """
+    Rescores a problem for all of the learners who have submitted answers to it.
+
+    Small rescores (and rescores of a single learner) are performed directly by
+    perform_module_state_update().  Larger rescores are broken down into batches of no
+    more than settings.RESCORE_STUDENT_MODULES_PER_TASK StudentModules, and a subtask is
+    queued for each batch so that the batches are rescored in parallel by the workers.
+
+    `create_subtask_fcn` is called with the list of StudentModule ids in a batch and the
+    batch's initial SubtaskStatus, and returns the subtask to run.  `update_fcn` is used
+    to rescore each StudentModule when the rescore isn't broken down into batches.
+
+    Returns the task's progress, as for perform_module_state_update().
+    """
+    entry = InstructorTask.objects.get(pk=entry_id)
+
+    # As for bulk email, if the subtasks have already been queued (because this task
+    # has been requeued), there's nothing more to do.
+    if len(entry.subtasks) > 0 and len(entry.task_output) > 0:
+        TASK_LOG.warning("Task %s has already queued its rescore subtasks: InstructorTask = %s", entry.task_id, entry)
+        return json.loads(entry.task_output)
+
+    if task_input.get('student'):
+        return perform_module_state_update(update_fcn, None, entry_id, course_id, task_input, action_name)
+
+    usage_keys, __ = _get_problems_to_update(course_id, task_input)
+    student_modules = _get_modules_to_update(course_id, usage_keys, None, None)
+    total_num_modules = student_modules.count()
+    if total_num_modules <= settings.RESCORE_STUDENT_MODULES_PER_TASK:
+        return perform_module_state_update(update_fcn, None, entry_id, course_id, task_input, action_name)
+
+    def _create_rescore_subtask(items, initial_subtask_status):
+        """Creates a subtask to rescore the StudentModules in `items`."""
+        return create_subtask_fcn([item['pk'] for item in items], initial_subtask_status)
+
+    TASK_LOG.info(
+        "Task %s: queueing subtasks to rescore %s StudentModules in course %s",
+        entry.task_id, total_num_modules, course_id,
+    )
+    return queue_subtasks_for_query(
+        entry,
+        action_name,
+        _create_rescore_subtask,
+        [student_modules],
+        [],
+        settings.RESCORE_STUDENT_MODULES_PER_TASK,
+        total_num_modules,
+    )
+
+
+def perform_module_state_update_subtask(update_fcn, entry_id, student_module_ids, subtask_status_dict):
+    """
+    Performs the update of a batch of StudentModules, as one subtask of an InstructorTask.
+
+    `update_fcn` is called on each of the StudentModules with the ids `student_module_ids`, as
+    for perform_module_state_update(), and the results are recorded in the InstructorTask
+    using the SubtaskStatus given by `subtask_status_dict`.  StudentModules which no longer
+    exist are counted as skipped.
+
+    Returns the final SubtaskStatus, as a dict.
+    """
+    subtask_status = SubtaskStatus.from_dict(subtask_status_dict)
+    current_task_id = subtask_status.task_id
+    # Rejects the subtask if it is unknown to the InstructorTask, or has already been run.
+    check_subtask_is_valid(entry_id, current_task_id, subtask_status)
+
+    entry = InstructorTask.objects.get(pk=entry_id)
+    course_id = entry.course_id
+    task_input = json.loads(entry.task_input)
+    num_updated = 0
+    try:
+        __, problems = _get_problems_to_update(course_id, task_input)
+        student_modules = StudentModule.objects.filter(pk__in=student_module_ids).select_related('student')
+        with modulestore().bulk_operations(course_id):
+            for student_module in student_modules:
+                update_status = update_fcn(problems[str(student_module.module_state_key)], student_module, task_input)
+                num_updated += 1
+                if update_status == UPDATE_STATUS_SUCCEEDED:
+                    subtask_status.increment(succeeded=1)
+                elif update_status == UPDATE_STATUS_FAILED:
+                    subtask_status.increment(failed=1)
+                elif update_status == UPDATE_STATUS_SKIPPED:
+                    subtask_status.increment(skipped=1)
+                else:
+                    raise UpdateProblemModuleStateError(f"Unexpected update_status returned: {update_status}")
+    except Exception:
+        TASK_LOG.exception("Subtask %s of instructor task %d failed unexpectedly!", current_task_id, entry_id)
+        # We don't know which updates were committed, so count everything left as having failed.
+        subtask_status.increment(failed=len(student_module_ids) - num_updated, state=FAILURE)
+        update_subtask_status(entry_id, current_task_id, subtask_status)
+        raise
+
+    subtask_status.increment(skipped=len(student_module_ids) - num_updated, state=SUCCESS)
+    update_subtask_status(entry_id, current_task_id, subtask_status)
+    return subtask_status.to_dict()
+
+
 @outer_atomic
 def rescore_problem_module_state(xblock_instance_args, block, student_module, task_input):
     '''
@@ -395,6 +482,36 @@ def _get_task_id_from_xblock_args(xblock_instance_args):
         return xblock_instance_args.get('task_id', UNKNOWN_TASK_ID)
 
 
+def _get_problems_to_update(course_id, task_input):
+    """
+    Returns the usage keys of the problems named by `task_input`, and a dict mapping
+    the string form of each of those usage keys to its problem block.
+
+    `task_input` names either a single problem (with 'problem_url'), or all of the
+    problems in an entrance exam (with 'entrance_exam_url').
+    """
+    usage_keys = []
+    problems = {}
+    problem_url = task_input.get('problem_url')
+    entrance_exam_url = task_input.get('entrance_exam_url')
+
+    # if problem_url is present make a usage key from it
+    if problem_url:
+        usage_key = UsageKey.from_string(problem_url).map_into_course(course_id)
+        usage_keys.append(usage_key)
+
+        # find the problem block:
+        problem_block = modulestore().get_item(usage_key)
+        problems[str(usage_key)] = problem_block
+
+    # if entrance_exam is present grab all problems in it
+    if entrance_exam_url:
+        problems = get_problems_in_section(entrance_exam_url)
+        usage_keys = [UsageKey.from_string(location) for location in problems.keys()]
+
+    return usage_keys, problems
+
+
 def _get_modules_to_update(course_id, usage_keys, student_identifier, filter_fcn, override_score_task=False):
     """
     Fetches a StudentModule instances for a given `course_id`, `student` object, and `usage_keys`.
@@ -427,7 +544,8 @@ def _get_modules_to_update(course_id, usage_keys, student_identifier, filter_fcn
     if student:
         module_query_params['student_id'] = student.id
 
-    student_modules = StudentModule.get_state_by_params(**module_query_params)
+    # Every update function needs the module's student, so fetch them in the same query.
+    student_modules = StudentModule.get_state_by_params(**module_query_params).select_related('student')
     if filter_fcn is not None:
         student_modules = filter_fcn(student_modules)
 
@@ -19,7 +19,8 @@ import ddt
 import pytest
 import unicodecsv
 from django.conf import settings
-from django.test.utils import override_settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
 from edx_django_utils.cache import RequestCache
 from freezegun import freeze_time
 from pytz import UTC
@@ -62,8 +63,10 @@ from lms.djangoapps.instructor_task.tests.test_base import (
 from lms.djangoapps.survey.models import SurveyAnswer, SurveyForm
 from lms.djangoapps.teams.tests.factories import CourseTeamFactory, CourseTeamMembershipFactory
 from lms.djangoapps.verify_student.tests.factories import SoftwareSecurePhotoVerificationFactory
+from openedx.core.djangoapps.course_groups.cohorts import add_user_to_cohort
 from openedx.core.djangoapps.course_groups.models import CohortMembership, CourseUserGroupPartitionGroup
-from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory
+from openedx.core.djangoapps.course_groups.tests.helpers import CohortFactory, config_course_cohorts
+from openedx.core.djangoapps.course_groups.views import link_cohort_to_partition_group
 from openedx.core.djangoapps.credit.tests.factories import CreditCourseFactory
 from openedx.core.djangoapps.user_api.partition_schemes import RandomUserPartitionScheme
 from openedx.core.djangoapps.util.testing import ContentGroupTestCase, TestConditionalContent
@@ -409,6 +412,49 @@ class TestInstructorGradeReport(InstructorGradeReportTestCase):
                 with self.assertNumQueries(50):
                     CourseGradeReport.generate(None, None, course.id, {}, 'graded')
 
+    def _create_course_with_cohort_partitions(self, num_partitions):
+        """
+        Creates a cohorted course with the given number of cohort partitions, and
+        four enrolled users split between two cohorts linked to their groups.
+        """
+        partitions = [
+            UserPartition(
+                partition_id,
+                f'Cohort Partition {partition_id}',
+                'Group Configuration for cohorts',
+                [Group(partition_id * 10, 'Group A'), Group(partition_id * 10 + 1, 'Group B')],
+                scheme_id='cohort',
+            )
+            for partition_id in range(1, num_partitions + 1)
+        ]
+        course = CourseFactory.create(user_partitions=partitions)
+        config_course_cohorts(course, is_cohorted=True)
+        cohorts = [CohortFactory(course_id=course.id) for _ in range(2)]
+        link_cohort_to_partition_group(cohorts[0], partitions[0].id, partitions[0].groups[0].id)
+        link_cohort_to_partition_group(cohorts[1], partitions[-1].id, partitions[-1].groups[1].id)
+        for index in range(4):
+            user = UserFactory.create()
+            CourseEnrollment.enroll(user, course.id)
+            add_user_to_cohort(cohorts[index % 2], user.username)
+        return course
+
+    def test_query_counts_independent_of_partitions(self):
+        """
+        The users' groups are prefetched for all the course's partitions at
+        once, so the number of queries doesn't grow with the partitions.
+        """
+        course = self._create_course_with_cohort_partitions(num_partitions=1)
+        RequestCache.clear_all_namespaces()
+        with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+            with CaptureQueriesContext(connection) as queries:
+                CourseGradeReport.generate(None, None, course.id, {}, 'graded')
+
+        course = self._create_course_with_cohort_partitions(num_partitions=4)
+        RequestCache.clear_all_namespaces()
+        with patch('lms.djangoapps.instructor_task.tasks_helper.runner._get_current_task'):
+            with self.assertNumQueries(len(queries)):
+                CourseGradeReport.generate(None, None, course.id, {}, 'graded')
+
     def test_inactive_enrollments(self):
         """
         Test that students with inactive enrollments are included in report.
@@ -97,6 +97,39 @@ class IDVerificationService:
             ManualVerification.objects.filter(**filter_kwargs).values_list('user_id', flat=True)
         )
 
+    @classmethod
+    def bulk_user_is_verified(cls, users):
+        """
+        Given a list of users, returns a dict mapping each user's id to whether the user has satisfactorily proved
+        their identity, as `user_is_verified` would for each of them, using a single query.
+        """
+        filter_kwargs = {
+            'user__in': users,
+            'status': 'approved',
+        }
+        photo_id_verifications, sso_id_verifications, manual_id_verifications = (
+            model.objects.filter(**filter_kwargs).order_by().values_list(
+                'user_id', 'created_at', 'updated_at', 'expiration_date',
+            )
+            for model in (SoftwareSecurePhotoVerification, SSOVerification, ManualVerification)
+        )
+        most_recent = {}
+        for user_id, created_at, updated_at, expiration_date in photo_id_verifications.union(
+            sso_id_verifications, manual_id_verifications, all=True,
+        ):
+            current = most_recent.get(user_id)
+            if not current or updated_at > current[0]:
+                # Old verifications have no expiration date, as in IDVerificationAttempt.expiration_datetime
+                expiration_datetime = expiration_date or (
+                    created_at + timedelta(days=settings.VERIFY_STUDENT["DAYS_GOOD_FOR"])
+                )
+                most_recent[user_id] = (updated_at, expiration_datetime)
+
+        return {
+            user.id: user.id in most_recent and most_recent[user.id][1] >= now()
+            for user in users
+        }
+
     @classmethod
     def get_expiration_datetime(cls, user, statuses):
         """
@@ -117,6 +117,40 @@ class TestIDVerificationService(ModuleStoreTestCase):
 
         assert expected_user_ids == verified_user_ids
 
+    def test_bulk_user_is_verified(self):
+        """
+        Test that bulk_user_is_verified answers as user_is_verified does for each user, with a single query.
+        """
+        user_photo, user_sso, user_manual, user_expired, user_renewal_expired, user_old, user_denied, user_unverified = (
+            UserFactory.create() for _ in range(8)
+        )
+        SoftwareSecurePhotoVerification.objects.create(user=user_photo, status='approved')
+        SSOVerification.objects.create(user=user_sso, status='approved')
+        ManualVerification.objects.create(user=user_manual, status='approved')
+        SSOVerification.objects.create(user=user_expired, status='approved', expiration_date=now() - timedelta(days=1))
+        # The most recent verification is used, even though an older one hasn't expired
+        ManualVerification.objects.create(
+            user=user_renewal_expired, status='approved', expiration_date=now() + timedelta(days=1)
+        )
+        SoftwareSecurePhotoVerification.objects.create(
+            user=user_renewal_expired, status='approved', expiration_date=now() - timedelta(days=1)
+        )
+        # Old verifications without an expiration date expire DAYS_GOOD_FOR days after they were created
+        ManualVerification.objects.create(user=user_old, status='approved')
+        ManualVerification.objects.filter(user=user_old).update(
+            expiration_date=None, created_at=now() - timedelta(days=settings.VERIFY_STUDENT["DAYS_GOOD_FOR"] + 1)
+        )
+        SSOVerification.objects.create(user=user_denied, status='denied')
+        users = [
+            user_photo, user_sso, user_manual, user_expired, user_renewal_expired, user_old, user_denied, user_unverified
+        ]
+
+        with self.assertNumQueries(1):
+            verified_users = IDVerificationService.bulk_user_is_verified(users)
+
+        assert verified_users == {user.id: IDVerificationService.user_is_verified(user) for user in users}
+        assert {user.id for user in users if verified_users[user.id]} == {user_photo.id, user_sso.id, user_manual.id}
+
     def test_get_verify_location_no_course_key(self):
         """
         Test for the path to the IDV flow with no course key given
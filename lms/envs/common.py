@@ -1219,6 +1219,22 @@ TPA_PROVIDER_SUSTAINED_THROTTLE = '50/hr'
 # Mako templating
 import tempfile  # pylint: disable=wrong-import-position,wrong-import-order
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+
+# .. setting_name: MAKO_PRECOMPILED_MODULE_DIR
+# .. setting_default: None
+# .. setting_description: A directory of Mako template modules compiled ahead of time by the compile_mako_templates
+#   management command, for every template of every enabled theme. When set, templates are loaded from the modules in
+#   it, which are shared by every process, rather than each process compiling each template on its first request after
+#   a deploy. The directory is only read from, so it can be read-only. Templates that have no up to date module in it
+#   are compiled into MAKO_MODULE_DIR as usual.
+MAKO_PRECOMPILED_MODULE_DIR = None
+
+# .. setting_name: MAKO_TEMPLATE_FILESYSTEM_CHECKS
+# .. setting_default: True
+# .. setting_description: Whether to check the modification time of a Mako template file whenever the template is
+#   looked up, so that changes to it are picked up without restarting. Deployments whose templates only change
+#   when they are redeployed (e.g. with MAKO_PRECOMPILED_MODULE_DIR set) can turn this off.
+MAKO_TEMPLATE_FILESYSTEM_CHECKS = True
 MAKO_TEMPLATE_DIRS_BASE = [
     PROJECT_ROOT / 'templates',
     COMMON_ROOT / 'templates',
@@ -1393,6 +1409,12 @@ DJFS = {
 # `common.djangoapps.util.date_utils.strftime_localized`.
 CERTIFICATE_DATE_FORMAT = "%B %-d, %Y"
 
+# .. setting_name: CERTIFICATE_GENERATION_BATCH_SIZE
+# .. setting_default: 1000
+# .. setting_description: The number of learners whose certificates are generated by each task when certificates are
+#   generated for a whole course run (for example by the instructor dashboard's "Generate Certificates" button).
+CERTIFICATE_GENERATION_BATCH_SIZE = 1000
+
 ### Dark code. Should be enabled in local settings for devel.
 
 ENABLE_MULTICOURSE = False  # set to False to disable multicourse display (see lib.util.views.edXhome)
@@ -1805,6 +1827,17 @@ STATICFILES_DIRS = [
 FAVICON_PATH = 'images/favicon.ico'
 DEFAULT_COURSE_ABOUT_IMAGE_URL = 'images/pencils.jpg'
 
+# Number of seconds for which the content of HTML blocks is cached after its static, course and
+# jump_to_id urls have been replaced. Changes to a course's assets (e.g. locking an asset) can take
+# this long to be reflected in the urls of HTML blocks which were already rendered. 0 disables the cache.
+STATIC_REPLACE_FRAGMENT_CACHE_TIMEOUT = 300
+
+# Block types whose rendered fragments are the same for every learner, which the render_xblock view
+# (used by the mobile apps and the learning MFE) caches for RENDER_XBLOCK_FRAGMENT_CACHE_TIMEOUT seconds.
+# Fragments are keyed on the block's version, so edits are seen as soon as they are published.
+RENDER_XBLOCK_FRAGMENT_CACHE_BLOCK_TYPES = ['html']
+RENDER_XBLOCK_FRAGMENT_CACHE_TIMEOUT = 300
+
 # User-uploaded content
 MEDIA_ROOT = '/edx/var/edxapp/media/'
 MEDIA_URL = '/media/'
@@ -2910,6 +2943,13 @@ BULK_EMAIL_LOG_SENT_EMAILS = False
 # parallel, and what the SES rate is.
 BULK_EMAIL_RETRY_DELAY_BETWEEN_SENDS = 0.02
 
+############################# Instructor Tasks ################################
+
+# Rescoring a problem for more than this number of learner submissions is broken
+# down into subtasks of at most this many submissions each, so that the rescoring
+# is spread across the available celery workers.
+RESCORE_STUDENT_MODULES_PER_TASK = 1000
+
 ############################# Email Opt In ####################################
 
 # Minimum age for organization-wide email opt in
@@ -3123,6 +3163,9 @@ INSTALLED_APPS = [
     'openedx.core.djangoapps.content.block_structure.apps.BlockStructureConfig',
     'lms.djangoapps.course_blocks',
 
+    # Course Blocks API
+    'lms.djangoapps.course_api.apps.CourseApiConfig',
+
     # Mailchimp Syncing
     'lms.djangoapps.mailing',
 
@@ -4086,6 +4129,13 @@ DEFAULT_MOBILE_AVAILABLE = False
 # Enrollment API Cache Timeout
 ENROLLMENT_COURSE_DETAILS_CACHE_TIMEOUT = 60
 
+# .. setting_name: COURSE_ENROLLMENT_STATE_CACHE_TIMEOUT
+# .. setting_default: 3600
+# .. setting_description: The number of seconds for which users' course enrollment states (their enrollment mode, and
+#   whether the enrollment is active) are cached across requests. Cached states are updated whenever an enrollment
+#   changes, so this only limits how long a state can be out of date if an update to the cache is lost.
+COURSE_ENROLLMENT_STATE_CACHE_TIMEOUT = 60 * 60
+
 # These tabs are currently disabled
 NOTES_DISABLED_TABS = ['course_structure', 'tags']
 
@@ -4242,6 +4292,12 @@ CREDENTIALS_PUBLIC_SERVICE_URL = 'http://localhost:8005'
 
 COMMENTS_SERVICE_URL = 'http://localhost:18080'
 COMMENTS_SERVICE_KEY = 'password'
+# The most connections to the comments service kept open by each process, and
+# the number of times connecting to it is retried.
+COMMENTS_SERVICE_POOL_MAXSIZE = 10
+COMMENTS_SERVICE_MAX_RETRIES = 2
+# The most comments service requests made at once when rendering a single page.
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 4
 
 # Reverification checkpoint name pattern
 CHECKPOINT_PATTERN = r'(?P<checkpoint_name>[^/]+)'
@@ -4467,6 +4523,13 @@ PROGRAM_CERTIFICATES_ROUTING_KEY = 'edx.lms.core.default'
 # Default site to use if site matching request headers does not exist
 SITE_ID = 1
 
+# .. setting_name: SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL
+# .. setting_default: 10
+# .. setting_description: Site configurations are cached in each process, and reloaded when any site configuration
+#   changes. This is the number of seconds between checks for changes made by other processes, so it bounds how long
+#   a process can keep using an out of date site configuration.
+SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL = 10
+
 # .. setting_name: COMPREHENSIVE_THEME_DIRS
 # .. setting_default: []
 # .. setting_description: A list of directories containing themes folders,
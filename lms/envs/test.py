@@ -124,6 +124,9 @@ MOCK_STAFF_GRADING = True
 MOCK_PEER_GRADING = True
 
 COMMENTS_SERVICE_URL = 'http://localhost:4567'
+# Comments service requests are mocked in tests, often by functions which query the
+# database, so they're made one at a time.
+COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS = 1
 
 DJFS = {
     'type': 'osfs',
@@ -223,6 +226,9 @@ CACHES = {
     },
 }
 
+# Check for changes to the site configurations on every use, as the caches are cleared between tests
+SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL = 0
+
 ############################# SECURITY SETTINGS ################################
 # Default to advanced security in common.py, so tests can reset here to use
 # a simpler security model
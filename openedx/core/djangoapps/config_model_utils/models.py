@@ -7,22 +7,30 @@ StackedConfigurationModel: A ConfigurationModel that can be overridden at site,
 # -*- coding: utf-8 -*-
 
 
-from collections import defaultdict
+import time
+import uuid
 from enum import Enum
 
-import crum
 from config_models.models import ConfigurationModel, cache
 from django.conf import settings
 from django.contrib.sites.models import Site
-from django.contrib.sites.requests import RequestSite
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.db.models import Q
+from django.db import models, transaction
+from django.dispatch import receiver
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
+from edx_django_utils.cache import RequestCache
 
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
-from openedx.core.lib.cache_utils import request_cached
+
+# The in-memory indexes of the current configuration of each StackedConfigurationModel in this process, keyed by model
+_STACKED_CONFIGURATION_INDEXES = {}
+
+# The generation of the stacked configuration, which is bumped whenever any StackedConfigurationModel (or any
+# SiteConfiguration, which determines the sites of orgs) is saved or deleted, invalidating the indexes in all processes
+STACKED_CONFIGURATION_GENERATION_CACHE_KEY = 'StackedConfigurationModel.generation'
+STACKED_CONFIGURATION_REQUEST_CACHE_NAMESPACE = 'config_model_utils.stacked_configuration'
 
 
 class Provenance(Enum):
@@ -156,156 +164,60 @@ class StackedConfigurationModel(ConfigurationModel):
             specified down to the level of the supplied argument (or global values if
             no arguments are supplied).
         """
-        cache_key_name = cls.cache_key_name(site, org, org_course, course_key)
-        cached = cache.get(cache_key_name)
-
-        if cached is not None:
-            return cached
-
         # Raise an error if more than one of site/org/course are specified simultaneously.
         if len([arg for arg in [site, org, org_course, course_key] if arg is not None]) > 1:
             raise ValueError("Only one of site, org, org_course, and course can be specified")
 
-        if org_course is None and course_key is not None:
-            org_course = cls._org_course_from_course_key(course_key)
-
-        if org is None and org_course is not None:
-            org = cls._org_from_org_course(org_course)
-
-        if site is None and org is not None:
-            site = cls._site_from_org(org)
-
-        stackable_fields = [cls._meta.get_field(field_name) for field_name in cls.STACKABLE_FIELDS]
-        field_defaults = {
-            field.name: field.get_default()
-            for field in stackable_fields
-        }
-
-        values = field_defaults.copy()
-
-        # Build a multi_filter_query that defaults to querying for the global-level setting and adds queries
-        # for the stacked-level settings when applicable.
-        # Note: Django2+ requires checking for 'isnull' rather than passing 'None' in the queries.
-        multi_filter_query = Q(site__isnull=True, org__isnull=True, org_course__isnull=True, course_id__isnull=True)
-        if site:
-            multi_filter_query |= Q(site=site, org__isnull=True, org_course__isnull=True, course_id__isnull=True)
-        if org:
-            multi_filter_query |= Q(site__isnull=True, org=org, org_course__isnull=True, course_id__isnull=True)
-        if org_course:
-            multi_filter_query |= Q(site__isnull=True, org__isnull=True, org_course=org_course, course_id__isnull=True)
-        if course_key:
-            multi_filter_query |= Q(site__isnull=True, org__isnull=True, org_course__isnull=True, course_id=course_key)
-
-        overrides = cls.objects.current_set().filter(multi_filter_query)
-
-        provenances = defaultdict(lambda: Provenance.default)
-        # We are sorting in python to avoid doing a filesort in the database for
-        # what will only be 4 rows at maximum
-
-        def sort_key(override):
-            """
-            Sort overrides in increasing specificity.
-
-            This particular sort order sorts None before not-None (because False < True)
-            It sorts global first (because all entries are None), then site entries
-            (because course_id and org are None), then org, org_course and course (by the same logic)
-            """
-            return (
-                override.course_id is not None,
-                override.org_course is not None,
-                override.org is not None,
-                override.site_id is not None
-            )
-
-        for override in sorted(overrides, key=sort_key):
-            for field in stackable_fields:
-                value = field.value_from_object(override)
-                if value != field_defaults[field.name]:
-                    values[field.name] = value
-                    if override.course_id is not None:
-                        provenances[field.name] = Provenance.run
-                    elif override.org_course is not None:
-                        provenances[field.name] = Provenance.org_course
-                    elif override.org is not None:
-                        provenances[field.name] = Provenance.org
-                    elif override.site_id is not None:
-                        provenances[field.name] = Provenance.site
-                    else:
-                        provenances[field.name] = Provenance.global_
-
+        values, provenances = cls._current_index().resolve(site, org, org_course, course_key)
         current = cls(**values)
-        current.provenances = {field.name: provenances[field.name] for field in stackable_fields}  # pylint: disable=attribute-defined-outside-init
-        cache.set(cache_key_name, current, cls.cache_timeout)
+        current.provenances = provenances  # pylint: disable=attribute-defined-outside-init
         return current
 
+    @classmethod
+    def current_for_courses(cls, course_keys):
+        """
+        Return the current overridden configuration for each of the given courses, keyed by course key.
+
+        All of the courses are resolved from the same in-memory index of the configuration, so this makes at most
+        a couple of queries (to build the index) however many courses there are.
+        """
+        return {course_key: cls.current(course_key=course_key) for course_key in course_keys}
+
     @classmethod
     def all_current_course_configs(cls):
         """
         Return configuration for all courses
         """
-        all_courses = CourseOverview.objects.all()
-        all_site_configs = SiteConfiguration.objects.filter(
-            site_values__contains='course_org_filter', enabled=True
-        ).select_related('site')
-
-        try:
-            default_site = Site.objects.get(id=settings.SITE_ID)
-        except Site.DoesNotExist:
-            default_site = RequestSite(crum.get_current_request())
-
-        sites_by_org = defaultdict(lambda: default_site)
-        site_cfg_org_filters = (
-            (site_cfg.site, site_cfg.site_values['course_org_filter'])
-            for site_cfg in all_site_configs
-        )
-        sites_by_org.update({
-            org: site
-            for (site, orgs) in site_cfg_org_filters
-            for org in (orgs if isinstance(orgs, list) else [orgs])
-        })
-
-        all_overrides = cls.objects.current_set()
-        overrides = {
-            (override.site_id, override.org, override.org_course, override.course_id): override
-            for override in all_overrides
-        }
-
+        index = cls._current_index()
         stackable_fields = [cls._meta.get_field(field_name) for field_name in cls.STACKABLE_FIELDS]
-        field_defaults = {
-            field.name: field.get_default()
-            for field in stackable_fields
-        }
-
-        def provenance(course, field):
-            """
-            Return provenance for given field
-            """
-            org_course = cls._org_course_from_course_key(course.id)
-            org = cls._org_from_org_course(org_course)
-
-            for (config_key, provenance) in [
-                ((None, None, None, course.id), Provenance.run),
-                ((None, None, org_course, None), Provenance.org_course),
-                ((None, org, None, None), Provenance.org),
-                ((sites_by_org[course.id.org].id, None, None, None), Provenance.site),
-                ((None, None, None, None), Provenance.global_),
-            ]:
-                config = overrides.get(config_key)
-                if config is None:
-                    continue
-                value = field.value_from_object(config)
-                if value != field_defaults[field.name]:
-                    return (value, provenance)
-
-            return (field_defaults[field.name], Provenance.default)
-
-        return {
-            course.id: {
-                field.name: provenance(course, field)
+        all_configs = {}
+        for course_key in CourseOverview.objects.values_list('id', flat=True):
+            values, provenances = index.resolve(None, None, None, course_key)
+            all_configs[course_key] = {
+                field.name: (values[field.name], provenances[field.name])
                 for field in stackable_fields
             }
-            for course in all_courses
-        }
+        return all_configs
+
+    @classmethod
+    def _current_index(cls):
+        """
+        Return the in-memory index of this model's current configuration, (re)building it if it is missing, out of
+        date, or older than the model's cache timeout.
+        """
+        generation = _get_stacked_configuration_generation()
+        if generation is None:
+            # The generation can't be cached (for example the cache is a DummyCache), so changes made by other
+            # processes can't be detected, and the index can only be reused within this request.
+            indexes = RequestCache(STACKED_CONFIGURATION_REQUEST_CACHE_NAMESPACE).data
+        else:
+            indexes = _STACKED_CONFIGURATION_INDEXES
+
+        index = indexes.get(cls)
+        if index is None or index.generation != generation or index.age > cls.cache_timeout:
+            index = StackedConfigurationIndex(cls, generation)
+            indexes[cls] = index
+        return index
 
     @classmethod
     def cache_key_name(cls, site, org, org_course, course_key):  # pylint: disable=arguments-differ
@@ -324,22 +236,160 @@ class StackedConfigurationModel(ConfigurationModel):
     def _org_course_from_course_key(cls, course_key):
         return f"{course_key.org}+{course_key.course}"
 
-    @classmethod
-    @request_cached()
-    def _site_from_org(cls, org):  # lint-amnesty, pylint: disable=missing-function-docstring
-
-        configuration = SiteConfiguration.get_configuration_for_org(org, select_related=['site'])
-        if configuration is None:
-            try:
-                return Site.objects.get(id=settings.SITE_ID)
-            except Site.DoesNotExist:
-                return RequestSite(crum.get_current_request())
-        else:
-            return configuration.site
-
     def clean(self):
         # fail validation if more than one of site/org/course are specified simultaneously
         if len([arg for arg in [self.site, self.org, self.org_course, self.course] if arg is not None]) > 1:
             raise ValidationError(
                 _('Configuration may not be specified at more than one level at once.')
             )
+
+
+class StackedConfigurationIndex:
+    """
+    An in-memory index of the current configuration of a StackedConfigurationModel, from which the stacked values
+    at any level can be resolved without querying the database.
+    """
+    def __init__(self, model, generation):
+        self.model = model
+        self.generation = generation
+        self.created = time.monotonic()
+        self.overrides = {
+            (override.site_id, override.org, override.org_course, override.course_id): override
+            for override in model.objects.current_set()
+        }
+        self.stackable_fields = [model._meta.get_field(field_name) for field_name in model.STACKABLE_FIELDS]  # pylint: disable=protected-access
+        self.field_defaults = {field.name: field.get_default() for field in self.stackable_fields}
+        self._resolved = {}
+
+    @property
+    def age(self):
+        """
+        The number of seconds since the index was built.
+        """
+        return time.monotonic() - self.created
+
+    @cached_property
+    def site_ids_by_org(self):
+        """
+        The ids of the sites whose course_org_filter includes each org, keyed by org.
+        """
+        site_ids_by_org = {}
+        site_configs = SiteConfiguration.objects.filter(site_values__contains='course_org_filter', enabled=True)
+        for site_config in site_configs:
+            orgs = site_config.site_values['course_org_filter']
+            for org in (orgs if isinstance(orgs, list) else [orgs]):
+                site_ids_by_org.setdefault(org, site_config.site_id)
+        return site_ids_by_org
+
+    def resolve(self, site, org, org_course, course_key):
+        """
+        Return the values of the stackable fields overridden down to the level of the supplied argument (of which at
+        most one may be supplied), and the provenance of each value, as two dicts keyed by field name.
+        """
+        site_id = site.id if site is not None else None
+        resolved_key = (site_id, org, org_course, course_key)
+        if resolved_key not in self._resolved:
+            self._resolved[resolved_key] = self._resolve(site_id, org, org_course, course_key)
+        values, provenances = self._resolved[resolved_key]
+        return values.copy(), provenances.copy()
+
+    def _resolve(self, site_id, org, org_course, course_key):
+        """
+        Resolve the stacked values (and their provenances) at the given level.
+        """
+        if org_course is None and course_key is not None:
+            org_course = self.model._org_course_from_course_key(course_key)  # pylint: disable=protected-access
+
+        if org is None and org_course is not None:
+            org = self.model._org_from_org_course(org_course)  # pylint: disable=protected-access
+
+        # Only look up the site of the org if there are site-level overrides to find
+        if site_id is None and org is not None and any(key[0] is not None for key in self.overrides):
+            site_id = self.site_ids_by_org.get(org, settings.SITE_ID)
+
+        # Stack the overrides in increasing specificity
+        levels = [((None, None, None, None), Provenance.global_)]
+        if site_id is not None:
+            levels.append(((site_id, None, None, None), Provenance.site))
+        if org is not None:
+            levels.append(((None, org, None, None), Provenance.org))
+        if org_course is not None:
+            levels.append(((None, None, org_course, None), Provenance.org_course))
+        if course_key is not None:
+            levels.append(((None, None, None, course_key), Provenance.run))
+
+        values = self.field_defaults.copy()
+        provenances = {field.name: Provenance.default for field in self.stackable_fields}
+        for key, provenance in levels:
+            override = self.overrides.get(key)
+            if override is None:
+                continue
+            for field in self.stackable_fields:
+                value = field.value_from_object(override)
+                if value != self.field_defaults[field.name]:
+                    values[field.name] = value
+                    provenances[field.name] = provenance
+        return values, provenances
+
+
+def _get_stacked_configuration_generation():
+    """
+    Return the current generation of the stacked configuration, reading it from the cache at most once per request.
+    """
+    request_cache = RequestCache(STACKED_CONFIGURATION_REQUEST_CACHE_NAMESPACE)
+    cached_response = request_cache.get_cached_response('generation')
+    if cached_response.is_found:
+        return cached_response.value
+
+    generation = cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY)
+    if generation is None:
+        # Start at a random generation, so that indexes built before the generation was evicted are rebuilt
+        cache.add(STACKED_CONFIGURATION_GENERATION_CACHE_KEY, uuid.uuid4().int & 0xffffffff, None)
+        generation = cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY)
+    request_cache.set('generation', generation)
+    return generation
+
+
+def _bump_stacked_configuration_generation():
+    """
+    Bump the generation of the stacked configuration, so that every process rebuilds its indexes.
+    """
+    try:
+        cache.incr(STACKED_CONFIGURATION_GENERATION_CACHE_KEY)
+    except ValueError:
+        cache.add(STACKED_CONFIGURATION_GENERATION_CACHE_KEY, uuid.uuid4().int & 0xffffffff, None)
+    _STACKED_CONFIGURATION_INDEXES.clear()
+    RequestCache(STACKED_CONFIGURATION_REQUEST_CACHE_NAMESPACE).clear()
+
+
+def invalidate_stacked_configuration(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the indexes of stacked configuration when any stacked configuration or site configuration changes.
+
+    The generation is bumped again once the transaction has been committed, so that indexes built from the old
+    configuration by other processes in the meantime are rebuilt too.
+    """
+    _bump_stacked_configuration_generation()
+    transaction.on_commit(_bump_stacked_configuration_generation)
+
+
+def _connect_stacked_configuration_invalidation(sender):
+    """
+    Invalidate the indexes of stacked configuration whenever an instance of the model sender is saved or deleted.
+    """
+    models.signals.post_save.connect(invalidate_stacked_configuration, sender=sender)
+    models.signals.post_delete.connect(invalidate_stacked_configuration, sender=sender)
+
+
+@receiver(models.signals.class_prepared)
+def connect_stacked_configuration_model(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Connect the invalidation of stacked configuration to each concrete StackedConfigurationModel, as it is defined.
+
+    Subclasses have to import this module first, so none of them can be defined before this is connected.
+    """
+    if issubclass(sender, StackedConfigurationModel) and not sender._meta.abstract:  # pylint: disable=protected-access
+        _connect_stacked_configuration_invalidation(sender)
+
+
+_connect_stacked_configuration_invalidation(SiteConfiguration)
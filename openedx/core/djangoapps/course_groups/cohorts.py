@@ -162,6 +162,7 @@ def get_cohort_id(user, course_key, use_cached=False):
 
 
 COHORT_CACHE_NAMESPACE = "cohorts.get_cohort"
+GROUP_INFO_CACHE_NAMESPACE = "cohorts.get_group_info_for_cohort"
 
 
 def _cohort_cache_key(user_id, course_key):
@@ -197,6 +198,30 @@ def bulk_cache_cohorts(course_key, users):
         cache[_cohort_cache_key(user.id, course_key)] = None
 
 
+def bulk_cache_cohort_partition_groups(course_key, users):
+    """
+    Pre-fetches and caches the cohort assignments of the given users (unless
+    they are all cached already), and the partition groups linked to each of
+    the course's cohorts, for later fast retrieval by get_cohort and
+    get_group_info_for_cohort.
+    """
+    cache = RequestCache(COHORT_CACHE_NAMESPACE).data
+    if any(_cohort_cache_key(user.id, course_key) not in cache for user in users):
+        bulk_cache_cohorts(course_key, users)
+
+    group_info_cache = RequestCache(GROUP_INFO_CACHE_NAMESPACE).data
+    cohorts = CourseUserGroup.objects.filter(
+        course_id=course_key,
+        group_type=CourseUserGroup.COHORT,
+    ).select_related('courseusergrouppartitiongroup')
+    for cohort in cohorts:
+        try:
+            partition_group = cohort.courseusergrouppartitiongroup
+            group_info_cache[str(cohort.id)] = (partition_group.group_id, partition_group.partition_id)
+        except CourseUserGroupPartitionGroup.DoesNotExist:
+            group_info_cache[str(cohort.id)] = (None, None)
+
+
 def get_cohort(user, course_key, assign=True, use_cached=False):
     """
     Returns the user's cohort for the specified course.
@@ -522,7 +547,7 @@ def get_group_info_for_cohort(cohort, use_cached=False):
     use_cached=True to use the cached value instead of fetching from the
     database.
     """
-    cache = RequestCache("cohorts.get_group_info_for_cohort").data
+    cache = RequestCache(GROUP_INFO_CACHE_NAMESPACE).data
     cache_key = str(cohort.id)
 
     if use_cached and cache_key in cache:
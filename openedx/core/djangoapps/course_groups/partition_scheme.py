@@ -12,7 +12,7 @@ from lms.djangoapps.courseware.masquerade import (
 )
 from xmodule.partitions.partitions import NoSuchUserPartitionGroupError  # lint-amnesty, pylint: disable=wrong-import-order
 
-from .cohorts import get_cohort, get_group_info_for_cohort
+from .cohorts import bulk_cache_cohort_partition_groups, get_cohort, get_group_info_for_cohort
 
 log = logging.getLogger(__name__)
 
@@ -24,6 +24,14 @@ class CohortPartitionScheme:
     Groups.
     """
 
+    @classmethod
+    def prefetch_groups_for_users(cls, course_key, users):
+        """
+        Caches the cohorts of the given users, and the partition groups their
+        cohorts are linked to, for the rest of the request.
+        """
+        bulk_cache_cohort_partition_groups(course_key, users)
+
     @classmethod
     def get_group_for_user(cls, course_key, user, user_partition, use_cached=True):
         """
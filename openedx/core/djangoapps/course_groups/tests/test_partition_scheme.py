@@ -6,6 +6,7 @@ Test the partitions and partitions service
 
 from unittest.mock import patch
 import django.test
+from edx_django_utils.cache import RequestCache
 
 from lms.djangoapps.courseware.tests.test_masquerade import StaffMasqueradeTestCase
 from openedx.core.djangoapps.user_api.partition_schemes import RandomUserPartitionScheme
@@ -15,6 +16,7 @@ from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disa
 from xmodule.modulestore.tests.django_utils import TEST_DATA_SPLIT_MODULESTORE, ModuleStoreTestCase  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.modulestore.tests.factories import ToyCourseFactory  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.partitions.partitions import Group, UserPartition, UserPartitionError  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.partitions.partitions_service import prefetch_user_partition_groups  # lint-amnesty, pylint: disable=wrong-import-order
 
 from ..cohorts import add_user_to_cohort, get_course_cohorts, remove_user_from_cohort
 from ..models import CourseUserGroupPartitionGroup
@@ -250,6 +252,33 @@ class TestCohortPartitionScheme(ModuleStoreTestCase):
             assert mock_log.warning.called
             self.assertRegex(mock_log.warning.call_args[0][0], 'partition mismatch')
 
+    def test_prefetch_groups_for_users(self):
+        """
+        Test that once the groups of several users have been prefetched, they
+        are found without any queries, whatever the number of partitions.
+        """
+        other_partition = UserPartition(
+            1, 'Other Partition', 'for testing purposes', [Group(30, 'Group 30')], scheme=CohortPartitionScheme,
+        )
+        cohorts = [CohortFactory(course_id=self.course_key) for _ in range(3)]
+        link_cohort_to_partition_group(cohorts[0], self.user_partition.id, self.groups[0].id)
+        link_cohort_to_partition_group(cohorts[1], other_partition.id, 30)
+        users = [UserFactory.create() for _ in range(4)]
+        for user, cohort in zip(users, cohorts):
+            add_user_to_cohort(cohort, user.username)
+
+        RequestCache.clear_all_namespaces()
+        prefetch_user_partition_groups(self.course_key, [self.user_partition, other_partition], users)
+        with self.assertNumQueries(0):
+            groups = [
+                [CohortPartitionScheme.get_group_for_user(self.course_key, user, partition) for user in users]
+                for partition in (self.user_partition, other_partition)
+            ]
+        assert groups == [
+            [self.groups[0], None, None, None],
+            [None, other_partition.groups[0], None, None],
+        ]
+
 
 class TestExtension(django.test.TestCase):
     """
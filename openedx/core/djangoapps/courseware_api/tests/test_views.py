@@ -11,7 +11,9 @@ import ddt
 from completion.test_utils import CompletionWaffleTestMixin, submit_completions_for_testing
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 
 from edx_django_utils.cache import TieredCache
 from edx_toggles.toggles.testutils import override_waffle_flag
@@ -431,7 +433,7 @@ class CourseApiTestViews(BaseCoursewareTests, MasqueradeMixin):
 
 
 @ddt.ddt
-class SequenceApiTestViews(MasqueradeMixin, BaseCoursewareTests):
+class SequenceApiTestViews(MasqueradeMixin, BaseCoursewareTests, CompletionWaffleTestMixin):
     """
     Tests for the sequence REST API
     """
@@ -451,6 +453,41 @@ class SequenceApiTestViews(MasqueradeMixin, BaseCoursewareTests):
         assert response.data['display_name'] == 'sequence'
         assert len(response.data['items']) == 1
 
+    def _create_sequence(self, num_units):
+        """
+        Creates a sequence with the given number of units, each containing a problem,
+        and returns it with the locations of the problems.
+        """
+        sequence = BlockFactory(parent_location=self.chapter.location, category='sequential')
+        problem_locations = []
+        for __ in range(num_units):
+            unit = BlockFactory(parent_location=sequence.location, category='vertical')
+            problem_locations.append(BlockFactory(parent_location=unit.location, category='problem').location)
+        return sequence, problem_locations
+
+    @ddt.data(5, 40)
+    def test_sequence_metadata_queries(self, num_units):
+        """The number of queries made for a sequence's metadata doesn't depend on how many units it has."""
+        self.override_waffle_switch(True)
+        CourseEnrollment.enroll(self.user, self.course.id)
+        small_sequence, small_problems = self._create_sequence(1)
+        large_sequence, large_problems = self._create_sequence(num_units)
+        submit_completions_for_testing(self.user, small_problems + large_problems[::2])
+
+        # Warm up anything that is only loaded on the first request.
+        self.client.get(f'/api/courseware/sequence/{small_sequence.location}')
+
+        num_queries = []
+        for sequence in (small_sequence, large_sequence):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(f'/api/courseware/sequence/{sequence.location}')
+            assert response.status_code == 200
+            num_queries.append(len(queries.captured_queries))
+        assert num_queries[0] == num_queries[1]
+        assert [item['complete'] for item in response.data['items']] == [
+            index % 2 == 0 for index in range(num_units)
+        ]
+
     def test_unit_error(self):
         """Verify that we return a proper error when passed a non-sequence"""
         response = self.client.get(f'/api/courseware/sequence/{self.unit.location}')
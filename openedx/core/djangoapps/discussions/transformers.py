@@ -11,10 +11,13 @@ class DiscussionsTopicLinkTransformer(BlockStructureTransformer):
     """
     A transformer that adds discussion topic context to the xblock.
     """
-    WRITE_VERSION = 1
-    READ_VERSION = 1
+    WRITE_VERSION = 2
+    READ_VERSION = 2
     EXTERNAL_ID = "discussions_id"
     EMBED_URL = "discussions_url"
+    # Fields of discussion blocks which are collected so that the course's discussion
+    # topics can be listed without loading the blocks from the modulestore.
+    DISCUSSION_BLOCK_FIELDS = ('discussion_id', 'discussion_category', 'discussion_target', 'sort_key', 'start')
 
     @classmethod
     def name(cls):
@@ -24,6 +27,13 @@ class DiscussionsTopicLinkTransformer(BlockStructureTransformer):
         """
         return "discussions_link"
 
+    @classmethod
+    def collect(cls, block_structure):
+        """
+        Collects the fields of discussion blocks used to list discussion topics.
+        """
+        block_structure.request_xblock_fields(*cls.DISCUSSION_BLOCK_FIELDS)
+
     def transform(self, usage_info, block_structure):
         """
         loads override data into blocks
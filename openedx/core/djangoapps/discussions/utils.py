@@ -2,12 +2,16 @@
 Shared utility code related to discussions.
 """
 import logging
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
-from opaque_keys.edx.keys import CourseKey
+from opaque_keys.edx.keys import CourseKey, UsageKey
 
-from lms.djangoapps.courseware.access import has_access
+from lms.djangoapps.course_blocks.api import get_course_blocks
+from lms.djangoapps.courseware.access import has_access_to_blocks
+from openedx.core.djangoapps.content.block_structure.api import get_block_structure_manager
 from openedx.core.djangoapps.course_groups.cohorts import get_cohort_names, is_course_cohorted
+from openedx.core.djangoapps.discussions.transformers import DiscussionsTopicLinkTransformer
 from openedx.core.djangoapps.django_comment_common.models import CourseDiscussionSettings
 from openedx.core.lib.cache_utils import request_cached
 from openedx.core.lib.courses import get_course_by_id
@@ -21,6 +25,18 @@ from xmodule.partitions.partitions_service import PartitionService  # lint-amnes
 log = logging.getLogger(__name__)
 
 
+class DiscussionBlockData(NamedTuple):
+    """
+    The fields of a discussion block that are used to list the course's discussion topics.
+    """
+    location: UsageKey
+    discussion_id: Optional[str]
+    discussion_category: Optional[str]
+    discussion_target: Optional[str]
+    sort_key: Optional[str]
+    start: Optional[datetime]
+
+
 def get_divided_discussions(
     course: CourseBlock,
     discussion_settings: CourseDiscussionSettings,
@@ -55,7 +71,7 @@ def get_discussion_categories_ids(course: CourseBlock, user: Optional[User], inc
 
     """
     accessible_discussion_ids = [
-        xblock.discussion_id for xblock in get_accessible_discussion_xblocks(course, user, include_all)
+        block.discussion_id for block in get_accessible_discussion_blocks(course, user, include_all)
     ]
     return course.top_level_discussion_topic_ids + accessible_discussion_ids
 
@@ -84,11 +100,81 @@ def get_accessible_discussion_xblocks_by_course_id(
     Checks for the given user's access if include_all is False.
     """
     all_xblocks = modulestore().get_items(course_id, qualifiers={'category': 'discussion'}, include_orphans=False)
+    xblocks = [xblock for xblock in all_xblocks if has_required_keys(xblock)]
+    if include_all:
+        return xblocks
 
-    return [
-        xblock for xblock in all_xblocks
-        if has_required_keys(xblock) and (include_all or has_access(user, 'load', xblock, course_id))
-    ]
+    access = has_access_to_blocks(user, 'load', xblocks, course_id)
+    return [xblock for xblock in xblocks if access[xblock.location]]
+
+
+def get_accessible_discussion_blocks(
+    course: CourseBlock,
+    user: Optional[User],
+    include_all: bool = False,
+) -> List[DiscussionBlockData]:
+    """
+    Return the data of all valid discussion blocks in this course that
+    are accessible to the given user, without loading the blocks.
+    """
+    include_all = include_all or getattr(user, 'is_community_ta', False)
+    return get_accessible_discussion_blocks_by_course_id(course.id, user, include_all=include_all)
+
+
+@request_cached()
+def get_accessible_discussion_blocks_by_course_id(
+    course_id: CourseKey,
+    user: Optional[User] = None,
+    include_all: bool = False
+) -> List[DiscussionBlockData]:
+    """
+    Return the data of all valid discussion blocks in this course.
+    Checks for the given user's access if include_all is False.
+
+    The user-independent list of discussion blocks is read from the course's
+    collected block structure, which is updated when the course is published,
+    and is then filtered by the blocks which the user's course blocks include.
+    """
+    discussion_blocks = _get_discussion_blocks_by_course_id(course_id)
+    if include_all or not discussion_blocks:
+        return discussion_blocks
+
+    collected_block_structure = _get_collected_block_structure(course_id)
+    course_blocks = get_course_blocks(
+        user,
+        collected_block_structure.root_block_usage_key,
+        collected_block_structure=collected_block_structure,
+    )
+    accessible_block_keys = set(course_blocks.get_block_keys())
+    return [block for block in discussion_blocks if block.location in accessible_block_keys]
+
+
+@request_cached()
+def _get_collected_block_structure(course_id: CourseKey):
+    """
+    Returns the course's collected block structure.
+    """
+    return get_block_structure_manager(course_id).get_collected()
+
+
+@request_cached()
+def _get_discussion_blocks_by_course_id(course_id: CourseKey) -> List[DiscussionBlockData]:
+    """
+    Returns the data of all valid discussion blocks in this course, in course order.
+    """
+    block_structure = _get_collected_block_structure(course_id)
+    discussion_blocks = []
+    for block_key in block_structure.topological_traversal(
+        filter_func=lambda block_key: block_key.block_type == 'discussion',
+        yield_descendants_of_unyielded=True,
+    ):
+        block = DiscussionBlockData(block_key, *(
+            block_structure.get_xblock_field(block_key, field_name)
+            for field_name in DiscussionsTopicLinkTransformer.DISCUSSION_BLOCK_FIELDS
+        ))
+        if has_required_keys(block):
+            discussion_blocks.append(block)
+    return discussion_blocks
 
 
 def available_division_schemes(course_key: CourseKey) -> List[str]:
@@ -109,7 +195,7 @@ def available_division_schemes(course_key: CourseKey) -> List[str]:
     return available_schemes
 
 
-def has_required_keys(xblock: DiscussionXBlock):
+def has_required_keys(xblock: Union[DiscussionXBlock, DiscussionBlockData]):
     """
     Returns True iff xblock has the proper attributes for generating metadata
     with get_discussion_id_map_entry()
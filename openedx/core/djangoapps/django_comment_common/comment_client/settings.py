@@ -7,3 +7,10 @@ else:
     SERVICE_HOST = 'http://localhost:4567'
 
 PREFIX = SERVICE_HOST + '/api/v1'
+
+# The most connections kept open to the comments service by each process, the number of
+# times a failed connection is retried, and the most requests made at once by
+# `perform_concurrently`.
+POOL_MAXSIZE = getattr(settings, 'COMMENTS_SERVICE_POOL_MAXSIZE', 10)
+MAX_RETRIES = getattr(settings, 'COMMENTS_SERVICE_MAX_RETRIES', 2)
+MAX_CONCURRENT_REQUESTS = getattr(settings, 'COMMENTS_SERVICE_MAX_CONCURRENT_REQUESTS', 4)
@@ -3,15 +3,42 @@
 
 
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 import requests
+from django.utils import translation
 from django.utils.translation import get_language
+from edx_django_utils import monitoring as monitoring_utils
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .settings import SERVICE_HOST as COMMENTS_SERVICE
+from .settings import MAX_CONCURRENT_REQUESTS, MAX_RETRIES, POOL_MAXSIZE, SERVICE_HOST as COMMENTS_SERVICE
 
 log = logging.getLogger(__name__)
 
+# Upper bounds, in milliseconds, of the buckets of the per-endpoint latency histograms.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500)
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+class _ConcurrentRequestContext(threading.local):
+    """
+    The forums configuration, and the latencies recorded so far, of requests
+    being made from a worker thread of `perform_concurrently`.
+    """
+    config = None
+    latencies = None
+
+
+_CONCURRENT_REQUEST_CONTEXT = _ConcurrentRequestContext()
+
 
 def strip_none(dic):
     return {k: v for k, v in dic.items() if v is not None}  # lint-amnesty, pylint: disable=consider-using-dict-comprehension
@@ -30,11 +57,102 @@ def extract(dic, keys):
         return strip_none({k: dic.get(k) for k in keys})
 
 
-def perform_request(method, url, data_or_params=None, raw=False,
-                    metric_action=None, metric_tags=None, paged_results=False):
+def get_session():
+    """
+    Returns this process's `requests.Session` for the comments service, which
+    keeps connections to it open between requests, and retries connecting to it.
+    """
+    global _session, _session_pid  # pylint: disable=global-statement
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            # Sessions aren't shared with forked processes, since their pooled connections would be.
+            if _session is None or _session_pid != pid:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=Retry(total=MAX_RETRIES, read=0, status=0, backoff_factor=0.1),
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session, _session_pid = session, pid
+    return _session
+
+
+def send_request(method, url, **kwargs):
+    """
+    Sends a request to the comments service using this process's session.
+    """
+    return get_session().request(method, url, **kwargs)
+
+
+def _get_forums_config():
     # To avoid dependency conflict
     from openedx.core.djangoapps.django_comment_common.models import ForumsConfig
-    config = ForumsConfig.current()
+    return _CONCURRENT_REQUEST_CONTEXT.config or ForumsConfig.current()
+
+
+def _record_latency(metric_action, latency_ms):
+    """
+    Records the latency of a comments service request in the histogram for its endpoint.
+    """
+    if _CONCURRENT_REQUEST_CONTEXT.latencies is not None:
+        # Custom attributes can only be set from the request's own thread.
+        _CONCURRENT_REQUEST_CONTEXT.latencies.append((metric_action, latency_ms))
+        return
+    metric_name = f'forums_request.{metric_action or "unknown"}.latency_ms'
+    bucket = next((f'le_{bound}' for bound in LATENCY_BUCKETS_MS if latency_ms <= bound), 'inf')
+    monitoring_utils.increment(f'{metric_name}.{bucket}')
+    monitoring_utils.accumulate(metric_name, latency_ms)
+
+
+def perform_concurrently(*functions, max_workers=None):
+    """
+    Calls each of the given functions at the same time, and returns their
+    results in order. Each function should only make comments service
+    requests (and not, for example, database queries), independently of the
+    others.
+
+    If any of the functions raises an exception, the first of them (in order)
+    is raised once all of the functions have returned.
+    """
+    max_workers = min(len(functions), max_workers or MAX_CONCURRENT_REQUESTS)
+    if max_workers <= 1:
+        return [function() for function in functions]
+
+    config = _get_forums_config()
+    language = get_language()
+
+    def call(function):
+        """
+        Returns the function's result, or the exception it raised, and the latencies of its requests.
+        """
+        _CONCURRENT_REQUEST_CONTEXT.config = config
+        _CONCURRENT_REQUEST_CONTEXT.latencies = latencies = []
+        try:
+            with translation.override(language):
+                return function(), None, latencies
+        except Exception as error:
+            return None, error, latencies
+        finally:
+            _CONCURRENT_REQUEST_CONTEXT.config = None
+            _CONCURRENT_REQUEST_CONTEXT.latencies = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(call, functions))
+
+    for __, __, latencies in outcomes:
+        for metric_action, latency_ms in latencies:
+            _record_latency(metric_action, latency_ms)
+    for __, error, __ in outcomes:
+        if error is not None:
+            raise error
+    return [result for result, __, __ in outcomes]
+
+
+def perform_request(method, url, data_or_params=None, raw=False,
+                    metric_action=None, metric_tags=None, paged_results=False):
+    config = _get_forums_config()
 
     if not config.enabled:
         raise CommentClientMaintenanceError('service disabled')
@@ -62,7 +180,8 @@ def perform_request(method, url, data_or_params=None, raw=False,
         data = None
         params = data_or_params.copy()
         params.update(request_id_dict)
-    response = requests.request(
+    start = time.perf_counter()
+    response = send_request(
         method,
         url,
         data=data,
@@ -70,6 +189,7 @@ def perform_request(method, url, data_or_params=None, raw=False,
         headers=headers,
         timeout=config.connection_timeout
     )
+    _record_latency(metric_action, (time.perf_counter() - start) * 1000)
 
     metric_tags.append(f'status_code:{response.status_code}')
     status_code = int(response.status_code)
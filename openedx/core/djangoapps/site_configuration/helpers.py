@@ -23,10 +23,7 @@ def get_current_site_configuration():
 
     # Import is placed here to avoid model import at project startup.
     from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
-    try:
-        return getattr(site, "configuration", None)
-    except SiteConfiguration.DoesNotExist:
-        return None
+    return SiteConfiguration.get_configuration_for_site(site)
 
 
 def get_current_site_configuration_values(default=None):
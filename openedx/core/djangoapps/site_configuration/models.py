@@ -4,18 +4,28 @@ Django models for site configurations.
 
 
 import collections
+import time
+import uuid
 from logging import getLogger
 
+from django.conf import settings
 from django.contrib.sites.models import Site
-from django.db import models
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from edx_django_utils.cache import RequestCache
 
 from jsonfield.fields import JSONField
 from model_utils.models import TimeStampedModel
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# The generation of the site configurations, which is bumped whenever a site or site configuration is saved or deleted,
+# so that every process reloads its SiteConfigurationIndex
+SITE_CONFIGURATION_GENERATION_CACHE_KEY = 'SiteConfiguration.generation'
+SITE_CONFIGURATION_REQUEST_CACHE_NAMESPACE = 'site_configuration.index'
+
 
 class SiteConfiguration(models.Model):
     """
@@ -69,28 +79,42 @@ class SiteConfiguration(models.Model):
 
         return default
 
+    def get_orgs(self):
+        """
+        Return the list of orgs in this configuration's course_org_filter.
+
+        The value of 'course_org_filter' can be configured as a string representing
+        a single organization or a list of strings representing multiple organizations.
+        """
+        course_org_filter = self.get_value('course_org_filter', [])
+        if not isinstance(course_org_filter, list):
+            course_org_filter = [course_org_filter]
+        return course_org_filter
+
+    @classmethod
+    def get_configuration_for_site(cls, site):
+        """
+        This returns the SiteConfiguration object of the supplied site, or None if it has none.
+
+        Args:
+            site (Site): Site whose configuration to return
+        """
+        site_id = getattr(site, 'id', None)
+        if site_id is None:
+            return None
+        return SiteConfigurationIndex.get().configurations_by_site_id.get(site_id)
+
     @classmethod
-    def get_configuration_for_org(cls, org, select_related=None):
+    def get_configuration_for_org(cls, org, select_related=None):  # pylint: disable=unused-argument
         """
         This returns a SiteConfiguration object which has an org_filter that matches
         the supplied org
 
         Args:
             org (str): Org to use to filter SiteConfigurations
-            select_related (list or None): A list of values to pass as arguments to select_related
-        """
-        query = cls.objects.filter(site_values__contains=org, enabled=True).all()
-        if select_related is not None:
-            query = query.select_related(*select_related)
-        for configuration in query:
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            # The value of 'course_org_filter' can be configured as a string representing
-            # a single organization or a list of strings representing multiple organizations.
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            if org in course_org_filter:
-                return configuration
-        return None
+            select_related (list or None): Ignored, as the site of each configuration is always loaded
+        """
+        return SiteConfigurationIndex.get().configurations_by_org.get(org)
 
     @classmethod
     def get_value_for_org(cls, org, name, default=None):
@@ -121,14 +145,7 @@ class SiteConfiguration(models.Model):
         Returns:
             A set of all organizations present in site configuration.
         """
-        org_filter_set = set()
-
-        for configuration in cls.objects.filter(site_values__contains='course_org_filter', enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            org_filter_set.update(course_org_filter)
-        return org_filter_set
+        return set(SiteConfigurationIndex.get().configurations_by_org)
 
     @classmethod
     def has_org(cls, org):
@@ -138,7 +155,95 @@ class SiteConfiguration(models.Model):
         Returns:
             True if given organization is present in site configurations otherwise False.
         """
-        return org in cls.get_all_orgs()
+        return org in SiteConfigurationIndex.get().configurations_by_org
+
+
+class SiteConfigurationIndex:
+    """
+    A process-local index of all of the site configurations, by site and by org, so that they don't need to be queried
+    (and their values parsed) on every request.
+
+    The index is reloaded when the generation of the site configurations changes. The generation is checked at most
+    once every settings.SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL seconds, which bounds how long another process can
+    keep using out of date configurations. Changes made in this process are seen straight away.
+
+    The indexed SiteConfiguration objects are shared, so they must not be modified.
+    """
+    _current = None
+
+    def __init__(self, generation):
+        self.generation = generation
+        self.checked = time.monotonic()
+        configurations = SiteConfiguration.objects.select_related('site').order_by('id')
+        self.configurations_by_site_id = {configuration.site_id: configuration for configuration in configurations}
+        self.configurations_by_org = {}
+        for configuration in self.configurations_by_site_id.values():
+            if configuration.enabled:
+                for org in configuration.get_orgs():
+                    self.configurations_by_org.setdefault(org, configuration)
+
+    @classmethod
+    def get(cls):
+        """
+        Return the current index, reloading it if it is out of date.
+        """
+        index = cls._current
+        if index is None or time.monotonic() - index.checked > settings.SITE_CONFIGURATION_GENERATION_CHECK_INTERVAL:
+            generation = cls._get_generation()
+            if generation is None:
+                # The generation can't be cached (for example the cache is a DummyCache), so changes made by other
+                # processes can't be detected, and the index can only be reused within this request.
+                return cls._get_request_index()
+            if index is None or index.generation != generation:
+                index = cls(generation)
+                cls._current = index
+            else:
+                index.checked = time.monotonic()
+        return index
+
+    @classmethod
+    def clear(cls):
+        """
+        Clear the index from this process, so that it is reloaded when it is next used.
+        """
+        cls._current = None
+        RequestCache(SITE_CONFIGURATION_REQUEST_CACHE_NAMESPACE).clear()
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Bump the generation of the site configurations, so that every process reloads its index.
+        """
+        try:
+            cache.incr(SITE_CONFIGURATION_GENERATION_CACHE_KEY)
+        except ValueError:
+            cache.add(SITE_CONFIGURATION_GENERATION_CACHE_KEY, uuid.uuid4().int & 0xffffffff, None)
+        cls.clear()
+
+    @classmethod
+    def _get_generation(cls):
+        """
+        Return the current generation of the site configurations, or None if it can't be cached.
+        """
+        generation = cache.get(SITE_CONFIGURATION_GENERATION_CACHE_KEY)
+        if generation is None:
+            # Start at a random generation, so that indexes loaded before the generation was evicted are reloaded
+            cache.add(SITE_CONFIGURATION_GENERATION_CACHE_KEY, uuid.uuid4().int & 0xffffffff, None)
+            generation = cache.get(SITE_CONFIGURATION_GENERATION_CACHE_KEY)
+        return generation
+
+    @classmethod
+    def _get_request_index(cls):
+        """
+        Return an index that is only reused within the current request.
+        """
+        request_cache = RequestCache(SITE_CONFIGURATION_REQUEST_CACHE_NAMESPACE)
+        cached_response = request_cache.get_cached_response('index')
+        if cached_response.is_found:
+            return cached_response.value
+        index = cls(None)
+        request_cache.set('index', index)
+        return index
 
 
 def save_siteconfig_without_historical_record(siteconfig, *args, **kwargs):
@@ -191,6 +296,21 @@ class SiteConfigurationHistory(TimeStampedModel):
         return self.__str__()
 
 
+@receiver(post_save, sender=SiteConfiguration)
+@receiver(post_delete, sender=SiteConfiguration)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_site_configuration_index(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the site configuration index of every process when a site or site configuration changes.
+
+    The generation is bumped again once the transaction has been committed, so that indexes loaded from the old
+    configurations by other processes in the meantime are reloaded too.
+    """
+    SiteConfigurationIndex.invalidate()
+    transaction.on_commit(SiteConfigurationIndex.invalidate)
+
+
 @receiver(post_save, sender=SiteConfiguration)
 def update_site_configuration_history(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
     """
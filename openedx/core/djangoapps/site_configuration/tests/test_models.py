@@ -5,13 +5,17 @@ from unittest.mock import patch
 import pytest
 from django.contrib.sites.models import Site
 from django.db import IntegrityError, transaction
+from django.core.cache import cache
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 from openedx.core.djangoapps.site_configuration.models import (
+    SITE_CONFIGURATION_GENERATION_CACHE_KEY,
     SiteConfiguration,
     SiteConfigurationHistory,
     save_siteconfig_without_historical_record
 )
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 
 
 class SiteConfigurationTests(TestCase):
@@ -319,3 +323,57 @@ class SiteConfigurationTests(TestCase):
 
         # Test that the default value is returned if the value for the given key is not found in the configuration
         self.assertCountEqual(SiteConfiguration.get_all_orgs(), expected_orgs)
+
+
+class SiteConfigurationIndexTests(CacheIsolationTestCase):
+    """
+    Tests for the process-local index of site configurations.
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super().setUp()
+        self.site = Site.objects.create(domain='index.example.com', name='index.example.com')
+        self.site_configuration = SiteConfigurationFactory.create(
+            site=self.site,
+            site_values={'course_org_filter': ['IndexX', 'OtherIndexX'], 'platform_name': 'Index'},
+        )
+
+    def test_index_reused_across_requests(self):
+        assert SiteConfiguration.get_configuration_for_org('IndexX') == self.site_configuration
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(0):
+            assert SiteConfiguration.get_configuration_for_site(self.site) == self.site_configuration
+            assert SiteConfiguration.get_configuration_for_org('OtherIndexX') == self.site_configuration
+            assert SiteConfiguration.get_value_for_org('IndexX', 'platform_name') == 'Index'
+            assert SiteConfiguration.has_org('IndexX')
+            assert not SiteConfiguration.has_org('MissingX')
+            assert {'IndexX', 'OtherIndexX'} <= SiteConfiguration.get_all_orgs()
+
+    def test_index_reloaded_when_configuration_saved(self):
+        assert SiteConfiguration.get_value_for_org('IndexX', 'platform_name') == 'Index'
+        self.site_configuration.site_values = {'course_org_filter': 'IndexX', 'platform_name': 'Changed'}
+        self.site_configuration.save()
+        assert SiteConfiguration.get_value_for_org('IndexX', 'platform_name') == 'Changed'
+        assert not SiteConfiguration.has_org('OtherIndexX')
+
+        self.site_configuration.enabled = False
+        self.site_configuration.save()
+        assert SiteConfiguration.get_configuration_for_org('IndexX') is None
+        assert SiteConfiguration.get_configuration_for_site(self.site) == self.site_configuration
+
+        self.site_configuration.delete()
+        assert SiteConfiguration.get_configuration_for_site(self.site) is None
+
+    def test_index_reloaded_when_generation_changes(self):
+        assert SiteConfiguration.get_value_for_org('IndexX', 'platform_name') == 'Index'
+
+        # Change the configuration as another process would, without this process's index being cleared
+        SiteConfiguration.objects.filter(id=self.site_configuration.id).update(
+            site_values={'course_org_filter': 'IndexX', 'platform_name': 'Changed'},
+        )
+        with self.assertNumQueries(0):
+            assert SiteConfiguration.get_value_for_org('IndexX', 'platform_name') == 'Index'
+
+        cache.incr(SITE_CONFIGURATION_GENERATION_CACHE_KEY)
+        assert SiteConfiguration.get_value_for_org('IndexX', 'platform_name') == 'Changed'
@@ -25,7 +25,7 @@ from collections import OrderedDict
 from django.contrib.staticfiles import utils
 from django.contrib.staticfiles.finders import BaseFinder
 
-from openedx.core.djangoapps.theming.helpers import get_themes
+from openedx.core.djangoapps.theming.helpers import get_themes, theme_dir_has_file
 from openedx.core.djangoapps.theming.storage import ThemeStorage
 
 
@@ -72,12 +72,10 @@ class ThemeFilesFinder(BaseFinder):  # lint-amnesty, pylint: disable=abstract-me
         matches = []
         theme_dir_name = path.split("/", 1)[0]
 
-        themes = {t.theme_dir_name: t for t in get_themes()}
         # if path is prefixed by theme name then search in the corresponding storage other wise search all storages.
-        if theme_dir_name in themes:
-            theme = themes[theme_dir_name]
+        if theme_dir_name in self.storages:
             path = "/".join(path.split("/")[1:])
-            match = self.find_in_theme(theme.theme_dir_name, path)
+            match = self.find_in_theme(theme_dir_name, path)
             if match:
                 if not all:
                     return match
@@ -91,7 +89,7 @@ class ThemeFilesFinder(BaseFinder):  # lint-amnesty, pylint: disable=abstract-me
         storage = self.storages.get(theme, None)
         if storage:
             # only try to find a file if the source dir actually exists
-            if storage.exists(path):
+            if theme_dir_has_file(storage.location, path):
                 matched_path = storage.path(path)
                 if matched_path:
                     return matched_path
@@ -7,6 +7,7 @@ you need models here, please import them inside the function which uses them.
 
 
 import os
+import posixpath
 import re
 from logging import getLogger
 
@@ -20,6 +21,7 @@ from openedx.core.djangoapps.theming.helpers_dirs import (
     get_project_root_name_from_settings,
     get_theme_base_dirs_from_settings,
     get_theme_dirs,
+    get_theme_files,
     get_themes_unchecked
 )
 from openedx.core.lib.cache_utils import request_cached
@@ -67,14 +69,36 @@ def get_template_path_with_theme(relative_path):
     # strip `/` if present at the start of relative_path
     template_name = re.sub(r'^/+', '', relative_path)
 
-    template_path = theme.template_path / template_name
-    absolute_path = theme.path / "templates" / template_name
-    if absolute_path.exists():
-        return str(template_path)
+    if theme_dir_has_file(theme.path / "templates", template_name):
+        return str(theme.template_path / template_name)
     else:
         return relative_path
 
 
+def theme_dir_has_file(theme_dir, name):
+    """
+    Returns True if the given file exists under the given directory of a theme, e.g. its templates or static directory.
+
+    The files in the directory are listed once per process, rather than looking for the file on every call, except in
+    DEBUG mode so that files added to a theme are picked up without restarting.
+
+    Example:
+        >> theme_dir_has_file('/edx/app/edxapp/edx-platform/themes/red-theme/lms/templates', 'header.html')
+        True
+
+    Parameters:
+        theme_dir (str): directory of the theme to look in
+        name (str): path of the file relative to the directory e.g. 'images/logo.png'
+
+    Returns:
+        (bool): True if the file exists under the directory
+    """
+    name = re.sub(r'^/+', '', name)
+    if settings.DEBUG:
+        return os.path.exists(os.path.join(theme_dir, name))
+    return posixpath.normpath(name) in get_theme_files(theme_dir)
+
+
 def get_all_theme_template_dirs():
     """
     Returns template directories for all the themes.
@@ -198,18 +222,28 @@ def get_current_theme():
     if not site_theme:
         return None
     try:
-        return Theme(
-            name=site_theme.theme_dir_name,
-            theme_dir_name=site_theme.theme_dir_name,
-            themes_base_dir=get_theme_base_dir(site_theme.theme_dir_name),
-            project_root=get_project_root_name()
-        )
+        return _get_theme(site_theme.theme_dir_name, tuple(get_theme_base_dirs()), get_project_root_name())
     except ValueError as error:
         # Log exception message and return None, so that open source theme is used instead
         logger.exception('Theme not found in any of the themes dirs. [%s]', error)
         return None
 
 
+@lru_cache
+def _get_theme(theme_dir_name, themes_base_dirs, project_root):  # pylint: disable=unused-argument
+    """
+    Return the Theme object for the given theme, which is shared by every site using the theme.
+
+    The theme is cached by the themes base dirs too, so that it is looked up again when they change.
+    """
+    return Theme(
+        name=theme_dir_name,
+        theme_dir_name=theme_dir_name,
+        themes_base_dir=get_theme_base_dir(theme_dir_name),
+        project_root=project_root,
+    )
+
+
 def current_request_has_associated_site_theme():
     """
     True if current request has an associated SiteTheme, False otherwise.
@@ -5,6 +5,7 @@ as the discovery happens during the initial setup of Django settings.
 
 
 import os
+import posixpath
 
 from path import Path
 from functools import lru_cache
@@ -69,6 +70,28 @@ def get_theme_dirs(themes_base_dir=None):
     return [_dir for _dir in themes_base_dir_listing if is_theme_dir(themes_base_dir / _dir)]
 
 
+@lru_cache
+def get_theme_files(theme_dir):
+    """
+    Get the paths of all the files under a directory of a theme, e.g. its templates or static directory.
+
+    The files are listed once, so that whether a theme overrides a template or static file can be looked up without
+    touching the file system.
+
+    Args:
+        theme_dir (Path): directory of the theme to list the files of.
+    Returns:
+        frozenset of file paths, relative to the directory and separated by forward slashes, or an empty frozenset if
+        the directory does not exist.
+    """
+    files = set()
+    for dirpath, __, filenames in os.walk(theme_dir, followlinks=True):
+        relative_dirpath = os.path.relpath(dirpath, theme_dir).replace(os.sep, posixpath.sep)
+        for filename in filenames:
+            files.add(posixpath.normpath(posixpath.join(relative_dirpath, filename)))
+    return frozenset(files)
+
+
 def is_theme_dir(_dir):
     """
     Returns true if given dir contains theme overrides.
@@ -99,7 +99,16 @@ class ThemeMixin:
             return os.path.exists(path)
         # in live mode check static asset in the static files dir defined by "STATIC_ROOT" setting
         else:
-            return self.exists(os.path.join(theme, name))
+            return self.asset_exists(os.path.join(theme, name))
+
+    def asset_exists(self, name):
+        """
+        Returns True if the given asset exists in this storage.
+
+        Args:
+            name: asset name e.g. 'red-theme/images/logo.png'
+        """
+        return self.exists(name)
 
 
 class ThemeStorage(ThemeMixin, StaticFilesStorage):
@@ -157,7 +166,7 @@ class ThemeManifestFilesMixin(ManifestFilesMixin):
         parsed_name = urlsplit(unquote(name))
         clean_name = parsed_name.path.strip()
         asset_name = name
-        if not self.exists(clean_name):
+        if not self.asset_exists(clean_name):
             # if themed asset does not exists then use default asset
             theme = name.split("/", 1)[0]
             # verify that themed asset was accessed
@@ -166,6 +175,46 @@ class ThemeManifestFilesMixin(ManifestFilesMixin):
 
         return asset_name
 
+    def asset_exists(self, name):
+        """
+        Returns True if the given asset exists in this storage.
+
+        Once the assets have been collected, the manifest lists every asset (themed or not) under both its name and
+        its hashed name, so it is looked up there rather than in the storage, which may be remote (e.g. S3). While
+        collectstatic is post-processing the assets the manifest is empty, and the storage is checked instead.
+
+        Args:
+            name: asset name e.g. 'red-theme/images/logo.png'
+        """
+        if not self.hashed_files:
+            return self.exists(name)
+
+        if self._manifest_names is None:
+            self._manifest_names = set(self.hashed_files).union(self.hashed_files.values())
+        return name in self._manifest_names
+
+    @property
+    def hashed_files(self):
+        """
+        The manifest, mapping asset names to their hashed names.
+        """
+        return self._hashed_files
+
+    @hashed_files.setter
+    def hashed_files(self, hashed_files):
+        """
+        Replaces the manifest (e.g. when it is loaded), so that its names are indexed again when next looked up.
+        """
+        self._hashed_files = hashed_files
+        self._manifest_names = None
+
+    def post_process(self, *args, **kwargs):
+        """
+        Post-processes the collected assets, indexing the names in the manifest again once they have been added to it.
+        """
+        yield from super().post_process(*args, **kwargs)
+        self._manifest_names = None
+
     def _url(self, hashed_name_func, name, force=False, hashed_files=None):
         """
         This override method swaps out `name` with a processed version.
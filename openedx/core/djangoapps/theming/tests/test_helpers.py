@@ -14,7 +14,8 @@ from openedx.core.djangoapps.theming.helpers import (
     get_template_path_with_theme,
     get_theme_base_dir,
     get_themes,
-    strip_site_theme_templates_path
+    strip_site_theme_templates_path,
+    theme_dir_has_file
 )
 from openedx.core.djangoapps.theming.helpers_dirs import get_theme_dirs
 from openedx.core.djangoapps.theming.tests.test_util import with_comprehensive_theme
@@ -135,6 +136,30 @@ class TestHelpersLMS(TestCase):
         template_path = get_template_path_with_theme('course.html')
         assert template_path == 'course.html'
 
+    @with_comprehensive_theme('red-theme')
+    def test_get_template_path_with_theme_uses_theme_index(self):
+        """
+        Tests themed templates are looked up without checking the file system once the theme has been indexed.
+        """
+        get_template_path_with_theme('header.html')
+        with patch('os.path.exists') as mock_exists:
+            assert get_template_path_with_theme('/header.html') == 'red-theme/lms/templates/header.html'
+            assert get_template_path_with_theme('course.html') == 'course.html'
+        assert not mock_exists.called
+
+    def test_theme_dir_has_file(self):
+        """
+        Tests files are found in theme directories, including in their subdirectories.
+        """
+        templates_dir = get_theme_base_dir('red-theme') / 'red-theme' / 'lms' / 'templates'
+        assert theme_dir_has_file(templates_dir, 'header.html')
+        assert theme_dir_has_file(templates_dir, '/header.html')
+        assert not theme_dir_has_file(templates_dir, 'course.html')
+        assert not theme_dir_has_file(templates_dir / 'missing', 'header.html')
+        with override_settings(DEBUG=True):
+            assert theme_dir_has_file(templates_dir, 'header.html')
+            assert not theme_dir_has_file(templates_dir, 'course.html')
+
     def test_get_template_path_with_theme_disabled(self):
         """
         Tests default template paths are returned when theme is non theme is enabled.
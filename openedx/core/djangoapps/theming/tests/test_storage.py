@@ -8,11 +8,20 @@ from unittest.mock import patch
 
 import ddt
 from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestFilesMixin, StaticFilesStorage
 from django.test import TestCase, override_settings
 
 from openedx.core.djangoapps.theming.helpers import Theme, get_theme_base_dir, get_theme_base_dirs
-from openedx.core.djangoapps.theming.storage import ThemeStorage
+from openedx.core.djangoapps.theming.storage import ThemeManifestFilesMixin, ThemeMixin, ThemeStorage
 from openedx.core.djangolib.testing.utils import skip_unless_lms
+from openedx.core.lib.tempdir import mkdtemp_clean
+
+
+class ThemeManifestStorage(ThemeManifestFilesMixin, ThemeMixin, StaticFilesStorage):
+    """
+    Comprehensive theme aware storage with a manifest of hashed names.
+    """
+    manifest_strict = False
 
 
 @skip_unless_lms
@@ -81,3 +90,57 @@ class TestStorageLMS(TestCase):
             expected_path = self.themes_dir / self.enabled_theme / "lms/static/" / asset
 
             assert expected_path == returned_path
+
+
+@skip_unless_lms
+class TestThemeManifestStorage(TestCase):
+    """
+    Test comprehensive theming static files storage with a manifest.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.storage = ThemeManifestStorage(location=mkdtemp_clean())
+        self.storage.hashed_files = {
+            'images/logo.png': 'images/logo.123.png',
+            'red-theme/images/logo.png': 'red-theme/images/logo.456.png',
+        }
+
+    def test_asset_exists_uses_manifest(self):
+        """
+        Verify assets are looked up in the manifest rather than in the storage
+        """
+        with patch.object(StaticFilesStorage, 'exists') as mock_exists:
+            assert self.storage.asset_exists('red-theme/images/logo.png')
+            assert self.storage.asset_exists('red-theme/images/logo.456.png')
+            assert not self.storage.asset_exists('red-theme/images/favicon.ico')
+
+            self.storage.hashed_files = {
+                'images/logo.png': 'images/logo.123.png',
+                'red-theme/images/favicon.ico': 'red-theme/images/favicon.789.ico',
+            }
+            assert self.storage.asset_exists('red-theme/images/favicon.ico')
+            assert not self.storage.asset_exists('red-theme/images/logo.png')
+        assert not mock_exists.called
+
+    def test_asset_exists_after_post_process(self):
+        """
+        Verify assets added to the manifest by collectstatic's post-processing are found
+        """
+        def post_process(storage, paths, dry_run=False, **options):  # pylint: disable=unused-argument
+            storage.hashed_files.update({'red-theme/images/favicon.ico': 'red-theme/images/favicon.789.ico'})
+            yield 'red-theme/images/favicon.ico', 'red-theme/images/favicon.789.ico', True
+
+        assert not self.storage.asset_exists('red-theme/images/favicon.ico')
+        with patch.object(ManifestFilesMixin, 'post_process', post_process):
+            list(self.storage.post_process({}))
+        assert self.storage.asset_exists('red-theme/images/favicon.ico')
+
+    def test_asset_exists_without_manifest(self):
+        """
+        Verify assets are looked up in the storage while the manifest is empty, e.g. during collectstatic
+        """
+        self.storage.hashed_files = {}
+        with patch.object(StaticFilesStorage, 'exists', return_value=True) as mock_exists:
+            assert self.storage.asset_exists('red-theme/images/logo.png')
+        mock_exists.assert_called_once_with('red-theme/images/logo.png')
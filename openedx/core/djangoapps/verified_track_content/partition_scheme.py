@@ -53,6 +53,14 @@ class EnrollmentTrackPartitionScheme:
 
     read_only = True
 
+    @classmethod
+    def prefetch_groups_for_users(cls, course_key, users):
+        """
+        Caches the enrollment modes of the given users for the rest of the request.
+        """
+        if not CourseEnrollment.enrollment_states_are_cached(users, course_key):
+            CourseEnrollment.bulk_fetch_enrollment_states(users, course_key)
+
     @classmethod
     def get_group_for_user(cls, course_key, user, user_partition, **kwargs):  # pylint: disable=unused-argument
         """
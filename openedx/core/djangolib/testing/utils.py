@@ -138,6 +138,10 @@ class CacheIsolationMixin:
         # Clear that.
         sites.models.SITE_CACHE.clear()
 
+        # Site configurations are indexed in each process. Clear that too.
+        from openedx.core.djangoapps.site_configuration.models import SiteConfigurationIndex
+        SiteConfigurationIndex.clear()
+
         RequestCache.clear_all_namespaces()
 
 
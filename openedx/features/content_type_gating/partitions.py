@@ -16,6 +16,7 @@ from django.utils.translation import gettext_lazy as _
 from web_fragments.fragment import Fragment
 
 from common.djangoapps.course_modes.models import CourseMode
+from common.djangoapps.student.models import CourseEnrollment
 from lms.djangoapps.commerce.utils import EcommerceService
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.lib.mobile_utils import is_request_from_mobile_app
@@ -142,6 +143,13 @@ class ContentTypeGatingPartitionScheme:
 
     read_only = True
 
+    @classmethod
+    def prefetch_groups_for_users(cls, course_key, users):
+        """
+        Caches the enrollments (and holdback exclusions) of the given users for the rest of the request.
+        """
+        CourseEnrollment.bulk_cache_enrollments(users, course_key, ['fbeenrollmentexclusion'])
+
     @classmethod
     def get_group_for_user(cls, course_key, user, user_partition, **kwargs):  # pylint: disable=unused-argument
         """
@@ -7,13 +7,14 @@ from datetime import datetime, timedelta  # lint-amnesty, pylint: disable=wrong-
 
 import ddt
 import pytz
+from config_models.models import cache as config_cache
 from django.utils import timezone
 from edx_django_utils.cache import RequestCache
 from unittest.mock import Mock  # lint-amnesty, pylint: disable=wrong-import-order
 from opaque_keys.edx.locator import CourseLocator
 
 from common.djangoapps.course_modes.tests.factories import CourseModeFactory
-from openedx.core.djangoapps.config_model_utils.models import Provenance
+from openedx.core.djangoapps.config_model_utils.models import STACKED_CONFIGURATION_GENERATION_CACHE_KEY, Provenance
 from openedx.core.djangoapps.content.course_overviews.tests.factories import CourseOverviewFactory
 from openedx.core.djangoapps.site_configuration.tests.factories import SiteConfigurationFactory
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
@@ -71,7 +72,7 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
         user = self.user
         course_key = self.course_overview.id
 
-        query_count = 7
+        query_count = 5
 
         with self.assertNumQueries(query_count):
             enabled = ContentTypeGatingConfig.enabled_for_enrollment(
@@ -206,7 +207,7 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
                             course=test_course, enabled=course_setting, enabled_as_of=datetime(2018, 1, 1)
                         )
 
-            with self.assertNumQueries(4):
+            with self.assertNumQueries(3):
                 all_configs = ContentTypeGatingConfig.all_current_course_configs()
 
         # Deliberatly using the last all_configs that was checked after the 3rd pass through the global_settings loop
@@ -231,6 +232,61 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
             'studio_override_enabled': (None, Provenance.default)
         }
 
+    def test_current_for_courses(self):
+        courses = [CourseOverviewFactory.create(org=f'test-org-{index}') for index in range(5)]
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+        ContentTypeGatingConfig.objects.create(course=courses[0], enabled=False, enabled_as_of=datetime(2018, 1, 1))
+
+        RequestCache.clear_all_namespaces()
+
+        # Check that the number of queries doesn't grow with the number of courses
+        with self.assertNumQueries(1):
+            configs = ContentTypeGatingConfig.current_for_courses([course.id for course in courses])
+
+        assert not configs[courses[0].id].enabled
+        assert configs[courses[0].id].provenances['enabled'] == Provenance.run
+        for course in courses[1:]:
+            assert configs[course.id].enabled
+            assert configs[course.id].provenances['enabled'] == Provenance.global_
+
+    def test_index_rebuilt_when_generation_changes(self):
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(1):
+            assert ContentTypeGatingConfig.current().enabled
+
+        RequestCache.clear_all_namespaces()
+
+        # Check that the index is reused by later requests
+        with self.assertNumQueries(0):
+            assert ContentTypeGatingConfig.current().enabled
+
+        # Simulate another process changing the configuration, which bumps the shared generation
+        ContentTypeGatingConfig.objects.update(enabled=False)
+        config_cache.incr(STACKED_CONFIGURATION_GENERATION_CACHE_KEY)
+
+        RequestCache.clear_all_namespaces()
+
+        # Check that the index is rebuilt once the generation has changed
+        with self.assertNumQueries(1):
+            assert not ContentTypeGatingConfig.current().enabled
+
+    def test_generation_bumped_only_by_configuration_changes(self):
+        generation = config_cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY)
+
+        # Check that saving an unrelated model doesn't invalidate the index
+        UserFactory.create()
+        assert config_cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY) == generation
+
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+        assert config_cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY) != generation
+
+        generation = config_cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY)
+        SiteConfigurationFactory.create()
+        assert config_cache.get(STACKED_CONFIGURATION_GENERATION_CACHE_KEY) != generation
+
     def test_caching_global(self):
         global_config = ContentTypeGatingConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
         global_config.save()
@@ -287,8 +343,8 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the site value is not updated in cache by changing the global value
-        with self.assertNumQueries(0):
+        # Check that the site value is recalculated after changing the global value
+        with self.assertNumQueries(1):
             assert not ContentTypeGatingConfig.current(site=site_cfg.site).enabled
 
     def test_caching_org(self):
@@ -302,7 +358,7 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
         RequestCache.clear_all_namespaces()
 
         # Check that the org value is not retrieved from cache after save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert ContentTypeGatingConfig.current(org=course.org).enabled
 
         RequestCache.clear_all_namespaces()
@@ -317,7 +373,7 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
         RequestCache.clear_all_namespaces()
 
         # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert not ContentTypeGatingConfig.current(org=course.org).enabled
 
         global_config = ContentTypeGatingConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -325,8 +381,8 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the global value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the global value
+        with self.assertNumQueries(1):
             assert not ContentTypeGatingConfig.current(org=course.org).enabled
 
         site_config = ContentTypeGatingConfig(site=site_cfg.site, enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -334,8 +390,8 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the site value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the site value
+        with self.assertNumQueries(2):
             assert not ContentTypeGatingConfig.current(org=course.org).enabled
 
     def test_caching_course(self):
@@ -349,7 +405,7 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
         RequestCache.clear_all_namespaces()
 
         # Check that the org value is not retrieved from cache after save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert ContentTypeGatingConfig.current(course_key=course.id).enabled
 
         RequestCache.clear_all_namespaces()
@@ -364,7 +420,7 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
         RequestCache.clear_all_namespaces()
 
         # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert not ContentTypeGatingConfig.current(course_key=course.id).enabled
 
         global_config = ContentTypeGatingConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -372,8 +428,8 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the global value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the global value
+        with self.assertNumQueries(1):
             assert not ContentTypeGatingConfig.current(course_key=course.id).enabled
 
         site_config = ContentTypeGatingConfig(site=site_cfg.site, enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -381,8 +437,8 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the site value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the site value
+        with self.assertNumQueries(2):
             assert not ContentTypeGatingConfig.current(course_key=course.id).enabled
 
         org_config = ContentTypeGatingConfig(org=course.org, enabled=True, enabled_as_of=datetime(2018, 1, 1))
@@ -390,8 +446,8 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the site value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the site value
+        with self.assertNumQueries(2):
             assert not ContentTypeGatingConfig.current(course_key=course.id).enabled
 
     def _resolve_settings(self, settings):
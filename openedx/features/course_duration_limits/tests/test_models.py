@@ -74,7 +74,7 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
         user = self.user
         course_key = self.course_overview.id  # lint-amnesty, pylint: disable=unused-variable
 
-        query_count = 7
+        query_count = 5
 
         with self.assertNumQueries(query_count):
             enabled = CourseDurationLimitConfig.enabled_for_enrollment(user, self.course_overview)
@@ -205,7 +205,7 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
                             course=test_course, enabled=course_setting, enabled_as_of=datetime(2018, 1, 1, tzinfo=pytz.UTC)  # lint-amnesty, pylint: disable=line-too-long
                         )
 
-            with self.assertNumQueries(4):
+            with self.assertNumQueries(3):
                 all_configs = CourseDurationLimitConfig.all_current_course_configs()
 
         # Deliberatly using the last all_configs that was checked after the 3rd pass through the global_settings loop
@@ -286,8 +286,8 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the site value is not updated in cache by changing the global value
-        with self.assertNumQueries(0):
+        # Check that the site value is recalculated after changing the global value
+        with self.assertNumQueries(1):
             assert not CourseDurationLimitConfig.current(site=site_cfg.site).enabled
 
     def test_caching_org(self):
@@ -301,7 +301,7 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
         RequestCache.clear_all_namespaces()
 
         # Check that the org value is not retrieved from cache after save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert CourseDurationLimitConfig.current(org=course.org).enabled
 
         RequestCache.clear_all_namespaces()
@@ -316,7 +316,7 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
         RequestCache.clear_all_namespaces()
 
         # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert not CourseDurationLimitConfig.current(org=course.org).enabled
 
         global_config = CourseDurationLimitConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1, tzinfo=pytz.UTC))
@@ -324,8 +324,8 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the global value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the global value
+        with self.assertNumQueries(1):
             assert not CourseDurationLimitConfig.current(org=course.org).enabled
 
         site_config = CourseDurationLimitConfig(site=site_cfg.site, enabled=True, enabled_as_of=datetime(2018, 1, 1, tzinfo=pytz.UTC))  # lint-amnesty, pylint: disable=line-too-long
@@ -333,8 +333,8 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the site value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the site value
+        with self.assertNumQueries(2):
             assert not CourseDurationLimitConfig.current(org=course.org).enabled
 
     def test_caching_course(self):
@@ -348,7 +348,7 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
         RequestCache.clear_all_namespaces()
 
         # Check that the org value is not retrieved from cache after save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert CourseDurationLimitConfig.current(course_key=course.id).enabled
 
         RequestCache.clear_all_namespaces()
@@ -363,7 +363,7 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
         RequestCache.clear_all_namespaces()
 
         # Check that the org value in cache was deleted on save
-        with self.assertNumQueries(2):
+        with self.assertNumQueries(1):
             assert not CourseDurationLimitConfig.current(course_key=course.id).enabled
 
         global_config = CourseDurationLimitConfig(enabled=True, enabled_as_of=datetime(2018, 1, 1, tzinfo=pytz.UTC))
@@ -371,8 +371,8 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the global value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the global value
+        with self.assertNumQueries(1):
             assert not CourseDurationLimitConfig.current(course_key=course.id).enabled
 
         site_config = CourseDurationLimitConfig(site=site_cfg.site, enabled=True, enabled_as_of=datetime(2018, 1, 1, tzinfo=pytz.UTC))  # lint-amnesty, pylint: disable=line-too-long
@@ -380,8 +380,8 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the site value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the site value
+        with self.assertNumQueries(2):
             assert not CourseDurationLimitConfig.current(course_key=course.id).enabled
 
         org_config = CourseDurationLimitConfig(org=course.org, enabled=True, enabled_as_of=datetime(2018, 1, 1, tzinfo=pytz.UTC))  # lint-amnesty, pylint: disable=line-too-long
@@ -389,8 +389,8 @@ class TestCourseDurationLimitConfig(CacheIsolationTestCase):
 
         RequestCache.clear_all_namespaces()
 
-        # Check that the org value is not updated in cache by changing the site value
-        with self.assertNumQueries(0):
+        # Check that the org value is recalculated after changing the site value
+        with self.assertNumQueries(2):
             assert not CourseDurationLimitConfig.current(course_key=course.id).enabled
 
     def _resolve_settings(self, settings):
@@ -14,9 +14,11 @@ This is used by capa_block.
 """
 
 
+import hashlib
 import logging
 import os.path
 import re
+import threading
 from collections import OrderedDict
 from copy import deepcopy
 from datetime import datetime
@@ -75,8 +77,56 @@ html_problem_semantics = [
     "openendedrubric",
 ]
 
+# The maximum number of parsed problem templates kept in memory by each process
+MAX_CACHED_PROBLEM_TEMPLATES = 500
+
 log = logging.getLogger(__name__)
 
+
+class ProblemTemplateCache(object):
+    """
+    A bounded, thread-safe, least-recently-used cache of parsed problem XML trees, keyed by
+    a hash of the problem XML.
+
+    The cached trees are templates, which are never handed out themselves: each problem
+    instance gets its own copy, which it is free to modify.
+    """
+    def __init__(self, max_size=MAX_CACHED_PROBLEM_TEMPLATES):
+        self.max_size = max_size
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return a copy of the tree cached for key, or None if there isn't one.
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                return None
+            self._templates.move_to_end(key)
+        return deepcopy(template)
+
+    def set(self, key, tree):
+        """
+        Cache a copy of tree for key.
+        """
+        template = deepcopy(tree)
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop all cached trees.
+        """
+        with self._lock:
+            self._templates.clear()
+
+
+PROBLEM_TEMPLATE_CACHE = ProblemTemplateCache()
+
 #-----------------------------------------------------------------------------
 # main class for this module
 
@@ -182,22 +232,7 @@ class LoncapaProblem(object):
         self.problem_text = problem_text
 
         # parse problem XML file into an element tree
-        if isinstance(problem_text, six.text_type):
-            # etree chokes on Unicode XML with an encoding declaration
-            problem_text = problem_text.encode('utf-8')
-        self.tree = etree.XML(problem_text)
-
-        try:
-            self.make_xml_compatible(self.tree)
-        except Exception:
-            capa_block = self.capa_block
-            log.exception(
-                "CAPAProblemError: %s, id:%s, data: %s",
-                capa_block.display_name,
-                self.problem_id,
-                capa_block.data
-            )
-            raise
+        self.tree = self._parse_problem_text(problem_text)
 
         # handle any <include file="foo"> tags
         self._process_includes()
@@ -233,6 +268,40 @@ class LoncapaProblem(object):
             if extract_tree:
                 self.extracted_tree = self._extract_html(self.tree)
 
+    def _parse_problem_text(self, problem_text):
+        """
+        Parse problem_text into an element tree, and apply the compatibility translations.
+
+        This doesn't depend on the seed or the student's state, so the result is kept as a
+        template in PROBLEM_TEMPLATE_CACHE, and every other instance of the same problem gets
+        a copy of it instead of parsing the XML again. Problems with <include> tags aren't
+        cached, since the included files may change.
+        """
+        if isinstance(problem_text, six.text_type):
+            # etree chokes on Unicode XML with an encoding declaration
+            problem_text = problem_text.encode('utf-8')
+        template_key = hashlib.sha1(problem_text).hexdigest()
+        tree = PROBLEM_TEMPLATE_CACHE.get(template_key)
+        if tree is not None:
+            return tree
+
+        tree = etree.XML(problem_text)
+        try:
+            self.make_xml_compatible(tree)
+        except Exception:
+            capa_block = self.capa_block
+            log.exception(
+                "CAPAProblemError: %s, id:%s, data: %s",
+                capa_block.display_name,
+                self.problem_id,
+                capa_block.data
+            )
+            raise
+
+        if tree.find('.//include') is None:
+            PROBLEM_TEMPLATE_CACHE.set(template_key, tree)
+        return tree
+
     def make_xml_compatible(self, tree):
         """
         Adjust tree xml in-place for compatibility before creating
@@ -0,0 +1,141 @@
+"""
+Parse-once math expressions for the numerical and formula response types.
+
+`calc.evaluator` parses its expression every time it is called. Formula responses
+evaluate the same instructor and student expressions at every sample point, and the
+same instructor expressions for every learner, so parsing dominates their grading
+time. A :class:`CompiledExpression` parses an expression once and can then be
+evaluated any number of times, giving exactly the results (and raising exactly the
+exceptions) that `calc.evaluator` would.
+"""
+
+
+import threading
+from collections import OrderedDict
+
+from calc.calc import (
+    ParseAugmenter,
+    add_defaults,
+    check_parens,
+    eval_atom,
+    eval_number,
+    eval_parallel,
+    eval_power,
+    eval_product,
+    eval_sum
+)
+
+# The maximum number of compiled expressions kept in memory by each process.
+MAX_CACHED_EXPRESSIONS = 2000
+
+
+class CompiledExpression(object):
+    """
+    A math expression which has been parsed once, and can be evaluated many times.
+
+    Parsing errors (`UnmatchedParenthesis` and pyparsing's `ParseException`) are raised
+    when the expression is compiled; undefined variables and errors in the maths are
+    raised when it is evaluated, as `calc.evaluator` does.
+    """
+    def __init__(self, math_expr, case_sensitive=False):
+        self.math_expr = math_expr
+        self.case_sensitive = case_sensitive
+        self._parser = None
+        # `calc.evaluator` doesn't parse blank expressions, which evaluate to NaN.
+        if math_expr.strip() != "":
+            check_parens(math_expr)
+            self._parser = ParseAugmenter(math_expr, case_sensitive)
+            self._parser.parse_algebra()
+
+    def evaluate(self, variables, unary_functions=None):
+        """
+        Evaluate the expression with the given variables and (additional) functions.
+        """
+        return self.evaluate_samples([variables], unary_functions)[0]
+
+    def evaluate_samples(self, var_dict_list, unary_functions=None):
+        """
+        Evaluate the expression once for each dict of variables in `var_dict_list`,
+        and return the list of results.
+        """
+        if self._parser is None:
+            return [float('nan') for __ in var_dict_list]
+
+        if self.case_sensitive:
+            casify = lambda x: x
+        else:
+            casify = lambda x: x.lower()  # Lowercase for case insens.
+
+        results = []
+        checked_names = set()
+        for variables in var_dict_list:
+            all_variables, all_functions = add_defaults(variables, unary_functions or {}, self.case_sensitive)
+            # Samples normally all define the same variables, so only check each set of names once.
+            names = frozenset(all_variables)
+            if names not in checked_names:
+                self._parser.check_variables(all_variables, all_functions)
+                checked_names.add(names)
+
+            evaluate_actions = {
+                'number': eval_number,
+                'variable': lambda x, all_variables=all_variables: all_variables[casify(x[0])],
+                'function': lambda x, all_functions=all_functions: all_functions[casify(x[0])](x[1]),
+                'atom': eval_atom,
+                'power': eval_power,
+                'parallel': eval_parallel,
+                'product': eval_product,
+                'sum': eval_sum
+            }
+            results.append(self._parser.reduce_tree(evaluate_actions))
+        return results
+
+
+class CompiledExpressionCache(object):
+    """
+    A bounded, thread-safe, least-recently-used cache of :class:`CompiledExpression`
+    objects, keyed by the expression and its case sensitivity.
+
+    Compiled expressions are never modified once they have been created, so the cached
+    objects themselves are shared between all of their users.
+    """
+    def __init__(self, max_size=MAX_CACHED_EXPRESSIONS):
+        self.max_size = max_size
+        self._expressions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, math_expr, case_sensitive=False):
+        """
+        Return the compiled form of `math_expr`, compiling it if needed.
+
+        Expressions which fail to compile aren't cached; the error is raised each time.
+        """
+        key = (math_expr, bool(case_sensitive))
+        with self._lock:
+            expression = self._expressions.get(key)
+            if expression is not None:
+                self._expressions.move_to_end(key)
+                return expression
+
+        expression = CompiledExpression(math_expr, case_sensitive)
+        with self._lock:
+            self._expressions[key] = expression
+            while len(self._expressions) > self.max_size:
+                self._expressions.popitem(last=False)
+        return expression
+
+    def clear(self):
+        """
+        Drop all compiled expressions.
+        """
+        with self._lock:
+            self._expressions.clear()
+
+
+COMPILED_EXPRESSION_CACHE = CompiledExpressionCache()
+
+
+def compiled_evaluator(variables, unary_functions, math_expr, case_sensitive=False):
+    """
+    A drop-in replacement for `calc.evaluator` which only parses each expression once.
+    """
+    return COMPILED_EXPRESSION_CACHE.get(math_expr, case_sensitive).evaluate(variables, unary_functions)
@@ -32,7 +32,7 @@ import random2 as random
 import requests
 import six
 # specific library imports
-from calc import UndefinedVariable, UnmatchedParenthesis, evaluator
+from calc import UndefinedVariable, UnmatchedParenthesis
 from django.utils import html
 
 from lxml import etree
@@ -50,6 +50,7 @@ from openedx.core.lib import edx_six
 from openedx.core.lib.grade_utils import round_away_from_zero
 
 from . import correctmap
+from .compiled_expressions import COMPILED_EXPRESSION_CACHE, compiled_evaluator
 from .registry import TagRegistry
 from .util import (
     compare_with_tolerance,
@@ -1559,7 +1560,7 @@ class NumericalResponse(LoncapaResponse):
         """
         Given the staff answer as a string, find its float value.
 
-        Use `evaluator` for this, but for backward compatability, try the
+        Use `compiled_evaluator` for this, but for backward compatability, try the
         built-in method `complex` (which used to be the standard).
         """
         try:
@@ -1569,7 +1570,7 @@ class NumericalResponse(LoncapaResponse):
             # `ValueError`. Then test if instead it is a math expression.
             # `complex` seems to only generate `ValueErrors`, only catch these.
             try:
-                correct_ans = evaluator({}, {}, answer)
+                correct_ans = compiled_evaluator({}, {}, answer)
             except Exception:
                 log.debug("Content error--answer '%s' is not a valid number", answer)
                 _ = edx_six.get_gettext(self.capa_system.i18n)
@@ -1601,10 +1602,10 @@ class NumericalResponse(LoncapaResponse):
             _("Could not interpret '{student_answer}' as a number.").format(student_answer=html.escape(student_answer))
         )
 
-        # Begin `evaluator` block
+        # Begin `compiled_evaluator` block
         # Catch a bunch of exceptions and give nicer messages to the student.
         try:
-            student_float = evaluator({}, {}, student_answer)
+            student_float = compiled_evaluator({}, {}, student_answer)
         except UndefinedVariable as err:
             raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
                 err.args[0]
@@ -1631,7 +1632,7 @@ class NumericalResponse(LoncapaResponse):
             )
         except Exception:
             raise general_exception  # lint-amnesty, pylint: disable=raise-missing-from
-        # End `evaluator` block -- we figured out the student's answer!
+        # End `compiled_evaluator` block -- we figured out the student's answer!
 
         tree = self.xml
 
@@ -1767,8 +1768,8 @@ class NumericalResponse(LoncapaResponse):
         with this problem's tolerance.
         """
         return compare_with_tolerance(
-            evaluator({}, {}, ans1),
-            evaluator({}, {}, ans2),
+            compiled_evaluator({}, {}, ans1),
+            compiled_evaluator({}, {}, ans2),
             self.tolerance
         )
 
@@ -1777,7 +1778,7 @@ class NumericalResponse(LoncapaResponse):
         Returns whether this answer is in a valid form.
         """
         try:
-            evaluator({}, {}, answer)
+            compiled_evaluator({}, {}, answer)
             return True
         except (StudentInputError, UndefinedVariable, UnmatchedParenthesis):
             return False
@@ -3093,64 +3094,60 @@ class FormulaResponse(LoncapaResponse):
         """
         _ = edx_six.get_gettext(self.capa_system.i18n)
 
-        out = []
-        for var_dict in var_dict_list:
-            try:
-                out.append(evaluator(
-                    var_dict,
-                    {},
-                    answer,
-                    case_sensitive=self.case_sensitive,
-                ))
-            except UndefinedVariable as err:
-                log.debug(
-                    'formularesponse: undefined variable in formula=%s',
-                    html.escape(answer)
-                )
-                raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
-                    err.args[0]
-                )
-            except UnmatchedParenthesis as err:
+        if not var_dict_list:
+            return []
+        try:
+            # The answer is parsed once, and then evaluated at every sample point.
+            expression = COMPILED_EXPRESSION_CACHE.get(answer, self.case_sensitive)
+            return expression.evaluate_samples(var_dict_list)
+        except UndefinedVariable as err:
+            log.debug(
+                'formularesponse: undefined variable in formula=%s',
+                html.escape(answer)
+            )
+            raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
+                err.args[0]
+            )
+        except UnmatchedParenthesis as err:
+            log.debug(
+                'formularesponse: unmatched parenthesis in formula=%s',
+                html.escape(answer)
+            )
+            raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
+                err.args[0]
+            )
+        except ValueError as err:
+            if 'factorial' in text_type(err):
+                # This is thrown when fact() or factorial() is used in a formularesponse answer
+                #   that tests on negative and/or non-integer inputs
+                # text_type(err) will be: `factorial() only accepts integral values` or
+                # `factorial() not defined for negative values`
                 log.debug(
-                    'formularesponse: unmatched parenthesis in formula=%s',
+                    ('formularesponse: factorial function used in response '
+                     'that tests negative and/or non-integer inputs. '
+                     'Provided answer was: %s'),
                     html.escape(answer)
                 )
                 raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
-                    err.args[0]
+                    _("Factorial function not permitted in answer "
+                      "for this problem. Provided answer was: "
+                      "{bad_input}").format(bad_input=html.escape(answer))
                 )
-            except ValueError as err:
-                if 'factorial' in text_type(err):
-                    # This is thrown when fact() or factorial() is used in a formularesponse answer
-                    #   that tests on negative and/or non-integer inputs
-                    # text_type(err) will be: `factorial() only accepts integral values` or
-                    # `factorial() not defined for negative values`
-                    log.debug(
-                        ('formularesponse: factorial function used in response '
-                         'that tests negative and/or non-integer inputs. '
-                         'Provided answer was: %s'),
-                        html.escape(answer)
-                    )
-                    raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
-                        _("Factorial function not permitted in answer "
-                          "for this problem. Provided answer was: "
-                          "{bad_input}").format(bad_input=html.escape(answer))
-                    )
-                # If non-factorial related ValueError thrown, handle it the same as any other Exception
-                log.debug('formularesponse: error %s in formula', err)
-                raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
-                    _("Invalid input: Could not parse '{bad_input}' as a formula.").format(
-                        bad_input=html.escape(answer)
-                    )
+            # If non-factorial related ValueError thrown, handle it the same as any other Exception
+            log.debug('formularesponse: error %s in formula', err)
+            raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
+                _("Invalid input: Could not parse '{bad_input}' as a formula.").format(
+                    bad_input=html.escape(answer)
                 )
-            except Exception as err:
-                # traceback.print_exc()
-                log.debug('formularesponse: error %s in formula', err)
-                raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
-                    _("Invalid input: Could not parse '{bad_input}' as a formula").format(
-                        bad_input=html.escape(answer)
-                    )
+            )
+        except Exception as err:
+            # traceback.print_exc()
+            log.debug('formularesponse: error %s in formula', err)
+            raise StudentInputError(  # lint-amnesty, pylint: disable=raise-missing-from
+                _("Invalid input: Could not parse '{bad_input}' as a formula").format(
+                    bad_input=html.escape(answer)
                 )
-        return out
+            )
 
     def randomize_variables(self, samples):
         """
@@ -3882,7 +3879,7 @@ class ChoiceTextResponse(LoncapaResponse):
             # if all that is important is verifying numericality
             try:
                 partial_correct = compare_with_tolerance(
-                    evaluator({}, {}, answer_value),
+                    compiled_evaluator({}, {}, answer_value),
                     correct_ans,
                     tolerance
                 )
@@ -3,17 +3,21 @@ Test capa problem.
 """
 
 
+import io
+import os
 import textwrap
+import timeit
 import unittest
 import pytest
 import ddt
 import six
 from lxml import etree
 from markupsafe import Markup
-from mock import patch
+from mock import Mock, patch
 
+from xmodule.capa.capa_problem import PROBLEM_TEMPLATE_CACHE, ProblemTemplateCache
 from xmodule.capa.responsetypes import LoncapaProblemError
-from xmodule.capa.tests.helpers import new_loncapa_problem
+from xmodule.capa.tests.helpers import new_loncapa_problem, test_capa_system
 from openedx.core.djangolib.markup import HTML
 
 
@@ -734,3 +738,117 @@ class CAPAProblemReportHelpersTest(unittest.TestCase):
         # Ensure that the answer is a string so that the dict returned from this
         # function can eventualy be serialized to json without issues.
         assert isinstance(problem.get_question_answers()['1_solution_1'], six.text_type)
+
+
+class ProblemTemplateCacheTest(unittest.TestCase):
+    """
+    Tests for reusing the parsed problem XML across problem instances.
+    """
+    xml = textwrap.dedent("""
+        <problem>
+            <optionresponse>
+                <optioninput label="Color">
+                    <option correct="False">yellow</option>
+                    <option correct="True">blue</option>
+                </optioninput>
+            </optionresponse>
+        </problem>
+    """)
+
+    def setUp(self):
+        super().setUp()
+        PROBLEM_TEMPLATE_CACHE.clear()
+        self.addCleanup(PROBLEM_TEMPLATE_CACHE.clear)
+
+    def test_instances_get_their_own_tree(self):
+        first = new_loncapa_problem(self.xml)
+        with patch('xmodule.capa.capa_problem.etree.XML') as mock_xml:
+            second = new_loncapa_problem(self.xml, seed=1)
+            mock_xml.assert_not_called()
+
+        assert first.tree is not second.tree
+        assert etree.tostring(first.tree) == etree.tostring(second.tree)
+        # The compatibility translations are part of the template
+        assert second.tree.find('.//optioninput').get('correct') == 'blue'
+        assert first.get_html() == second.get_html()
+
+    def test_includes_are_not_cached(self):
+        xml = '<problem><include file="include.xml"/></problem>'
+        capa_system = test_capa_system()
+        capa_system.resources_fs = Mock(open=Mock(return_value=io.BytesIO(b'<p>Included</p>')))
+        new_loncapa_problem(xml, capa_system=capa_system)
+
+        capa_system.resources_fs.open.return_value = io.BytesIO(b'<p>Changed</p>')
+        problem = new_loncapa_problem(xml, capa_system=capa_system)
+        assert problem.tree.find('p').text == 'Changed'
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = ProblemTemplateCache(max_size=1)
+        cache.set('first', etree.XML('<problem/>'))
+        cache.set('second', etree.XML('<problem/>'))
+        assert cache.get('first') is None
+        assert cache.get('second') is not None
+
+
+@unittest.skipUnless(os.environ.get('RUN_PERF_TESTS'), 'Set RUN_PERF_TESTS to run performance tests.')
+@ddt.ddt
+class ProblemTemplateCachePerformance(unittest.TestCase):
+    """
+    Time creating many instances of a problem, with and without the parsed problem template cache.
+
+    Run with:
+
+        RUN_PERF_TESTS=1 pytest xmodule/capa/tests/test_capa_problem.py -k Performance -s
+    """
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    # Number of problem instances (e.g. learners viewing the problem) to time.
+    INSTANCES = 200
+
+    xml = textwrap.dedent("""
+        <problem>
+            <script type="loncapa/python">
+        x = random.randint(1, 10)
+            </script>
+            <p>What is $x times 2?</p>
+            <numericalresponse answer="$x*2">
+                <formulaequationinput label="Answer"/>
+            </numericalresponse>
+            <multiplechoiceresponse>
+                <choicegroup type="MultipleChoice" shuffle="true">
+                    <choice correct="false">one</choice>
+                    <choice correct="true">two</choice>
+                    <choice correct="false">three</choice>
+                </choicegroup>
+            </multiplechoiceresponse>
+            <optionresponse>
+                <optioninput label="Color">
+                    <option correct="False">yellow</option>
+                    <option correct="True">blue</option>
+                </optioninput>
+            </optionresponse>
+        </problem>
+    """)
+
+    @ddt.data(False, True)
+    def test_problem_instances(self, randomized):
+        """
+        Print the time taken to create problem instances with the same seed (non-randomized
+        problems) or a different seed for each instance (randomized problems).
+        """
+        capa_system = test_capa_system()
+
+        def create_instances():
+            for instance in range(self.INSTANCES):
+                new_loncapa_problem(self.xml, capa_system=capa_system, seed=instance if randomized else 1)
+
+        with patch.object(PROBLEM_TEMPLATE_CACHE, 'get', return_value=None):
+            uncached_time = timeit.timeit(create_instances, number=1)
+        PROBLEM_TEMPLATE_CACHE.clear()
+        cached_time = timeit.timeit(create_instances, number=1)
+
+        print(
+            f"{'randomized' if randomized else 'non-randomized'} problem, {self.INSTANCES} instances: "
+            f"parsing every time {uncached_time * 1000:.2f}ms, from template {cached_time * 1000:.2f}ms"
+        )
@@ -0,0 +1,78 @@
+"""
+Tests for the parse-once math expressions used by capa response types.
+"""
+
+
+import math
+import unittest
+
+import calc
+import ddt
+import pyparsing
+
+from xmodule.capa.compiled_expressions import CompiledExpression, CompiledExpressionCache, compiled_evaluator
+
+
+@ddt.ddt
+class CompiledExpressionTest(unittest.TestCase):
+    """
+    Tests that compiled expressions evaluate exactly as `calc.evaluator` does.
+    """
+
+    @ddt.data(
+        ('x+2*y', {'x': 1.5, 'y': -2.25}, False),
+        ('2^3^2', {}, False),
+        ('sqrt(-4) + pi', {}, False),
+        ('2 || 3', {}, False),
+        ('5%*X', {'x': 3}, False),
+        ('-sin(x)/cos(x) + abs(-x)', {'x': 0.3}, False),
+        ('X_{ab}^{2} + x', {'X_{ab}^{2}': 2, 'x': 1}, True),
+        ('   ', {}, False),
+    )
+    @ddt.unpack
+    def test_matches_evaluator(self, math_expr, variables, case_sensitive):
+        expected = calc.evaluator(variables, {}, math_expr, case_sensitive=case_sensitive)
+        result = compiled_evaluator(variables, {}, math_expr, case_sensitive=case_sensitive)
+        if isinstance(expected, float) and math.isnan(expected):
+            assert math.isnan(result)
+        else:
+            assert result == expected
+
+    def test_evaluate_samples(self):
+        expression = CompiledExpression('x^2 - f(y)')
+        samples = [{'x': x, 'y': y} for x, y in ((1, 2), (3, 4), (-0.5, 0.25))]
+        functions = {'f': lambda value: value * 10}
+        assert expression.evaluate_samples(samples, functions) == [
+            calc.evaluator(sample, functions, 'x^2 - f(y)') for sample in samples
+        ]
+
+    @ddt.data(
+        ('(x', {'x': 1}, calc.UnmatchedParenthesis),
+        ('x +* 2', {'x': 1}, pyparsing.ParseException),
+        ('x + z', {'x': 1}, calc.UndefinedVariable),
+        ('1/x', {'x': 0}, ZeroDivisionError),
+        ('X', {'x': 1}, calc.UndefinedVariable),
+    )
+    @ddt.unpack
+    def test_errors_match_evaluator(self, math_expr, variables, error):
+        with self.assertRaises(error) as expected:
+            calc.evaluator(variables, {}, math_expr, case_sensitive=True)
+        with self.assertRaises(error) as raised:
+            compiled_evaluator(variables, {}, math_expr, case_sensitive=True)
+        assert str(raised.exception) == str(expected.exception)
+
+    def test_cache_reuses_and_evicts(self):
+        cache = CompiledExpressionCache(max_size=2)
+        expression = cache.get('x+1')
+        assert cache.get('x+1') is expression
+        assert cache.get('x+1', case_sensitive=True) is not expression
+
+        cache.get('x+2')
+        assert cache.get('x+1') is not expression
+
+    def test_cache_skips_invalid_expressions(self):
+        cache = CompiledExpressionCache()
+        for __ in range(2):
+            with self.assertRaises(calc.UnmatchedParenthesis):
+                cache.get('(x')
+        assert not cache._expressions  # pylint: disable=protected-access
@@ -8,6 +8,7 @@ import io
 import json
 import os
 import textwrap
+import timeit
 import unittest
 import zipfile
 from datetime import datetime
@@ -22,6 +23,7 @@ import six
 from pytz import UTC
 from six import text_type
 
+from xmodule.capa.compiled_expressions import COMPILED_EXPRESSION_CACHE
 from xmodule.capa.correctmap import CorrectMap
 from xmodule.capa.responsetypes import LoncapaProblemError, ResponseError, StudentInputError
 from xmodule.capa.tests.helpers import load_fixture, new_loncapa_problem, test_capa_system
@@ -575,6 +577,49 @@ class FormulaResponseTest(ResponseTest):
         assert not list(problem.responders.values())[0].validate_answer('3*y+2*x')
 
 
+@unittest.skipUnless(os.environ.get('RUN_PERF_TESTS'), 'Set RUN_PERF_TESTS to run performance tests.')
+class FormulaResponsePerformance(ResponseTest):
+    """
+    Time grading a formula response with 20 samples, with and without compiled expressions cached.
+
+    Run with:
+
+        RUN_PERF_TESTS=1 pytest xmodule/capa/tests/test_responsetypes.py -k FormulaResponsePerformance -s
+    """
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    xml_factory_class = FormulaResponseXMLFactory
+
+    # Number of times the answer is graded when timing it.
+    REPETITIONS = 200
+
+    def test_grading_timings(self):
+        """
+        Print the average time taken to grade a correct answer.
+        """
+        problem = self.build_problem(
+            sample_dict={'x': (-10, 10), 'y': (-10, 10)},
+            num_samples=20,
+            tolerance='0.1%',
+            answer='x^2 + 2*x*y + sin(y)/cos(x)',
+        )
+
+        def grade():
+            self.assert_grade(problem, 'sin(y)/cos(x) + x*(x + 2*y)', 'correct')
+
+        with mock.patch.object(COMPILED_EXPRESSION_CACHE, 'max_size', 0):
+            COMPILED_EXPRESSION_CACHE.clear()
+            uncached_time = timeit.timeit(grade, number=self.REPETITIONS) / self.REPETITIONS
+        COMPILED_EXPRESSION_CACHE.clear()
+        cached_time = timeit.timeit(grade, number=self.REPETITIONS) / self.REPETITIONS
+
+        print(
+            f"formularesponse (20 samples): parsing every expression {uncached_time * 1000:.2f}ms, "
+            f"with compiled expressions cached {cached_time * 1000:.2f}ms"
+        )
+
+
 class StringResponseTest(ResponseTest):  # pylint: disable=missing-class-docstring
     xml_factory_class = StringResponseXMLFactory
 
@@ -1622,7 +1667,7 @@ class NumericalResponseTest(ResponseTest):  # pylint: disable=missing-class-docs
 
         problem = self.build_problem(answer=4, tolerance='10%')
 
-        with mock.patch('xmodule.capa.responsetypes.evaluator') as mock_eval:
+        with mock.patch('xmodule.capa.responsetypes.compiled_evaluator') as mock_eval:
             mock_eval.side_effect = evaluator_side_effect
             self.assert_grade(problem, 'some big input', 'incorrect')
             self.assert_grade(problem, 'some neg input', 'incorrect')
@@ -1643,7 +1688,7 @@ class NumericalResponseTest(ResponseTest):  # pylint: disable=missing-class-docs
             (ZeroDivisionError(), "Could not interpret '.*' as a number")
         ]
 
-        with mock.patch('xmodule.capa.responsetypes.evaluator') as mock_eval:
+        with mock.patch('xmodule.capa.responsetypes.compiled_evaluator') as mock_eval:
             for err, msg_regex in errors:
 
                 def evaluator_side_effect(_, __, math_string):
@@ -10,12 +10,13 @@ from decimal import Decimal
 
 import bleach
 import six
-from calc import evaluator
 from lxml import etree
 
 from bleach.css_sanitizer import CSSSanitizer
 from openedx.core.djangolib.markup import HTML
 
+from .compiled_expressions import compiled_evaluator
+
 #-----------------------------------------------------------------------------
 #
 # Utility functions used in CAPA responsetypes
@@ -62,11 +63,11 @@ def compare_with_tolerance(student_complex, instructor_complex, tolerance=defaul
         if tolerance == default_tolerance:
             relative_tolerance = True
         if tolerance.endswith('%'):
-            tolerance = evaluator({}, {}, tolerance[:-1]) * 0.01
+            tolerance = compiled_evaluator({}, {}, tolerance[:-1]) * 0.01
             if not relative_tolerance:
                 tolerance = tolerance * abs(instructor_complex)
         else:
-            tolerance = evaluator({}, {}, tolerance)
+            tolerance = compiled_evaluator({}, {}, tolerance)
 
     if relative_tolerance:
         tolerance = tolerance * max(abs(student_complex), abs(instructor_complex))
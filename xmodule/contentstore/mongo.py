@@ -5,6 +5,7 @@ MongoDB/GridFS-level code for the contentstore.
 
 import json
 import os
+from datetime import datetime
 
 import gridfs
 import pymongo
@@ -13,6 +14,8 @@ from fs.osfs import OSFS
 from gridfs.errors import NoFile, FileExists
 from mongodb_proxy import autoretry_read
 from opaque_keys.edx.keys import AssetKey
+from pymongo.errors import OperationFailure
+from pytz import UTC
 
 from xmodule.contentstore.content import XASSET_LOCATION_TAG
 from xmodule.exceptions import NotFoundError
@@ -404,21 +407,20 @@ class MongoContentStore(ContentStore):
         """
         See :meth:`.ContentStore.copy_all_course_assets`
 
-        This implementation fairly expensively copies all of the data
+        The asset contents are copied on the database server when it supports it (MongoDB 4.4+),
+        so that the bits don't have to be pulled over and pushed back. Otherwise, this
+        implementation fairly expensively copies all of the data.
         """
         source_query = query_for_course(source_course_key)
-        # it'd be great to figure out how to do all of this on the db server and not pull the bits over
+        copy_on_server = True
         for asset in self.fs_files.find(source_query):
-            asset_key = self.make_id_son(asset)
-            # don't convert from string until fs access
-            source_content = self.fs.get(asset_key)
+            source_id = self.make_id_son(asset)
+            asset_key = source_id
             if isinstance(asset_key, str):
                 asset_key = AssetKey.from_string(asset_key)
                 __, asset_key = self.asset_db_key(asset_key)
-            # Need to replace dict IDs with SON for chunk lookup to work under Python 3
-            # because field order can be different and mongo cares about the order
-            if isinstance(source_content._id, dict):  # lint-amnesty, pylint: disable=protected-access
-                source_content._file['_id'] = asset_key.copy()  # lint-amnesty, pylint: disable=protected-access
+            else:
+                asset_key = asset_key.copy()
             asset_key['org'] = dest_course_key.org
             asset_key['course'] = dest_course_key.course
             if getattr(dest_course_key, 'deprecated', False):  # remove the run if exists
@@ -430,12 +432,46 @@ class MongoContentStore(ContentStore):
                 asset_id = str(
                     dest_course_key.make_asset_key(asset_key['category'], asset_key['name']).for_branch(None)
                 )
+
+            if copy_on_server:
+                try:
+                    self._copy_asset_on_server(asset, source_id, asset_id, asset_key)
+                    continue
+                except OperationFailure:
+                    # $merge into the collection being aggregated isn't supported by this server
+                    copy_on_server = False
+
+            # don't convert from string until fs access
+            source_content = self.fs.get(source_id)
+            # Need to replace dict IDs with SON for chunk lookup to work under Python 3
+            # because field order can be different and mongo cares about the order
+            if isinstance(source_content._id, dict):  # lint-amnesty, pylint: disable=protected-access
+                source_content._file['_id'] = source_id.copy()  # lint-amnesty, pylint: disable=protected-access
             try:
                 self.create_asset(source_content, asset_id, asset, asset_key)
             except FileExists:
                 self.fs.delete(file_id=asset_id)
                 self.create_asset(source_content, asset_id, asset, asset_key)
 
+    def _copy_asset_on_server(self, asset, source_id, asset_id, asset_key):
+        """
+        Copy the GridFS file ``asset`` (whose id is ``source_id``) to ``asset_id`` without
+        reading its chunks into this process, replacing any existing file with that id.
+
+        Raises:
+            OperationFailure: if the server can't run the aggregation used to copy the chunks
+        """
+        self.fs.delete(asset_id)
+        self.chunks.aggregate([
+            {'$match': {'files_id': source_id}},
+            {'$project': {'_id': 0, 'files_id': {'$literal': asset_id}, 'n': 1, 'data': 1}},
+            {'$merge': {'into': self.chunks.name}},
+        ])
+        # Only add the file document once all of its chunks are in place
+        self.fs_files.insert_one(dict(
+            asset, _id=asset_id, content_son=asset_key, uploadDate=datetime.now(UTC),
+        ))
+
     def create_asset(self, source_content, asset_id, asset, asset_key):
         """
         Creates a new asset
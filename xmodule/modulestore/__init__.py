@@ -120,6 +120,9 @@ class BulkOpsRecord:
     def __init__(self):
         self._active_count = 0
         self.has_publish_item = False
+        # The usage keys of the blocks changed by publishes during this bulk operation,
+        # or None if some publish didn't report the blocks it changed.
+        self.published_blocks = set()
         self.has_library_updated_item = False
 
     @property
@@ -129,6 +132,15 @@ class BulkOpsRecord:
         """
         return self._active_count > 0
 
+    def add_published_blocks(self, changed_blocks):
+        """
+        Record the usage keys of blocks changed by a publish, or that they aren't known (if None).
+        """
+        if changed_blocks is None:
+            self.published_blocks = None
+        elif self.published_blocks is not None:
+            self.published_blocks.update(changed_blocks)
+
     def nest(self):
         """
         Record another level of nesting of this bulk write operation
@@ -319,8 +331,12 @@ class BulkOperationsMixin:
         """
         if self.signal_handler and bulk_ops_record.has_publish_item:
             # We remove the branch, because publishing always means copying from draft to published
-            self.signal_handler.send("course_published", course_key=course_id.for_branch(None))
+            signal_kwargs = {'course_key': course_id.for_branch(None)}
+            if bulk_ops_record.published_blocks is not None:
+                signal_kwargs['changed_blocks'] = list(bulk_ops_record.published_blocks)
+            self.signal_handler.send("course_published", **signal_kwargs)
             bulk_ops_record.has_publish_item = False
+            bulk_ops_record.published_blocks = set()
 
     def send_bulk_library_updated_signal(self, bulk_ops_record, library_id):
         """
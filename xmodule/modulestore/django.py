@@ -172,12 +172,16 @@ class SignalHandler:
     5. The thing that listens for the signal lives in process, but should do
        almost no work. Its main job is to kick off the celery task that will
        do the actual work.
+    6. When the modulestore knows which blocks a publish added, changed or
+       removed, course_published is also sent a "changed_blocks" list of their
+       (branchless) usage keys, which can be used to update incrementally.
+       Without it, assume that anything in the course may have changed.
     """
 
     # If you add a new signal, please don't forget to add it to the _mapping
     # as well.
     pre_publish = SwitchedSignal("pre_publish", providing_args=["course_key"])
-    course_published = SwitchedSignal("course_published", providing_args=["course_key"])
+    course_published = SwitchedSignal("course_published", providing_args=["course_key", "changed_blocks"])
     course_deleted = SwitchedSignal("course_deleted", providing_args=["course_key"])
     library_updated = SwitchedSignal("library_updated", providing_args=["library_key"])
     item_deleted = SwitchedSignal("item_deleted", providing_args=["usage_key", "user_id"])
@@ -122,7 +122,7 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin, meta
         """
         raise NotImplementedError
 
-    def _flag_publish_event(self, course_key):
+    def _flag_publish_event(self, course_key, changed_blocks=None):
         """
         Wrapper around calls to fire the course_published signal
         Unless we're nested in an active bulk operation, this simply fires the signal
@@ -130,14 +130,20 @@ class ModuleStoreDraftAndPublished(BranchSettingMixin, BulkOperationsMixin, meta
 
         Arguments:
             course_key - course_key to which the signal applies
+            changed_blocks - the usage keys of the blocks the publish added, changed or removed,
+                or None if they aren't known
         """
         if self.signal_handler:
             bulk_record = self._get_bulk_ops_record(course_key) if isinstance(self, BulkOperationsMixin) else None
             if bulk_record and bulk_record.active:
                 bulk_record.has_publish_item = True
+                bulk_record.add_published_blocks(changed_blocks)
             else:
                 # We remove the branch, because publishing always means copying from draft to published
-                self.signal_handler.send("course_published", course_key=course_key.for_branch(None))
+                signal_kwargs = {'course_key': course_key.for_branch(None)}
+                if changed_blocks is not None:
+                    signal_kwargs['changed_blocks'] = list(changed_blocks)
+                self.signal_handler.send("course_published", **signal_kwargs)
 
     def update_item_parent(self, item_location, new_parent_location, old_parent_location, user_id, insert_at=None):
         """
@@ -0,0 +1,116 @@
+"""
+Performance test for rerunning (cloning) large split modulestore courses.
+
+Clones a ~5k block course with some assets and reports how long the clone took, and
+how many bytes of structures, definitions and asset contents this process wrote.
+
+Run with:
+
+    RUN_PERF_TESTS=1 pytest xmodule/modulestore/perf_tests/test_split_clone.py -s
+"""
+
+
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+import bson
+from opaque_keys.edx.locator import CourseLocator
+
+from xmodule.contentstore.content import StaticContent
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.split_mongo.mongo_connection import structure_to_mongo
+from xmodule.modulestore.tests.utils import SPLIT_MODULESTORE_SETUP
+
+# Shape of the generated course: chapters x sequentials x verticals x components ~= 5k blocks.
+COURSE_SHAPE = (5, 10, 20, 4)
+
+# Number (and size in bytes) of the assets added to the course.
+ASSET_COUNT = 20
+ASSET_SIZE = 256 * 1024
+
+
+@unittest.skipUnless(os.environ.get('RUN_PERF_TESTS'), 'Set RUN_PERF_TESTS to run performance tests.')
+class SplitClonePerformance(unittest.TestCase):
+    """
+    Time cloning a ~5k block course, and measure the data written doing so.
+    """
+
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    def _build_course(self, store, contentstore):
+        """
+        Create a course with the shape given by COURSE_SHAPE and some assets, and return its key.
+        """
+        user_id = ModuleStoreEnum.UserID.test
+        chapters, sequentials, verticals, components = COURSE_SHAPE
+        course_key = store.make_course_key('perf', 'clone', 'run')
+        with store.bulk_operations(course_key):
+            course = store.create_course(course_key.org, course_key.course, course_key.run, user_id)
+            for chapter_idx in range(chapters):
+                chapter = store.create_child(user_id, course.location, 'chapter', f'ch{chapter_idx}')
+                for seq_idx in range(sequentials):
+                    sequential = store.create_child(
+                        user_id, chapter.location, 'sequential', f'seq{chapter_idx}_{seq_idx}',
+                    )
+                    for vert_idx in range(verticals):
+                        vertical = store.create_child(
+                            user_id, sequential.location, 'vertical', f'v{chapter_idx}_{seq_idx}_{vert_idx}',
+                        )
+                        for comp_idx in range(components):
+                            store.create_child(
+                                user_id, vertical.location, ('problem', 'html')[comp_idx % 2],
+                                f'c{chapter_idx}_{seq_idx}_{vert_idx}_{comp_idx}',
+                            )
+            store.publish(course.location, user_id)
+
+        for asset_idx in range(ASSET_COUNT):
+            asset_key = course.id.make_asset_key('asset', f'asset{asset_idx}.bin')
+            contentstore.save(StaticContent(
+                asset_key, asset_key.path, 'application/octet-stream', os.urandom(ASSET_SIZE),
+            ))
+        return course.id
+
+    def test_clone_course(self):
+        """
+        Print the time taken to clone the course, and the bytes written by this process.
+        """
+        with SPLIT_MODULESTORE_SETUP.build() as (contentstore, store):
+            source_key = self._build_course(store, contentstore)
+            dest_key = CourseLocator('perf', 'clone', 'rerun')
+            split_store = store._get_modulestore_for_courselike(source_key)  # pylint: disable=protected-access
+            db_connection = split_store.db_connection
+            written = {'structures': 0, 'definitions': 0, 'assets': 0}
+
+            def insert_structure(structure, course_context=None):
+                written['structures'] += len(bson.encode(structure_to_mongo(structure, course_context)))
+                return original_insert_structure(structure, course_context)
+
+            def insert_definition(definition, course_context=None):
+                written['definitions'] += len(bson.encode(definition))
+                return original_insert_definition(definition, course_context)
+
+            def put_asset(data, **kwargs):
+                written['assets'] += len(data)
+                return original_put(data, **kwargs)
+
+            original_insert_structure = db_connection.insert_structure
+            original_insert_definition = db_connection.insert_definition
+            original_put = contentstore.fs.put
+            with patch.object(db_connection, 'insert_structure', insert_structure), \
+                    patch.object(db_connection, 'insert_definition', insert_definition), \
+                    patch.object(contentstore.fs, 'put', put_asset):
+                start = time.perf_counter()
+                store.clone_course(
+                    source_key, dest_key, ModuleStoreEnum.UserID.test, fields={'display_name': 'Rerun'},
+                )
+                elapsed = time.perf_counter() - start
+
+            __, asset_count = contentstore.get_all_content_for_course(dest_key)
+            assert asset_count == ASSET_COUNT
+            print(
+                f"clone_course: {elapsed * 1000:.2f}ms; bytes written: {written['structures']} structures, "
+                f"{written['definitions']} definitions, {written['assets']} asset contents"
+            )
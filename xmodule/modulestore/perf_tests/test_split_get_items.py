@@ -0,0 +1,102 @@
+"""
+Performance test for get_items queries against large split modulestore courses.
+
+Compares the timings of common get_items queries answered from the process-local
+structure index against the same queries answered by scanning every block.
+
+Run with:
+
+    RUN_PERF_TESTS=1 pytest xmodule/modulestore/perf_tests/test_split_get_items.py -s
+"""
+
+
+import os
+import timeit
+import unittest
+from unittest.mock import patch
+
+import ddt
+
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
+from xmodule.modulestore.split_mongo.structure_index import STRUCTURE_INDEX_CACHE
+from xmodule.modulestore.tests.utils import SPLIT_MODULESTORE_SETUP
+
+# Shape of the generated course: chapters x sequentials x verticals x (problem + html) ~= 10k blocks.
+COURSE_SHAPE = (10, 10, 40, 2)
+
+# Number of times each query is repeated when timing it.
+REPETITIONS = 20
+
+QUERIES = (
+    ('problems', {'qualifiers': {'category': 'problem'}}),
+    ('timed_sequentials', {'qualifiers': {'category': 'sequential'}, 'settings': {'is_time_limited': True}}),
+    ('group_access', {'settings': {'group_access': {'$exists': True}}}),
+)
+
+
+@ddt.ddt
+@unittest.skipUnless(os.environ.get('RUN_PERF_TESTS'), 'Set RUN_PERF_TESTS to run performance tests.')
+class SplitGetItemsPerformance(unittest.TestCase):
+    """
+    Time get_items on a ~10k block course, with and without the structure index.
+    """
+
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    def _build_course(self, store):
+        """
+        Create a course with the shape given by COURSE_SHAPE and return its key.
+        """
+        user_id = ModuleStoreEnum.UserID.test
+        chapters, sequentials, verticals, components = COURSE_SHAPE
+        course_key = store.make_course_key('perf', 'get_items', 'run')
+        with store.bulk_operations(course_key):
+            course = store.create_course(course_key.org, course_key.course, course_key.run, user_id)
+            for chapter_idx in range(chapters):
+                chapter = store.create_child(user_id, course.location, 'chapter', f'ch{chapter_idx}')
+                for seq_idx in range(sequentials):
+                    sequential = store.create_child(
+                        user_id, chapter.location, 'sequential', f'seq{chapter_idx}_{seq_idx}',
+                        fields={'is_time_limited': seq_idx == 0},
+                    )
+                    for vert_idx in range(verticals):
+                        vertical = store.create_child(
+                            user_id, sequential.location, 'vertical', f'v{chapter_idx}_{seq_idx}_{vert_idx}',
+                        )
+                        for comp_idx in range(components):
+                            store.create_child(
+                                user_id, vertical.location, ('problem', 'html')[comp_idx % 2],
+                                f'c{chapter_idx}_{seq_idx}_{vert_idx}_{comp_idx}',
+                            )
+        return course.id
+
+    @ddt.data(*QUERIES)
+    @ddt.unpack
+    def test_get_items_timings(self, name, query):
+        """
+        Print the time taken by ``query`` with a full scan and with the (warm) structure index.
+        """
+        with SPLIT_MODULESTORE_SETUP.build() as (__, store):
+            course_key = self._build_course(store)
+            split_store = store._get_modulestore_for_courselike(course_key)  # pylint: disable=protected-access
+            # Only time the matching, not the loading of the matched XBlocks.
+            with patch.object(split_store, '_load_items', lambda course, block_keys, **kwargs: block_keys):
+                def run_query():
+                    return store.get_items(course_key, **query)
+
+                with patch.object(SplitMongoModuleStore, '_get_items_candidates', return_value=None):
+                    scanned = run_query()
+                    scan_time = timeit.timeit(run_query, number=REPETITIONS) / REPETITIONS
+
+                STRUCTURE_INDEX_CACHE.clear()
+                cold_time = timeit.timeit(run_query, number=1)
+                indexed = run_query()
+                indexed_time = timeit.timeit(run_query, number=REPETITIONS) / REPETITIONS
+
+            assert indexed == scanned
+            print(
+                f"get_items[{name}]: {len(indexed)} matches; full scan {scan_time * 1000:.2f}ms, "
+                f"index build {cold_time * 1000:.2f}ms, indexed {indexed_time * 1000:.2f}ms"
+            )
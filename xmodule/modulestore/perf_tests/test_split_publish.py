@@ -0,0 +1,96 @@
+"""
+Performance test for publishing in the split modulestore.
+
+Times publishing a single unit and publishing a whole course after editing one
+component, with publishes copying only the changed blocks and with publishes
+copying every block in the published subtree.
+
+Run with:
+
+    RUN_PERF_TESTS=1 pytest xmodule/modulestore/perf_tests/test_split_publish.py -s
+"""
+
+
+import os
+import timeit
+import unittest
+from unittest.mock import patch
+
+import ddt
+
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.split_mongo.split import SplitMongoModuleStore
+from xmodule.modulestore.tests.utils import SPLIT_MODULESTORE_SETUP
+
+# Shape of the generated course: chapters x sequentials x verticals x (problem + html) ~= 5k blocks.
+COURSE_SHAPE = (5, 10, 20, 4)
+
+# Number of times each publish is repeated when timing it.
+REPETITIONS = 10
+
+
+@ddt.ddt
+@unittest.skipUnless(os.environ.get('RUN_PERF_TESTS'), 'Set RUN_PERF_TESTS to run performance tests.')
+class SplitPublishPerformance(unittest.TestCase):
+    """
+    Time publishes on a ~5k block course, with and without structure diffing.
+    """
+
+    # Use this attribute to skip this test on regular unittest CI runs.
+    perf_test = True
+
+    def _build_course(self, store):
+        """
+        Create and publish a course with the shape given by COURSE_SHAPE.
+        Return the course, its first unit and the first component of that unit.
+        """
+        user_id = ModuleStoreEnum.UserID.test
+        chapters, sequentials, verticals, components = COURSE_SHAPE
+        course_key = store.make_course_key('perf', 'publish', 'run')
+        units = []
+        with store.bulk_operations(course_key):
+            course = store.create_course(course_key.org, course_key.course, course_key.run, user_id)
+            for chapter_idx in range(chapters):
+                chapter = store.create_child(user_id, course.location, 'chapter', f'ch{chapter_idx}')
+                for seq_idx in range(sequentials):
+                    sequential = store.create_child(
+                        user_id, chapter.location, 'sequential', f'seq{chapter_idx}_{seq_idx}',
+                    )
+                    for vert_idx in range(verticals):
+                        vertical = store.create_child(
+                            user_id, sequential.location, 'vertical', f'v{chapter_idx}_{seq_idx}_{vert_idx}',
+                        )
+                        units.append(vertical)
+                        for comp_idx in range(components):
+                            store.create_child(
+                                user_id, vertical.location, ('problem', 'html')[comp_idx % 2],
+                                f'c{chapter_idx}_{seq_idx}_{vert_idx}_{comp_idx}',
+                            )
+            store.publish(course.location, user_id)
+        unit = store.get_item(units[0].location)
+        return course, unit, store.get_item(unit.children[0])
+
+    @ddt.data('unit', 'course')
+    def test_publish_timings(self, scope):
+        """
+        Print the time taken to publish a unit or the whole course after editing one component.
+        """
+        user_id = ModuleStoreEnum.UserID.test
+        with SPLIT_MODULESTORE_SETUP.build() as (__, store):
+            course, unit, component = self._build_course(store)
+            location = unit.location if scope == 'unit' else course.location
+
+            def edit_and_publish():
+                block = store.get_item(component.location)
+                block.display_name = f'Edited {block.display_name}'
+                store.update_item(block, user_id)
+                store.publish(location, user_id)
+
+            with patch.object(SplitMongoModuleStore, '_get_structure_changes', return_value=None):
+                full_time = timeit.timeit(edit_and_publish, number=REPETITIONS) / REPETITIONS
+            diffed_time = timeit.timeit(edit_and_publish, number=REPETITIONS) / REPETITIONS
+
+            print(
+                f"publish[{scope}]: copying every block {full_time * 1000:.2f}ms, "
+                f"copying changed blocks {diffed_time * 1000:.2f}ms"
+            )
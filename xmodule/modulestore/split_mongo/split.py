@@ -108,6 +108,7 @@ from xmodule.util.misc import get_library_or_course_attribute
 
 from ..exceptions import ItemNotFoundError
 from .caching_descriptor_system import CachingDescriptorSystem
+from .structure_index import STRUCTURE_INDEX_CACHE, StructureIndex, lookup_values
 
 log = logging.getLogger(__name__)
 
@@ -145,6 +146,8 @@ class SplitBulkWriteRecord(BulkOpsRecord):  # lint-amnesty, pylint: disable=miss
         self.definitions = {}
         self.definitions_in_db = set()
         self.course_key = None
+        # dict(version_guid, StructureIndex) for the structures being edited in this bulk operation
+        self.structure_indexes = {}
 
     # TODO: This needs to track which branches have actually been modified/versioned,
     # so that copying one branch to another doesn't update the original branch.
@@ -349,15 +352,21 @@ class SplitBulkWriteMixin(BulkOperationsMixin):
             version_guid = course_key.as_object_id(version_guid)
             return self.db_connection.get_structure(version_guid, course_key)
 
-    def update_structure(self, course_key, structure):
+    def update_structure(self, course_key, structure, index_updated=False):
         """
         Update a course structure, respecting the current bulk operation status
         (no data will be written to the database if a bulk operation is active.)
+
+        Unless ``index_updated`` is True (meaning the caller has already recorded its changes in
+        the structure's index), any index built for the structure during the bulk operation is dropped.
         """
         self._clear_cache(structure['_id'])
+        STRUCTURE_INDEX_CACHE.discard(structure['_id'])
         bulk_write_record = self._get_bulk_ops_record(course_key)
         if bulk_write_record.active:
             bulk_write_record.structures[structure['_id']] = structure
+            if not index_updated:
+                bulk_write_record.structure_indexes.pop(structure['_id'], None)
         else:
             self.db_connection.insert_structure(structure, course_key)
 
@@ -1265,21 +1274,22 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         if 'children' in qualifiers:
             settings['children'] = qualifiers.pop('children')
 
-        # No need of these caches unless include_orphans is set to False
-        path_cache = None
-        parents_cache = None
+        # Only needed when include_orphans is set to False
+        reachable = None
 
         if not include_orphans:
-            path_cache = {}
-            parents_cache = self.build_block_key_to_parents_mapping(course.structure)
+            reachable = self._get_structure_index(course, include_edited=True).reachable(course.structure['blocks'])
+
+        blocks = course.structure['blocks']
+        candidates = self._get_items_candidates(course, settings, qualifiers)
+        if candidates is None:
+            candidates = blocks.keys()
 
-        for block_id, value in course.structure['blocks'].items():
+        for block_id in candidates:
+            value = blocks[block_id]
             if _block_matches_all(value):
                 if not include_orphans:
-                    if (
-                        block_id.type in DETACHED_XBLOCK_TYPES or
-                        self.has_path_to_root(block_id, course, path_cache, parents_cache)
-                    ):
+                    if block_id.type in DETACHED_XBLOCK_TYPES or block_id in reachable:
                         items.append(block_id)
                 else:
                     items.append(block_id)
@@ -1289,6 +1299,89 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         else:
             return []
 
+    def _get_structure_index(self, course_entry, include_edited=False):
+        """
+        Return the :class:`StructureIndex` for the structure in ``course_entry``.
+
+        Structures which are still being edited in an active bulk operation are only indexed
+        if ``include_edited`` is True, and then only the parent and reachability indexes are
+        kept up to date as the structure changes; otherwise None is returned for them.
+        """
+        structure = course_entry.structure
+        if self._is_structure_being_edited(course_entry):
+            if not include_edited:
+                return None
+            bulk_write_record = self._get_bulk_ops_record(course_entry.course_key)
+            index = bulk_write_record.structure_indexes.get(structure['_id'])
+            if index is None:
+                index = bulk_write_record.structure_indexes[structure['_id']] = StructureIndex(structure)
+            return index
+        return STRUCTURE_INDEX_CACHE.get_index(structure)
+
+    def _is_structure_being_edited(self, course_entry):
+        """
+        Return whether the structure in ``course_entry`` is still being edited in an active
+        bulk operation (and so hasn't been persisted, and isn't immutable yet).
+        """
+        bulk_write_record = self._get_bulk_ops_record(course_entry.course_key)
+        return bulk_write_record.active and course_entry.structure['_id'] not in bulk_write_record.structures_in_db
+
+    def _get_edited_structure_index(self, course_key, structure):
+        """
+        Return the index built for ``structure`` while it's being edited in the active bulk operation
+        on ``course_key``, or None if there isn't one (in which case there's nothing to update).
+        """
+        bulk_write_record = self._get_bulk_ops_record(course_key)
+        if not bulk_write_record.active:
+            return None
+        return bulk_write_record.structure_indexes.get(structure['_id'])
+
+    def _get_items_candidates(self, course_entry, settings, qualifiers):
+        """
+        Use the structure index to narrow down the blocks which :meth:`get_items` has to check
+        against ``settings`` and ``qualifiers``.
+
+        Returns:
+            a list of BlockKeys (in structure order) which is a superset of the matching blocks,
+            or None if no indexed qualifier was given and every block has to be checked.
+        """
+        index = self._get_structure_index(course_entry)
+        if index is None:
+            return None
+
+        blocks = course_entry.structure['blocks']
+        candidate_sets = []
+
+        def _lookup(by_value, values):
+            """
+            Return the set of BlockKeys stored in ``by_value`` under any of ``values``.
+            """
+            return {block_key for value in values for block_key in by_value.get(value, ())}
+
+        for attr_name, get_attr_index in (
+            ('block_type', index.blocks_by_type),
+            ('definition', index.blocks_by_definition),
+        ):
+            values = lookup_values(qualifiers[attr_name]) if attr_name in qualifiers else None
+            if values is not None:
+                candidate_sets.append(_lookup(get_attr_index(blocks), values))
+
+        for field_name, criteria in settings.items():
+            if isinstance(criteria, dict) and criteria.get('$exists') is True:
+                __, __, with_field = index.blocks_by_setting(blocks, field_name)
+                candidate_sets.append(set(with_field))
+                continue
+            values = lookup_values(criteria)
+            if values is not None:
+                by_value, unindexed, __ = index.blocks_by_setting(blocks, field_name)
+                candidate_sets.append(_lookup(by_value, values).union(unindexed))
+
+        if not candidate_sets:
+            return None
+
+        candidates = set.intersection(*candidate_sets)
+        return sorted(candidates, key=index.positions(blocks).__getitem__)
+
     def build_block_key_to_parents_mapping(self, structure):
         """
         Given a structure, builds block_key to parents mapping for all block keys in structure
@@ -1357,14 +1450,17 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             raise ItemNotFoundError(locator)
 
         course = self._lookup_course(locator.course_key)
-        all_parent_ids = self._get_parents_from_structure(BlockKey.from_usage_key(locator), course.structure)
+        blocks = course.structure['blocks']
+        structure_index = self._get_structure_index(course, include_edited=True)
+        all_parent_ids = structure_index.parents(blocks).get(BlockKey.from_usage_key(locator), [])
 
         # Check and verify the found parent_ids are not orphans; Remove parent which has no valid path
         # to the course root
+        reachable = structure_index.reachable(blocks)
         parent_ids = [
             valid_parent
             for valid_parent in all_parent_ids
-            if self.has_path_to_root(valid_parent, course)
+            if valid_parent in reachable
         ]
 
         if len(parent_ids) == 0:
@@ -1388,16 +1484,16 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         detached_categories = [name for name, __ in XBlock.load_tagged_classes("detached")]
         course = self._lookup_course(course_key)
-        items = set(course.structure['blocks'].keys())
-        items.remove(course.structure['root'])
         blocks = course.structure['blocks']
-        for block_id, block_data in blocks.items():
-            items.difference_update(BlockKey(*child) for child in block_data.fields.get('children', []))
-            if block_data.block_type in detached_categories:
-                items.discard(block_id)
+        parents = self._get_structure_index(course, include_edited=True).parents(blocks)
         return [
             course_key.make_usage_key(block_type=block_id.type, block_id=block_id.id)
-            for block_id in items
+            for block_id, block_data in blocks.items()
+            if (
+                block_id != course.structure['root'] and
+                not parents.get(block_id) and
+                block_data.block_type not in detached_categories
+            )
         ]
 
     def get_course_index_info(self, course_key):
@@ -1667,7 +1763,10 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 asides=asides
             ))
 
-            self.update_structure(course_key, new_structure)
+            structure_index = self._get_edited_structure_index(course_key, new_structure)
+            if structure_index is not None:
+                structure_index.add_block(new_structure['blocks'], block_key)
+            self.update_structure(course_key, new_structure, index_updated=True)
 
             # update the index entry if appropriate
             if index_entry is not None:
@@ -1731,13 +1830,14 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             parent = new_structure['blocks'][block_id]
 
             # Originally added to support entrance exams (settings.FEATURES.get('ENTRANCE_EXAMS'))
+            child_key = BlockKey.from_usage_key(xblock.location)
             if kwargs.get('position') is None:
-                parent.fields.setdefault('children', []).append(BlockKey.from_usage_key(xblock.location))
+                parent.fields.setdefault('children', []).append(child_key)
             else:
-                parent.fields.setdefault('children', []).insert(
-                    kwargs.get('position'),
-                    BlockKey.from_usage_key(xblock.location)
-                )
+                parent.fields.setdefault('children', []).insert(kwargs.get('position'), child_key)
+            structure_index = self._get_edited_structure_index(parent_usage_key.course_key, new_structure)
+            if structure_index is not None:
+                structure_index.add_child(new_structure['blocks'], block_id, child_key)
 
             if parent.edit_info.update_version != new_structure['_id']:
                 # if the parent hadn't been previously changed in this bulk transaction, indicate that it's
@@ -1746,7 +1846,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             self.decache_block(parent_usage_key.course_key, new_structure['_id'], block_id)
 
             # db update
-            self.update_structure(parent_usage_key.course_key, new_structure)
+            self.update_structure(parent_usage_key.course_key, new_structure, index_updated=True)
 
         # don't need to update the index b/c create_item did it for this version
         return xblock
@@ -1853,6 +1953,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             block_fields.update(partitioned_fields[Scope.children])
         definition_fields = self._serialize_fields(root_category, partitioned_fields.get(Scope.content, {}))
 
+        existing_structure = False
         # build from inside out: definition, structure, index entry
         # if building a wholly new structure
         if versions_dict is None or master_branch not in versions_dict:
@@ -1886,10 +1987,14 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 root_block.fields.update(self._serialize_fields(root_category, block_fields))
             if definition_fields is not None:
                 old_def = self.get_definition(locator, root_block.definition)
-                new_fields = old_def['fields']
+                new_fields = dict(old_def['fields'])
                 new_fields.update(definition_fields)
-                definition_id = self._update_definition_from_data(locator, old_def, new_fields, user_id).definition_id
-                root_block.definition = definition_id
+                # The root definition is shared with the source course, so only copy it if it changed
+                if new_fields != old_def['fields']:
+                    definition_id = self._update_definition_from_data(
+                        locator, old_def, new_fields, user_id
+                    ).definition_id
+                    root_block.definition = definition_id
                 root_block.edit_info.edited_on = datetime.datetime.now(UTC)
                 root_block.edit_info.edited_by = user_id
                 root_block.edit_info.previous_version = root_block.edit_info.update_version
@@ -1900,10 +2005,18 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             new_id = versions_dict[master_branch]
             draft_version = CourseLocator(version_guid=new_id)
             draft_structure = self._lookup_course(draft_version).structure
+            existing_structure = True
 
         locator = locator.replace(version_guid=new_id)
         with self.bulk_operations(locator):
-            self.update_structure(locator, draft_structure)
+            if existing_structure:
+                # The structure is shared with the course it came from and is already persisted,
+                # so just make it available to the bulk operation rather than writing it again.
+                bulk_write_record = self._get_bulk_ops_record(locator)
+                bulk_write_record.structures[new_id] = draft_structure
+                bulk_write_record.structures_in_db.add(new_id)
+            else:
+                self.update_structure(locator, draft_structure)
             index_entry = {
                 '_id': ObjectId(),
                 'org': locator.org,
@@ -2274,13 +2387,19 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         :param blacklist: a list of usage keys to not change in the destination: i.e., don't add
         if not there, don't update if there.
 
+        Only the blocks in each subtree which changed since they were last copied are copied again:
+        descendants whose subtrees are unchanged are left as they are in the destination.
+
+        Returns the set of BlockKeys of the destination blocks which were added, changed or removed.
+
         Raises:
             ItemNotFoundError: if it cannot find the course. if the request is to publish a
                 subtree but the ancestors up to and including the course root are not published.
         """
         # get the destination's index, and source and destination structures.
         with self.bulk_operations(source_course):
-            source_structure = self._lookup_course(source_course).structure
+            source_entry = self._lookup_course(source_course)
+            source_structure = source_entry.structure
 
         with self.bulk_operations(destination_course):
             index_entry = self.get_course_index(destination_course)
@@ -2299,14 +2418,17 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                     # leave off the fields b/c the children must be filtered
                     definition_id=root_source.definition,
                 )
+                changes = None
             else:
-                destination_structure = self._lookup_course(destination_course).structure
-                destination_structure = self.version_structure(destination_course, destination_structure, user_id)
+                destination_entry = self._lookup_course(destination_course)
+                changes = self._get_structure_changes(source_entry, destination_entry)
+                destination_structure = self.version_structure(destination_course, destination_entry.structure, user_id)
 
             if blacklist != EXCLUDE_ALL:
                 blacklist = [BlockKey.from_usage_key(shunned) for shunned in blacklist or []]
             # iterate over subtree list filtering out blacklist.
             orphans = set()
+            changed_blocks = set()
             destination_blocks = destination_structure['blocks']
             for subtree_root in subtree_list:
                 if BlockKey.from_usage_key(subtree_root) != source_structure['root']:
@@ -2318,6 +2440,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                         # in the course export. Continue and only throw an exception if *no* parents are found.
                         if parent in destination_blocks:
                             parent_found = True
+                            original_children = destination_blocks[parent].fields['children']
                             orphans.update(
                                 self._sync_children(
                                     source_structure['blocks'][parent],
@@ -2325,6 +2448,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                                     BlockKey.from_usage_key(subtree_root)
                                 )
                             )
+                            if destination_blocks[parent].fields['children'] != original_children:
+                                changed_blocks.add(parent)
                     if len(parents) and not parent_found:  # lint-amnesty, pylint: disable=len-as-condition
                         raise ItemNotFoundError(parents)
                 # update/create the subtree and its children in destination (skipping blacklist)
@@ -2334,17 +2459,39 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                         BlockKey.from_usage_key(subtree_root),
                         source_structure['blocks'],
                         destination_blocks,
-                        blacklist
+                        blacklist,
+                        changes,
+                        changed_blocks,
                     )
                 )
             # remove any remaining orphans
             for orphan in orphans:
                 # orphans will include moved as well as deleted xblocks. Only delete the deleted ones.
-                self._delete_if_true_orphan(orphan, destination_structure)
+                changed_blocks.update(self._delete_if_true_orphan(orphan, destination_structure))
 
             # update the db
             self.update_structure(destination_course, destination_structure)
             self._update_head(destination_course, index_entry, destination_course.branch, destination_structure['_id'])
+            return changed_blocks
+
+    def _get_structure_changes(self, source_entry, destination_entry):
+        """
+        Return a dict mapping each BlockKey in the source structure to whether it or any of its
+        descendants differs from the destination structure (see :meth:`StructureIndex.changes`).
+        """
+        if self._is_structure_being_edited(source_entry) or self._is_structure_being_edited(destination_entry):
+            # Either structure may still change, so don't keep the comparison around
+            index = StructureIndex(source_entry.structure)
+        else:
+            index = self._get_structure_index(source_entry)
+        return index.changes(source_entry.structure['blocks'], destination_entry.structure, self._get_version)
+
+    def _get_version(self, block):
+        """
+        Return the version of the given database representation of a block.
+        """
+        source_version = block.edit_info.source_version
+        return source_version if source_version is not None else block.edit_info.update_version
 
     def copy_from_template(self, source_keys, dest_usage, user_id, head_validation=True):
         """
@@ -2546,10 +2693,16 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             new_structure = self.version_structure(usage_locator.course_key, original_structure, user_id)
             new_blocks = new_structure['blocks']
             new_id = new_structure['_id']
-            parent_block_keys = self._get_parents_from_structure(block_key, original_structure)
+            structure_index = self._get_edited_structure_index(usage_locator.course_key, new_structure)
+            if structure_index is not None:
+                parent_block_keys = list(structure_index.parents(new_blocks).get(block_key, []))
+            else:
+                parent_block_keys = self._get_parents_from_structure(block_key, original_structure)
             for parent_block_key in parent_block_keys:
                 parent_block = new_blocks[parent_block_key]
                 parent_block.fields['children'].remove(block_key)
+                if structure_index is not None:
+                    structure_index.remove_child(new_blocks, parent_block_key, block_key)
                 parent_block.edit_info.edited_on = datetime.datetime.now(UTC)
                 parent_block.edit_info.edited_by = user_id
                 parent_block.edit_info.previous_version = parent_block.edit_info.update_version
@@ -2558,10 +2711,12 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
                 parent_block.edit_info.source_version = None
                 self.decache_block(usage_locator.course_key, new_id, parent_block_key)
 
-            self._remove_subtree(BlockKey.from_usage_key(usage_locator), new_blocks)
+            removed_blocks = self._remove_subtree(BlockKey.from_usage_key(usage_locator), new_blocks)
+            if structure_index is not None:
+                structure_index.remove_blocks(new_blocks, removed_blocks)
 
             # update index if appropriate and structures
-            self.update_structure(usage_locator.course_key, new_structure)
+            self.update_structure(usage_locator.course_key, new_structure, index_updated=True)
 
             if index_entry is not None:
                 # update the index entry if appropriate
@@ -2582,6 +2737,8 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         Remove the subtree rooted at root_block_key
         We do this breadth-first to make sure that we don't remove
         any children that may have parents that we don't want to delete.
+
+        Returns a dict of the removed BlockKeys to their BlockData.
         """
         # create mapping from each child's key to its parents' keys
         child_parent_map = defaultdict(set)
@@ -2604,8 +2761,7 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
             tier = next_tier
             to_delete.update(tier)
 
-        for block_key in to_delete:
-            del blocks[block_key]
+        return {block_key: blocks.pop(block_key) for block_key in to_delete}
 
     def delete_course(self, course_key, user_id):  # lint-amnesty, pylint: disable=arguments-differ
         """
@@ -3096,14 +3252,23 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
         destination_parent.fields['children'] = destination_reordered
         return orphans
 
-    def _copy_subdag(self, user_id, destination_version, block_key, source_blocks, destination_blocks, blacklist):
+    def _copy_subdag(  # lint-amnesty, pylint: disable=too-many-arguments
+        self, user_id, destination_version, block_key, source_blocks, destination_blocks, blacklist,
+        changes=None, changed_blocks=None
+    ):
         """
         Update destination_blocks for the sub-dag rooted at block_key to be like the one in
         source_blocks excluding blacklist.
 
+        If ``changes`` (see :meth:`_get_structure_changes`) is given, descendants whose subtrees
+        haven't changed are left as they are in destination_blocks. The keys of the blocks
+        which changed are added to ``changed_blocks``, if given.
+
         Return any newly discovered orphans (as a set)
         """
         orphans = set()
+        if changed_blocks is not None and (changes is None or changes.get(block_key, True)):
+            changed_blocks.add(block_key)
         destination_block = destination_blocks.get(block_key)
         new_block = source_blocks[block_key]
         if destination_block:
@@ -3155,10 +3320,14 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
 
         if blacklist != EXCLUDE_ALL:
             for child in destination_block.fields.get('children', []):
+                child_key = BlockKey(*child)
+                if changes is not None and not changes.get(child_key, True) and child_key in destination_blocks:
+                    continue
                 if child not in blacklist:
                     orphans.update(
                         self._copy_subdag(
-                            user_id, destination_version, BlockKey(*child), source_blocks, destination_blocks, blacklist
+                            user_id, destination_version, child_key, source_blocks, destination_blocks, blacklist,
+                            changes, changed_blocks
                         )
                     )
         destination_blocks[block_key] = destination_block
@@ -3178,11 +3347,15 @@ class SplitMongoModuleStore(SplitBulkWriteMixin, ModuleStoreWriteBase):
     def _delete_if_true_orphan(self, orphan, structure):
         """
         Delete the orphan and any of its descendants which no longer have parents.
+        Return the keys of the deleted blocks (as a list).
         """
+        deleted = []
         if len(self._get_parents_from_structure(orphan, structure)) == 0:
             orphan_data = structure['blocks'].pop(orphan)
+            deleted.append(orphan)
             for child in orphan_data.fields.get('children', []):
-                self._delete_if_true_orphan(BlockKey(*child), structure)
+                deleted.extend(self._delete_if_true_orphan(BlockKey(*child), structure))
+        return deleted
 
     def _new_block(self, user_id, category, block_fields, definition_id, new_id, raw=False,
                    asides=None, block_defaults=None):
@@ -337,13 +337,23 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
         :return: True if the draft and published versions differ
         """
         def get_course(branch_name):
-            return self._lookup_course(xblock.location.course_key.for_branch(branch_name)).structure
+            return self._lookup_course(xblock.location.course_key.for_branch(branch_name))
 
         def get_block(course_structure, block_key):
             return self._get_block_from_structure(course_structure, block_key)
 
-        draft_course = get_course(ModuleStoreEnum.BranchName.draft)
-        published_course = get_course(ModuleStoreEnum.BranchName.published)
+        draft_entry = get_course(ModuleStoreEnum.BranchName.draft)
+        published_entry = get_course(ModuleStoreEnum.BranchName.published)
+        draft_course = draft_entry.structure
+        published_course = published_entry.structure
+
+        # When neither structure is being edited, compare the whole course once and reuse the result
+        # for every block (e.g. for all of the blocks on the course outline).
+        if not self._is_structure_being_edited(draft_entry) and not self._is_structure_being_edited(published_entry):
+            changes = self._get_structure_index(draft_entry).changes(
+                draft_course['blocks'], published_course, self._get_version
+            )
+            return changes.get(BlockKey.from_usage_key(xblock.location), True)
 
         def has_changes_subtree(block_key):
             draft_block = get_block(draft_course, block_key)
@@ -372,7 +382,7 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
         Publishes the subtree under location from the draft branch to the published branch
         Returns the newly published item.
         """
-        super().copy(
+        changed_blocks = super().copy(
             user_id,
             # Directly using the replace function rather than the for_branch function
             # because for_branch obliterates the version_guid and will lead to missed version conflicts.
@@ -385,7 +395,10 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
             blacklist=blacklist
         )
 
-        self._flag_publish_event(location.course_key)
+        published_course_key = location.course_key.for_branch(None)
+        self._flag_publish_event(location.course_key, [
+            published_course_key.make_usage_key(block_key.type, block_key.id) for block_key in changed_blocks
+        ])
 
         return self.get_item(location.for_branch(ModuleStoreEnum.BranchName.published), **kwargs)
 
@@ -544,13 +557,6 @@ class DraftVersioningModuleStore(SplitMongoModuleStore, ModuleStoreDraftAndPubli
             return None
         return self._get_block_from_structure(course_structure, BlockKey.from_usage_key(xblock.location))
 
-    def _get_version(self, block):
-        """
-        Return the version of the given database representation of a block.
-        """
-        source_version = block.edit_info.source_version
-        return source_version if source_version is not None else block.edit_info.update_version
-
     def import_xblock(self, user_id, course_key, block_type, block_id, fields=None, runtime=None, **kwargs):
         """
         Split-based modulestores need to import published blocks to both branches
@@ -0,0 +1,330 @@
+"""
+Process-local secondary indexes over split modulestore structures.
+
+Structures are append-only: once a structure has been written to the database, the
+blocks it contains never change. That makes it safe to build lookup tables over a
+structure's blocks once, keep them in memory keyed by the structure ``_id``, and reuse
+them across requests instead of scanning every block each time a query is made.
+
+Structures which are still being edited inside an active bulk operation are *not*
+immutable, and must never be indexed through :data:`STRUCTURE_INDEX_CACHE`. Their
+indexes are kept on the bulk operation record instead, and are either updated
+incrementally as blocks and children are added and removed, or dropped.
+"""
+
+
+import re
+import threading
+from collections import OrderedDict, defaultdict
+
+from xmodule.modulestore.split_mongo import BlockKey
+
+# The maximum number of structure indexes kept in memory by each process.
+MAX_CACHED_STRUCTURE_INDEXES = 64
+
+# Block types which are the root of a structure.
+ROOT_BLOCK_TYPES = ('course', 'library')
+
+
+class StructureIndex:
+    """
+    Secondary indexes over the blocks of a single immutable structure.
+
+    Every index is built lazily, the first time it is needed, and then kept for the
+    life of this object. The index does not hold on to the structure itself (which
+    may be large); callers pass in the blocks of the structure the index was built for.
+    """
+
+    def __init__(self, structure):
+        self.structure_id = structure['_id']
+        self.block_count = len(structure['blocks'])
+        self._positions = None
+        self._by_type = None
+        self._by_definition = None
+        # dict(field_name, (dict(value, [BlockKey]), [BlockKey], [BlockKey]))
+        self._by_setting = {}
+        # dict(BlockKey, [BlockKey])
+        self._parents = None
+        # set(BlockKey)
+        self._reachable = None
+        # (published structure _id, dict(BlockKey, bool))
+        self._changes = None
+
+    def matches(self, structure):
+        """
+        Return whether this index can be used to answer queries about ``structure``.
+        """
+        return structure['_id'] == self.structure_id and len(structure['blocks']) == self.block_count
+
+    def positions(self, blocks):
+        """
+        Return a dict mapping each BlockKey to its position in the structure's blocks,
+        so that lookups can be returned in the same order as a full scan would produce.
+        """
+        if self._positions is None:
+            self._positions = {block_key: position for position, block_key in enumerate(blocks)}
+        return self._positions
+
+    def blocks_by_type(self, blocks):
+        """
+        Return a dict mapping each block_type to the list of BlockKeys of that type.
+        """
+        if self._by_type is None:
+            by_type = defaultdict(list)
+            for block_key, block_data in blocks.items():
+                by_type[block_data.block_type].append(block_key)
+            self._by_type = dict(by_type)
+        return self._by_type
+
+    def blocks_by_definition(self, blocks):
+        """
+        Return a dict mapping each definition id to the list of BlockKeys which use it.
+        """
+        if self._by_definition is None:
+            by_definition = defaultdict(list)
+            for block_key, block_data in blocks.items():
+                by_definition[block_data.definition].append(block_key)
+            self._by_definition = dict(by_definition)
+        return self._by_definition
+
+    def blocks_by_setting(self, blocks, field_name):
+        """
+        Return the index for the settings field ``field_name`` as a tuple of:
+
+        * a dict mapping each explicitly set value (or each element of a list value) to
+          the list of BlockKeys having that value,
+        * the list of BlockKeys whose value could not be indexed (because it isn't hashable),
+        * the list of BlockKeys which have the field explicitly set at all.
+        """
+        if field_name not in self._by_setting:
+            by_value = defaultdict(list)
+            unindexed = []
+            with_field = []
+            for block_key, block_data in blocks.items():
+                if field_name not in block_data.fields:
+                    continue
+                with_field.append(block_key)
+                value = block_data.fields[field_name]
+                for element in (value if isinstance(value, list) else [value]):
+                    try:
+                        by_value[element].append(block_key)
+                    except TypeError:
+                        unindexed.append(block_key)
+                        break
+            self._by_setting[field_name] = (dict(by_value), unindexed, with_field)
+        return self._by_setting[field_name]
+
+    def parents(self, blocks):
+        """
+        Return a dict mapping each BlockKey to the list of BlockKeys which have it as a child.
+        Blocks without parents are not included.
+
+        The returned lists must not be modified by callers.
+        """
+        if self._parents is None:
+            parents = defaultdict(list)
+            for parent_key, block_data in blocks.items():
+                for child in block_data.fields.get('children', []):
+                    parents[BlockKey(*child)].append(parent_key)
+            self._parents = dict(parents)
+        return self._parents
+
+    def reachable(self, blocks):
+        """
+        Return the set of BlockKeys which have a path to the root of the structure (that is,
+        to a parentless course or library block).
+        """
+        if self._reachable is None:
+            parents = self.parents(blocks)
+            self._reachable = set()
+            self._add_reachable(blocks, [
+                block_key
+                for block_key in blocks
+                if block_key.type in ROOT_BLOCK_TYPES and not parents.get(block_key)
+            ])
+        return self._reachable
+
+    def changes(self, blocks, published_structure, get_version):
+        """
+        Return a dict mapping each BlockKey in this (draft) structure to whether it or any of
+        its descendants differs from the same block in ``published_structure``, which must
+        also be immutable. All blocks are compared in a single pass over the structure.
+
+        Arguments:
+            blocks: the blocks of the structure this index was built for
+            published_structure: the structure to compare against
+            get_version: a function returning the version of a BlockData to compare
+        """
+        if self._changes is not None and self._changes[0] == published_structure['_id']:
+            return self._changes[1]
+
+        published_blocks = published_structure['blocks']
+        changes = {}
+
+        def _has_changes(block_key):
+            """
+            Compute (and record) whether the subtree rooted at block_key has changes.
+            """
+            if block_key in changes:
+                return changes[block_key]
+            # Guard against cycles while this block's children are visited.
+            changes[block_key] = False
+            draft_block = blocks.get(block_key)
+            published_block = published_blocks.get(block_key)
+            if draft_block is None or published_block is None:
+                has_changes = True
+            elif get_version(draft_block) != get_version(published_block):
+                has_changes = True
+            else:
+                has_changes = False
+                for child in draft_block.fields.get('children', []):
+                    # Don't short-circuit, so that every child gets recorded too.
+                    has_changes = _has_changes(BlockKey(*child)) or has_changes
+            changes[block_key] = has_changes
+            return has_changes
+
+        for block_key in blocks:
+            _has_changes(block_key)
+        self._changes = (published_structure['_id'], changes)
+        return changes
+
+    def _add_reachable(self, blocks, block_keys):
+        """
+        Add ``block_keys`` and all of their descendants to the reachable set.
+        """
+        stack = list(block_keys)
+        while stack:
+            block_key = stack.pop()
+            if block_key in self._reachable:
+                continue
+            self._reachable.add(block_key)
+            block_data = blocks.get(block_key)
+            if block_data is not None:
+                stack.extend(BlockKey(*child) for child in block_data.fields.get('children', []))
+
+    def _reset_block_indexes(self, block_count):
+        """
+        Drop the indexes which aren't updated incrementally when the structure is edited.
+        """
+        self.block_count = block_count
+        self._positions = None
+        self._by_type = None
+        self._by_definition = None
+        self._by_setting = {}
+        self._changes = None
+
+    def add_block(self, blocks, block_key):
+        """
+        Record that ``block_key`` (which has no parents yet) has been added to ``blocks``.
+        """
+        self._reset_block_indexes(len(blocks))
+        if self._parents is not None:
+            for child in blocks[block_key].fields.get('children', []):
+                self._parents.setdefault(BlockKey(*child), []).append(block_key)
+        if block_key.type in ROOT_BLOCK_TYPES:
+            self._reachable = None
+
+    def add_child(self, blocks, parent_key, child_key):
+        """
+        Record that ``child_key`` has been added to the children of ``parent_key``.
+        """
+        self._reset_block_indexes(len(blocks))
+        if self._parents is not None:
+            self._parents.setdefault(child_key, []).append(parent_key)
+        if self._reachable is not None and parent_key in self._reachable:
+            self._add_reachable(blocks, [child_key])
+
+    def remove_child(self, blocks, parent_key, child_key):
+        """
+        Record that ``child_key`` has been removed from the children of ``parent_key``.
+        """
+        self._reset_block_indexes(len(blocks))
+        if self._parents is not None and parent_key in self._parents.get(child_key, ()):
+            self._parents[child_key].remove(parent_key)
+        self._reachable = None
+
+    def remove_blocks(self, blocks, removed_blocks):
+        """
+        Record that ``removed_blocks`` (a dict of BlockKey to BlockData) have been removed from ``blocks``.
+        """
+        self._reset_block_indexes(len(blocks))
+        if self._parents is not None:
+            for block_key, block_data in removed_blocks.items():
+                self._parents.pop(block_key, None)
+                for child in block_data.fields.get('children', []):
+                    child_parents = self._parents.get(BlockKey(*child))
+                    if child_parents and block_key in child_parents:
+                        child_parents.remove(block_key)
+        if self._reachable is not None:
+            self._reachable.difference_update(removed_blocks)
+
+
+def lookup_values(criteria):
+    """
+    Return the list of values which ``criteria`` (a get_items qualifier) matches by equality,
+    or None if the criteria can't be answered with a dictionary lookup (regexes, functions,
+    ``$nin``, ``$exists`` and unhashable values).
+    """
+    if isinstance(criteria, dict):
+        if set(criteria) != {'$in'}:
+            return None
+        values = list(criteria['$in'])
+    else:
+        values = [criteria]
+
+    for value in values:
+        if isinstance(value, (dict, re.Pattern)) or callable(value):
+            return None
+        try:
+            hash(value)
+        except TypeError:
+            return None
+    return values
+
+
+class StructureIndexCache:
+    """
+    A bounded, thread-safe, least-recently-used cache of :class:`StructureIndex` objects,
+    keyed by structure ``_id``.
+    """
+
+    def __init__(self, max_size=MAX_CACHED_STRUCTURE_INDEXES):
+        self.max_size = max_size
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_index(self, structure):
+        """
+        Return the :class:`StructureIndex` for ``structure``, creating it if needed.
+
+        ``structure`` must be immutable (that is, already persisted).
+        """
+        structure_id = structure['_id']
+        with self._lock:
+            index = self._indexes.get(structure_id)
+            if index is not None and index.matches(structure):
+                self._indexes.move_to_end(structure_id)
+                return index
+
+            index = StructureIndex(structure)
+            self._indexes[structure_id] = index
+            while len(self._indexes) > self.max_size:
+                self._indexes.popitem(last=False)
+            return index
+
+    def discard(self, structure_id):
+        """
+        Drop the index for ``structure_id``, if there is one.
+        """
+        with self._lock:
+            self._indexes.pop(structure_id, None)
+
+    def clear(self):
+        """
+        Drop all cached indexes.
+        """
+        with self._lock:
+            self._indexes.clear()
+
+
+STRUCTURE_INDEX_CACHE = StructureIndexCache()
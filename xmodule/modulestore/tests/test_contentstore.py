@@ -3,11 +3,13 @@
 """
 
 
+import itertools
 import logging
 import mimetypes
 import shutil
 import unittest
 from tempfile import mkdtemp
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
@@ -15,6 +17,7 @@ import ddt
 import path
 from opaque_keys.edx.keys import AssetKey
 from opaque_keys.edx.locator import AssetLocator, CourseLocator
+from pymongo.errors import OperationFailure
 
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.mongo import MongoContentStore
@@ -198,6 +201,24 @@ class TestContentstore(unittest.TestCase):
         __, count = self.contentstore.get_all_content_for_course(dest_course)
         assert count == len(self.course1_files)
 
+    @ddt.data(*itertools.product((True, False), repeat=2))
+    @ddt.unpack
+    def test_copy_assets_contents(self, deprecated, copy_on_server):
+        """
+        copy_all_course_assets copies the asset contents, whether or not the server can copy them itself
+        """
+        self.set_up_assets(deprecated)
+        dest_course = CourseLocator('test', 'destination', 'copy')
+        if copy_on_server:
+            self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+        else:
+            with patch.object(self.contentstore.chunks, 'aggregate', side_effect=OperationFailure('$merge')):
+                self.contentstore.copy_all_course_assets(self.course1_key, dest_course)
+        for filename in self.course1_files:
+            source = self.contentstore.find(self.course1_key.make_asset_key('asset', filename))
+            copied = self.contentstore.find(dest_course.make_asset_key('asset', filename))
+            assert source.data == copied.data
+
     @ddt.data(True, False)
     def test_copy_assets_with_duplicates(self, deprecated):
         """
@@ -12,7 +12,7 @@ from contextlib import contextmanager
 from shutil import rmtree
 from tempfile import mkdtemp
 from uuid import uuid4
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import ddt
 from openedx_events.content_authoring.data import XBlockData
@@ -2580,6 +2580,15 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
             with self.store.default_store(fake_store):
                 pass  # pragma: no cover
 
+    def assert_course_published(self, signal_handler, course_key):
+        """
+        Assert that the last signal sent by signal_handler was course_published for course_key.
+        """
+        args, kwargs = signal_handler.send.call_args
+        assert args == ('course_published',)
+        assert kwargs['course_key'] == course_key
+        assert set(kwargs) <= {'course_key', 'changed_blocks'}
+
     def save_asset(self, asset_key):
         """
         Load and save the given file. (taken from test_contentstore)
@@ -2639,7 +2648,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
                 signal_handler.reset_mock()
 
                 course_key = course.id
@@ -2649,7 +2658,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     Check if the signal has been fired.
                     The course_published signal fires before the _clear_bulk_ops_record.
                     """
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    self.assert_course_published(signal_handler, course.id)
 
                 with patch.object(
                     self.store.thread_cache.default_store, '_clear_bulk_ops_record', wraps=_clear_bulk_ops_record
@@ -2663,7 +2672,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                     assert mock_clear_bulk_ops_record.call_count == 1
 
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_publish_signal_direct_firing(self, default):
@@ -2685,7 +2694,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 course_key = course.id
 
@@ -2695,16 +2704,16 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     log.debug('Testing with block type %s', block_type)
                     signal_handler.reset_mock()
                     block = self.store.create_item(self.user_id, course_key, block_type)
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    self.assert_course_published(signal_handler, course.id)
 
                     signal_handler.reset_mock()
                     block.display_name = block_type
                     self.store.update_item(block, self.user_id)
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    self.assert_course_published(signal_handler, course.id)
 
                     signal_handler.reset_mock()
                     self.store.publish(block.location, self.user_id)
-                    signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                    self.assert_course_published(signal_handler, course.id)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_publish_signal_rerun_firing(self, default):
@@ -2726,7 +2735,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 course_key = course.id
 
@@ -2734,7 +2743,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                 signal_handler.reset_mock()
                 dest_course_id = self.store.make_course_key("org.other", "course.other", "run.other")
                 self.store.clone_course(course_key, dest_course_id, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=dest_course_id)
+                self.assert_course_published(signal_handler, dest_course_id)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_publish_signal_import_firing(self, default):
@@ -2762,12 +2771,19 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     static_content_store=contentstore,
                     create_if_not_present=True,
                 )
-                signal_handler.send.assert_has_calls([
-                    call('pre_publish', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                    call('course_published', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                    call('pre_publish', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                    call('course_published', course_key=self.store.make_course_key('edX', 'toy', '2012_Fall')),
-                ])
+                course_key = self.store.make_course_key('edX', 'toy', '2012_Fall')
+                expected_signals = [
+                    ('pre_publish', course_key),
+                    ('course_published', course_key),
+                    ('pre_publish', course_key),
+                    ('course_published', course_key),
+                ]
+                # Ignore the changed blocks sent with course_published
+                signals = [(args[0], kwargs['course_key']) for args, kwargs in signal_handler.send.call_args_list]
+                assert any(
+                    signals[start:start + len(expected_signals)] == expected_signals
+                    for start in range(len(signals))
+                )
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_publish_signal_publish_firing(self, default):
@@ -2789,18 +2805,18 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 # Test a draftable block type, which needs to be explicitly published, and nest it within the
                 # normal structure - this is important because some implementors change the parent when adding a
                 # non-published child; if parent is in DIRECT_ONLY_CATEGORIES then this should not fire the event
                 signal_handler.reset_mock()
                 section = self.store.create_item(self.user_id, course.id, 'chapter')
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 signal_handler.reset_mock()
                 subsection = self.store.create_child(self.user_id, section.location, 'sequential')
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 # 'units' and 'blocks' are draftable types
                 signal_handler.reset_mock()
@@ -2815,15 +2831,15 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 signal_handler.reset_mock()
                 self.store.publish(unit.location, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 signal_handler.reset_mock()
                 self.store.unpublish(unit.location, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 signal_handler.reset_mock()
                 self.store.delete_item(unit.location, self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_bulk_course_publish_signal_direct_firing(self, default):
@@ -2845,7 +2861,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 course_key = course.id
 
@@ -2865,7 +2881,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                         self.store.publish(block.location, self.user_id)
                         signal_handler.send.assert_not_called()
 
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_bulk_course_publish_signal_publish_firing(self, default):
@@ -2887,7 +2903,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
 
                 # Course creation and publication should fire the signal
                 course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 course_key = course.id
 
@@ -2915,7 +2931,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     self.store.publish(unit.location, self.user_id)
                     signal_handler.send.assert_not_called()
 
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 # Test editing draftable block type without publish
                 signal_handler.reset_mock()
@@ -2926,7 +2942,7 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     signal_handler.send.assert_not_called()
                     self.store.publish(unit.location, self.user_id)
                     signal_handler.send.assert_not_called()
-                signal_handler.send.assert_called_with('course_published', course_key=course.id)
+                self.assert_course_published(signal_handler, course.id)
 
                 signal_handler.reset_mock()
                 with self.store.bulk_operations(course_key):
@@ -2936,6 +2952,58 @@ class TestMixedModuleStore(CommonMixedModuleStoreSetup):
                     signal_handler.send.assert_not_called()
                 signal_handler.send.assert_not_called()
 
+    def test_course_publish_signal_changed_blocks(self):
+        """
+        Publishing in split sends the blocks which the publish changed along with course_published.
+        """
+        with MongoContentstoreBuilder().build() as contentstore:
+            signal_handler = Mock(name='signal_handler')
+            self.store = MixedModuleStore(
+                contentstore=contentstore,
+                create_modulestore_instance=create_modulestore_instance,
+                mappings={},
+                signal_handler=signal_handler,
+                **self.OPTIONS
+            )
+            self.addCleanup(self.store.close_all_connections)
+
+            with self.store.default_store(ModuleStoreEnum.Type.split):
+                course = self.store.create_course('org_x', 'course_y', 'run_z', self.user_id)
+                section = self.store.create_item(self.user_id, course.id, 'chapter')
+                subsection = self.store.create_child(self.user_id, section.location, 'sequential')
+                unit = self.store.create_child(self.user_id, subsection.location, 'vertical')
+                problem = self.store.create_child(self.user_id, unit.location, 'problem')
+                html = self.store.create_child(self.user_id, unit.location, 'html')
+
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                __, kwargs = signal_handler.send.call_args
+                # The subsection's published children now include the unit
+                assert set(kwargs['changed_blocks']) == {
+                    subsection.location.for_branch(None),
+                    unit.location.for_branch(None),
+                    problem.location.for_branch(None),
+                    html.location.for_branch(None),
+                }
+
+                # Only the edited problem and the unit containing it have changed
+                problem.display_name = 'Edited'
+                self.store.update_item(problem, self.user_id)
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                __, kwargs = signal_handler.send.call_args
+                assert set(kwargs['changed_blocks']) == {
+                    unit.location.for_branch(None),
+                    problem.location.for_branch(None),
+                }
+                assert not self.store.has_changes(self.store.get_item(unit.location))
+
+                # Publishing again doesn't change anything
+                signal_handler.reset_mock()
+                self.store.publish(unit.location, self.user_id)
+                __, kwargs = signal_handler.send.call_args
+                assert kwargs['changed_blocks'] == []
+
     @ddt.data(ModuleStoreEnum.Type.mongo, ModuleStoreEnum.Type.split)
     def test_course_deleted_signal(self, default):
         with MongoContentstoreBuilder().build() as contentstore:
@@ -849,6 +849,7 @@ class TestCourseStructureCache(CacheIsolationMixin, SplitModuleTest):
         )
 
 
+@ddt.ddt
 class SplitModuleItemTests(SplitModuleTest):
     '''
     Item read tests including inheritance
@@ -1038,6 +1039,27 @@ class SplitModuleItemTests(SplitModuleTest):
         matches = modulestore().get_items(locator, settings={'group_access': {'$exists': False}})
         assert len(matches) == 7
 
+    @ddt.data(
+        ({'category': 'chapter'}, None),
+        ({'category': {'$in': ['chapter', 'course']}}, None),
+        ({'category': re.compile('chap')}, None),
+        ({'category': 'chapter'}, {'display_name': 'Hercules'}),
+        ({'category': 'chapter'}, {'display_name': re.compile(r'Hera')}),
+        ({}, {'group_access': {'$exists': True}}),
+        ({}, {'group_access': {'$exists': False}}),
+        ({'children': BlockKey('chapter', 'chapter1')}, None),
+    )
+    @ddt.unpack
+    def test_get_items_index_matches_full_scan(self, qualifiers, settings):
+        '''
+        get_items answered from the structure index returns exactly what a full scan of the blocks returns
+        '''
+        locator = CourseLocator(org='testx', course='GreekHero', run="run", branch=BRANCH_NAME_DRAFT)
+        indexed = modulestore().get_items(locator, qualifiers=qualifiers, settings=settings and dict(settings))
+        with patch.object(SplitMongoModuleStore, '_get_items_candidates', return_value=None):
+            scanned = modulestore().get_items(locator, qualifiers=qualifiers, settings=settings and dict(settings))
+        assert [block.location for block in indexed] == [block.location for block in scanned]
+
     def test_get_parents(self):
         '''
         get_parent_location(locator): BlockUsageLocator
@@ -1245,6 +1267,28 @@ class TestItemCrud(SplitModuleTest):
         chapter = modulestore().get_item(chapter_locator)
         assert problem_locator in version_agnostic(chapter.children)
 
+    def test_parents_in_bulk_operations(self):
+        """
+        Test that parent and orphan lookups stay correct while a bulk operation edits the structure
+        """
+        user = random.getrandbits(32)
+        course_key = CourseLocator('test_org', 'test_parents', 'test_run')
+        with modulestore().bulk_operations(course_key):
+            new_course = modulestore().create_course('test_org', 'test_parents', 'test_run', user, BRANCH_NAME_DRAFT)
+            course_block_locator = new_course.location.version_agnostic()
+            chapter = modulestore().create_child(user, course_block_locator, 'chapter')
+            # look up a parent so that the structure being edited gets indexed
+            assert modulestore().get_parent_location(chapter.location.version_agnostic()) == course_block_locator
+
+            sequential = modulestore().create_child(user, chapter.location.version_agnostic(), 'sequential')
+            sequential_locator = sequential.location.version_agnostic()
+            assert modulestore().get_parent_location(sequential_locator) == chapter.location.version_agnostic()
+            assert not modulestore().get_orphans(course_key.for_branch(BRANCH_NAME_DRAFT))
+
+            modulestore().delete_item(chapter.location.version_agnostic(), user)
+            assert modulestore().get_parent_location(sequential_locator) is None
+            assert not modulestore().get_orphans(course_key.for_branch(BRANCH_NAME_DRAFT))
+
     def test_create_bulk_operations(self):
         """
         Test create_item using bulk_operations
@@ -1652,6 +1696,20 @@ class TestCourseCreation(SplitModuleTest):
         original_course = modulestore().get_course(original_locator)
         assert original_course.location.version_guid == original_index['versions'][BRANCH_NAME_DRAFT]
 
+    def test_cloned_course_reuses_structures(self):
+        """
+        Test that pointing a new course at existing structures doesn't write those structures again.
+        """
+        original_locator = CourseLocator(org='testx', course='wonderful', run="run", branch=BRANCH_NAME_DRAFT)
+        original_index = modulestore().get_course_index_info(original_locator)
+        db_connection = modulestore().db_connection
+        with patch.object(db_connection, 'insert_structure', wraps=db_connection.insert_structure) as insert_structure:
+            modulestore().create_course(
+                'best', 'reuse', 'reuse_run', TEST_OTHER_USER_ID, BRANCH_NAME_DRAFT,
+                versions_dict=original_index['versions'])
+        inserted = {call_args[0][0]['_id'] for call_args in insert_structure.call_args_list}
+        assert not inserted & set(original_index['versions'].values())
+
     def test_derived_course(self):
         """
         Create a new course which overrides metadata and course_data
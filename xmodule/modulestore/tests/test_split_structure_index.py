@@ -0,0 +1,159 @@
+"""
+Tests for the process-local split modulestore structure indexes.
+"""
+
+
+import re
+import unittest
+
+import ddt
+from bson.objectid import ObjectId
+
+from xmodule.modulestore import BlockData
+from xmodule.modulestore.split_mongo import BlockKey
+from xmodule.modulestore.split_mongo.structure_index import StructureIndexCache, lookup_values
+
+
+def make_structure(blocks):
+    """
+    Return a minimal structure containing ``blocks``, a list of (BlockKey, fields, definition) tuples.
+    """
+    return {
+        '_id': ObjectId(),
+        'root': blocks[0][0],
+        'blocks': {
+            block_key: BlockData(block_type=block_key.type, fields=fields, definition=definition)
+            for block_key, fields, definition in blocks
+        },
+    }
+
+
+@ddt.ddt
+class TestStructureIndex(unittest.TestCase):
+    """
+    Tests for :class:`StructureIndex` and :class:`StructureIndexCache`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.course = BlockKey('course', 'course')
+        self.chapter = BlockKey('chapter', 'chapter')
+        self.problem1 = BlockKey('problem', 'problem1')
+        self.problem2 = BlockKey('problem', 'problem2')
+        self.structure = make_structure([
+            (self.course, {'children': [self.chapter]}, 'd1'),
+            (self.chapter, {'children': [self.problem1, self.problem2], 'display_name': 'Chapter'}, 'd2'),
+            (self.problem1, {'weight': 1, 'group_access': {'1': [2]}}, 'd3'),
+            (self.problem2, {'weight': 2}, 'd3'),
+        ])
+        self.blocks = self.structure['blocks']
+        self.cache = StructureIndexCache(max_size=2)
+
+    def test_blocks_by_type(self):
+        index = self.cache.get_index(self.structure)
+        assert index.blocks_by_type(self.blocks) == {
+            'course': [self.course],
+            'chapter': [self.chapter],
+            'problem': [self.problem1, self.problem2],
+        }
+
+    def test_blocks_by_definition(self):
+        index = self.cache.get_index(self.structure)
+        assert index.blocks_by_definition(self.blocks)['d3'] == [self.problem1, self.problem2]
+
+    def test_blocks_by_setting(self):
+        index = self.cache.get_index(self.structure)
+        by_value, unindexed, with_field = index.blocks_by_setting(self.blocks, 'children')
+        assert by_value[self.problem2] == [self.chapter]
+        assert unindexed == []
+        assert with_field == [self.course, self.chapter]
+
+        by_value, unindexed, with_field = index.blocks_by_setting(self.blocks, 'group_access')
+        assert not by_value
+        assert unindexed == [self.problem1]
+        assert with_field == [self.problem1]
+
+    def test_parents_and_reachable(self):
+        orphan = BlockKey('html', 'orphan')
+        self.blocks[orphan] = BlockData(block_type='html', fields={'children': [self.problem1]})
+        index = self.cache.get_index(self.structure)
+        assert index.parents(self.blocks) == {
+            self.chapter: [self.course],
+            self.problem1: [self.chapter, orphan],
+            self.problem2: [self.chapter],
+        }
+        assert index.reachable(self.blocks) == {self.course, self.chapter, self.problem1, self.problem2}
+
+    def test_incremental_updates(self):
+        index = self.cache.get_index(self.structure)
+        index.parents(self.blocks)
+        index.reachable(self.blocks)
+
+        vertical = BlockKey('vertical', 'vertical')
+        html = BlockKey('html', 'html')
+        self.blocks[html] = BlockData(block_type='html', fields={})
+        index.add_block(self.blocks, html)
+        self.blocks[vertical] = BlockData(block_type='vertical', fields={'children': [html]})
+        index.add_block(self.blocks, vertical)
+        assert index.parents(self.blocks)[html] == [vertical]
+        assert vertical not in index.reachable(self.blocks)
+
+        self.blocks[self.chapter].fields['children'].append(vertical)
+        index.add_child(self.blocks, self.chapter, vertical)
+        assert index.parents(self.blocks)[vertical] == [self.chapter]
+        assert {vertical, html} <= index.reachable(self.blocks)
+        assert index.blocks_by_type(self.blocks)['vertical'] == [vertical]
+
+        self.blocks[self.course].fields['children'].remove(self.chapter)
+        index.remove_child(self.blocks, self.course, self.chapter)
+        removed = {key: self.blocks.pop(key) for key in (self.chapter, vertical, html)}
+        index.remove_blocks(self.blocks, removed)
+        assert index.parents(self.blocks) == {self.problem1: [], self.problem2: []}
+        assert index.reachable(self.blocks) == {self.course}
+
+    def test_changes(self):
+        published = make_structure([
+            (self.course, {'children': [self.chapter]}, 'd1'),
+            (self.chapter, {'children': [self.problem1]}, 'd2'),
+            (self.problem1, {}, 'd3'),
+        ])
+        for block_key, block_data in published['blocks'].items():
+            self.blocks[block_key].edit_info.update_version = block_data.edit_info.update_version = 'v1'
+        # problem2 only exists in the draft
+        self.blocks[self.problem2].edit_info.update_version = 'v2'
+
+        index = self.cache.get_index(self.structure)
+        changes = index.changes(self.blocks, published, lambda block: block.edit_info.update_version)
+        assert changes == {
+            self.course: True,
+            self.chapter: True,
+            self.problem1: False,
+            self.problem2: True,
+        }
+        assert index.changes(self.blocks, published, None) is changes
+
+    def test_cache_reuses_and_evicts(self):
+        index = self.cache.get_index(self.structure)
+        assert self.cache.get_index(self.structure) is index
+
+        self.cache.get_index(make_structure([(self.course, {}, 'd1')]))
+        self.cache.get_index(make_structure([(self.course, {}, 'd1')]))
+        assert self.cache.get_index(self.structure) is not index
+
+    def test_discard(self):
+        index = self.cache.get_index(self.structure)
+        self.cache.discard(self.structure['_id'])
+        assert self.cache.get_index(self.structure) is not index
+
+    @ddt.data(
+        ('problem', ['problem']),
+        ({'$in': ['problem', 'html']}, ['problem', 'html']),
+        ({'$nin': ['problem']}, None),
+        ({'$exists': True}, None),
+        (re.compile('prob'), None),
+        (lambda value: True, None),
+        (['unhashable'], None),
+    )
+    @ddt.unpack
+    def test_lookup_values(self, criteria, expected):
+        assert lookup_values(criteria) == expected
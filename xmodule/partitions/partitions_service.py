@@ -73,6 +73,33 @@ def get_user_partition_groups(course_key: str, user_partitions: list, user: User
     return partition_groups
 
 
+def prefetch_user_partition_groups(course_key, user_partitions: list, users: list):
+    """
+    Load the data which the schemes of the given partitions need to find the
+    groups of the given users, with one query per scheme, and keep it in the
+    request cache so that get_user_partition_groups (and any other lookup of
+    these users' groups during the request) doesn't query per user or per
+    partition.
+
+    Schemes opt in by implementing a `prefetch_groups_for_users(course_key, users)`
+    class method.
+
+    Args:
+        course_key (CourseKey): the course the partitions belong to.
+        user_partitions (list[UserPartition]): the partitions whose groups will be looked up.
+        users (list[User]): the users whose groups will be looked up.
+    """
+    schemes = []
+    for partition in user_partitions:
+        if partition.scheme not in schemes:
+            schemes.append(partition.scheme)
+
+    for scheme in schemes:
+        prefetch_groups_for_users = getattr(scheme, 'prefetch_groups_for_users', None)
+        if prefetch_groups_for_users is not None:
+            prefetch_groups_for_users(course_key, users)
+
+
 def _get_dynamic_partitions(course):
     """
     Return the dynamic user partitions for this course.
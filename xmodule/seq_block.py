@@ -783,6 +783,17 @@ class SequenceBlock(
             self.get_parent().display_name_with_default,
             self.display_name_with_default
         ]
+        verticals_completion = {}
+        if is_user_authenticated and completion_service:
+            verticals_completion = self._get_verticals_completion(completion_service, children)
+        content_type_gating_service = self.runtime.service(self, 'content_type_gating')
+        # Only check each child for gated content if anything in the sequence is gated.
+        check_children_for_gated_content = bool(
+            content_type_gating_service and
+            content_type_gating_service.check_children_for_content_type_gating_paywall(
+                self, self.scope_ids.usage_id.context_key
+            ) is not None
+        )
         contents = []
         for block in children:
             item_type = get_icon(block)
@@ -806,9 +817,8 @@ class SequenceBlock(
             else:
                 content = ''
 
-            content_type_gating_service = self.runtime.service(self, 'content_type_gating')
             contains_content_type_gated_content = False
-            if content_type_gating_service:
+            if check_children_for_gated_content:
                 contains_content_type_gated_content = content_type_gating_service.check_children_for_content_type_gating_paywall(  # pylint:disable=line-too-long
                     block, self.scope_ids.usage_id.context_key
                 ) is not None
@@ -826,14 +836,37 @@ class SequenceBlock(
                 # The item url format can be defined in the template context like so:
                 # context['item_url'] = '/my/item/path/{usage_key}/whatever'
                 block_info['href'] = context.get('item_url', '').format(usage_key=usage_id)
-            if is_user_authenticated:
-                if block.location.block_type == 'vertical' and completion_service:
-                    block_info['complete'] = completion_service.vertical_is_complete(block)
+            if block.location in verticals_completion:
+                block_info['complete'] = verticals_completion[block.location]
 
             contents.append(block_info)
 
         return contents
 
+    @staticmethod
+    def _get_verticals_completion(completion_service, children):
+        """
+        Returns a dict mapping the location of each vertical in children to
+        whether it is complete, as `completion_service.vertical_is_complete`
+        would, but looking up the completions of all the verticals' completable
+        children at once rather than one vertical at a time.
+        """
+        verticals = [block for block in children if block.location.block_type == 'vertical']
+        if not completion_service.completion_tracking_enabled():
+            return {vertical.location: None for vertical in verticals}
+
+        completable_locations = {
+            vertical.location: [child.location for child in completion_service.get_completable_children(vertical)]
+            for vertical in verticals
+        }
+        completions = completion_service.get_completions([
+            location for locations in completable_locations.values() for location in locations
+        ])
+        return {
+            vertical_location: all(completions[location] >= 1.0 for location in locations)
+            for vertical_location, locations in completable_locations.items()
+        }
+
     def _locations_in_subtree(self, node):
         """
         The usage keys for all descendants of an XBlock/XModule as a flat list.
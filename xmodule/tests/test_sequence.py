@@ -21,6 +21,7 @@ from openedx.features.content_type_gating.models import ContentTypeGatingConfig
 from xmodule.seq_block import TIMED_EXAM_GATING_WAFFLE_FLAG, SequenceBlock
 from xmodule.tests import get_test_system, prepare_block_runtime
 from xmodule.tests.helpers import StubUserService
+from xmodule.tests.test_vertical import StubCompletionService
 from xmodule.tests.xml import XModuleXmlImportTest
 from xmodule.tests.xml import factories as xml
 from xmodule.x_module import PUBLIC_VIEW, STUDENT_VIEW
@@ -443,6 +444,17 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
         assert metadata['tag'] == 'sequential'
         assert metadata['display_name'] == self.sequence_3_1.display_name_with_default
 
+    @ddt.data((True, 1.0, True), (True, 0.5, False), (False, 1.0, None))
+    @ddt.unpack
+    def test_get_metadata_completion(self, enabled, completion_value, expected_complete):
+        """Test that the completion of every unit is included in the sequence metadata"""
+        self.sequence_5_1.runtime._services['bookmarks'] = None  # pylint: disable=protected-access
+        self.sequence_5_1.runtime._services['completion'] = StubCompletionService(  # pylint: disable=protected-access
+            enabled=enabled, completion_value=completion_value,
+        )
+        metadata = self.sequence_5_1.get_metadata()
+        assert [item['complete'] for item in metadata['items']] == [expected_complete]
+
     @override_settings(FIELD_OVERRIDE_PROVIDERS=(
         'openedx.features.content_type_gating.field_override.ContentTypeGatingFieldOverride',
     ))